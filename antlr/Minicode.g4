@@ -1,5 +1,12 @@
 grammar Minicode;
 
+// Palabras que solo son clave en un sitio (p. ej. `tempo` tras `cambiar`): en el resto
+// del programa son identificadores normales, así que llegan como ID y se mira su texto
+@parser::members {
+def _palabra(self, texto):
+    return self._input.LT(1).text == texto
+}
+
 //============================
 //  REGLA INICIAL
 //============================
@@ -13,8 +20,11 @@ programa
 instruccion
     : declarar_var
     | asignacion
+    | asignar_elemento
     | imprimir
     | repetir
+    | mientras
+    | para_cada
     | condicional
     | funcion_def
     | funcion_llamada
@@ -38,6 +48,11 @@ asignacion
     : ID '=' expresion NUEVALINEA?
     ;
 
+// lista[i] = valor (y lista[i][j] = valor en listas de listas)
+asignar_elemento
+    : ID (ABRECORCHETE expresion CIERRACORCHETE)+ '=' expresion NUEVALINEA?
+    ;
+
 //============================
 //  FUNCIONES
 //============================
@@ -72,6 +87,25 @@ repetir
     : REPETIR expresion VECES ':' NUEVALINEA bloque FIN
     ;
 
+// `hacer` es opcional: “mientras x < 10:” o “mientras x < 10 hacer:”
+mientras
+    : MIENTRAS expresion palabra_hacer? ':' NUEVALINEA bloque FIN
+    ;
+
+para_cada
+    : PARA CADA ID palabra_en expresion ':' NUEVALINEA bloque FIN
+    ;
+
+// `hacer` y `en` son palabras clave solo aquí: fuera de estos bucles siguen siendo
+// nombres válidos (p. ej. “en = 1”), como en los programas anteriores a los bucles
+palabra_hacer
+    : {self._palabra("hacer")}?<fail={"se esperaba 'hacer'"}> ID
+    ;
+
+palabra_en
+    : {self._palabra("en")}?<fail={"se esperaba 'en'"}> ID
+    ;
+
 bloque
     : instruccion+
     ;
@@ -102,6 +136,12 @@ comando_grafico
 comando_musical
     : TOCAR NOTA ID
       (DURANTE expresion SEGUNDOS)? NUEVALINEA?
+    | CAMBIAR palabra_tempo expresion NUEVALINEA?
+    ;
+
+// “cambiar tempo 120”: pulsos por minuto de las notas siguientes
+palabra_tempo
+    : {self._palabra("tempo")}?<fail={"se esperaba 'tempo'"}> ID
     ;
 
 //============================
@@ -132,14 +172,19 @@ operar_polinomio
 //============================
 //  EXPRESIONES
 //============================
+// De mayor a menor precedencia (como en Python): índice, ** (asociativa por la
+// derecha), signo, * / %, + -, comparaciones, y, o
 expresion
-    : expresion op=(POR|DIV|MOD) expresion          #expMulDiv
+    : expresion ABRECORCHETE expresion CIERRACORCHETE  #expIndice
+    | <assoc=right> expresion op=POTENCIA expresion #expPotencia
+    | (MAS|MENOS) expresion                         #expSigno
+    | expresion op=(POR|DIV|MOD) expresion          #expMulDiv
     | expresion op=(MAS|MENOS) expresion            #expSumaResta
     | expresion op=(MENOR|MAYOR|MENORIGUAL|MAYORIGUAL|IGUAL|DIFERENTE) expresion  #expComparacion
-    | expresion op=(Y|O) expresion                  #expLogica
-    | expresion op=POTENCIA expresion               #expPotencia    
+    | expresion op=Y expresion                      #expLogica
+    | expresion op=O expresion                      #expLogica
     | '(' expresion ')'                             #expParen
-    | (MAS|MENOS) expresion                         #expSigno
+    | ABRECORCHETE (expresion (',' expresion)*)? CIERRACORCHETE  #expLista
     | NUMERO                                        #expNumero
     | TEXTO                                         #expTexto
     | VERDADERO                                     #expVerdadero
@@ -162,6 +207,9 @@ SI          : 'si';
 SINO        : 'sino';
 REPETIR     : 'repetir';
 VECES       : 'veces';
+MIENTRAS    : 'mientras';
+PARA        : 'para';
+CADA        : 'cada';
 IMPRIMIR    : 'imprimir';
 MOSTRAR     : 'mostrar';
 
@@ -214,6 +262,8 @@ Y           : 'y';
 O           : 'o';
 
 // --- Literales y símbolos ---
+ABRECORCHETE   : '[';
+CIERRACORCHETE : ']';
 NUMERO      : [0-9]+ ('.' [0-9]+)?;
 TEXTO       : '"' (~["\\] | '\\' .)* '"' ;
 ID          : [a-zA-ZáéíóúÁÉÍÓÚñÑ_][a-zA-Z0-9áéíóúÁÉÍÓÚñÑ_]* ;
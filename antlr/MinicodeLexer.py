@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,60,483,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,65,516,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
@@ -19,171 +19,183 @@ def serializedATN():
         39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
         45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
         52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
-        58,2,59,7,59,1,0,1,0,1,1,1,1,1,2,1,2,1,3,1,3,1,4,1,4,1,5,1,5,1,5,
-        1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,
-        1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,1,
-        10,1,11,1,11,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,
-        12,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,
-        14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,
-        16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,
-        18,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,
-        20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,
-        21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,
-        23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,
-        25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,
-        27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,
-        29,1,29,1,29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,31,1,
-        31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,
-        32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,
-        34,1,34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,
-        35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,
-        37,1,37,1,37,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
-        38,1,38,1,38,1,38,1,38,3,38,379,8,38,1,39,1,39,1,39,1,39,1,39,1,
-        39,1,40,1,40,1,41,1,41,1,42,1,42,1,43,1,43,1,44,1,44,1,45,1,45,1,
-        45,1,46,1,46,1,47,1,47,1,48,1,48,1,48,1,49,1,49,1,49,1,50,1,50,1,
-        50,1,50,3,50,414,8,50,1,51,1,51,1,51,1,51,1,51,1,51,1,51,3,51,423,
-        8,51,1,52,1,52,1,53,1,53,1,54,4,54,430,8,54,11,54,12,54,431,1,54,
-        1,54,4,54,436,8,54,11,54,12,54,437,3,54,440,8,54,1,55,1,55,1,55,
-        1,55,5,55,446,8,55,10,55,12,55,449,9,55,1,55,1,55,1,56,1,56,5,56,
-        455,8,56,10,56,12,56,458,9,56,1,57,3,57,461,8,57,1,57,4,57,464,8,
-        57,11,57,12,57,465,1,58,4,58,469,8,58,11,58,12,58,470,1,58,1,58,
-        1,59,1,59,5,59,477,8,59,10,59,12,59,480,9,59,1,59,1,59,0,0,60,1,
-        1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,
-        14,29,15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,
-        25,51,26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,
-        36,73,37,75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,
-        47,95,48,97,49,99,50,101,51,103,52,105,53,107,54,109,55,111,56,113,
-        57,115,58,117,59,119,60,1,0,6,1,0,48,57,2,0,34,34,92,92,15,0,65,
-        90,95,95,97,122,193,193,201,201,205,205,209,209,211,211,218,218,
-        225,225,233,233,237,237,241,241,243,243,250,250,16,0,48,57,65,90,
-        95,95,97,122,193,193,201,201,205,205,209,209,211,211,218,218,225,
-        225,233,233,237,237,241,241,243,243,250,250,2,0,9,9,32,32,2,0,10,
-        10,13,13,495,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,
-        1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,
-        1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,
-        1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,
-        1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,
-        1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,
-        1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,
-        1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,
-        1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,
-        1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,
-        1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,
-        0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,
-        0,0,0,0,119,1,0,0,0,1,121,1,0,0,0,3,123,1,0,0,0,5,125,1,0,0,0,7,
-        127,1,0,0,0,9,129,1,0,0,0,11,131,1,0,0,0,13,139,1,0,0,0,15,144,1,
-        0,0,0,17,152,1,0,0,0,19,159,1,0,0,0,21,163,1,0,0,0,23,166,1,0,0,
-        0,25,171,1,0,0,0,27,179,1,0,0,0,29,185,1,0,0,0,31,194,1,0,0,0,33,
-        202,1,0,0,0,35,208,1,0,0,0,37,217,1,0,0,0,39,223,1,0,0,0,41,229,
-        1,0,0,0,43,239,1,0,0,0,45,247,1,0,0,0,47,255,1,0,0,0,49,261,1,0,
-        0,0,51,267,1,0,0,0,53,273,1,0,0,0,55,279,1,0,0,0,57,285,1,0,0,0,
-        59,290,1,0,0,0,61,298,1,0,0,0,63,307,1,0,0,0,65,317,1,0,0,0,67,326,
-        1,0,0,0,69,332,1,0,0,0,71,339,1,0,0,0,73,351,1,0,0,0,75,359,1,0,
-        0,0,77,378,1,0,0,0,79,380,1,0,0,0,81,386,1,0,0,0,83,388,1,0,0,0,
-        85,390,1,0,0,0,87,392,1,0,0,0,89,394,1,0,0,0,91,396,1,0,0,0,93,399,
-        1,0,0,0,95,401,1,0,0,0,97,403,1,0,0,0,99,406,1,0,0,0,101,413,1,0,
-        0,0,103,422,1,0,0,0,105,424,1,0,0,0,107,426,1,0,0,0,109,429,1,0,
-        0,0,111,441,1,0,0,0,113,452,1,0,0,0,115,463,1,0,0,0,117,468,1,0,
-        0,0,119,474,1,0,0,0,121,122,5,61,0,0,122,2,1,0,0,0,123,124,5,40,
-        0,0,124,4,1,0,0,0,125,126,5,41,0,0,126,6,1,0,0,0,127,128,5,58,0,
-        0,128,8,1,0,0,0,129,130,5,44,0,0,130,10,1,0,0,0,131,132,5,100,0,
-        0,132,133,5,101,0,0,133,134,5,102,0,0,134,135,5,105,0,0,135,136,
-        5,110,0,0,136,137,5,105,0,0,137,138,5,114,0,0,138,12,1,0,0,0,139,
-        140,5,99,0,0,140,141,5,111,0,0,141,142,5,109,0,0,142,143,5,111,0,
-        0,143,14,1,0,0,0,144,145,5,102,0,0,145,146,5,117,0,0,146,147,5,110,
-        0,0,147,148,5,99,0,0,148,149,5,105,0,0,149,150,5,111,0,0,150,151,
-        5,110,0,0,151,16,1,0,0,0,152,153,5,108,0,0,153,154,5,108,0,0,154,
-        155,5,97,0,0,155,156,5,109,0,0,156,157,5,97,0,0,157,158,5,114,0,
-        0,158,18,1,0,0,0,159,160,5,102,0,0,160,161,5,105,0,0,161,162,5,110,
-        0,0,162,20,1,0,0,0,163,164,5,115,0,0,164,165,5,105,0,0,165,22,1,
-        0,0,0,166,167,5,115,0,0,167,168,5,105,0,0,168,169,5,110,0,0,169,
-        170,5,111,0,0,170,24,1,0,0,0,171,172,5,114,0,0,172,173,5,101,0,0,
-        173,174,5,112,0,0,174,175,5,101,0,0,175,176,5,116,0,0,176,177,5,
-        105,0,0,177,178,5,114,0,0,178,26,1,0,0,0,179,180,5,118,0,0,180,181,
-        5,101,0,0,181,182,5,99,0,0,182,183,5,101,0,0,183,184,5,115,0,0,184,
-        28,1,0,0,0,185,186,5,105,0,0,186,187,5,109,0,0,187,188,5,112,0,0,
-        188,189,5,114,0,0,189,190,5,105,0,0,190,191,5,109,0,0,191,192,5,
-        105,0,0,192,193,5,114,0,0,193,30,1,0,0,0,194,195,5,109,0,0,195,196,
-        5,111,0,0,196,197,5,115,0,0,197,198,5,116,0,0,198,199,5,114,0,0,
-        199,200,5,97,0,0,200,201,5,114,0,0,201,32,1,0,0,0,202,203,5,109,
-        0,0,203,204,5,111,0,0,204,205,5,118,0,0,205,206,5,101,0,0,206,207,
-        5,114,0,0,207,34,1,0,0,0,208,209,5,97,0,0,209,210,5,100,0,0,210,
-        211,5,101,0,0,211,212,5,108,0,0,212,213,5,97,0,0,213,214,5,110,0,
-        0,214,215,5,116,0,0,215,216,5,101,0,0,216,36,1,0,0,0,217,218,5,97,
-        0,0,218,219,5,116,0,0,219,220,5,114,0,0,220,221,5,97,0,0,221,222,
-        5,115,0,0,222,38,1,0,0,0,223,224,5,103,0,0,224,225,5,105,0,0,225,
-        226,5,114,0,0,226,227,5,97,0,0,227,228,5,114,0,0,228,40,1,0,0,0,
-        229,230,5,105,0,0,230,231,5,122,0,0,231,232,5,113,0,0,232,233,5,
-        117,0,0,233,234,5,105,0,0,234,235,5,101,0,0,235,236,5,114,0,0,236,
-        237,5,100,0,0,237,238,5,97,0,0,238,42,1,0,0,0,239,240,5,100,0,0,
-        240,241,5,101,0,0,241,242,5,114,0,0,242,243,5,101,0,0,243,244,5,
-        99,0,0,244,245,5,104,0,0,245,246,5,97,0,0,246,44,1,0,0,0,247,248,
-        5,99,0,0,248,249,5,97,0,0,249,250,5,109,0,0,250,251,5,98,0,0,251,
-        252,5,105,0,0,252,253,5,97,0,0,253,254,5,114,0,0,254,46,1,0,0,0,
-        255,256,5,99,0,0,256,257,5,111,0,0,257,258,5,108,0,0,258,259,5,111,
-        0,0,259,260,5,114,0,0,260,48,1,0,0,0,261,262,5,98,0,0,262,263,5,
-        97,0,0,263,264,5,106,0,0,264,265,5,97,0,0,265,266,5,114,0,0,266,
-        50,1,0,0,0,267,268,5,115,0,0,268,269,5,117,0,0,269,270,5,98,0,0,
-        270,271,5,105,0,0,271,272,5,114,0,0,272,52,1,0,0,0,273,274,5,108,
-        0,0,274,275,5,97,0,0,275,276,5,112,0,0,276,277,5,105,0,0,277,278,
-        5,122,0,0,278,54,1,0,0,0,279,280,5,116,0,0,280,281,5,111,0,0,281,
-        282,5,99,0,0,282,283,5,97,0,0,283,284,5,114,0,0,284,56,1,0,0,0,285,
-        286,5,110,0,0,286,287,5,111,0,0,287,288,5,116,0,0,288,289,5,97,0,
-        0,289,58,1,0,0,0,290,291,5,100,0,0,291,292,5,117,0,0,292,293,5,114,
-        0,0,293,294,5,97,0,0,294,295,5,110,0,0,295,296,5,116,0,0,296,297,
-        5,101,0,0,297,60,1,0,0,0,298,299,5,115,0,0,299,300,5,101,0,0,300,
-        301,5,103,0,0,301,302,5,117,0,0,302,303,5,110,0,0,303,304,5,100,
-        0,0,304,305,5,111,0,0,305,306,5,115,0,0,306,62,1,0,0,0,307,308,5,
-        112,0,0,308,309,5,111,0,0,309,310,5,108,0,0,310,311,5,105,0,0,311,
-        312,5,110,0,0,312,313,5,111,0,0,313,314,5,109,0,0,314,315,5,105,
-        0,0,315,316,5,111,0,0,316,64,1,0,0,0,317,318,5,103,0,0,318,319,5,
-        114,0,0,319,320,5,97,0,0,320,321,5,102,0,0,321,322,5,105,0,0,322,
-        323,5,99,0,0,323,324,5,97,0,0,324,325,5,114,0,0,325,66,1,0,0,0,326,
-        327,5,115,0,0,327,328,5,117,0,0,328,329,5,109,0,0,329,330,5,97,0,
-        0,330,331,5,114,0,0,331,68,1,0,0,0,332,333,5,114,0,0,333,334,5,101,
-        0,0,334,335,5,115,0,0,335,336,5,116,0,0,336,337,5,97,0,0,337,338,
-        5,114,0,0,338,70,1,0,0,0,339,340,5,109,0,0,340,341,5,117,0,0,341,
-        342,5,108,0,0,342,343,5,116,0,0,343,344,5,105,0,0,344,345,5,112,
-        0,0,345,346,5,108,0,0,346,347,5,105,0,0,347,348,5,99,0,0,348,349,
-        5,97,0,0,349,350,5,114,0,0,350,72,1,0,0,0,351,352,5,100,0,0,352,
-        353,5,105,0,0,353,354,5,118,0,0,354,355,5,105,0,0,355,356,5,100,
-        0,0,356,357,5,105,0,0,357,358,5,114,0,0,358,74,1,0,0,0,359,360,5,
-        99,0,0,360,361,5,111,0,0,361,362,5,110,0,0,362,76,1,0,0,0,363,364,
-        5,118,0,0,364,365,5,101,0,0,365,366,5,114,0,0,366,367,5,100,0,0,
-        367,368,5,97,0,0,368,369,5,100,0,0,369,370,5,101,0,0,370,371,5,114,
-        0,0,371,379,5,111,0,0,372,373,5,99,0,0,373,374,5,105,0,0,374,375,
-        5,101,0,0,375,376,5,114,0,0,376,377,5,116,0,0,377,379,5,111,0,0,
-        378,363,1,0,0,0,378,372,1,0,0,0,379,78,1,0,0,0,380,381,5,102,0,0,
-        381,382,5,97,0,0,382,383,5,108,0,0,383,384,5,115,0,0,384,385,5,111,
-        0,0,385,80,1,0,0,0,386,387,5,43,0,0,387,82,1,0,0,0,388,389,5,45,
-        0,0,389,84,1,0,0,0,390,391,5,42,0,0,391,86,1,0,0,0,392,393,5,47,
-        0,0,393,88,1,0,0,0,394,395,5,37,0,0,395,90,1,0,0,0,396,397,5,42,
-        0,0,397,398,5,42,0,0,398,92,1,0,0,0,399,400,5,60,0,0,400,94,1,0,
-        0,0,401,402,5,62,0,0,402,96,1,0,0,0,403,404,5,60,0,0,404,405,5,61,
-        0,0,405,98,1,0,0,0,406,407,5,62,0,0,407,408,5,61,0,0,408,100,1,0,
-        0,0,409,410,5,61,0,0,410,414,5,61,0,0,411,412,5,101,0,0,412,414,
-        5,115,0,0,413,409,1,0,0,0,413,411,1,0,0,0,414,102,1,0,0,0,415,416,
-        5,33,0,0,416,423,5,61,0,0,417,418,5,110,0,0,418,419,5,111,0,0,419,
-        420,5,32,0,0,420,421,5,101,0,0,421,423,5,115,0,0,422,415,1,0,0,0,
-        422,417,1,0,0,0,423,104,1,0,0,0,424,425,5,121,0,0,425,106,1,0,0,
-        0,426,427,5,111,0,0,427,108,1,0,0,0,428,430,7,0,0,0,429,428,1,0,
-        0,0,430,431,1,0,0,0,431,429,1,0,0,0,431,432,1,0,0,0,432,439,1,0,
-        0,0,433,435,5,46,0,0,434,436,7,0,0,0,435,434,1,0,0,0,436,437,1,0,
-        0,0,437,435,1,0,0,0,437,438,1,0,0,0,438,440,1,0,0,0,439,433,1,0,
-        0,0,439,440,1,0,0,0,440,110,1,0,0,0,441,447,5,34,0,0,442,446,8,1,
-        0,0,443,444,5,92,0,0,444,446,9,0,0,0,445,442,1,0,0,0,445,443,1,0,
-        0,0,446,449,1,0,0,0,447,445,1,0,0,0,447,448,1,0,0,0,448,450,1,0,
-        0,0,449,447,1,0,0,0,450,451,5,34,0,0,451,112,1,0,0,0,452,456,7,2,
-        0,0,453,455,7,3,0,0,454,453,1,0,0,0,455,458,1,0,0,0,456,454,1,0,
-        0,0,456,457,1,0,0,0,457,114,1,0,0,0,458,456,1,0,0,0,459,461,5,13,
-        0,0,460,459,1,0,0,0,460,461,1,0,0,0,461,462,1,0,0,0,462,464,5,10,
-        0,0,463,460,1,0,0,0,464,465,1,0,0,0,465,463,1,0,0,0,465,466,1,0,
-        0,0,466,116,1,0,0,0,467,469,7,4,0,0,468,467,1,0,0,0,469,470,1,0,
-        0,0,470,468,1,0,0,0,470,471,1,0,0,0,471,472,1,0,0,0,472,473,6,58,
-        0,0,473,118,1,0,0,0,474,478,5,35,0,0,475,477,8,5,0,0,476,475,1,0,
-        0,0,477,480,1,0,0,0,478,476,1,0,0,0,478,479,1,0,0,0,479,481,1,0,
-        0,0,480,478,1,0,0,0,481,482,6,59,0,0,482,120,1,0,0,0,14,0,378,413,
-        422,431,437,439,445,447,456,460,465,470,478,1,6,0,0
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,1,
+        0,1,0,1,1,1,1,1,2,1,2,1,3,1,3,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,
+        5,1,5,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,
+        8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,11,1,11,1,
+        11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,
+        13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,
+        15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,
+        17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,
+        18,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,20,1,
+        20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,
+        22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,24,1,
+        24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,25,1,
+        25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,
+        27,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,29,1,
+        30,1,30,1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,32,1,32,1,
+        32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,
+        33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,
+        35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,
+        36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,
+        39,1,39,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,
+        41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,3,41,408,8,41,1,42,1,42,1,
+        42,1,42,1,42,1,42,1,43,1,43,1,44,1,44,1,45,1,45,1,46,1,46,1,47,1,
+        47,1,48,1,48,1,48,1,49,1,49,1,50,1,50,1,51,1,51,1,51,1,52,1,52,1,
+        52,1,53,1,53,1,53,1,53,3,53,443,8,53,1,54,1,54,1,54,1,54,1,54,1,
+        54,1,54,3,54,452,8,54,1,55,1,55,1,56,1,56,1,57,1,57,1,58,1,58,1,
+        59,4,59,463,8,59,11,59,12,59,464,1,59,1,59,4,59,469,8,59,11,59,12,
+        59,470,3,59,473,8,59,1,60,1,60,1,60,1,60,5,60,479,8,60,10,60,12,
+        60,482,9,60,1,60,1,60,1,61,1,61,5,61,488,8,61,10,61,12,61,491,9,
+        61,1,62,3,62,494,8,62,1,62,4,62,497,8,62,11,62,12,62,498,1,63,4,
+        63,502,8,63,11,63,12,63,503,1,63,1,63,1,64,1,64,5,64,510,8,64,10,
+        64,12,64,513,9,64,1,64,1,64,0,0,65,1,1,3,2,5,3,7,4,9,5,11,6,13,7,
+        15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,
+        37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,
+        59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,
+        81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,
+        51,103,52,105,53,107,54,109,55,111,56,113,57,115,58,117,59,119,60,
+        121,61,123,62,125,63,127,64,129,65,1,0,6,1,0,48,57,2,0,34,34,92,
+        92,15,0,65,90,95,95,97,122,193,193,201,201,205,205,209,209,211,211,
+        218,218,225,225,233,233,237,237,241,241,243,243,250,250,16,0,48,
+        57,65,90,95,95,97,122,193,193,201,201,205,205,209,209,211,211,218,
+        218,225,225,233,233,237,237,241,241,243,243,250,250,2,0,9,9,32,32,
+        2,0,10,10,13,13,528,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,
+        0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,
+        0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,
+        0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,
+        0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,
+        0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,
+        0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,
+        0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,
+        0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,
+        0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,
+        0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,
+        1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,
+        0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,0,0,0,0,123,1,0,0,0,0,125,1,
+        0,0,0,0,127,1,0,0,0,0,129,1,0,0,0,1,131,1,0,0,0,3,133,1,0,0,0,5,
+        135,1,0,0,0,7,137,1,0,0,0,9,139,1,0,0,0,11,141,1,0,0,0,13,149,1,
+        0,0,0,15,154,1,0,0,0,17,162,1,0,0,0,19,169,1,0,0,0,21,173,1,0,0,
+        0,23,176,1,0,0,0,25,181,1,0,0,0,27,189,1,0,0,0,29,195,1,0,0,0,31,
+        204,1,0,0,0,33,209,1,0,0,0,35,214,1,0,0,0,37,223,1,0,0,0,39,231,
+        1,0,0,0,41,237,1,0,0,0,43,246,1,0,0,0,45,252,1,0,0,0,47,258,1,0,
+        0,0,49,268,1,0,0,0,51,276,1,0,0,0,53,284,1,0,0,0,55,290,1,0,0,0,
+        57,296,1,0,0,0,59,302,1,0,0,0,61,308,1,0,0,0,63,314,1,0,0,0,65,319,
+        1,0,0,0,67,327,1,0,0,0,69,336,1,0,0,0,71,346,1,0,0,0,73,355,1,0,
+        0,0,75,361,1,0,0,0,77,368,1,0,0,0,79,380,1,0,0,0,81,388,1,0,0,0,
+        83,407,1,0,0,0,85,409,1,0,0,0,87,415,1,0,0,0,89,417,1,0,0,0,91,419,
+        1,0,0,0,93,421,1,0,0,0,95,423,1,0,0,0,97,425,1,0,0,0,99,428,1,0,
+        0,0,101,430,1,0,0,0,103,432,1,0,0,0,105,435,1,0,0,0,107,442,1,0,
+        0,0,109,451,1,0,0,0,111,453,1,0,0,0,113,455,1,0,0,0,115,457,1,0,
+        0,0,117,459,1,0,0,0,119,462,1,0,0,0,121,474,1,0,0,0,123,485,1,0,
+        0,0,125,496,1,0,0,0,127,501,1,0,0,0,129,507,1,0,0,0,131,132,5,61,
+        0,0,132,2,1,0,0,0,133,134,5,40,0,0,134,4,1,0,0,0,135,136,5,41,0,
+        0,136,6,1,0,0,0,137,138,5,58,0,0,138,8,1,0,0,0,139,140,5,44,0,0,
+        140,10,1,0,0,0,141,142,5,100,0,0,142,143,5,101,0,0,143,144,5,102,
+        0,0,144,145,5,105,0,0,145,146,5,110,0,0,146,147,5,105,0,0,147,148,
+        5,114,0,0,148,12,1,0,0,0,149,150,5,99,0,0,150,151,5,111,0,0,151,
+        152,5,109,0,0,152,153,5,111,0,0,153,14,1,0,0,0,154,155,5,102,0,0,
+        155,156,5,117,0,0,156,157,5,110,0,0,157,158,5,99,0,0,158,159,5,105,
+        0,0,159,160,5,111,0,0,160,161,5,110,0,0,161,16,1,0,0,0,162,163,5,
+        108,0,0,163,164,5,108,0,0,164,165,5,97,0,0,165,166,5,109,0,0,166,
+        167,5,97,0,0,167,168,5,114,0,0,168,18,1,0,0,0,169,170,5,102,0,0,
+        170,171,5,105,0,0,171,172,5,110,0,0,172,20,1,0,0,0,173,174,5,115,
+        0,0,174,175,5,105,0,0,175,22,1,0,0,0,176,177,5,115,0,0,177,178,5,
+        105,0,0,178,179,5,110,0,0,179,180,5,111,0,0,180,24,1,0,0,0,181,182,
+        5,114,0,0,182,183,5,101,0,0,183,184,5,112,0,0,184,185,5,101,0,0,
+        185,186,5,116,0,0,186,187,5,105,0,0,187,188,5,114,0,0,188,26,1,0,
+        0,0,189,190,5,118,0,0,190,191,5,101,0,0,191,192,5,99,0,0,192,193,
+        5,101,0,0,193,194,5,115,0,0,194,28,1,0,0,0,195,196,5,109,0,0,196,
+        197,5,105,0,0,197,198,5,101,0,0,198,199,5,110,0,0,199,200,5,116,
+        0,0,200,201,5,114,0,0,201,202,5,97,0,0,202,203,5,115,0,0,203,30,
+        1,0,0,0,204,205,5,112,0,0,205,206,5,97,0,0,206,207,5,114,0,0,207,
+        208,5,97,0,0,208,32,1,0,0,0,209,210,5,99,0,0,210,211,5,97,0,0,211,
+        212,5,100,0,0,212,213,5,97,0,0,213,34,1,0,0,0,214,215,5,105,0,0,
+        215,216,5,109,0,0,216,217,5,112,0,0,217,218,5,114,0,0,218,219,5,
+        105,0,0,219,220,5,109,0,0,220,221,5,105,0,0,221,222,5,114,0,0,222,
+        36,1,0,0,0,223,224,5,109,0,0,224,225,5,111,0,0,225,226,5,115,0,0,
+        226,227,5,116,0,0,227,228,5,114,0,0,228,229,5,97,0,0,229,230,5,114,
+        0,0,230,38,1,0,0,0,231,232,5,109,0,0,232,233,5,111,0,0,233,234,5,
+        118,0,0,234,235,5,101,0,0,235,236,5,114,0,0,236,40,1,0,0,0,237,238,
+        5,97,0,0,238,239,5,100,0,0,239,240,5,101,0,0,240,241,5,108,0,0,241,
+        242,5,97,0,0,242,243,5,110,0,0,243,244,5,116,0,0,244,245,5,101,0,
+        0,245,42,1,0,0,0,246,247,5,97,0,0,247,248,5,116,0,0,248,249,5,114,
+        0,0,249,250,5,97,0,0,250,251,5,115,0,0,251,44,1,0,0,0,252,253,5,
+        103,0,0,253,254,5,105,0,0,254,255,5,114,0,0,255,256,5,97,0,0,256,
+        257,5,114,0,0,257,46,1,0,0,0,258,259,5,105,0,0,259,260,5,122,0,0,
+        260,261,5,113,0,0,261,262,5,117,0,0,262,263,5,105,0,0,263,264,5,
+        101,0,0,264,265,5,114,0,0,265,266,5,100,0,0,266,267,5,97,0,0,267,
+        48,1,0,0,0,268,269,5,100,0,0,269,270,5,101,0,0,270,271,5,114,0,0,
+        271,272,5,101,0,0,272,273,5,99,0,0,273,274,5,104,0,0,274,275,5,97,
+        0,0,275,50,1,0,0,0,276,277,5,99,0,0,277,278,5,97,0,0,278,279,5,109,
+        0,0,279,280,5,98,0,0,280,281,5,105,0,0,281,282,5,97,0,0,282,283,
+        5,114,0,0,283,52,1,0,0,0,284,285,5,99,0,0,285,286,5,111,0,0,286,
+        287,5,108,0,0,287,288,5,111,0,0,288,289,5,114,0,0,289,54,1,0,0,0,
+        290,291,5,98,0,0,291,292,5,97,0,0,292,293,5,106,0,0,293,294,5,97,
+        0,0,294,295,5,114,0,0,295,56,1,0,0,0,296,297,5,115,0,0,297,298,5,
+        117,0,0,298,299,5,98,0,0,299,300,5,105,0,0,300,301,5,114,0,0,301,
+        58,1,0,0,0,302,303,5,108,0,0,303,304,5,97,0,0,304,305,5,112,0,0,
+        305,306,5,105,0,0,306,307,5,122,0,0,307,60,1,0,0,0,308,309,5,116,
+        0,0,309,310,5,111,0,0,310,311,5,99,0,0,311,312,5,97,0,0,312,313,
+        5,114,0,0,313,62,1,0,0,0,314,315,5,110,0,0,315,316,5,111,0,0,316,
+        317,5,116,0,0,317,318,5,97,0,0,318,64,1,0,0,0,319,320,5,100,0,0,
+        320,321,5,117,0,0,321,322,5,114,0,0,322,323,5,97,0,0,323,324,5,110,
+        0,0,324,325,5,116,0,0,325,326,5,101,0,0,326,66,1,0,0,0,327,328,5,
+        115,0,0,328,329,5,101,0,0,329,330,5,103,0,0,330,331,5,117,0,0,331,
+        332,5,110,0,0,332,333,5,100,0,0,333,334,5,111,0,0,334,335,5,115,
+        0,0,335,68,1,0,0,0,336,337,5,112,0,0,337,338,5,111,0,0,338,339,5,
+        108,0,0,339,340,5,105,0,0,340,341,5,110,0,0,341,342,5,111,0,0,342,
+        343,5,109,0,0,343,344,5,105,0,0,344,345,5,111,0,0,345,70,1,0,0,0,
+        346,347,5,103,0,0,347,348,5,114,0,0,348,349,5,97,0,0,349,350,5,102,
+        0,0,350,351,5,105,0,0,351,352,5,99,0,0,352,353,5,97,0,0,353,354,
+        5,114,0,0,354,72,1,0,0,0,355,356,5,115,0,0,356,357,5,117,0,0,357,
+        358,5,109,0,0,358,359,5,97,0,0,359,360,5,114,0,0,360,74,1,0,0,0,
+        361,362,5,114,0,0,362,363,5,101,0,0,363,364,5,115,0,0,364,365,5,
+        116,0,0,365,366,5,97,0,0,366,367,5,114,0,0,367,76,1,0,0,0,368,369,
+        5,109,0,0,369,370,5,117,0,0,370,371,5,108,0,0,371,372,5,116,0,0,
+        372,373,5,105,0,0,373,374,5,112,0,0,374,375,5,108,0,0,375,376,5,
+        105,0,0,376,377,5,99,0,0,377,378,5,97,0,0,378,379,5,114,0,0,379,
+        78,1,0,0,0,380,381,5,100,0,0,381,382,5,105,0,0,382,383,5,118,0,0,
+        383,384,5,105,0,0,384,385,5,100,0,0,385,386,5,105,0,0,386,387,5,
+        114,0,0,387,80,1,0,0,0,388,389,5,99,0,0,389,390,5,111,0,0,390,391,
+        5,110,0,0,391,82,1,0,0,0,392,393,5,118,0,0,393,394,5,101,0,0,394,
+        395,5,114,0,0,395,396,5,100,0,0,396,397,5,97,0,0,397,398,5,100,0,
+        0,398,399,5,101,0,0,399,400,5,114,0,0,400,408,5,111,0,0,401,402,
+        5,99,0,0,402,403,5,105,0,0,403,404,5,101,0,0,404,405,5,114,0,0,405,
+        406,5,116,0,0,406,408,5,111,0,0,407,392,1,0,0,0,407,401,1,0,0,0,
+        408,84,1,0,0,0,409,410,5,102,0,0,410,411,5,97,0,0,411,412,5,108,
+        0,0,412,413,5,115,0,0,413,414,5,111,0,0,414,86,1,0,0,0,415,416,5,
+        43,0,0,416,88,1,0,0,0,417,418,5,45,0,0,418,90,1,0,0,0,419,420,5,
+        42,0,0,420,92,1,0,0,0,421,422,5,47,0,0,422,94,1,0,0,0,423,424,5,
+        37,0,0,424,96,1,0,0,0,425,426,5,42,0,0,426,427,5,42,0,0,427,98,1,
+        0,0,0,428,429,5,60,0,0,429,100,1,0,0,0,430,431,5,62,0,0,431,102,
+        1,0,0,0,432,433,5,60,0,0,433,434,5,61,0,0,434,104,1,0,0,0,435,436,
+        5,62,0,0,436,437,5,61,0,0,437,106,1,0,0,0,438,439,5,61,0,0,439,443,
+        5,61,0,0,440,441,5,101,0,0,441,443,5,115,0,0,442,438,1,0,0,0,442,
+        440,1,0,0,0,443,108,1,0,0,0,444,445,5,33,0,0,445,452,5,61,0,0,446,
+        447,5,110,0,0,447,448,5,111,0,0,448,449,5,32,0,0,449,450,5,101,0,
+        0,450,452,5,115,0,0,451,444,1,0,0,0,451,446,1,0,0,0,452,110,1,0,
+        0,0,453,454,5,121,0,0,454,112,1,0,0,0,455,456,5,111,0,0,456,114,
+        1,0,0,0,457,458,5,91,0,0,458,116,1,0,0,0,459,460,5,93,0,0,460,118,
+        1,0,0,0,461,463,7,0,0,0,462,461,1,0,0,0,463,464,1,0,0,0,464,462,
+        1,0,0,0,464,465,1,0,0,0,465,472,1,0,0,0,466,468,5,46,0,0,467,469,
+        7,0,0,0,468,467,1,0,0,0,469,470,1,0,0,0,470,468,1,0,0,0,470,471,
+        1,0,0,0,471,473,1,0,0,0,472,466,1,0,0,0,472,473,1,0,0,0,473,120,
+        1,0,0,0,474,480,5,34,0,0,475,479,8,1,0,0,476,477,5,92,0,0,477,479,
+        9,0,0,0,478,475,1,0,0,0,478,476,1,0,0,0,479,482,1,0,0,0,480,478,
+        1,0,0,0,480,481,1,0,0,0,481,483,1,0,0,0,482,480,1,0,0,0,483,484,
+        5,34,0,0,484,122,1,0,0,0,485,489,7,2,0,0,486,488,7,3,0,0,487,486,
+        1,0,0,0,488,491,1,0,0,0,489,487,1,0,0,0,489,490,1,0,0,0,490,124,
+        1,0,0,0,491,489,1,0,0,0,492,494,5,13,0,0,493,492,1,0,0,0,493,494,
+        1,0,0,0,494,495,1,0,0,0,495,497,5,10,0,0,496,493,1,0,0,0,497,498,
+        1,0,0,0,498,496,1,0,0,0,498,499,1,0,0,0,499,126,1,0,0,0,500,502,
+        7,4,0,0,501,500,1,0,0,0,502,503,1,0,0,0,503,501,1,0,0,0,503,504,
+        1,0,0,0,504,505,1,0,0,0,505,506,6,63,0,0,506,128,1,0,0,0,507,511,
+        5,35,0,0,508,510,8,5,0,0,509,508,1,0,0,0,510,513,1,0,0,0,511,509,
+        1,0,0,0,511,512,1,0,0,0,512,514,1,0,0,0,513,511,1,0,0,0,514,515,
+        6,64,0,0,515,130,1,0,0,0,14,0,407,442,451,464,470,472,478,480,489,
+        493,498,503,511,1,6,0,0
     ]
 
 class MinicodeLexer(Lexer):
@@ -206,52 +218,57 @@ class MinicodeLexer(Lexer):
     SINO = 12
     REPETIR = 13
     VECES = 14
-    IMPRIMIR = 15
-    MOSTRAR = 16
-    MOVER = 17
-    ADELANTE = 18
-    ATRAS = 19
-    GIRAR = 20
-    IZQUIERDA = 21
-    DERECHA = 22
-    CAMBIAR = 23
-    COLOR = 24
-    BAJAR = 25
-    SUBIR = 26
-    LAPIZ = 27
-    TOCAR = 28
-    NOTA = 29
-    DURANTE = 30
-    SEGUNDOS = 31
-    POLINOMIO = 32
-    GRAFICAR = 33
-    SUMAR = 34
-    RESTAR = 35
-    MULTIPLICAR = 36
-    DIVIDIR = 37
-    CON = 38
-    VERDADERO = 39
-    FALSO = 40
-    MAS = 41
-    MENOS = 42
-    POR = 43
-    DIV = 44
-    MOD = 45
-    POTENCIA = 46
-    MENOR = 47
-    MAYOR = 48
-    MENORIGUAL = 49
-    MAYORIGUAL = 50
-    IGUAL = 51
-    DIFERENTE = 52
-    Y = 53
-    O = 54
-    NUMERO = 55
-    TEXTO = 56
-    ID = 57
-    NUEVALINEA = 58
-    ESPACIOS = 59
-    COMENTARIO = 60
+    MIENTRAS = 15
+    PARA = 16
+    CADA = 17
+    IMPRIMIR = 18
+    MOSTRAR = 19
+    MOVER = 20
+    ADELANTE = 21
+    ATRAS = 22
+    GIRAR = 23
+    IZQUIERDA = 24
+    DERECHA = 25
+    CAMBIAR = 26
+    COLOR = 27
+    BAJAR = 28
+    SUBIR = 29
+    LAPIZ = 30
+    TOCAR = 31
+    NOTA = 32
+    DURANTE = 33
+    SEGUNDOS = 34
+    POLINOMIO = 35
+    GRAFICAR = 36
+    SUMAR = 37
+    RESTAR = 38
+    MULTIPLICAR = 39
+    DIVIDIR = 40
+    CON = 41
+    VERDADERO = 42
+    FALSO = 43
+    MAS = 44
+    MENOS = 45
+    POR = 46
+    DIV = 47
+    MOD = 48
+    POTENCIA = 49
+    MENOR = 50
+    MAYOR = 51
+    MENORIGUAL = 52
+    MAYORIGUAL = 53
+    IGUAL = 54
+    DIFERENTE = 55
+    Y = 56
+    O = 57
+    ABRECORCHETE = 58
+    CIERRACORCHETE = 59
+    NUMERO = 60
+    TEXTO = 61
+    ID = 62
+    NUEVALINEA = 63
+    ESPACIOS = 64
+    COMENTARIO = 65
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -260,35 +277,37 @@ class MinicodeLexer(Lexer):
     literalNames = [ "<INVALID>",
             "'='", "'('", "')'", "':'", "','", "'definir'", "'como'", "'funcion'", 
             "'llamar'", "'fin'", "'si'", "'sino'", "'repetir'", "'veces'", 
-            "'imprimir'", "'mostrar'", "'mover'", "'adelante'", "'atras'", 
-            "'girar'", "'izquierda'", "'derecha'", "'cambiar'", "'color'", 
-            "'bajar'", "'subir'", "'lapiz'", "'tocar'", "'nota'", "'durante'", 
-            "'segundos'", "'polinomio'", "'graficar'", "'sumar'", "'restar'", 
-            "'multiplicar'", "'dividir'", "'con'", "'falso'", "'+'", "'-'", 
-            "'*'", "'/'", "'%'", "'**'", "'<'", "'>'", "'<='", "'>='", "'y'", 
-            "'o'" ]
+            "'mientras'", "'para'", "'cada'", "'imprimir'", "'mostrar'", 
+            "'mover'", "'adelante'", "'atras'", "'girar'", "'izquierda'", 
+            "'derecha'", "'cambiar'", "'color'", "'bajar'", "'subir'", "'lapiz'", 
+            "'tocar'", "'nota'", "'durante'", "'segundos'", "'polinomio'", 
+            "'graficar'", "'sumar'", "'restar'", "'multiplicar'", "'dividir'", 
+            "'con'", "'falso'", "'+'", "'-'", "'*'", "'/'", "'%'", "'**'", 
+            "'<'", "'>'", "'<='", "'>='", "'y'", "'o'", "'['", "']'" ]
 
     symbolicNames = [ "<INVALID>",
             "DEFINIR", "COMO", "FUNCION", "LLAMAR", "FIN", "SI", "SINO", 
-            "REPETIR", "VECES", "IMPRIMIR", "MOSTRAR", "MOVER", "ADELANTE", 
-            "ATRAS", "GIRAR", "IZQUIERDA", "DERECHA", "CAMBIAR", "COLOR", 
-            "BAJAR", "SUBIR", "LAPIZ", "TOCAR", "NOTA", "DURANTE", "SEGUNDOS", 
-            "POLINOMIO", "GRAFICAR", "SUMAR", "RESTAR", "MULTIPLICAR", "DIVIDIR", 
-            "CON", "VERDADERO", "FALSO", "MAS", "MENOS", "POR", "DIV", "MOD", 
-            "POTENCIA", "MENOR", "MAYOR", "MENORIGUAL", "MAYORIGUAL", "IGUAL", 
-            "DIFERENTE", "Y", "O", "NUMERO", "TEXTO", "ID", "NUEVALINEA", 
+            "REPETIR", "VECES", "MIENTRAS", "PARA", "CADA", "IMPRIMIR", 
+            "MOSTRAR", "MOVER", "ADELANTE", "ATRAS", "GIRAR", "IZQUIERDA", 
+            "DERECHA", "CAMBIAR", "COLOR", "BAJAR", "SUBIR", "LAPIZ", "TOCAR", 
+            "NOTA", "DURANTE", "SEGUNDOS", "POLINOMIO", "GRAFICAR", "SUMAR", 
+            "RESTAR", "MULTIPLICAR", "DIVIDIR", "CON", "VERDADERO", "FALSO", 
+            "MAS", "MENOS", "POR", "DIV", "MOD", "POTENCIA", "MENOR", "MAYOR", 
+            "MENORIGUAL", "MAYORIGUAL", "IGUAL", "DIFERENTE", "Y", "O", 
+            "ABRECORCHETE", "CIERRACORCHETE", "NUMERO", "TEXTO", "ID", "NUEVALINEA", 
             "ESPACIOS", "COMENTARIO" ]
 
     ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "DEFINIR", "COMO", 
                   "FUNCION", "LLAMAR", "FIN", "SI", "SINO", "REPETIR", "VECES", 
-                  "IMPRIMIR", "MOSTRAR", "MOVER", "ADELANTE", "ATRAS", "GIRAR", 
-                  "IZQUIERDA", "DERECHA", "CAMBIAR", "COLOR", "BAJAR", "SUBIR", 
-                  "LAPIZ", "TOCAR", "NOTA", "DURANTE", "SEGUNDOS", "POLINOMIO", 
-                  "GRAFICAR", "SUMAR", "RESTAR", "MULTIPLICAR", "DIVIDIR", 
-                  "CON", "VERDADERO", "FALSO", "MAS", "MENOS", "POR", "DIV", 
-                  "MOD", "POTENCIA", "MENOR", "MAYOR", "MENORIGUAL", "MAYORIGUAL", 
-                  "IGUAL", "DIFERENTE", "Y", "O", "NUMERO", "TEXTO", "ID", 
-                  "NUEVALINEA", "ESPACIOS", "COMENTARIO" ]
+                  "MIENTRAS", "PARA", "CADA", "IMPRIMIR", "MOSTRAR", "MOVER", 
+                  "ADELANTE", "ATRAS", "GIRAR", "IZQUIERDA", "DERECHA", 
+                  "CAMBIAR", "COLOR", "BAJAR", "SUBIR", "LAPIZ", "TOCAR", 
+                  "NOTA", "DURANTE", "SEGUNDOS", "POLINOMIO", "GRAFICAR", 
+                  "SUMAR", "RESTAR", "MULTIPLICAR", "DIVIDIR", "CON", "VERDADERO", 
+                  "FALSO", "MAS", "MENOS", "POR", "DIV", "MOD", "POTENCIA", 
+                  "MENOR", "MAYOR", "MENORIGUAL", "MAYORIGUAL", "IGUAL", 
+                  "DIFERENTE", "Y", "O", "ABRECORCHETE", "CIERRACORCHETE", 
+                  "NUMERO", "TEXTO", "ID", "NUEVALINEA", "ESPACIOS", "COMENTARIO" ]
 
     grammarFileName = "Minicode.g4"
 
@@ -10,105 +10,137 @@ else:
 
 def serializedATN():
     return [
-        4,1,60,264,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,65,350,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
-        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,1,0,5,0,40,8,0,
-        10,0,12,0,43,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,3,1,61,8,1,1,2,1,2,1,2,1,2,3,2,67,8,2,1,2,3,2,70,
-        8,2,1,3,1,3,1,3,1,3,3,3,76,8,3,1,4,1,4,1,4,1,4,3,4,82,8,4,1,4,1,
-        4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,5,5,93,8,5,10,5,12,5,96,9,5,1,6,1,
-        6,1,6,1,6,3,6,102,8,6,1,6,3,6,105,8,6,1,6,3,6,108,8,6,1,6,1,6,1,
-        6,3,6,113,8,6,1,6,1,6,3,6,117,8,6,3,6,119,8,6,1,7,1,7,1,7,5,7,124,
-        8,7,10,7,12,7,127,9,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,3,8,138,
-        8,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,10,4,10,151,8,10,11,
-        10,12,10,152,1,11,1,11,1,11,3,11,158,8,11,1,12,1,12,1,12,3,12,163,
-        8,12,1,12,1,12,1,12,3,12,168,8,12,1,12,1,12,1,12,3,12,173,8,12,1,
-        12,1,12,1,12,3,12,178,8,12,1,12,1,12,1,12,1,12,3,12,184,8,12,1,12,
-        3,12,187,8,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,3,13,196,8,13,1,
-        13,3,13,199,8,13,1,14,1,14,1,14,1,14,1,14,1,14,3,14,207,8,14,1,15,
-        1,15,1,15,1,15,3,15,213,8,15,1,16,1,16,1,16,3,16,218,8,16,1,17,1,
-        17,1,17,1,17,1,17,1,17,1,17,3,17,227,8,17,1,18,1,18,1,18,1,18,1,
-        18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,3,18,242,8,18,1,18,1,
-        18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,
-        18,5,18,259,8,18,10,18,12,18,262,9,18,1,18,0,1,36,19,0,2,4,6,8,10,
-        12,14,16,18,20,22,24,26,28,30,32,34,36,0,8,1,0,15,16,1,0,21,22,1,
-        0,34,37,2,0,38,38,43,43,1,0,41,42,1,0,43,45,1,0,47,52,1,0,53,54,
-        301,0,41,1,0,0,0,2,60,1,0,0,0,4,62,1,0,0,0,6,71,1,0,0,0,8,77,1,0,
-        0,0,10,89,1,0,0,0,12,118,1,0,0,0,14,120,1,0,0,0,16,128,1,0,0,0,18,
-        141,1,0,0,0,20,150,1,0,0,0,22,154,1,0,0,0,24,183,1,0,0,0,26,188,
-        1,0,0,0,28,200,1,0,0,0,30,208,1,0,0,0,32,214,1,0,0,0,34,219,1,0,
-        0,0,36,241,1,0,0,0,38,40,3,2,1,0,39,38,1,0,0,0,40,43,1,0,0,0,41,
-        39,1,0,0,0,41,42,1,0,0,0,42,44,1,0,0,0,43,41,1,0,0,0,44,45,5,0,0,
-        1,45,1,1,0,0,0,46,61,3,4,2,0,47,61,3,6,3,0,48,61,3,22,11,0,49,61,
-        3,18,9,0,50,61,3,16,8,0,51,61,3,8,4,0,52,61,3,12,6,0,53,61,3,24,
-        12,0,54,61,3,26,13,0,55,61,3,28,14,0,56,61,3,34,17,0,57,61,3,30,
-        15,0,58,61,3,32,16,0,59,61,5,58,0,0,60,46,1,0,0,0,60,47,1,0,0,0,
-        60,48,1,0,0,0,60,49,1,0,0,0,60,50,1,0,0,0,60,51,1,0,0,0,60,52,1,
-        0,0,0,60,53,1,0,0,0,60,54,1,0,0,0,60,55,1,0,0,0,60,56,1,0,0,0,60,
-        57,1,0,0,0,60,58,1,0,0,0,60,59,1,0,0,0,61,3,1,0,0,0,62,63,5,6,0,
-        0,63,66,5,57,0,0,64,65,5,7,0,0,65,67,3,36,18,0,66,64,1,0,0,0,66,
-        67,1,0,0,0,67,69,1,0,0,0,68,70,5,58,0,0,69,68,1,0,0,0,69,70,1,0,
-        0,0,70,5,1,0,0,0,71,72,5,57,0,0,72,73,5,1,0,0,73,75,3,36,18,0,74,
-        76,5,58,0,0,75,74,1,0,0,0,75,76,1,0,0,0,76,7,1,0,0,0,77,78,5,8,0,
-        0,78,79,5,57,0,0,79,81,5,2,0,0,80,82,3,10,5,0,81,80,1,0,0,0,81,82,
-        1,0,0,0,82,83,1,0,0,0,83,84,5,3,0,0,84,85,5,4,0,0,85,86,5,58,0,0,
-        86,87,3,20,10,0,87,88,5,10,0,0,88,9,1,0,0,0,89,94,5,57,0,0,90,91,
-        5,5,0,0,91,93,5,57,0,0,92,90,1,0,0,0,93,96,1,0,0,0,94,92,1,0,0,0,
-        94,95,1,0,0,0,95,11,1,0,0,0,96,94,1,0,0,0,97,98,5,9,0,0,98,104,5,
-        57,0,0,99,101,5,2,0,0,100,102,3,14,7,0,101,100,1,0,0,0,101,102,1,
-        0,0,0,102,103,1,0,0,0,103,105,5,3,0,0,104,99,1,0,0,0,104,105,1,0,
-        0,0,105,107,1,0,0,0,106,108,5,58,0,0,107,106,1,0,0,0,107,108,1,0,
-        0,0,108,119,1,0,0,0,109,110,5,57,0,0,110,112,5,2,0,0,111,113,3,14,
-        7,0,112,111,1,0,0,0,112,113,1,0,0,0,113,114,1,0,0,0,114,116,5,3,
-        0,0,115,117,5,58,0,0,116,115,1,0,0,0,116,117,1,0,0,0,117,119,1,0,
-        0,0,118,97,1,0,0,0,118,109,1,0,0,0,119,13,1,0,0,0,120,125,3,36,18,
-        0,121,122,5,5,0,0,122,124,3,36,18,0,123,121,1,0,0,0,124,127,1,0,
-        0,0,125,123,1,0,0,0,125,126,1,0,0,0,126,15,1,0,0,0,127,125,1,0,0,
-        0,128,129,5,11,0,0,129,130,3,36,18,0,130,131,5,4,0,0,131,132,5,58,
-        0,0,132,137,3,20,10,0,133,134,5,12,0,0,134,135,5,4,0,0,135,136,5,
-        58,0,0,136,138,3,20,10,0,137,133,1,0,0,0,137,138,1,0,0,0,138,139,
-        1,0,0,0,139,140,5,10,0,0,140,17,1,0,0,0,141,142,5,13,0,0,142,143,
-        3,36,18,0,143,144,5,14,0,0,144,145,5,4,0,0,145,146,5,58,0,0,146,
-        147,3,20,10,0,147,148,5,10,0,0,148,19,1,0,0,0,149,151,3,2,1,0,150,
-        149,1,0,0,0,151,152,1,0,0,0,152,150,1,0,0,0,152,153,1,0,0,0,153,
-        21,1,0,0,0,154,155,7,0,0,0,155,157,3,36,18,0,156,158,5,58,0,0,157,
-        156,1,0,0,0,157,158,1,0,0,0,158,23,1,0,0,0,159,160,5,17,0,0,160,
-        162,5,18,0,0,161,163,3,36,18,0,162,161,1,0,0,0,162,163,1,0,0,0,163,
-        184,1,0,0,0,164,165,5,17,0,0,165,167,5,19,0,0,166,168,3,36,18,0,
-        167,166,1,0,0,0,167,168,1,0,0,0,168,184,1,0,0,0,169,170,5,20,0,0,
-        170,172,7,1,0,0,171,173,3,36,18,0,172,171,1,0,0,0,172,173,1,0,0,
-        0,173,184,1,0,0,0,174,175,5,23,0,0,175,177,5,24,0,0,176,178,3,36,
-        18,0,177,176,1,0,0,0,177,178,1,0,0,0,178,184,1,0,0,0,179,180,5,25,
-        0,0,180,184,5,27,0,0,181,182,5,26,0,0,182,184,5,27,0,0,183,159,1,
-        0,0,0,183,164,1,0,0,0,183,169,1,0,0,0,183,174,1,0,0,0,183,179,1,
-        0,0,0,183,181,1,0,0,0,184,186,1,0,0,0,185,187,5,58,0,0,186,185,1,
-        0,0,0,186,187,1,0,0,0,187,25,1,0,0,0,188,189,5,28,0,0,189,190,5,
-        29,0,0,190,195,5,57,0,0,191,192,5,30,0,0,192,193,3,36,18,0,193,194,
-        5,31,0,0,194,196,1,0,0,0,195,191,1,0,0,0,195,196,1,0,0,0,196,198,
-        1,0,0,0,197,199,5,58,0,0,198,197,1,0,0,0,198,199,1,0,0,0,199,27,
-        1,0,0,0,200,201,5,6,0,0,201,202,5,32,0,0,202,203,5,57,0,0,203,204,
-        5,1,0,0,204,206,3,36,18,0,205,207,5,58,0,0,206,205,1,0,0,0,206,207,
-        1,0,0,0,207,29,1,0,0,0,208,209,5,16,0,0,209,210,5,32,0,0,210,212,
-        5,57,0,0,211,213,5,58,0,0,212,211,1,0,0,0,212,213,1,0,0,0,213,31,
-        1,0,0,0,214,215,5,33,0,0,215,217,5,57,0,0,216,218,5,58,0,0,217,216,
-        1,0,0,0,217,218,1,0,0,0,218,33,1,0,0,0,219,220,7,2,0,0,220,221,5,
-        32,0,0,221,222,5,57,0,0,222,223,7,3,0,0,223,224,5,32,0,0,224,226,
-        5,57,0,0,225,227,5,58,0,0,226,225,1,0,0,0,226,227,1,0,0,0,227,35,
-        1,0,0,0,228,229,6,18,-1,0,229,230,5,2,0,0,230,231,3,36,18,0,231,
-        232,5,3,0,0,232,242,1,0,0,0,233,234,7,4,0,0,234,242,3,36,18,7,235,
-        242,5,55,0,0,236,242,5,56,0,0,237,242,5,39,0,0,238,242,5,40,0,0,
-        239,242,5,57,0,0,240,242,3,12,6,0,241,228,1,0,0,0,241,233,1,0,0,
-        0,241,235,1,0,0,0,241,236,1,0,0,0,241,237,1,0,0,0,241,238,1,0,0,
-        0,241,239,1,0,0,0,241,240,1,0,0,0,242,260,1,0,0,0,243,244,10,13,
-        0,0,244,245,7,5,0,0,245,259,3,36,18,14,246,247,10,12,0,0,247,248,
-        7,4,0,0,248,259,3,36,18,13,249,250,10,11,0,0,250,251,7,6,0,0,251,
-        259,3,36,18,12,252,253,10,10,0,0,253,254,7,7,0,0,254,259,3,36,18,
-        11,255,256,10,9,0,0,256,257,5,46,0,0,257,259,3,36,18,10,258,243,
-        1,0,0,0,258,246,1,0,0,0,258,249,1,0,0,0,258,252,1,0,0,0,258,255,
-        1,0,0,0,259,262,1,0,0,0,260,258,1,0,0,0,260,261,1,0,0,0,261,37,1,
-        0,0,0,262,260,1,0,0,0,32,41,60,66,69,75,81,94,101,104,107,112,116,
-        118,125,137,152,157,162,167,172,177,183,186,195,198,206,212,217,
-        226,241,258,260
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,1,0,5,0,52,8,0,10,0,
+        12,0,55,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,3,1,76,8,1,1,2,1,2,1,2,1,2,3,2,82,8,2,1,
+        2,3,2,85,8,2,1,3,1,3,1,3,1,3,3,3,91,8,3,1,4,1,4,1,4,1,4,1,4,4,4,
+        98,8,4,11,4,12,4,99,1,4,1,4,1,4,3,4,105,8,4,1,5,1,5,1,5,1,5,3,5,
+        111,8,5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,5,6,122,8,6,10,6,12,
+        6,125,9,6,1,7,1,7,1,7,1,7,3,7,131,8,7,1,7,3,7,134,8,7,1,7,3,7,137,
+        8,7,1,7,1,7,1,7,3,7,142,8,7,1,7,1,7,3,7,146,8,7,3,7,148,8,7,1,8,
+        1,8,1,8,5,8,153,8,8,10,8,12,8,156,9,8,1,9,1,9,1,9,1,9,1,9,1,9,1,
+        9,1,9,1,9,3,9,167,8,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
+        1,10,1,11,1,11,1,11,3,11,182,8,11,1,11,1,11,1,11,1,11,1,11,1,12,
+        1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,14,
+        1,14,1,14,1,15,4,15,206,8,15,11,15,12,15,207,1,16,1,16,1,16,3,16,
+        213,8,16,1,17,1,17,1,17,3,17,218,8,17,1,17,1,17,1,17,3,17,223,8,
+        17,1,17,1,17,1,17,3,17,228,8,17,1,17,1,17,1,17,3,17,233,8,17,1,17,
+        1,17,1,17,1,17,3,17,239,8,17,1,17,3,17,242,8,17,1,18,1,18,1,18,1,
+        18,1,18,1,18,1,18,3,18,251,8,18,1,18,3,18,254,8,18,1,18,1,18,1,18,
+        1,18,3,18,260,8,18,3,18,262,8,18,1,19,1,19,1,19,1,20,1,20,1,20,1,
+        20,1,20,1,20,3,20,273,8,20,1,21,1,21,1,21,1,21,3,21,279,8,21,1,22,
+        1,22,1,22,3,22,284,8,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,3,23,
+        293,8,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,
+        5,24,306,8,24,10,24,12,24,309,9,24,3,24,311,8,24,1,24,1,24,1,24,
+        1,24,1,24,1,24,1,24,3,24,320,8,24,1,24,1,24,1,24,1,24,1,24,1,24,
+        1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,
+        1,24,1,24,1,24,1,24,5,24,345,8,24,10,24,12,24,348,9,24,1,24,0,1,
+        48,25,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
+        42,44,46,48,0,7,1,0,18,19,1,0,24,25,1,0,37,40,2,0,41,41,46,46,1,
+        0,44,45,1,0,46,48,1,0,50,55,394,0,53,1,0,0,0,2,75,1,0,0,0,4,77,1,
+        0,0,0,6,86,1,0,0,0,8,92,1,0,0,0,10,106,1,0,0,0,12,118,1,0,0,0,14,
+        147,1,0,0,0,16,149,1,0,0,0,18,157,1,0,0,0,20,170,1,0,0,0,22,178,
+        1,0,0,0,24,188,1,0,0,0,26,198,1,0,0,0,28,201,1,0,0,0,30,205,1,0,
+        0,0,32,209,1,0,0,0,34,238,1,0,0,0,36,261,1,0,0,0,38,263,1,0,0,0,
+        40,266,1,0,0,0,42,274,1,0,0,0,44,280,1,0,0,0,46,285,1,0,0,0,48,319,
+        1,0,0,0,50,52,3,2,1,0,51,50,1,0,0,0,52,55,1,0,0,0,53,51,1,0,0,0,
+        53,54,1,0,0,0,54,56,1,0,0,0,55,53,1,0,0,0,56,57,5,0,0,1,57,1,1,0,
+        0,0,58,76,3,4,2,0,59,76,3,6,3,0,60,76,3,8,4,0,61,76,3,32,16,0,62,
+        76,3,20,10,0,63,76,3,22,11,0,64,76,3,24,12,0,65,76,3,18,9,0,66,76,
+        3,10,5,0,67,76,3,14,7,0,68,76,3,34,17,0,69,76,3,36,18,0,70,76,3,
+        40,20,0,71,76,3,46,23,0,72,76,3,42,21,0,73,76,3,44,22,0,74,76,5,
+        63,0,0,75,58,1,0,0,0,75,59,1,0,0,0,75,60,1,0,0,0,75,61,1,0,0,0,75,
+        62,1,0,0,0,75,63,1,0,0,0,75,64,1,0,0,0,75,65,1,0,0,0,75,66,1,0,0,
+        0,75,67,1,0,0,0,75,68,1,0,0,0,75,69,1,0,0,0,75,70,1,0,0,0,75,71,
+        1,0,0,0,75,72,1,0,0,0,75,73,1,0,0,0,75,74,1,0,0,0,76,3,1,0,0,0,77,
+        78,5,6,0,0,78,81,5,62,0,0,79,80,5,7,0,0,80,82,3,48,24,0,81,79,1,
+        0,0,0,81,82,1,0,0,0,82,84,1,0,0,0,83,85,5,63,0,0,84,83,1,0,0,0,84,
+        85,1,0,0,0,85,5,1,0,0,0,86,87,5,62,0,0,87,88,5,1,0,0,88,90,3,48,
+        24,0,89,91,5,63,0,0,90,89,1,0,0,0,90,91,1,0,0,0,91,7,1,0,0,0,92,
+        97,5,62,0,0,93,94,5,58,0,0,94,95,3,48,24,0,95,96,5,59,0,0,96,98,
+        1,0,0,0,97,93,1,0,0,0,98,99,1,0,0,0,99,97,1,0,0,0,99,100,1,0,0,0,
+        100,101,1,0,0,0,101,102,5,1,0,0,102,104,3,48,24,0,103,105,5,63,0,
+        0,104,103,1,0,0,0,104,105,1,0,0,0,105,9,1,0,0,0,106,107,5,8,0,0,
+        107,108,5,62,0,0,108,110,5,2,0,0,109,111,3,12,6,0,110,109,1,0,0,
+        0,110,111,1,0,0,0,111,112,1,0,0,0,112,113,5,3,0,0,113,114,5,4,0,
+        0,114,115,5,63,0,0,115,116,3,30,15,0,116,117,5,10,0,0,117,11,1,0,
+        0,0,118,123,5,62,0,0,119,120,5,5,0,0,120,122,5,62,0,0,121,119,1,
+        0,0,0,122,125,1,0,0,0,123,121,1,0,0,0,123,124,1,0,0,0,124,13,1,0,
+        0,0,125,123,1,0,0,0,126,127,5,9,0,0,127,133,5,62,0,0,128,130,5,2,
+        0,0,129,131,3,16,8,0,130,129,1,0,0,0,130,131,1,0,0,0,131,132,1,0,
+        0,0,132,134,5,3,0,0,133,128,1,0,0,0,133,134,1,0,0,0,134,136,1,0,
+        0,0,135,137,5,63,0,0,136,135,1,0,0,0,136,137,1,0,0,0,137,148,1,0,
+        0,0,138,139,5,62,0,0,139,141,5,2,0,0,140,142,3,16,8,0,141,140,1,
+        0,0,0,141,142,1,0,0,0,142,143,1,0,0,0,143,145,5,3,0,0,144,146,5,
+        63,0,0,145,144,1,0,0,0,145,146,1,0,0,0,146,148,1,0,0,0,147,126,1,
+        0,0,0,147,138,1,0,0,0,148,15,1,0,0,0,149,154,3,48,24,0,150,151,5,
+        5,0,0,151,153,3,48,24,0,152,150,1,0,0,0,153,156,1,0,0,0,154,152,
+        1,0,0,0,154,155,1,0,0,0,155,17,1,0,0,0,156,154,1,0,0,0,157,158,5,
+        11,0,0,158,159,3,48,24,0,159,160,5,4,0,0,160,161,5,63,0,0,161,166,
+        3,30,15,0,162,163,5,12,0,0,163,164,5,4,0,0,164,165,5,63,0,0,165,
+        167,3,30,15,0,166,162,1,0,0,0,166,167,1,0,0,0,167,168,1,0,0,0,168,
+        169,5,10,0,0,169,19,1,0,0,0,170,171,5,13,0,0,171,172,3,48,24,0,172,
+        173,5,14,0,0,173,174,5,4,0,0,174,175,5,63,0,0,175,176,3,30,15,0,
+        176,177,5,10,0,0,177,21,1,0,0,0,178,179,5,15,0,0,179,181,3,48,24,
+        0,180,182,3,26,13,0,181,180,1,0,0,0,181,182,1,0,0,0,182,183,1,0,
+        0,0,183,184,5,4,0,0,184,185,5,63,0,0,185,186,3,30,15,0,186,187,5,
+        10,0,0,187,23,1,0,0,0,188,189,5,16,0,0,189,190,5,17,0,0,190,191,
+        5,62,0,0,191,192,3,28,14,0,192,193,3,48,24,0,193,194,5,4,0,0,194,
+        195,5,63,0,0,195,196,3,30,15,0,196,197,5,10,0,0,197,25,1,0,0,0,198,
+        199,4,13,0,0,199,200,5,62,0,0,200,27,1,0,0,0,201,202,4,14,1,0,202,
+        203,5,62,0,0,203,29,1,0,0,0,204,206,3,2,1,0,205,204,1,0,0,0,206,
+        207,1,0,0,0,207,205,1,0,0,0,207,208,1,0,0,0,208,31,1,0,0,0,209,210,
+        7,0,0,0,210,212,3,48,24,0,211,213,5,63,0,0,212,211,1,0,0,0,212,213,
+        1,0,0,0,213,33,1,0,0,0,214,215,5,20,0,0,215,217,5,21,0,0,216,218,
+        3,48,24,0,217,216,1,0,0,0,217,218,1,0,0,0,218,239,1,0,0,0,219,220,
+        5,20,0,0,220,222,5,22,0,0,221,223,3,48,24,0,222,221,1,0,0,0,222,
+        223,1,0,0,0,223,239,1,0,0,0,224,225,5,23,0,0,225,227,7,1,0,0,226,
+        228,3,48,24,0,227,226,1,0,0,0,227,228,1,0,0,0,228,239,1,0,0,0,229,
+        230,5,26,0,0,230,232,5,27,0,0,231,233,3,48,24,0,232,231,1,0,0,0,
+        232,233,1,0,0,0,233,239,1,0,0,0,234,235,5,28,0,0,235,239,5,30,0,
+        0,236,237,5,29,0,0,237,239,5,30,0,0,238,214,1,0,0,0,238,219,1,0,
+        0,0,238,224,1,0,0,0,238,229,1,0,0,0,238,234,1,0,0,0,238,236,1,0,
+        0,0,239,241,1,0,0,0,240,242,5,63,0,0,241,240,1,0,0,0,241,242,1,0,
+        0,0,242,35,1,0,0,0,243,244,5,31,0,0,244,245,5,32,0,0,245,250,5,62,
+        0,0,246,247,5,33,0,0,247,248,3,48,24,0,248,249,5,34,0,0,249,251,
+        1,0,0,0,250,246,1,0,0,0,250,251,1,0,0,0,251,253,1,0,0,0,252,254,
+        5,63,0,0,253,252,1,0,0,0,253,254,1,0,0,0,254,262,1,0,0,0,255,256,
+        5,26,0,0,256,257,3,38,19,0,257,259,3,48,24,0,258,260,5,63,0,0,259,
+        258,1,0,0,0,259,260,1,0,0,0,260,262,1,0,0,0,261,243,1,0,0,0,261,
+        255,1,0,0,0,262,37,1,0,0,0,263,264,4,19,2,0,264,265,5,62,0,0,265,
+        39,1,0,0,0,266,267,5,6,0,0,267,268,5,35,0,0,268,269,5,62,0,0,269,
+        270,5,1,0,0,270,272,3,48,24,0,271,273,5,63,0,0,272,271,1,0,0,0,272,
+        273,1,0,0,0,273,41,1,0,0,0,274,275,5,19,0,0,275,276,5,35,0,0,276,
+        278,5,62,0,0,277,279,5,63,0,0,278,277,1,0,0,0,278,279,1,0,0,0,279,
+        43,1,0,0,0,280,281,5,36,0,0,281,283,5,62,0,0,282,284,5,63,0,0,283,
+        282,1,0,0,0,283,284,1,0,0,0,284,45,1,0,0,0,285,286,7,2,0,0,286,287,
+        5,35,0,0,287,288,5,62,0,0,288,289,7,3,0,0,289,290,5,35,0,0,290,292,
+        5,62,0,0,291,293,5,63,0,0,292,291,1,0,0,0,292,293,1,0,0,0,293,47,
+        1,0,0,0,294,295,6,24,-1,0,295,296,7,4,0,0,296,320,3,48,24,14,297,
+        298,5,2,0,0,298,299,3,48,24,0,299,300,5,3,0,0,300,320,1,0,0,0,301,
+        310,5,58,0,0,302,307,3,48,24,0,303,304,5,5,0,0,304,306,3,48,24,0,
+        305,303,1,0,0,0,306,309,1,0,0,0,307,305,1,0,0,0,307,308,1,0,0,0,
+        308,311,1,0,0,0,309,307,1,0,0,0,310,302,1,0,0,0,310,311,1,0,0,0,
+        311,312,1,0,0,0,312,320,5,59,0,0,313,320,5,60,0,0,314,320,5,61,0,
+        0,315,320,5,42,0,0,316,320,5,43,0,0,317,320,5,62,0,0,318,320,3,14,
+        7,0,319,294,1,0,0,0,319,297,1,0,0,0,319,301,1,0,0,0,319,313,1,0,
+        0,0,319,314,1,0,0,0,319,315,1,0,0,0,319,316,1,0,0,0,319,317,1,0,
+        0,0,319,318,1,0,0,0,320,346,1,0,0,0,321,322,10,15,0,0,322,323,5,
+        49,0,0,323,345,3,48,24,15,324,325,10,13,0,0,325,326,7,5,0,0,326,
+        345,3,48,24,14,327,328,10,12,0,0,328,329,7,4,0,0,329,345,3,48,24,
+        13,330,331,10,11,0,0,331,332,7,6,0,0,332,345,3,48,24,12,333,334,
+        10,10,0,0,334,335,5,56,0,0,335,345,3,48,24,11,336,337,10,9,0,0,337,
+        338,5,57,0,0,338,345,3,48,24,10,339,340,10,16,0,0,340,341,5,58,0,
+        0,341,342,3,48,24,0,342,343,5,59,0,0,343,345,1,0,0,0,344,321,1,0,
+        0,0,344,324,1,0,0,0,344,327,1,0,0,0,344,330,1,0,0,0,344,333,1,0,
+        0,0,344,336,1,0,0,0,344,339,1,0,0,0,345,348,1,0,0,0,346,344,1,0,
+        0,0,346,347,1,0,0,0,347,49,1,0,0,0,348,346,1,0,0,0,39,53,75,81,84,
+        90,99,104,110,123,130,133,136,141,145,147,154,166,181,207,212,217,
+        222,227,232,238,241,250,253,259,261,272,278,283,292,307,310,319,
+        344,346
     ]
 
 class MinicodeParser ( Parser ):
@@ -123,54 +155,64 @@ class MinicodeParser ( Parser ):
 
     literalNames = [ "<INVALID>", "'='", "'('", "')'", "':'", "','", "'definir'", 
                      "'como'", "'funcion'", "'llamar'", "'fin'", "'si'", 
-                     "'sino'", "'repetir'", "'veces'", "'imprimir'", "'mostrar'", 
-                     "'mover'", "'adelante'", "'atras'", "'girar'", "'izquierda'", 
-                     "'derecha'", "'cambiar'", "'color'", "'bajar'", "'subir'", 
-                     "'lapiz'", "'tocar'", "'nota'", "'durante'", "'segundos'", 
-                     "'polinomio'", "'graficar'", "'sumar'", "'restar'", 
-                     "'multiplicar'", "'dividir'", "'con'", "<INVALID>", 
-                     "'falso'", "'+'", "'-'", "'*'", "'/'", "'%'", "'**'", 
-                     "'<'", "'>'", "'<='", "'>='", "<INVALID>", "<INVALID>", 
-                     "'y'", "'o'" ]
+                     "'sino'", "'repetir'", "'veces'", "'mientras'", "'para'", 
+                     "'cada'", "'imprimir'", "'mostrar'", "'mover'", "'adelante'", 
+                     "'atras'", "'girar'", "'izquierda'", "'derecha'", "'cambiar'", 
+                     "'color'", "'bajar'", "'subir'", "'lapiz'", "'tocar'", 
+                     "'nota'", "'durante'", "'segundos'", "'polinomio'", 
+                     "'graficar'", "'sumar'", "'restar'", "'multiplicar'", 
+                     "'dividir'", "'con'", "<INVALID>", "'falso'", "'+'", 
+                     "'-'", "'*'", "'/'", "'%'", "'**'", "'<'", "'>'", "'<='", 
+                     "'>='", "<INVALID>", "<INVALID>", "'y'", "'o'", "'['", 
+                     "']'" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "DEFINIR", "COMO", "FUNCION", 
                       "LLAMAR", "FIN", "SI", "SINO", "REPETIR", "VECES", 
-                      "IMPRIMIR", "MOSTRAR", "MOVER", "ADELANTE", "ATRAS", 
-                      "GIRAR", "IZQUIERDA", "DERECHA", "CAMBIAR", "COLOR", 
-                      "BAJAR", "SUBIR", "LAPIZ", "TOCAR", "NOTA", "DURANTE", 
-                      "SEGUNDOS", "POLINOMIO", "GRAFICAR", "SUMAR", "RESTAR", 
-                      "MULTIPLICAR", "DIVIDIR", "CON", "VERDADERO", "FALSO", 
-                      "MAS", "MENOS", "POR", "DIV", "MOD", "POTENCIA", "MENOR", 
-                      "MAYOR", "MENORIGUAL", "MAYORIGUAL", "IGUAL", "DIFERENTE", 
-                      "Y", "O", "NUMERO", "TEXTO", "ID", "NUEVALINEA", "ESPACIOS", 
-                      "COMENTARIO" ]
+                      "MIENTRAS", "PARA", "CADA", "IMPRIMIR", "MOSTRAR", 
+                      "MOVER", "ADELANTE", "ATRAS", "GIRAR", "IZQUIERDA", 
+                      "DERECHA", "CAMBIAR", "COLOR", "BAJAR", "SUBIR", "LAPIZ", 
+                      "TOCAR", "NOTA", "DURANTE", "SEGUNDOS", "POLINOMIO", 
+                      "GRAFICAR", "SUMAR", "RESTAR", "MULTIPLICAR", "DIVIDIR", 
+                      "CON", "VERDADERO", "FALSO", "MAS", "MENOS", "POR", 
+                      "DIV", "MOD", "POTENCIA", "MENOR", "MAYOR", "MENORIGUAL", 
+                      "MAYORIGUAL", "IGUAL", "DIFERENTE", "Y", "O", "ABRECORCHETE", 
+                      "CIERRACORCHETE", "NUMERO", "TEXTO", "ID", "NUEVALINEA", 
+                      "ESPACIOS", "COMENTARIO" ]
 
     RULE_programa = 0
     RULE_instruccion = 1
     RULE_declarar_var = 2
     RULE_asignacion = 3
-    RULE_funcion_def = 4
-    RULE_parametros = 5
-    RULE_funcion_llamada = 6
-    RULE_argumentos = 7
-    RULE_condicional = 8
-    RULE_repetir = 9
-    RULE_bloque = 10
-    RULE_imprimir = 11
-    RULE_comando_grafico = 12
-    RULE_comando_musical = 13
-    RULE_definir_polinomio = 14
-    RULE_mostrar_polinomio = 15
-    RULE_graficar_polinomio = 16
-    RULE_operar_polinomio = 17
-    RULE_expresion = 18
+    RULE_asignar_elemento = 4
+    RULE_funcion_def = 5
+    RULE_parametros = 6
+    RULE_funcion_llamada = 7
+    RULE_argumentos = 8
+    RULE_condicional = 9
+    RULE_repetir = 10
+    RULE_mientras = 11
+    RULE_para_cada = 12
+    RULE_palabra_hacer = 13
+    RULE_palabra_en = 14
+    RULE_bloque = 15
+    RULE_imprimir = 16
+    RULE_comando_grafico = 17
+    RULE_comando_musical = 18
+    RULE_palabra_tempo = 19
+    RULE_definir_polinomio = 20
+    RULE_mostrar_polinomio = 21
+    RULE_graficar_polinomio = 22
+    RULE_operar_polinomio = 23
+    RULE_expresion = 24
 
     ruleNames =  [ "programa", "instruccion", "declarar_var", "asignacion", 
-                   "funcion_def", "parametros", "funcion_llamada", "argumentos", 
-                   "condicional", "repetir", "bloque", "imprimir", "comando_grafico", 
-                   "comando_musical", "definir_polinomio", "mostrar_polinomio", 
-                   "graficar_polinomio", "operar_polinomio", "expresion" ]
+                   "asignar_elemento", "funcion_def", "parametros", "funcion_llamada", 
+                   "argumentos", "condicional", "repetir", "mientras", "para_cada", 
+                   "palabra_hacer", "palabra_en", "bloque", "imprimir", 
+                   "comando_grafico", "comando_musical", "palabra_tempo", 
+                   "definir_polinomio", "mostrar_polinomio", "graficar_polinomio", 
+                   "operar_polinomio", "expresion" ]
 
     EOF = Token.EOF
     T__0=1
@@ -187,52 +229,57 @@ class MinicodeParser ( Parser ):
     SINO=12
     REPETIR=13
     VECES=14
-    IMPRIMIR=15
-    MOSTRAR=16
-    MOVER=17
-    ADELANTE=18
-    ATRAS=19
-    GIRAR=20
-    IZQUIERDA=21
-    DERECHA=22
-    CAMBIAR=23
-    COLOR=24
-    BAJAR=25
-    SUBIR=26
-    LAPIZ=27
-    TOCAR=28
-    NOTA=29
-    DURANTE=30
-    SEGUNDOS=31
-    POLINOMIO=32
-    GRAFICAR=33
-    SUMAR=34
-    RESTAR=35
-    MULTIPLICAR=36
-    DIVIDIR=37
-    CON=38
-    VERDADERO=39
-    FALSO=40
-    MAS=41
-    MENOS=42
-    POR=43
-    DIV=44
-    MOD=45
-    POTENCIA=46
-    MENOR=47
-    MAYOR=48
-    MENORIGUAL=49
-    MAYORIGUAL=50
-    IGUAL=51
-    DIFERENTE=52
-    Y=53
-    O=54
-    NUMERO=55
-    TEXTO=56
-    ID=57
-    NUEVALINEA=58
-    ESPACIOS=59
-    COMENTARIO=60
+    MIENTRAS=15
+    PARA=16
+    CADA=17
+    IMPRIMIR=18
+    MOSTRAR=19
+    MOVER=20
+    ADELANTE=21
+    ATRAS=22
+    GIRAR=23
+    IZQUIERDA=24
+    DERECHA=25
+    CAMBIAR=26
+    COLOR=27
+    BAJAR=28
+    SUBIR=29
+    LAPIZ=30
+    TOCAR=31
+    NOTA=32
+    DURANTE=33
+    SEGUNDOS=34
+    POLINOMIO=35
+    GRAFICAR=36
+    SUMAR=37
+    RESTAR=38
+    MULTIPLICAR=39
+    DIVIDIR=40
+    CON=41
+    VERDADERO=42
+    FALSO=43
+    MAS=44
+    MENOS=45
+    POR=46
+    DIV=47
+    MOD=48
+    POTENCIA=49
+    MENOR=50
+    MAYOR=51
+    MENORIGUAL=52
+    MAYORIGUAL=53
+    IGUAL=54
+    DIFERENTE=55
+    Y=56
+    O=57
+    ABRECORCHETE=58
+    CIERRACORCHETE=59
+    NUMERO=60
+    TEXTO=61
+    ID=62
+    NUEVALINEA=63
+    ESPACIOS=64
+    COMENTARIO=65
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -242,6 +289,10 @@ class MinicodeParser ( Parser ):
 
 
 
+    def _palabra(self, texto):
+        return self._input.LT(1).text == texto
+
+
 
     class ProgramaContext(ParserRuleContext):
         __slots__ = 'parser'
@@ -279,17 +330,17 @@ class MinicodeParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 41
+            self.state = 53
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 432345830894316352) != 0):
-                self.state = 38
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & -4611683885093377216) != 0):
+                self.state = 50
                 self.instruccion()
-                self.state = 43
+                self.state = 55
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 44
+            self.state = 56
             self.match(MinicodeParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -315,6 +366,10 @@ class MinicodeParser ( Parser ):
             return self.getTypedRuleContext(MinicodeParser.AsignacionContext,0)
 
 
+        def asignar_elemento(self):
+            return self.getTypedRuleContext(MinicodeParser.Asignar_elementoContext,0)
+
+
         def imprimir(self):
             return self.getTypedRuleContext(MinicodeParser.ImprimirContext,0)
 
@@ -323,6 +378,14 @@ class MinicodeParser ( Parser ):
             return self.getTypedRuleContext(MinicodeParser.RepetirContext,0)
 
 
+        def mientras(self):
+            return self.getTypedRuleContext(MinicodeParser.MientrasContext,0)
+
+
+        def para_cada(self):
+            return self.getTypedRuleContext(MinicodeParser.Para_cadaContext,0)
+
+
         def condicional(self):
             return self.getTypedRuleContext(MinicodeParser.CondicionalContext,0)
 
@@ -379,90 +442,108 @@ class MinicodeParser ( Parser ):
         localctx = MinicodeParser.InstruccionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_instruccion)
         try:
-            self.state = 60
+            self.state = 75
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 46
+                self.state = 58
                 self.declarar_var()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 47
+                self.state = 59
                 self.asignacion()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 48
-                self.imprimir()
+                self.state = 60
+                self.asignar_elemento()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 49
-                self.repetir()
+                self.state = 61
+                self.imprimir()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 50
-                self.condicional()
+                self.state = 62
+                self.repetir()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 51
-                self.funcion_def()
+                self.state = 63
+                self.mientras()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 52
-                self.funcion_llamada()
+                self.state = 64
+                self.para_cada()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 53
-                self.comando_grafico()
+                self.state = 65
+                self.condicional()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 54
-                self.comando_musical()
+                self.state = 66
+                self.funcion_def()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 55
-                self.definir_polinomio()
+                self.state = 67
+                self.funcion_llamada()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 56
-                self.operar_polinomio()
+                self.state = 68
+                self.comando_grafico()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 57
-                self.mostrar_polinomio()
+                self.state = 69
+                self.comando_musical()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 58
-                self.graficar_polinomio()
+                self.state = 70
+                self.definir_polinomio()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 59
+                self.state = 71
+                self.operar_polinomio()
+                pass
+
+            elif la_ == 15:
+                self.enterOuterAlt(localctx, 15)
+                self.state = 72
+                self.mostrar_polinomio()
+                pass
+
+            elif la_ == 16:
+                self.enterOuterAlt(localctx, 16)
+                self.state = 73
+                self.graficar_polinomio()
+                pass
+
+            elif la_ == 17:
+                self.enterOuterAlt(localctx, 17)
+                self.state = 74
                 self.match(MinicodeParser.NUEVALINEA)
                 pass
 
@@ -518,25 +599,25 @@ class MinicodeParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 62
+            self.state = 77
             self.match(MinicodeParser.DEFINIR)
-            self.state = 63
+            self.state = 78
             self.match(MinicodeParser.ID)
-            self.state = 66
+            self.state = 81
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==7:
-                self.state = 64
+                self.state = 79
                 self.match(MinicodeParser.COMO)
-                self.state = 65
+                self.state = 80
                 self.expresion(0)
 
 
-            self.state = 69
+            self.state = 84
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
             if la_ == 1:
-                self.state = 68
+                self.state = 83
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -584,17 +665,107 @@ class MinicodeParser ( Parser ):
         self.enterRule(localctx, 6, self.RULE_asignacion)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 71
+            self.state = 86
             self.match(MinicodeParser.ID)
-            self.state = 72
+            self.state = 87
             self.match(MinicodeParser.T__0)
-            self.state = 73
+            self.state = 88
             self.expresion(0)
-            self.state = 75
+            self.state = 90
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
             if la_ == 1:
-                self.state = 74
+                self.state = 89
+                self.match(MinicodeParser.NUEVALINEA)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Asignar_elementoContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(MinicodeParser.ID, 0)
+
+        def expresion(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MinicodeParser.ExpresionContext)
+            else:
+                return self.getTypedRuleContext(MinicodeParser.ExpresionContext,i)
+
+
+        def ABRECORCHETE(self, i:int=None):
+            if i is None:
+                return self.getTokens(MinicodeParser.ABRECORCHETE)
+            else:
+                return self.getToken(MinicodeParser.ABRECORCHETE, i)
+
+        def CIERRACORCHETE(self, i:int=None):
+            if i is None:
+                return self.getTokens(MinicodeParser.CIERRACORCHETE)
+            else:
+                return self.getToken(MinicodeParser.CIERRACORCHETE, i)
+
+        def NUEVALINEA(self):
+            return self.getToken(MinicodeParser.NUEVALINEA, 0)
+
+        def getRuleIndex(self):
+            return MinicodeParser.RULE_asignar_elemento
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAsignar_elemento" ):
+                return visitor.visitAsignar_elemento(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def asignar_elemento(self):
+
+        localctx = MinicodeParser.Asignar_elementoContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_asignar_elemento)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 92
+            self.match(MinicodeParser.ID)
+            self.state = 97 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 93
+                self.match(MinicodeParser.ABRECORCHETE)
+                self.state = 94
+                self.expresion(0)
+                self.state = 95
+                self.match(MinicodeParser.CIERRACORCHETE)
+                self.state = 99 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==58):
+                    break
+
+            self.state = 101
+            self.match(MinicodeParser.T__0)
+            self.state = 102
+            self.expresion(0)
+            self.state = 104
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
+            if la_ == 1:
+                self.state = 103
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -649,33 +820,33 @@ class MinicodeParser ( Parser ):
     def funcion_def(self):
 
         localctx = MinicodeParser.Funcion_defContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 8, self.RULE_funcion_def)
+        self.enterRule(localctx, 10, self.RULE_funcion_def)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 77
+            self.state = 106
             self.match(MinicodeParser.FUNCION)
-            self.state = 78
+            self.state = 107
             self.match(MinicodeParser.ID)
-            self.state = 79
+            self.state = 108
             self.match(MinicodeParser.T__1)
-            self.state = 81
+            self.state = 110
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==57:
-                self.state = 80
+            if _la==62:
+                self.state = 109
                 self.parametros()
 
 
-            self.state = 83
+            self.state = 112
             self.match(MinicodeParser.T__2)
-            self.state = 84
+            self.state = 113
             self.match(MinicodeParser.T__3)
-            self.state = 85
+            self.state = 114
             self.match(MinicodeParser.NUEVALINEA)
-            self.state = 86
+            self.state = 115
             self.bloque()
-            self.state = 87
+            self.state = 116
             self.match(MinicodeParser.FIN)
         except RecognitionException as re:
             localctx.exception = re
@@ -714,21 +885,21 @@ class MinicodeParser ( Parser ):
     def parametros(self):
 
         localctx = MinicodeParser.ParametrosContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 10, self.RULE_parametros)
+        self.enterRule(localctx, 12, self.RULE_parametros)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 89
+            self.state = 118
             self.match(MinicodeParser.ID)
-            self.state = 94
+            self.state = 123
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==5:
-                self.state = 90
+                self.state = 119
                 self.match(MinicodeParser.T__4)
-                self.state = 91
+                self.state = 120
                 self.match(MinicodeParser.ID)
-                self.state = 96
+                self.state = 125
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -776,66 +947,66 @@ class MinicodeParser ( Parser ):
     def funcion_llamada(self):
 
         localctx = MinicodeParser.Funcion_llamadaContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_funcion_llamada)
+        self.enterRule(localctx, 14, self.RULE_funcion_llamada)
         self._la = 0 # Token type
         try:
-            self.state = 118
+            self.state = 147
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [9]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 97
+                self.state = 126
                 self.match(MinicodeParser.LLAMAR)
-                self.state = 98
+                self.state = 127
                 self.match(MinicodeParser.ID)
-                self.state = 104
+                self.state = 133
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
                 if la_ == 1:
-                    self.state = 99
+                    self.state = 128
                     self.match(MinicodeParser.T__1)
-                    self.state = 101
+                    self.state = 130
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if (((_la) & ~0x3f) == 0 and ((1 << _la) & 252209825469956612) != 0):
-                        self.state = 100
+                    if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8358746879097307652) != 0):
+                        self.state = 129
                         self.argumentos()
 
 
-                    self.state = 103
+                    self.state = 132
                     self.match(MinicodeParser.T__2)
 
 
-                self.state = 107
+                self.state = 136
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,11,self._ctx)
                 if la_ == 1:
-                    self.state = 106
+                    self.state = 135
                     self.match(MinicodeParser.NUEVALINEA)
 
 
                 pass
-            elif token in [57]:
+            elif token in [62]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 109
+                self.state = 138
                 self.match(MinicodeParser.ID)
-                self.state = 110
+                self.state = 139
                 self.match(MinicodeParser.T__1)
-                self.state = 112
+                self.state = 141
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 252209825469956612) != 0):
-                    self.state = 111
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8358746879097307652) != 0):
+                    self.state = 140
                     self.argumentos()
 
 
-                self.state = 114
+                self.state = 143
                 self.match(MinicodeParser.T__2)
-                self.state = 116
+                self.state = 145
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,11,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
                 if la_ == 1:
-                    self.state = 115
+                    self.state = 144
                     self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -881,21 +1052,21 @@ class MinicodeParser ( Parser ):
     def argumentos(self):
 
         localctx = MinicodeParser.ArgumentosContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_argumentos)
+        self.enterRule(localctx, 16, self.RULE_argumentos)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 120
+            self.state = 149
             self.expresion(0)
-            self.state = 125
+            self.state = 154
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==5:
-                self.state = 121
+                self.state = 150
                 self.match(MinicodeParser.T__4)
-                self.state = 122
+                self.state = 151
                 self.expresion(0)
-                self.state = 127
+                self.state = 156
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -956,35 +1127,35 @@ class MinicodeParser ( Parser ):
     def condicional(self):
 
         localctx = MinicodeParser.CondicionalContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_condicional)
+        self.enterRule(localctx, 18, self.RULE_condicional)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 128
+            self.state = 157
             self.match(MinicodeParser.SI)
-            self.state = 129
+            self.state = 158
             self.expresion(0)
-            self.state = 130
+            self.state = 159
             self.match(MinicodeParser.T__3)
-            self.state = 131
+            self.state = 160
             self.match(MinicodeParser.NUEVALINEA)
-            self.state = 132
+            self.state = 161
             self.bloque()
-            self.state = 137
+            self.state = 166
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==12:
-                self.state = 133
+                self.state = 162
                 self.match(MinicodeParser.SINO)
-                self.state = 134
+                self.state = 163
                 self.match(MinicodeParser.T__3)
-                self.state = 135
+                self.state = 164
                 self.match(MinicodeParser.NUEVALINEA)
-                self.state = 136
+                self.state = 165
                 self.bloque()
 
 
-            self.state = 139
+            self.state = 168
             self.match(MinicodeParser.FIN)
         except RecognitionException as re:
             localctx.exception = re
@@ -1037,22 +1208,176 @@ class MinicodeParser ( Parser ):
     def repetir(self):
 
         localctx = MinicodeParser.RepetirContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_repetir)
+        self.enterRule(localctx, 20, self.RULE_repetir)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 141
+            self.state = 170
             self.match(MinicodeParser.REPETIR)
-            self.state = 142
+            self.state = 171
             self.expresion(0)
-            self.state = 143
+            self.state = 172
             self.match(MinicodeParser.VECES)
-            self.state = 144
+            self.state = 173
             self.match(MinicodeParser.T__3)
-            self.state = 145
+            self.state = 174
             self.match(MinicodeParser.NUEVALINEA)
-            self.state = 146
+            self.state = 175
             self.bloque()
-            self.state = 147
+            self.state = 176
+            self.match(MinicodeParser.FIN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MientrasContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MIENTRAS(self):
+            return self.getToken(MinicodeParser.MIENTRAS, 0)
+
+        def expresion(self):
+            return self.getTypedRuleContext(MinicodeParser.ExpresionContext,0)
+
+
+        def NUEVALINEA(self):
+            return self.getToken(MinicodeParser.NUEVALINEA, 0)
+
+        def bloque(self):
+            return self.getTypedRuleContext(MinicodeParser.BloqueContext,0)
+
+
+        def FIN(self):
+            return self.getToken(MinicodeParser.FIN, 0)
+
+        def palabra_hacer(self):
+            return self.getTypedRuleContext(MinicodeParser.Palabra_hacerContext,0)
+
+
+        def getRuleIndex(self):
+            return MinicodeParser.RULE_mientras
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMientras" ):
+                return visitor.visitMientras(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def mientras(self):
+
+        localctx = MinicodeParser.MientrasContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_mientras)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 178
+            self.match(MinicodeParser.MIENTRAS)
+            self.state = 179
+            self.expresion(0)
+            self.state = 181
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
+            if la_ == 1:
+                self.state = 180
+                self.palabra_hacer()
+
+
+            self.state = 183
+            self.match(MinicodeParser.T__3)
+            self.state = 184
+            self.match(MinicodeParser.NUEVALINEA)
+            self.state = 185
+            self.bloque()
+            self.state = 186
+            self.match(MinicodeParser.FIN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Para_cadaContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def PARA(self):
+            return self.getToken(MinicodeParser.PARA, 0)
+
+        def CADA(self):
+            return self.getToken(MinicodeParser.CADA, 0)
+
+        def ID(self):
+            return self.getToken(MinicodeParser.ID, 0)
+
+        def palabra_en(self):
+            return self.getTypedRuleContext(MinicodeParser.Palabra_enContext,0)
+
+
+        def expresion(self):
+            return self.getTypedRuleContext(MinicodeParser.ExpresionContext,0)
+
+
+        def NUEVALINEA(self):
+            return self.getToken(MinicodeParser.NUEVALINEA, 0)
+
+        def bloque(self):
+            return self.getTypedRuleContext(MinicodeParser.BloqueContext,0)
+
+
+        def FIN(self):
+            return self.getToken(MinicodeParser.FIN, 0)
+
+        def getRuleIndex(self):
+            return MinicodeParser.RULE_para_cada
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPara_cada" ):
+                return visitor.visitPara_cada(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def para_cada(self):
+
+        localctx = MinicodeParser.Para_cadaContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_para_cada)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 188
+            self.match(MinicodeParser.PARA)
+            self.state = 189
+            self.match(MinicodeParser.CADA)
+            self.state = 190
+            self.match(MinicodeParser.ID)
+            self.state = 191
+            self.palabra_en()
+            self.state = 192
+            self.expresion(0)
+            self.state = 193
+            self.match(MinicodeParser.T__3)
+            self.state = 194
+            self.match(MinicodeParser.NUEVALINEA)
+            self.state = 195
+            self.bloque()
+            self.state = 196
             self.match(MinicodeParser.FIN)
         except RecognitionException as re:
             localctx.exception = re
@@ -1063,6 +1388,92 @@ class MinicodeParser ( Parser ):
         return localctx
 
 
+    class Palabra_hacerContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(MinicodeParser.ID, 0)
+
+        def getRuleIndex(self):
+            return MinicodeParser.RULE_palabra_hacer
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPalabra_hacer" ):
+                return visitor.visitPalabra_hacer(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def palabra_hacer(self):
+
+        localctx = MinicodeParser.Palabra_hacerContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_palabra_hacer)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 198
+            if not self._palabra("hacer"):
+                from antlr4.error.Errors import FailedPredicateException
+                raise FailedPredicateException(self, "self._palabra(\"hacer\")", "se esperaba 'hacer'")
+            self.state = 199
+            self.match(MinicodeParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Palabra_enContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(MinicodeParser.ID, 0)
+
+        def getRuleIndex(self):
+            return MinicodeParser.RULE_palabra_en
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPalabra_en" ):
+                return visitor.visitPalabra_en(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def palabra_en(self):
+
+        localctx = MinicodeParser.Palabra_enContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_palabra_en)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 201
+            if not self._palabra("en"):
+                from antlr4.error.Errors import FailedPredicateException
+                raise FailedPredicateException(self, "self._palabra(\"en\")", "se esperaba 'en'")
+            self.state = 202
+            self.match(MinicodeParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class BloqueContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -1092,20 +1503,20 @@ class MinicodeParser ( Parser ):
     def bloque(self):
 
         localctx = MinicodeParser.BloqueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_bloque)
+        self.enterRule(localctx, 30, self.RULE_bloque)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 150 
+            self.state = 205 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 149
+                self.state = 204
                 self.instruccion()
-                self.state = 152 
+                self.state = 207 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 432345830894316352) != 0)):
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & -4611683885093377216) != 0)):
                     break
 
         except RecognitionException as re:
@@ -1152,24 +1563,24 @@ class MinicodeParser ( Parser ):
     def imprimir(self):
 
         localctx = MinicodeParser.ImprimirContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_imprimir)
+        self.enterRule(localctx, 32, self.RULE_imprimir)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 154
+            self.state = 209
             _la = self._input.LA(1)
-            if not(_la==15 or _la==16):
+            if not(_la==18 or _la==19):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 155
+            self.state = 210
             self.expresion(0)
-            self.state = 157
+            self.state = 212
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
             if la_ == 1:
-                self.state = 156
+                self.state = 211
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -1244,98 +1655,98 @@ class MinicodeParser ( Parser ):
     def comando_grafico(self):
 
         localctx = MinicodeParser.Comando_graficoContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 24, self.RULE_comando_grafico)
+        self.enterRule(localctx, 34, self.RULE_comando_grafico)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 183
+            self.state = 238
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,21,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
             if la_ == 1:
-                self.state = 159
+                self.state = 214
                 self.match(MinicodeParser.MOVER)
-                self.state = 160
+                self.state = 215
                 self.match(MinicodeParser.ADELANTE)
-                self.state = 162
+                self.state = 217
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
                 if la_ == 1:
-                    self.state = 161
+                    self.state = 216
                     self.expresion(0)
 
 
                 pass
 
             elif la_ == 2:
-                self.state = 164
+                self.state = 219
                 self.match(MinicodeParser.MOVER)
-                self.state = 165
+                self.state = 220
                 self.match(MinicodeParser.ATRAS)
-                self.state = 167
+                self.state = 222
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,18,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,21,self._ctx)
                 if la_ == 1:
-                    self.state = 166
+                    self.state = 221
                     self.expresion(0)
 
 
                 pass
 
             elif la_ == 3:
-                self.state = 169
+                self.state = 224
                 self.match(MinicodeParser.GIRAR)
-                self.state = 170
+                self.state = 225
                 _la = self._input.LA(1)
-                if not(_la==21 or _la==22):
+                if not(_la==24 or _la==25):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 172
+                self.state = 227
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
                 if la_ == 1:
-                    self.state = 171
+                    self.state = 226
                     self.expresion(0)
 
 
                 pass
 
             elif la_ == 4:
-                self.state = 174
+                self.state = 229
                 self.match(MinicodeParser.CAMBIAR)
-                self.state = 175
+                self.state = 230
                 self.match(MinicodeParser.COLOR)
-                self.state = 177
+                self.state = 232
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,23,self._ctx)
                 if la_ == 1:
-                    self.state = 176
+                    self.state = 231
                     self.expresion(0)
 
 
                 pass
 
             elif la_ == 5:
-                self.state = 179
+                self.state = 234
                 self.match(MinicodeParser.BAJAR)
-                self.state = 180
+                self.state = 235
                 self.match(MinicodeParser.LAPIZ)
                 pass
 
             elif la_ == 6:
-                self.state = 181
+                self.state = 236
                 self.match(MinicodeParser.SUBIR)
-                self.state = 182
+                self.state = 237
                 self.match(MinicodeParser.LAPIZ)
                 pass
 
 
-            self.state = 186
+            self.state = 241
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
             if la_ == 1:
-                self.state = 185
+                self.state = 240
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -1377,6 +1788,13 @@ class MinicodeParser ( Parser ):
         def NUEVALINEA(self):
             return self.getToken(MinicodeParser.NUEVALINEA, 0)
 
+        def CAMBIAR(self):
+            return self.getToken(MinicodeParser.CAMBIAR, 0)
+
+        def palabra_tempo(self):
+            return self.getTypedRuleContext(MinicodeParser.Palabra_tempoContext,0)
+
+
         def getRuleIndex(self):
             return MinicodeParser.RULE_comando_musical
 
@@ -1392,36 +1810,104 @@ class MinicodeParser ( Parser ):
     def comando_musical(self):
 
         localctx = MinicodeParser.Comando_musicalContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 26, self.RULE_comando_musical)
+        self.enterRule(localctx, 36, self.RULE_comando_musical)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 188
-            self.match(MinicodeParser.TOCAR)
-            self.state = 189
-            self.match(MinicodeParser.NOTA)
-            self.state = 190
-            self.match(MinicodeParser.ID)
-            self.state = 195
+            self.state = 261
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==30:
-                self.state = 191
-                self.match(MinicodeParser.DURANTE)
-                self.state = 192
+            token = self._input.LA(1)
+            if token in [31]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 243
+                self.match(MinicodeParser.TOCAR)
+                self.state = 244
+                self.match(MinicodeParser.NOTA)
+                self.state = 245
+                self.match(MinicodeParser.ID)
+                self.state = 250
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 246
+                    self.match(MinicodeParser.DURANTE)
+                    self.state = 247
+                    self.expresion(0)
+                    self.state = 248
+                    self.match(MinicodeParser.SEGUNDOS)
+
+
+                self.state = 253
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
+                if la_ == 1:
+                    self.state = 252
+                    self.match(MinicodeParser.NUEVALINEA)
+
+
+                pass
+            elif token in [26]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 255
+                self.match(MinicodeParser.CAMBIAR)
+                self.state = 256
+                self.palabra_tempo()
+                self.state = 257
                 self.expresion(0)
-                self.state = 193
-                self.match(MinicodeParser.SEGUNDOS)
+                self.state = 259
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,28,self._ctx)
+                if la_ == 1:
+                    self.state = 258
+                    self.match(MinicodeParser.NUEVALINEA)
 
 
-            self.state = 198
-            self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
-            if la_ == 1:
-                self.state = 197
-                self.match(MinicodeParser.NUEVALINEA)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class Palabra_tempoContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(MinicodeParser.ID, 0)
+
+        def getRuleIndex(self):
+            return MinicodeParser.RULE_palabra_tempo
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPalabra_tempo" ):
+                return visitor.visitPalabra_tempo(self)
+            else:
+                return visitor.visitChildren(self)
 
 
+
+
+    def palabra_tempo(self):
+
+        localctx = MinicodeParser.Palabra_tempoContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_palabra_tempo)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 263
+            if not self._palabra("tempo"):
+                from antlr4.error.Errors import FailedPredicateException
+                raise FailedPredicateException(self, "self._palabra(\"tempo\")", "se esperaba 'tempo'")
+            self.state = 264
+            self.match(MinicodeParser.ID)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1469,24 +1955,24 @@ class MinicodeParser ( Parser ):
     def definir_polinomio(self):
 
         localctx = MinicodeParser.Definir_polinomioContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_definir_polinomio)
+        self.enterRule(localctx, 40, self.RULE_definir_polinomio)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 200
+            self.state = 266
             self.match(MinicodeParser.DEFINIR)
-            self.state = 201
+            self.state = 267
             self.match(MinicodeParser.POLINOMIO)
-            self.state = 202
+            self.state = 268
             self.match(MinicodeParser.ID)
-            self.state = 203
+            self.state = 269
             self.match(MinicodeParser.T__0)
-            self.state = 204
+            self.state = 270
             self.expresion(0)
-            self.state = 206
+            self.state = 272
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,30,self._ctx)
             if la_ == 1:
-                self.state = 205
+                self.state = 271
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -1533,20 +2019,20 @@ class MinicodeParser ( Parser ):
     def mostrar_polinomio(self):
 
         localctx = MinicodeParser.Mostrar_polinomioContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_mostrar_polinomio)
+        self.enterRule(localctx, 42, self.RULE_mostrar_polinomio)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 208
+            self.state = 274
             self.match(MinicodeParser.MOSTRAR)
-            self.state = 209
+            self.state = 275
             self.match(MinicodeParser.POLINOMIO)
-            self.state = 210
+            self.state = 276
             self.match(MinicodeParser.ID)
-            self.state = 212
+            self.state = 278
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
             if la_ == 1:
-                self.state = 211
+                self.state = 277
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -1590,18 +2076,18 @@ class MinicodeParser ( Parser ):
     def graficar_polinomio(self):
 
         localctx = MinicodeParser.Graficar_polinomioContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_graficar_polinomio)
+        self.enterRule(localctx, 44, self.RULE_graficar_polinomio)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 214
+            self.state = 280
             self.match(MinicodeParser.GRAFICAR)
-            self.state = 215
+            self.state = 281
             self.match(MinicodeParser.ID)
-            self.state = 217
+            self.state = 283
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,32,self._ctx)
             if la_ == 1:
-                self.state = 216
+                self.state = 282
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -1669,37 +2155,37 @@ class MinicodeParser ( Parser ):
     def operar_polinomio(self):
 
         localctx = MinicodeParser.Operar_polinomioContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_operar_polinomio)
+        self.enterRule(localctx, 46, self.RULE_operar_polinomio)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 219
+            self.state = 285
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 257698037760) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2061584302080) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 220
+            self.state = 286
             self.match(MinicodeParser.POLINOMIO)
-            self.state = 221
+            self.state = 287
             self.match(MinicodeParser.ID)
-            self.state = 222
+            self.state = 288
             _la = self._input.LA(1)
-            if not(_la==38 or _la==43):
+            if not(_la==41 or _la==46):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 223
+            self.state = 289
             self.match(MinicodeParser.POLINOMIO)
-            self.state = 224
+            self.state = 290
             self.match(MinicodeParser.ID)
-            self.state = 226
+            self.state = 292
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,28,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,33,self._ctx)
             if la_ == 1:
-                self.state = 225
+                self.state = 291
                 self.match(MinicodeParser.NUEVALINEA)
 
 
@@ -1786,6 +2272,29 @@ class MinicodeParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
+    class ExpPotenciaContext(ExpresionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MinicodeParser.ExpresionContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expresion(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MinicodeParser.ExpresionContext)
+            else:
+                return self.getTypedRuleContext(MinicodeParser.ExpresionContext,i)
+
+        def POTENCIA(self):
+            return self.getToken(MinicodeParser.POTENCIA, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpPotencia" ):
+                return visitor.visitExpPotencia(self)
+            else:
+                return visitor.visitChildren(self)
+
+
     class ExpMulDivContext(ExpresionContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a MinicodeParser.ExpresionContext
@@ -1813,25 +2322,26 @@ class MinicodeParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
-    class ExpPotenciaContext(ExpresionContext):
+    class ExpListaContext(ExpresionContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a MinicodeParser.ExpresionContext
             super().__init__(parser)
-            self.op = None # Token
             self.copyFrom(ctx)
 
+        def ABRECORCHETE(self):
+            return self.getToken(MinicodeParser.ABRECORCHETE, 0)
+        def CIERRACORCHETE(self):
+            return self.getToken(MinicodeParser.CIERRACORCHETE, 0)
         def expresion(self, i:int=None):
             if i is None:
                 return self.getTypedRuleContexts(MinicodeParser.ExpresionContext)
             else:
                 return self.getTypedRuleContext(MinicodeParser.ExpresionContext,i)
 
-        def POTENCIA(self):
-            return self.getToken(MinicodeParser.POTENCIA, 0)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitExpPotencia" ):
-                return visitor.visitExpPotencia(self)
+            if hasattr( visitor, "visitExpLista" ):
+                return visitor.visitExpLista(self)
             else:
                 return visitor.visitChildren(self)
 
@@ -1939,6 +2449,30 @@ class MinicodeParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
+    class ExpIndiceContext(ExpresionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a MinicodeParser.ExpresionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expresion(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(MinicodeParser.ExpresionContext)
+            else:
+                return self.getTypedRuleContext(MinicodeParser.ExpresionContext,i)
+
+        def ABRECORCHETE(self):
+            return self.getToken(MinicodeParser.ABRECORCHETE, 0)
+        def CIERRACORCHETE(self):
+            return self.getToken(MinicodeParser.CIERRACORCHETE, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpIndice" ):
+                return visitor.visitExpIndice(self)
+            else:
+                return visitor.visitChildren(self)
+
+
     class ExpNumeroContext(ExpresionContext):
 
         def __init__(self, parser, ctx:ParserRuleContext): # actually a MinicodeParser.ExpresionContext
@@ -2002,196 +2536,248 @@ class MinicodeParser ( Parser ):
         _parentState = self.state
         localctx = MinicodeParser.ExpresionContext(self, self._ctx, _parentState)
         _prevctx = localctx
-        _startState = 36
-        self.enterRecursionRule(localctx, 36, self.RULE_expresion, _p)
+        _startState = 48
+        self.enterRecursionRule(localctx, 48, self.RULE_expresion, _p)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 241
+            self.state = 319
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,29,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,36,self._ctx)
             if la_ == 1:
-                localctx = MinicodeParser.ExpParenContext(self, localctx)
+                localctx = MinicodeParser.ExpSignoContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
 
-                self.state = 229
+                self.state = 295
+                _la = self._input.LA(1)
+                if not(_la==44 or _la==45):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 296
+                self.expresion(14)
+                pass
+
+            elif la_ == 2:
+                localctx = MinicodeParser.ExpParenContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 297
                 self.match(MinicodeParser.T__1)
-                self.state = 230
+                self.state = 298
                 self.expresion(0)
-                self.state = 231
+                self.state = 299
                 self.match(MinicodeParser.T__2)
                 pass
 
-            elif la_ == 2:
-                localctx = MinicodeParser.ExpSignoContext(self, localctx)
+            elif la_ == 3:
+                localctx = MinicodeParser.ExpListaContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 233
+                self.state = 301
+                self.match(MinicodeParser.ABRECORCHETE)
+                self.state = 310
+                self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not(_la==41 or _la==42):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 234
-                self.expresion(7)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8358746879097307652) != 0):
+                    self.state = 302
+                    self.expresion(0)
+                    self.state = 307
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==5:
+                        self.state = 303
+                        self.match(MinicodeParser.T__4)
+                        self.state = 304
+                        self.expresion(0)
+                        self.state = 309
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+
+
+                self.state = 312
+                self.match(MinicodeParser.CIERRACORCHETE)
                 pass
 
-            elif la_ == 3:
+            elif la_ == 4:
                 localctx = MinicodeParser.ExpNumeroContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 235
+                self.state = 313
                 self.match(MinicodeParser.NUMERO)
                 pass
 
-            elif la_ == 4:
+            elif la_ == 5:
                 localctx = MinicodeParser.ExpTextoContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 236
+                self.state = 314
                 self.match(MinicodeParser.TEXTO)
                 pass
 
-            elif la_ == 5:
+            elif la_ == 6:
                 localctx = MinicodeParser.ExpVerdaderoContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 237
+                self.state = 315
                 self.match(MinicodeParser.VERDADERO)
                 pass
 
-            elif la_ == 6:
+            elif la_ == 7:
                 localctx = MinicodeParser.ExpFalsoContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 238
+                self.state = 316
                 self.match(MinicodeParser.FALSO)
                 pass
 
-            elif la_ == 7:
+            elif la_ == 8:
                 localctx = MinicodeParser.ExpIDContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 239
+                self.state = 317
                 self.match(MinicodeParser.ID)
                 pass
 
-            elif la_ == 8:
+            elif la_ == 9:
                 localctx = MinicodeParser.ExpFuncionContext(self, localctx)
                 self._ctx = localctx
                 _prevctx = localctx
-                self.state = 240
+                self.state = 318
                 self.funcion_llamada()
                 pass
 
 
             self._ctx.stop = self._input.LT(-1)
-            self.state = 260
+            self.state = 346
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,31,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,38,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
                     if self._parseListeners is not None:
                         self.triggerExitRuleEvent()
                     _prevctx = localctx
-                    self.state = 258
+                    self.state = 344
                     self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,30,self._ctx)
+                    la_ = self._interp.adaptivePredict(self._input,37,self._ctx)
                     if la_ == 1:
+                        localctx = MinicodeParser.ExpPotenciaContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
+                        self.state = 321
+                        if not self.precpred(self._ctx, 15):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 15)")
+                        self.state = 322
+                        localctx.op = self.match(MinicodeParser.POTENCIA)
+                        self.state = 323
+                        self.expresion(15)
+                        pass
+
+                    elif la_ == 2:
                         localctx = MinicodeParser.ExpMulDivContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
-                        self.state = 243
+                        self.state = 324
                         if not self.precpred(self._ctx, 13):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 13)")
-                        self.state = 244
+                        self.state = 325
                         localctx.op = self._input.LT(1)
                         _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 61572651155456) != 0)):
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 492581209243648) != 0)):
                             localctx.op = self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 245
+                        self.state = 326
                         self.expresion(14)
                         pass
 
-                    elif la_ == 2:
+                    elif la_ == 3:
                         localctx = MinicodeParser.ExpSumaRestaContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
-                        self.state = 246
+                        self.state = 327
                         if not self.precpred(self._ctx, 12):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 12)")
-                        self.state = 247
+                        self.state = 328
                         localctx.op = self._input.LT(1)
                         _la = self._input.LA(1)
-                        if not(_la==41 or _la==42):
+                        if not(_la==44 or _la==45):
                             localctx.op = self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 248
+                        self.state = 329
                         self.expresion(13)
                         pass
 
-                    elif la_ == 3:
+                    elif la_ == 4:
                         localctx = MinicodeParser.ExpComparacionContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
-                        self.state = 249
+                        self.state = 330
                         if not self.precpred(self._ctx, 11):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 11)")
-                        self.state = 250
+                        self.state = 331
                         localctx.op = self._input.LT(1)
                         _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 8866461766385664) != 0)):
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 70931694131085312) != 0)):
                             localctx.op = self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 251
+                        self.state = 332
                         self.expresion(12)
                         pass
 
-                    elif la_ == 4:
+                    elif la_ == 5:
                         localctx = MinicodeParser.ExpLogicaContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
-                        self.state = 252
+                        self.state = 333
                         if not self.precpred(self._ctx, 10):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
-                        self.state = 253
-                        localctx.op = self._input.LT(1)
-                        _la = self._input.LA(1)
-                        if not(_la==53 or _la==54):
-                            localctx.op = self._errHandler.recoverInline(self)
-                        else:
-                            self._errHandler.reportMatch(self)
-                            self.consume()
-                        self.state = 254
+                        self.state = 334
+                        localctx.op = self.match(MinicodeParser.Y)
+                        self.state = 335
                         self.expresion(11)
                         pass
 
-                    elif la_ == 5:
-                        localctx = MinicodeParser.ExpPotenciaContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
+                    elif la_ == 6:
+                        localctx = MinicodeParser.ExpLogicaContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
-                        self.state = 255
+                        self.state = 336
                         if not self.precpred(self._ctx, 9):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
-                        self.state = 256
-                        localctx.op = self.match(MinicodeParser.POTENCIA)
-                        self.state = 257
+                        self.state = 337
+                        localctx.op = self.match(MinicodeParser.O)
+                        self.state = 338
                         self.expresion(10)
                         pass
 
+                    elif la_ == 7:
+                        localctx = MinicodeParser.ExpIndiceContext(self, MinicodeParser.ExpresionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expresion)
+                        self.state = 339
+                        if not self.precpred(self._ctx, 16):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 16)")
+                        self.state = 340
+                        self.match(MinicodeParser.ABRECORCHETE)
+                        self.state = 341
+                        self.expresion(0)
+                        self.state = 342
+                        self.match(MinicodeParser.CIERRACORCHETE)
+                        pass
+
              
-                self.state = 262
+                self.state = 348
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,31,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,38,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -2206,34 +2792,60 @@ class MinicodeParser ( Parser ):
     def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
         if self._predicates == None:
             self._predicates = dict()
-        self._predicates[18] = self.expresion_sempred
+        self._predicates[13] = self.palabra_hacer_sempred
+        self._predicates[14] = self.palabra_en_sempred
+        self._predicates[19] = self.palabra_tempo_sempred
+        self._predicates[24] = self.expresion_sempred
         pred = self._predicates.get(ruleIndex, None)
         if pred is None:
             raise Exception("No predicate with index:" + str(ruleIndex))
         else:
             return pred(localctx, predIndex)
 
-    def expresion_sempred(self, localctx:ExpresionContext, predIndex:int):
+    def palabra_hacer_sempred(self, localctx:Palabra_hacerContext, predIndex:int):
             if predIndex == 0:
-                return self.precpred(self._ctx, 13)
+                return self._palabra("hacer")
          
 
+    def palabra_en_sempred(self, localctx:Palabra_enContext, predIndex:int):
             if predIndex == 1:
-                return self.precpred(self._ctx, 12)
+                return self._palabra("en")
          
 
+    def palabra_tempo_sempred(self, localctx:Palabra_tempoContext, predIndex:int):
             if predIndex == 2:
-                return self.precpred(self._ctx, 11)
+                return self._palabra("tempo")
          
 
+    def expresion_sempred(self, localctx:ExpresionContext, predIndex:int):
             if predIndex == 3:
-                return self.precpred(self._ctx, 10)
+                return self.precpred(self._ctx, 15)
          
 
             if predIndex == 4:
+                return self.precpred(self._ctx, 13)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 12)
+         
+
+            if predIndex == 6:
+                return self.precpred(self._ctx, 11)
+         
+
+            if predIndex == 7:
+                return self.precpred(self._ctx, 10)
+         
+
+            if predIndex == 8:
                 return self.precpred(self._ctx, 9)
          
 
+            if predIndex == 9:
+                return self.precpred(self._ctx, 16)
+         
+
 
 
 
@@ -29,6 +29,11 @@ class MinicodeVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by MinicodeParser#asignar_elemento.
+    def visitAsignar_elemento(self, ctx:MinicodeParser.Asignar_elementoContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by MinicodeParser#funcion_def.
     def visitFuncion_def(self, ctx:MinicodeParser.Funcion_defContext):
         return self.visitChildren(ctx)
@@ -59,6 +64,26 @@ class MinicodeVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by MinicodeParser#mientras.
+    def visitMientras(self, ctx:MinicodeParser.MientrasContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MinicodeParser#para_cada.
+    def visitPara_cada(self, ctx:MinicodeParser.Para_cadaContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MinicodeParser#palabra_hacer.
+    def visitPalabra_hacer(self, ctx:MinicodeParser.Palabra_hacerContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by MinicodeParser#palabra_en.
+    def visitPalabra_en(self, ctx:MinicodeParser.Palabra_enContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by MinicodeParser#bloque.
     def visitBloque(self, ctx:MinicodeParser.BloqueContext):
         return self.visitChildren(ctx)
@@ -79,6 +104,11 @@ class MinicodeVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by MinicodeParser#palabra_tempo.
+    def visitPalabra_tempo(self, ctx:MinicodeParser.Palabra_tempoContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by MinicodeParser#definir_polinomio.
     def visitDefinir_polinomio(self, ctx:MinicodeParser.Definir_polinomioContext):
         return self.visitChildren(ctx)
@@ -109,13 +139,18 @@ class MinicodeVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by MinicodeParser#expPotencia.
+    def visitExpPotencia(self, ctx:MinicodeParser.ExpPotenciaContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by MinicodeParser#expMulDiv.
     def visitExpMulDiv(self, ctx:MinicodeParser.ExpMulDivContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by MinicodeParser#expPotencia.
-    def visitExpPotencia(self, ctx:MinicodeParser.ExpPotenciaContext):
+    # Visit a parse tree produced by MinicodeParser#expLista.
+    def visitExpLista(self, ctx:MinicodeParser.ExpListaContext):
         return self.visitChildren(ctx)
 
 
@@ -149,6 +184,11 @@ class MinicodeVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by MinicodeParser#expIndice.
+    def visitExpIndice(self, ctx:MinicodeParser.ExpIndiceContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by MinicodeParser#expNumero.
     def visitExpNumero(self, ctx:MinicodeParser.ExpNumeroContext):
         return self.visitChildren(ctx)
@@ -165,4 +205,4 @@ class MinicodeVisitor(ParseTreeVisitor):
 
 
 
-del MinicodeParser
\ No newline at end of file
+del MinicodeParser
\ No newline at end of file
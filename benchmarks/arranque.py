@@ -0,0 +1,105 @@
+"""
+Informe del tiempo de arranque del IDE.
+
+Ejecuta en procesos nuevos (para que nada esté ya importado):
+  1. `python -X importtime -c "import gui.main_window"` y resume los módulos
+     que más tardan en importarse.
+  2. La creación y el primer pintado de MainWindow (en modo offscreen).
+
+Comprueba además que los módulos que deben cargarse de forma diferida
+(NumPy, SymPy, matplotlib, ANTLR, executor, panel de polinomios) no se importan al
+arrancar. Sale con 1 si alguno se importa o si la ventana tarda más del límite.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.arranque
+    python -m benchmarks.arranque --limite-ms 800 --top 25
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que no deben importarse antes de mostrar la ventana
+DIFERIDOS = ["numpy", "sympy", "matplotlib", "antlr4", "antlr.MinicodeParser", "core.executor",
+             "gui.polinomios_panel"]
+
+_SCRIPT_VENTANA = """
+import time
+inicio = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+from gui.main_window import MainWindow
+ventana = MainWindow()
+ventana.show()
+app.processEvents()
+print((time.perf_counter() - inicio) * 1000)
+ventana.close()
+"""
+
+
+def _entorno():
+    entorno = dict(os.environ)
+    entorno.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return entorno
+
+
+def tiempos_importacion():
+    """Devuelve [(modulo, propio_us, acumulado_us, nivel)] según `-X importtime`."""
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import gui.main_window"],
+        cwd=RAIZ, env=_entorno(), capture_output=True, text=True, check=True,
+    ).stderr
+    filas = []
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, nombre = linea[len("import time:"):].split("|")
+        nivel = (len(nombre) - len(nombre.lstrip())) // 2
+        filas.append((nombre.strip(), int(propio), int(acumulado), nivel))
+    return filas
+
+
+def tiempo_ventana():
+    """Milisegundos desde el inicio del script hasta que la ventana se ha mostrado y pintado."""
+    salida = subprocess.run(
+        [sys.executable, "-c", _SCRIPT_VENTANA],
+        cwd=RAIZ, env=_entorno(), capture_output=True, text=True, check=True,
+    ).stdout
+    return float(salida.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    argp = argparse.ArgumentParser(description="Informe del tiempo de arranque del IDE")
+    argp.add_argument("--limite-ms", type=float, default=1000.0,
+                      help="tiempo máximo hasta mostrar la ventana (por defecto 1000 ms)")
+    argp.add_argument("--top", type=int, default=15, help="módulos a listar")
+    args = argp.parse_args(argv)
+
+    filas = tiempos_importacion()
+    total = sum(propio for _, propio, _, _ in filas)
+    print(f"Importación de gui.main_window: {total / 1000:.1f} ms en {len(filas)} módulos\n")
+    print(f"{'módulo':<50}{'propio (ms)':>12}{'acumulado (ms)':>16}")
+    for nombre, propio, acumulado, _ in sorted(filas, key=lambda f: f[2], reverse=True)[:args.top]:
+        print(f"{nombre:<50}{propio / 1000:>12.1f}{acumulado / 1000:>16.1f}")
+
+    fallos = 0
+    importados = {nombre for nombre, _, _, _ in filas}
+    indebidos = [m for m in DIFERIDOS if m in importados]
+    if indebidos:
+        fallos += 1
+        print(f"\n✗ Se importan al arrancar módulos que deberían ser diferidos: {', '.join(indebidos)}")
+
+    ms = tiempo_ventana()
+    print(f"\nVentana mostrada en {ms:.0f} ms (límite {args.limite_ms:.0f} ms)")
+    if ms > args.limite_ms:
+        fallos += 1
+        print("✗ El arranque supera el límite")
+
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Generadores de programas Minicode y mapas sintéticos para los benchmarks.
+Todos son deterministas: el mismo tamaño produce siempre el mismo texto.
+"""
+import random
+
+
+def programa_bucles(iteraciones):
+    """Bucle aritmético con condicional: mide sobre todo la ejecución."""
+    return (
+        "definir s como 0\n"
+        "definir i como 0\n"
+        f"repetir {iteraciones} veces:\n"
+        "\ti = i + 1\n"
+        "\ts = s + i * 2 % 7\n"
+        "\tsi s > 100:\n"
+        "\t\ts = s - 100\n"
+        "\tfin\n"
+        "fin\n"
+        "mostrar s\n"
+    )
+
+
+def programa_recursion(profundidad):
+    """Llamadas recursivas anidadas hasta `profundidad` niveles."""
+    return (
+        "definir hojas como 0\n"
+        "funcion descender(n):\n"
+        "\tsi n > 0:\n"
+        "\t\tdescender(n - 1)\n"
+        "\tsino:\n"
+        "\t\thojas = hojas + 1\n"
+        "\tfin\n"
+        "fin\n"
+        f"descender({profundidad})\n"
+        "mostrar hojas\n"
+    )
+
+
+def programa_lineal(instrucciones):
+    """
+    Programa largo sin bucles, con una mezcla de todas las construcciones
+    habituales. Sirve para medir lexer y parser en función del tamaño del fuente.
+    """
+    plantillas = [
+        "definir v{i} como {i} + 2 * ({i} - 1)\n",
+        "v{i} = v{i} * 3 + 1\n",
+        "si v{i} > {i} y verdadero:\n\tmostrar v{i}\nsino:\n\tmostrar \"no\"\nfin\n",
+        "funcion f{i}(a, b):\n\tdefinir r como a + b\nfin\n",
+        "f{i}(v{i}, {i})\n",
+        "repetir 2 veces:\n\tv{i} = v{i} - 1\nfin\n",
+    ]
+    partes = []
+    for i in range(instrucciones):
+        bloque = (i // len(plantillas)) * len(plantillas)
+        partes.append(plantillas[i % len(plantillas)].format(i=bloque))
+    return "".join(partes)
+
+
+def programa_grafico(pasos):
+    """Recorrido en espiral cuadrada por un mapa libre, todo con comandos gráficos."""
+    return (
+        f"repetir {pasos} veces:\n"
+        "\tmover adelante 3\n"
+        "\tgirar izquierda\n"
+        "fin\n"
+    )
+
+
+def programa_musical(notas):
+    """Escala que se repite hasta tocar `notas` notas (pocas formas de onda distintas)."""
+    escala = ["do", "re", "mi", "fa", "sol", "la", "si4", "do5"]  # "si" sola es la palabra clave del condicional
+    vueltas, resto = divmod(notas, len(escala))
+    cuerpo = "".join(f"\ttocar nota {n} durante 0.25 segundos\n" for n in escala)
+    sobrantes = "".join(f"tocar nota {n} durante 0.25 segundos\n" for n in escala[:resto])
+    return f"repetir {vueltas} veces:\n{cuerpo}fin\n{sobrantes}"
+
+
+def programa_listas(elementos):
+    """Lista de `elementos` números: construcción, operaciones en bloque y recorrido."""
+    return (
+        f"datos = rango({elementos})\n"
+        "cuadrados = datos * datos[1] + 3 * datos % 7\n"
+        "total = suma(cuadrados) + maximo(datos) - minimo(datos)\n"
+        "pares = []\n"
+        "para cada x en datos:\n"
+        "\tsi x % 2 == 0:\n"
+        "\t\tagregar(pares, x)\n"
+        "\tfin\n"
+        "fin\n"
+        "mostrar longitud(pares) + total\n"
+    )
+
+
+def polinomio(grado, semilla=0):
+    """Texto SymPy de un polinomio denso de grado `grado` con coeficientes enteros."""
+    rnd = random.Random(semilla)
+    terminos = [f"{rnd.randint(1, 9)}*x**{g}" for g in range(grado, 1, -1)]
+    terminos.append(f"{rnd.randint(1, 9)}*x")
+    terminos.append(str(rnd.randint(1, 9)))
+    return " + ".join(terminos)
+
+
+def programa_polinomios(grado):
+    return (
+        f"definir polinomio p = {polinomio(grado, 1)}\n"
+        f"definir polinomio q = {polinomio(grado, 2)}\n"
+        "sumar polinomio p con polinomio q\n"
+        "multiplicar polinomio p con polinomio q\n"
+    )
+
+
+def mapa(lado, semilla=0):
+    """
+    Mapa cuadrado `lado`×`lado` con muros en el borde, algunos muros interiores
+    aleatorios, inicio (3) en (1, 1) y meta (2) en la esquina opuesta.
+    """
+    rnd = random.Random(semilla)
+    grid = []
+    for y in range(lado):
+        fila = []
+        for x in range(lado):
+            borde = x in (0, lado - 1) or y in (0, lado - 1)
+            fila.append(1 if borde or rnd.random() < 0.1 else 0)
+        grid.append(fila)
+    grid[1][1] = 3
+    grid[lado - 2][lado - 2] = 2
+    return grid
+
+
+def texto_mapa(grid):
+    lineas = ["# 0 = libre, 1 = muro, 2 = meta, 3 = inicio"]
+    lineas.extend(" ".join(str(v) for v in fila) for fila in grid)
+    return "\n".join(lineas) + "\n"
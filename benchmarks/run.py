@@ -0,0 +1,401 @@
+"""
+Benchmarks del intérprete Minicode.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.run                       # ejecuta todo y guarda benchmarks/resultados.json
+    python -m benchmarks.run --rapido              # tamaños pequeños, para comprobar que todo funciona
+    python -m benchmarks.run --guardar-baseline    # guarda los resultados como baseline
+    python -m benchmarks.run --umbral 0.10         # falla si algo va >10% más lento que el baseline
+    python -m benchmarks.run -k parser             # solo los benchmarks cuyo nombre contiene "parser"
+
+El código de salida es 1 si alguna medición supera el baseline en más del umbral.
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from benchmarks import programas
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RESULTADOS = os.path.join(DIRECTORIO, "resultados.json")
+BASELINE = os.path.join(DIRECTORIO, "baseline.json")
+
+_APP = None  # QApplication de los benchmarks headless (debe seguir viva)
+_GRUPO = None  # GrupoTrabajadores de bench_aislamiento (se arranca una vez)
+
+
+class _ConsolaNula:
+    """Sustituto de ConsoleOutput que solo cuenta las líneas escritas."""
+
+    def __init__(self):
+        self.lineas = 0
+
+    def append(self, text):
+        self.lineas += 1
+
+
+# ------------------------------------------------------------
+# Utilidades de frontend (lexer / parser)
+# ------------------------------------------------------------
+def _tokens(codigo):
+    from antlr4 import InputStream, CommonTokenStream
+    from antlr.MinicodeLexer import MinicodeLexer
+
+    stream = CommonTokenStream(MinicodeLexer(InputStream(codigo)))
+    stream.fill()
+    return stream.tokens
+
+
+def _parsear(codigo):
+    from antlr4 import InputStream, CommonTokenStream
+    from antlr.MinicodeLexer import MinicodeLexer
+    from antlr.MinicodeParser import MinicodeParser
+
+    parser = MinicodeParser(CommonTokenStream(MinicodeLexer(InputStream(codigo))))
+    return parser.programa()
+
+
+# ------------------------------------------------------------
+# Benchmarks: cada uno recibe un tamaño, prepara lo necesario
+# y devuelve la función (sin argumentos) que se cronometra.
+# ------------------------------------------------------------
+def bench_lexer(instrucciones):
+    from antlr4 import InputStream, CommonTokenStream
+    from antlr.MinicodeLexer import MinicodeLexer
+
+    codigo = programas.programa_lineal(instrucciones)
+
+    def medir():
+        CommonTokenStream(MinicodeLexer(InputStream(codigo))).fill()
+    return medir
+
+
+def bench_parser(instrucciones):
+    from antlr4 import CommonTokenStream
+    from antlr4.ListTokenSource import ListTokenSource
+    from antlr.MinicodeParser import MinicodeParser
+
+    tokens = _tokens(programas.programa_lineal(instrucciones))
+
+    def medir():
+        MinicodeParser(CommonTokenStream(ListTokenSource(tokens))).programa()
+    return medir
+
+
+def bench_parser_sll(instrucciones):
+    """Primera etapa del frontend ANTLR: predicción SLL con BailErrorStrategy."""
+    from antlr4 import CommonTokenStream
+    from antlr4.ListTokenSource import ListTokenSource
+    from antlr4.atn.PredictionMode import PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy
+    from antlr.MinicodeParser import MinicodeParser
+
+    tokens = _tokens(programas.programa_lineal(instrucciones))
+
+    def medir():
+        parser = MinicodeParser(CommonTokenStream(ListTokenSource(tokens)))
+        parser._interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = BailErrorStrategy()
+        parser.programa()
+    return medir
+
+
+def bench_lexer_rapido(instrucciones):
+    from core.parser_rapido import tokenizar
+
+    codigo = programas.programa_lineal(instrucciones)
+
+    def medir():
+        tokenizar(codigo)
+    return medir
+
+
+def bench_parser_rapido(instrucciones):
+    from core.parser_rapido import ParserRapido, tokenizar
+
+    tokens = tokenizar(programas.programa_lineal(instrucciones))
+
+    def medir():
+        ParserRapido(tokens).programa()
+    return medir
+
+
+def _bench_ejecucion(codigo, optimizar=False):
+    from core.executor import MinicodeExecutor
+
+    def medir():
+        tree = _parsear(codigo)
+        if optimizar:
+            from core.optimizador import OptimizadorAST
+            OptimizadorAST().optimizar(tree)
+        inicio = time.perf_counter()
+        MinicodeExecutor(_ConsolaNula()).visit(tree)
+        return time.perf_counter() - inicio
+    return medir
+
+
+def bench_ejecucion_bucles(iteraciones):
+    return _bench_ejecucion(programas.programa_bucles(iteraciones))
+
+
+def bench_ejecucion_bucles_optimizado(iteraciones):
+    return _bench_ejecucion(programas.programa_bucles(iteraciones), optimizar=True)
+
+
+def bench_ejecucion_recursion(profundidad):
+    return _bench_ejecucion(programas.programa_recursion(profundidad))
+
+
+def bench_listas(elementos):
+    return _bench_ejecucion(programas.programa_listas(elementos))
+
+
+def bench_polinomios(grado):
+    return _bench_ejecucion(programas.programa_polinomios(grado))
+
+
+def bench_reanudar(grado):
+    """Volver a ejecutar el programa de polinomios tras añadir una línea al final (puntos de control)."""
+    from core.executor import MinicodeExecutor
+    from core.puntos_control import PuntosControl
+
+    codigo = programas.programa_polinomios(grado)
+    puntos = PuntosControl()
+    puntos.preparar(codigo)
+    MinicodeExecutor(_ConsolaNula(), puntos_control=puntos).visit(_parsear(codigo))
+    editado = codigo + "mostrar 1\n"
+    tree = _parsear(editado)
+
+    def medir():
+        puntos.preparar(editado)
+        inicio = time.perf_counter()
+        MinicodeExecutor(_ConsolaNula(), puntos_control=puntos).visit(tree)
+        return time.perf_counter() - inicio
+    return medir
+
+
+def bench_aislamiento(programas_lote):
+    """Programas cortos en procesos aislados, con un trabajador nuevo (fork) para cada uno."""
+    from core.aislamiento import GrupoTrabajadores
+
+    global _GRUPO
+    if _GRUPO is None:
+        _GRUPO = GrupoTrabajadores(trabajadores=2, trabajos_por_trabajador=1)
+    codigos = [programas.programa_bucles(10)] * programas_lote
+
+    def medir():
+        for resultado in _GRUPO.ejecutar_varios(codigos):
+            assert resultado.estado == "ok", resultado.error
+    return medir
+
+
+def bench_musica(notas):
+    """Ejecutar un programa musical y renderizar todas sus notas a un buffer (sin audio)."""
+    from core.executor import MinicodeExecutor
+
+    tree = _parsear(programas.programa_musical(notas))
+
+    def medir():
+        executor = MinicodeExecutor(_ConsolaNula())
+        executor.visit(tree)
+        executor.musica.renderizar()
+    return medir
+
+
+def bench_carga_mapa(lado):
+    from gui.tutorial_manager import TutorialManager
+
+    directorio = tempfile.mkdtemp(prefix="minicode_bench_")
+    with open(os.path.join(directorio, "bench.map"), "w", encoding="utf-8") as f:
+        f.write(programas.texto_mapa(programas.mapa(lado)))
+    manager = TutorialManager()
+    manager.maps_path = directorio
+
+    def medir():
+        manager.load_map_data("bench")
+    return medir
+
+
+def bench_simulacion(pasos):
+    """Programa gráfico completo contra un SimulationPanel real en modo headless (offscreen)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from gui.simulation_panel import SimulationPanel
+    from core.executor import MinicodeExecutor
+
+    global _APP
+    _APP = QApplication.instance() or QApplication([])
+    panel = SimulationPanel()
+    grid = programas.mapa(40)
+    codigo = programas.programa_grafico(pasos)
+
+    def medir():
+        panel.load_map(grid)
+        tree = _parsear(codigo)
+        inicio = time.perf_counter()
+        MinicodeExecutor(_ConsolaNula(), panel).visit(tree)
+        return time.perf_counter() - inicio
+    return medir
+
+
+def bench_simulacion_distancia(distancia):
+    """Movimientos mucho más largos que el mapa: el coste no debe depender de la distancia."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from gui.simulation_panel import SimulationPanel
+    from core.executor import MinicodeExecutor
+
+    global _APP
+    _APP = QApplication.instance() or QApplication([])
+    panel = SimulationPanel()
+    grid = [[0] * 10 for _ in range(10)]
+    codigo = f"mover adelante {distancia}\ngirar izquierda\n" * 4
+
+    def medir():
+        panel.load_map(grid)
+        tree = _parsear(codigo)
+        MinicodeExecutor(_ConsolaNula(), panel).visit(tree)
+        assert len(panel.action_queue) < 100, len(panel.action_queue)
+    return medir
+
+
+BENCHMARKS = {
+    "lexer": (bench_lexer, [100, 500, 2000], [50]),
+    "parser": (bench_parser, [100, 500, 2000], [50]),
+    "parser_sll": (bench_parser_sll, [100, 500, 2000], [50]),
+    "lexer_rapido": (bench_lexer_rapido, [100, 500, 2000], [50]),
+    "parser_rapido": (bench_parser_rapido, [100, 500, 2000], [50]),
+    "ejecucion_bucles": (bench_ejecucion_bucles, [1000, 5000, 20000], [100]),
+    "ejecucion_bucles_optimizado": (bench_ejecucion_bucles_optimizado, [1000, 5000, 20000], [100]),
+    "ejecucion_recursion": (bench_ejecucion_recursion, [25, 100, 200], [10]),
+    "listas": (bench_listas, [1000, 10000, 100000], [100]),
+    "polinomios": (bench_polinomios, [5, 15, 30], [3]),
+    "reanudar": (bench_reanudar, [5, 15, 30], [3]),
+    "aislamiento": (bench_aislamiento, [10, 50], [5]),
+    "musica": (bench_musica, [100, 1000, 10000], [20]),
+    "carga_mapa": (bench_carga_mapa, [10, 100, 400], [10]),
+    "simulacion": (bench_simulacion, [100, 1000, 10000], [20]),
+    "simulacion_distancia": (bench_simulacion_distancia, [10, 10 ** 6, 300_000_000], [20]),
+}
+
+
+# ------------------------------------------------------------
+# Medición y comparación
+# ------------------------------------------------------------
+def medir(funcion, repeticiones):
+    """
+    Ejecuta `funcion` varias veces y devuelve los tiempos. Si la función devuelve
+    un número, se toma como el tiempo medido (para excluir su propia preparación).
+    """
+    tiempos = []
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            resultado = funcion()
+            transcurrido = time.perf_counter() - inicio
+            tiempos.append(resultado if isinstance(resultado, float) else transcurrido)
+    return tiempos
+
+
+def ejecutar(filtro=None, rapido=False, repeticiones=5):
+    resultados = {}
+    for nombre, (fabrica, tamanos, tamanos_rapidos) in BENCHMARKS.items():
+        if filtro and filtro not in nombre:
+            continue
+        for tamano in (tamanos_rapidos if rapido else tamanos):
+            clave = f"{nombre}[{tamano}]"
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    funcion = fabrica(tamano)
+            except ImportError as e:
+                print(f"{clave:<40} omitido ({e})")
+                break
+            tiempos = medir(funcion, repeticiones)
+            resultados[clave] = {
+                "minimo": min(tiempos),
+                "mediana": statistics.median(tiempos),
+                "repeticiones": repeticiones,
+            }
+            print(f"{clave:<40} {min(tiempos) * 1000:>10.2f} ms (mediana {statistics.median(tiempos) * 1000:.2f} ms)")
+    return resultados
+
+
+def comparar(resultados, baseline, umbral):
+    """Devuelve la lista de regresiones (clave, antes, ahora, ratio) que superan el umbral."""
+    regresiones = []
+    for clave, actual in resultados.items():
+        anterior = baseline.get(clave)
+        if not anterior or anterior["minimo"] <= 0:
+            continue
+        ratio = actual["minimo"] / anterior["minimo"]
+        marca = ""
+        if ratio > 1 + umbral:
+            regresiones.append((clave, anterior["minimo"], actual["minimo"], ratio))
+            marca = "  <-- REGRESIÓN"
+        print(f"{clave:<40} {anterior['minimo'] * 1000:>10.2f} -> {actual['minimo'] * 1000:>10.2f} ms  x{ratio:.2f}{marca}")
+    return regresiones
+
+
+def main(argv=None):
+    argp = argparse.ArgumentParser(description="Benchmarks del intérprete Minicode")
+    argp.add_argument("-k", dest="filtro", help="solo benchmarks cuyo nombre contenga este texto")
+    argp.add_argument("--rapido", action="store_true", help="usar tamaños pequeños")
+    argp.add_argument("--repeticiones", type=int, default=5)
+    argp.add_argument("--salida", default=RESULTADOS, help="fichero JSON de resultados")
+    argp.add_argument("--baseline", default=BASELINE, help="fichero JSON con el baseline a comparar")
+    argp.add_argument("--guardar-baseline", action="store_true", help="guardar los resultados como baseline")
+    argp.add_argument("--umbral", type=float, default=0.15,
+                      help="ralentización relativa tolerada antes de marcar regresión (0.15 = 15%%)")
+    args = argp.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000))
+    resultados = ejecutar(args.filtro, args.rapido, args.repeticiones)
+
+    documento = {
+        "metadatos": {
+            "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+        },
+        "resultados": resultados,
+    }
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(documento, f, indent=2)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.guardar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=2)
+        print(f"Baseline guardado en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No hay baseline para comparar (usa --guardar-baseline).")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["resultados"]
+    print(f"\nComparación con {args.baseline} (umbral {args.umbral:.0%}):")
+    regresiones = comparar(resultados, baseline, args.umbral)
+    if regresiones:
+        print(f"\n{len(regresiones)} regresión(es) por encima del umbral.")
+        return 1
+    print("\nSin regresiones.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Validación diferencial de las expresiones de Minicode contra Python.
+
+Genera expresiones aleatorias con los operadores que comparten ambos lenguajes
+(+ - * / % **, signo, comparaciones, y/o, paréntesis) y comprueba que MinicodeExecutor
+da el mismo resultado que `eval` de Python: misma precedencia, `**` asociativo por
+la derecha, enteros exactos. Cada expresión se evalúa con los dos parsers (ANTLR y
+el rápido) y con y sin OptimizadorAST. Si Python lanza una excepción (división por
+cero, desbordamiento, resultado complejo), Minicode también debe dar un error.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.validar_expresiones
+    python -m benchmarks.validar_expresiones --cantidad 5000 --semilla 3
+
+El código de salida es 1 si hay alguna discrepancia.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from core.executor import MinicodeExecutor
+from core.frontend import parsear
+from core.optimizador import OptimizadorAST
+
+_ERROR = object()
+
+# Casos fijos: precedencia y asociatividad que más fácil es romper
+CASOS = [
+    "2 ** 3 ** 2", "-2 ** 2", "2 ** -1", "(-2) ** 2", "-2 * 3", "-(2 + 3) * 4",
+    "1 + 2 * 3 ** 2", "2 * 3 ** 2 * 4", "10 - 4 - 3", "100 / 10 / 5", "17 % 5 * 2",
+    "2 ** 0.5", "4 ** -2 ** 2", "0 ** 0", "0 ** -1", "7 % 0", "1 / 0", "(0 - 8) ** 0.5",
+    "10.0 ** 400", "2 ** 200", "3 ** 40 - 3 ** 39", "1 + 2 < 4 y 3 * 2 > 5 o falso",
+    "1 > 2 o 2 > 1 y 3 > 4", "falso y 1 / 0 > 1", "verdadero o 1 / 0 > 1",
+]
+
+
+class _Consola:
+    def __init__(self):
+        self.lineas = []
+
+    def append(self, texto):
+        self.lineas.append(texto)
+
+
+def _aritmetica(rnd, profundidad):
+    if profundidad <= 0 or rnd.random() < 0.25:
+        return rnd.choice(["0", "1", "2", "3", "7", "10", "0.5", "2.5", "12.75"])
+    forma = rnd.random()
+    if forma < 0.15:
+        return f"({_aritmetica(rnd, profundidad - 1)})"
+    if forma < 0.3:
+        return rnd.choice("+-") + _aritmetica(rnd, profundidad - 1)
+    if forma < 0.45:
+        # Exponentes pequeños: Python calcularía sin límite lo que Minicode rechaza
+        exponente = rnd.choice(["0", "1", "2", "3", "-1", "-2", "0.5", "2 ** 2"])
+        return f"{_aritmetica(rnd, profundidad - 1)} ** {exponente}"
+    op = rnd.choice(["+", "-", "*", "/", "%"])
+    return f"{_aritmetica(rnd, profundidad - 1)} {op} {_aritmetica(rnd, profundidad - 1)}"
+
+
+def _logica(rnd, profundidad):
+    # Sin comparaciones encadenadas: en Python `a < b < c` no es `(a < b) < c`
+    if profundidad <= 0 or rnd.random() < 0.4:
+        op = rnd.choice(["<", ">", "<=", ">=", "==", "!="])
+        return f"{_aritmetica(rnd, 2)} {op} {_aritmetica(rnd, 2)}"
+    op = rnd.choice(["y", "o"])
+    return f"{_logica(rnd, profundidad - 1)} {op} {_logica(rnd, profundidad - 1)}"
+
+
+def expresiones(cantidad, semilla):
+    yield from CASOS
+    rnd = random.Random(semilla)
+    for _ in range(cantidad):
+        yield _aritmetica(rnd, 4) if rnd.random() < 0.7 else _logica(rnd, 2)
+
+
+def en_python(expresion):
+    texto = expresion.replace(" y ", " and ").replace(" o ", " or ")
+    try:
+        valor = eval(texto, {"__builtins__": {}, "verdadero": True, "falso": False})
+    except Exception:
+        return _ERROR
+    return _ERROR if isinstance(valor, complex) else valor
+
+
+def en_minicode(expresion, motor, optimizar):
+    consola = _Consola()
+    try:
+        tree, _ = parsear(f"resultado = {expresion}\n", motor=motor)
+        if optimizar:
+            OptimizadorAST().optimizar(tree)
+        executor = MinicodeExecutor(consola)
+        executor.visit(tree)
+        return executor.get_variable_value("resultado")
+    except Exception:
+        return _ERROR
+
+
+def iguales(a, b):
+    if a is _ERROR or b is _ERROR:
+        return a is b
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+def validar(cantidad=2000, semilla=0):
+    discrepancias = 0
+    total = 0
+    for expresion in expresiones(cantidad, semilla):
+        total += 1
+        esperado = en_python(expresion)
+        for motor in ("antlr", "rapido"):
+            for optimizar in (False, True):
+                obtenido = en_minicode(expresion, motor, optimizar)
+                if not iguales(esperado, obtenido):
+                    discrepancias += 1
+                    print(f"✗ {expresion}  [{motor}{', optimizado' if optimizar else ''}]: "
+                          f"Python {'error' if esperado is _ERROR else repr(esperado)}, "
+                          f"Minicode {'error' if obtenido is _ERROR else repr(obtenido)}")
+    print(f"\n{total} expresiones, {discrepancias} discrepancia(s)")
+    return discrepancias
+
+
+def main(argv=None):
+    argp = argparse.ArgumentParser(description="Compara las expresiones de Minicode con Python")
+    argp.add_argument("--cantidad", type=int, default=2000, help="expresiones aleatorias a generar")
+    argp.add_argument("--semilla", type=int, default=0)
+    args = argp.parse_args(argv)
+    return 1 if validar(args.cantidad, args.semilla) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
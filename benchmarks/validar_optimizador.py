@@ -0,0 +1,181 @@
+"""
+Validación diferencial de OptimizadorAST (core/optimizador.py).
+
+Cada programa del corpus se ejecuta dos veces, con y sin optimizar el árbol, y se
+comparan la salida de la consola, el error final (si lo hay) y las variables que
+quedan al terminar. El optimizador no debe cambiar nada de eso: el plegado de
+constantes, la eliminación de ramas y sobre todo las expresiones invariantes que
+se sacan de los bucles (`repetir`, `mientras`, `para cada`) tienen que dar
+exactamente el mismo resultado. Los programas con errores de sintaxis se saltan.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.validar_optimizador
+    python -m benchmarks.validar_optimizador --aleatorios 2000 --semilla 7
+
+El código de salida es 1 si hay alguna discrepancia.
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from benchmarks import programas
+from core import traza
+from core.diagnosticos import errores_sintaxis
+from core.executor import MinicodeExecutor
+from core.frontend import parsear
+from core.optimizador import OptimizadorAST
+
+LIMITE_PASOS = 20_000  # algún programa aleatorio recorre una lista mientras la hace crecer
+
+# Casos fijos: variables que cambian en cada vuelta y que no se pueden sacar del bucle
+CASOS = [
+    "l = [1, 2, 3]\npara cada x en l:\n\tmostrar x * 2\nfin\n",
+    "para cada c en \"abc\":\n\tmostrar c + c\nfin\n",
+    "para cada x en [1, 2]:\n\tpara cada z en [10, 20]:\n\t\tmostrar x * z + 1\n\tfin\nfin\n",
+    "definir i como 0\nrepetir 3 veces:\n\ti = i + 1\n\tmostrar i * 2 + 1\nfin\n",
+    "definir i como 0\nmientras i < 3:\n\tmostrar (i + 1) * (i + 1)\n\ti = i + 1\nfin\n",
+    "definir k como 5\nrepetir 3 veces:\n\tmostrar k * 2 + 1\nfin\n",
+    "l = [1, 2, 3]\nrepetir 2 veces:\n\tl[0] = l[0] + 1\n\tmostrar l[0] * 2\nfin\n",
+    "definir n como 1\nfuncion doblar():\n\tn = n * 2\nfin\nrepetir 3 veces:\n\tdoblar()\n\tmostrar n + 1\nfin\n",
+    "si 1 + 1 == 2:\n\tmostrar \"si\"\nsino:\n\tmostrar \"no\"\nfin\n",
+    "mientras falso:\n\tmostrar 1 / 0\nfin\nmostrar 2 ** 10\n",
+]
+
+
+class _Consola:
+    def __init__(self):
+        self.lineas = []
+
+    def append(self, texto):
+        self.lineas.append(texto)
+
+
+# ------------------------------------------------------------
+# Programas aleatorios
+# ------------------------------------------------------------
+_VARIABLES = ["a", "b", "i"]
+
+
+def _expresion(rnd, nombres, profundidad=2):
+    if profundidad <= 0 or rnd.random() < 0.3:
+        return rnd.choice(nombres + ["1", "2", "3", "0.5", "7"])
+    if rnd.random() < 0.2:
+        return f"({_expresion(rnd, nombres, profundidad - 1)})"
+    op = rnd.choice(["+", "-", "*", "%", "<", "=="])
+    return f"{_expresion(rnd, nombres, profundidad - 1)} {op} {_expresion(rnd, nombres, profundidad - 1)}"
+
+
+def _bloque(rnd, nombres, profundidad, sangria):
+    lineas = []
+    for _ in range(rnd.randint(1, 3)):
+        forma = rnd.random()
+        if profundidad > 0 and forma < 0.15:
+            lineas.append(f"repetir {rnd.randint(0, 3)} veces:")
+            lineas += _bloque(rnd, nombres, profundidad - 1, 1)
+            lineas.append("fin")
+        elif profundidad > 0 and forma < 0.3:
+            variable = rnd.choice(["x", "z", "c"])  # "y" es la conjunción
+            coleccion = rnd.choice(["[1, 2, 3]", "l", "\"ab\"", "rango(3)"])
+            lineas.append(f"para cada {variable} en {coleccion}:")
+            lineas += _bloque(rnd, nombres + [variable], profundidad - 1, 1)
+            lineas.append("fin")
+        elif profundidad > 0 and forma < 0.4:
+            lineas.append(f"si {_expresion(rnd, nombres)}:")
+            lineas += _bloque(rnd, nombres, profundidad - 1, 1)
+            lineas.append("fin")
+        elif forma < 0.55:
+            lineas.append(f"{rnd.choice(_VARIABLES)} = {_expresion(rnd, nombres)}")
+        elif forma < 0.6:
+            lineas.append(f"l[{rnd.randint(0, 2)}] = {_expresion(rnd, nombres)}")
+        elif forma < 0.65:
+            lineas.append(f"agregar(l, {_expresion(rnd, nombres)})")
+        else:
+            lineas.append(f"mostrar {_expresion(rnd, nombres)}")
+    return ["\t" * sangria + linea for linea in lineas]
+
+
+def _programa_aleatorio(rnd):
+    lineas = ["definir a como 1", "definir b como 2", "definir i como 0", "l = [4, 5, 6]"]
+    lineas += _bloque(rnd, list(_VARIABLES), 3, 0)
+    # Un contador para que también haya `mientras` que terminen
+    lineas += ["mientras i < 3:", f"\tmostrar {_expresion(rnd, _VARIABLES)}", "\ti = i + 1", "fin"]
+    return "\n".join(lineas) + "\n"
+
+
+def corpus(aleatorios, semilla):
+    for ruta in sorted(glob.glob(os.path.join(RAIZ, "**", "*.minicode"), recursive=True)):
+        with open(ruta, "r", encoding="utf-8") as f:
+            yield os.path.relpath(ruta, RAIZ), f.read()
+    for i, codigo in enumerate(CASOS):
+        yield f"caso[{i}]", codigo
+    yield "bucles", programas.programa_bucles(20)
+    yield "recursion", programas.programa_recursion(8)
+    yield "lineal", programas.programa_lineal(60)
+    yield "listas", programas.programa_listas(50)
+    yield "grafico", programas.programa_grafico(5)
+    rnd = random.Random(semilla)
+    for i in range(aleatorios):
+        yield f"aleatorio[{i}]", _programa_aleatorio(rnd)
+
+
+# ------------------------------------------------------------
+# Validación
+# ------------------------------------------------------------
+def ejecutar(codigo, optimizar):
+    """(salida, error, variables) de una ejecución, todo como texto comparable."""
+    consola = _Consola()
+    tree, _ = parsear(codigo)
+    if optimizar:
+        OptimizadorAST().optimizar(tree)
+    executor = MinicodeExecutor(consola, limite_pasos=LIMITE_PASOS)
+    error = None
+    try:
+        executor.visit(tree)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    variables = {nombre: repr(valor) for nombre, valor in executor.variables.items()}
+    return consola.lineas, error, variables
+
+
+def validar(aleatorios=500, semilla=0):
+    discrepancias = 0
+    total = 0
+    saltados = 0
+    for nombre, codigo in corpus(aleatorios, semilla):
+        if errores_sintaxis(codigo)[1]:
+            saltados += 1
+            continue
+        total += 1
+        esperado = ejecutar(codigo, optimizar=False)
+        obtenido = ejecutar(codigo, optimizar=True)
+        if esperado != obtenido:
+            discrepancias += 1
+            print(f"✗ {nombre}: el programa optimizado da otro resultado")
+            for parte, sin, con in zip(("salida", "error", "variables"), esperado, obtenido):
+                if sin != con:
+                    print(f"   {parte} sin optimizar: {str(sin)[:200]}")
+                    print(f"   {parte} optimizado   : {str(con)[:200]}")
+            print("   " + codigo.replace("\n", "\n   ")[:600])
+    print(f"\n{total} programas ({saltados} saltados por errores de sintaxis), "
+          f"{discrepancias} discrepancia(s)")
+    return discrepancias
+
+
+def main(argv=None):
+    argp = argparse.ArgumentParser(description="Compara la ejecución con y sin OptimizadorAST")
+    argp.add_argument("--aleatorios", type=int, default=500, help="programas aleatorios a generar")
+    argp.add_argument("--semilla", type=int, default=0)
+    args = argp.parse_args(argv)
+    traza.configurar("graficos=error")  # sin panel de simulación: no avisar de cada orden gráfica
+    return 1 if validar(args.aleatorios, args.semilla) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+Validación diferencial del parser rápido (core/parser_rapido.py) contra ANTLR.
+
+Para cada programa del corpus se comparan los dos árboles nodo a nodo (clase
+del contexto, tokens, posiciones de inicio/fin). Los programas con errores de
+sintaxis deben hacer fallar al parser rápido, que así cede el control a ANTLR.
+Al final se muestra la aceleración de cada parser sobre el corpus completo.
+
+Uso (desde la raíz del proyecto):
+
+    python -m benchmarks.validar_parser
+    python -m benchmarks.validar_parser --aleatorios 2000 --semilla 7
+
+El código de salida es 1 si hay alguna discrepancia.
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.tree.Tree import TerminalNode
+
+from antlr.MinicodeLexer import MinicodeLexer
+from antlr.MinicodeParser import MinicodeParser
+from benchmarks import programas
+from core.parser_rapido import ErrorSintaxis, ParserRapido, tokenizar
+
+
+class _ContadorErrores(ErrorListener):
+    def __init__(self):
+        self.errores = 0
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errores += 1
+
+
+def parsear_antlr(codigo):
+    """Devuelve (tree, numero_de_errores) sin imprimir nada en la consola."""
+    contador = _ContadorErrores()
+    lexer = MinicodeLexer(InputStream(codigo))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(contador)
+    parser = MinicodeParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(contador)
+    return parser.programa(), contador.errores
+
+
+def firma(nodo):
+    """Representación comparable de un subárbol."""
+    if isinstance(nodo, TerminalNode):
+        t = nodo.symbol
+        return ("T", t.type, t.text, t.tokenIndex, t.line, t.column, t.start, t.stop)
+    indice = lambda t: None if t is None else t.tokenIndex
+    hijos = tuple(firma(h) for h in (nodo.children or ()))
+    return (type(nodo).__name__, indice(nodo.start), indice(nodo.stop), hijos)
+
+
+def padres_coherentes(nodo):
+    for hijo in nodo.children or ():
+        if hijo.parentCtx is not nodo:
+            return False
+        if not isinstance(hijo, TerminalNode) and not padres_coherentes(hijo):
+            return False
+    return True
+
+
+# ------------------------------------------------------------
+# Corpus
+# ------------------------------------------------------------
+CASOS_BORDE = [
+    "",
+    "\n\n\n",
+    "# solo un comentario",
+    "mostrar 1",
+    "mostrar -2 + 3 * 4",
+    "mostrar -a + b",
+    "mostrar 2 ** 3 ** 2",
+    "mostrar 1 + 2 ** 3 * 4",
+    "mostrar a y b o c < d + e * f % g",
+    "mostrar a no es b",
+    "mostrar a es b",
+    "mostrar x != y == z",
+    "si a <= b y c >= d:\n\tmostrar \"si\"\nsino:\n\tmostrar \"no\"\nfin\n",
+    "mostrar \"texto con \\\"comillas\\\" y # almohadilla\"",
+    "mostrar \"multi\nlinea\"\nmostrar 2",
+    "definir x\r\ndefinir y como 3\r\n",
+    "definir año como 2024\nmostrar año",
+    "llamar saludar\nllamar saludar()\nllamar sumar(1, 2)\nsumar(1)\n",
+    "mostrar f(g(1), (2 + 3) * -4)\n",
+    "mover adelante\nmover atras 3\ngirar izquierda\ngirar derecha 45\n",
+    "cambiar color \"rojo\"\nbajar lapiz\nsubir lapiz\ncambiar color\n",
+    "tocar nota do\ntocar nota re durante 0.5 segundos\n",
+    "cambiar tempo 120\ncambiar tempo t * 2\ntempo = 3\ncambiar color \"rojo\"\n",
+    "definir polinomio p = x**2 + 1\nmostrar polinomio p\ngraficar p\n",
+    "sumar polinomio p con polinomio q\nmultiplicar polinomio p por polinomio q\n",
+    "funcion f():\n\tmostrar 1\nfin\nfuncion g(a, b, c):\n\tmostrar a\nfin\n",
+    "repetir 3 veces:\n\trepetir 2 veces:\n\t\tmover adelante 1\n\tfin\nfin\n",
+    "mostrar verdadero\nmostrar cierto\nmostrar falso\n",
+    "mientras x < 3:\n\tx = x + 1\nfin\nmientras verdadero hacer:\n\tmostrar 1\nfin\n",
+    "l = []\nm = [1, [2, 3], \"a\"]\nm[1][0] = -m[0] ** 2\nmostrar longitud(m) + f(l)[0]\n",
+    "para cada x en [1, 2, 3]:\n\tagregar(l, x * 2)\nfin\npara cada c en \"hola\":\n\tmostrar c\nfin\n",
+    "nose = 1\nnoes = 2\nmostrar no esto",
+    "en = 1\nhacer = 2\nmientras en < hacer hacer:\n\ten = en + 1\nfin\npara cada hacer en [en]:\n\tmostrar hacer\nfin\n",
+    # Con errores: el parser rápido debe rechazarlos
+    "mostrar",
+    "mostrar (1 + 2",
+    "definir 3",
+    "x + 1",
+    "si x:\nmostrar 1\n",
+    "mostrar 1.",
+    "mostrar @",
+    "mostrar \"sin cerrar",
+    "fin",
+    "mientras x < 3\n\tx = x + 1\nfin\n",
+    "mientras = 1\n",
+    "mientras x < 3 haz:\n\tx = x + 1\nfin\n",
+    "para cada x de l:\n\tmostrar x\nfin\n",
+    "l[0] = \n",
+    "mostrar [1, 2\n",
+    "mostrar [1,]\n",
+    "para x en l:\n\tmostrar x\nfin\n",
+    "cambiar volumen 3\n",
+    "cambiar tempo\n",
+]
+
+
+def _expresion_aleatoria(rnd, profundidad):
+    if profundidad <= 0 or rnd.random() < 0.3:
+        return rnd.choice(["1", "2.5", "x", "y", "verdadero", "falso", "\"t\"", "f(x)", "llamar g",
+                           "[]", "[1, x]", "l[0]"])
+    forma = rnd.random()
+    if forma < 0.15:
+        return f"({_expresion_aleatoria(rnd, profundidad - 1)})"
+    if forma < 0.3:
+        return rnd.choice("+-") + _expresion_aleatoria(rnd, profundidad - 1)
+    if forma < 0.4:
+        return f"{_expresion_aleatoria(rnd, profundidad - 1)}[{_expresion_aleatoria(rnd, profundidad - 1)}]"
+    op = rnd.choice(["+", "-", "*", "/", "%", "**", "<", ">", "<=", ">=", "==", "!=",
+                     "es", "no es", "y", "o"])
+    return f"{_expresion_aleatoria(rnd, profundidad - 1)} {op} {_expresion_aleatoria(rnd, profundidad - 1)}"
+
+
+def _programa_aleatorio(rnd):
+    lineas = []
+    for _ in range(rnd.randint(1, 6)):
+        plantilla = rnd.choice([
+            "mostrar {e}", "x = {e}", "definir v como {e}", "si {e}:\n\tmostrar {e}\nfin",
+            "repetir {e} veces:\n\tmover adelante {e}\nfin", "mientras {e}:\n\tx = {e}\nfin",
+            "para cada x en {e}:\n\tl[{e}] = {e}\nfin", "f({e}, {e})", "llamar g({e})",
+        ])
+        lineas.append(plantilla.replace("{e}", "{}").format(
+            *[_expresion_aleatoria(rnd, 4) for _ in range(plantilla.count("{e}"))]))
+    return "\n".join(lineas) + rnd.choice(["", "\n"])
+
+
+def corpus(aleatorios, semilla):
+    for ruta in sorted(glob.glob(os.path.join(RAIZ, "**", "*.minicode"), recursive=True)):
+        with open(ruta, "r", encoding="utf-8") as f:
+            yield os.path.relpath(ruta, RAIZ), f.read()
+    for i, codigo in enumerate(CASOS_BORDE):
+        yield f"borde[{i}]", codigo
+    for n in (10, 100, 500):
+        yield f"lineal[{n}]", programas.programa_lineal(n)
+    yield "bucles", programas.programa_bucles(10)
+    yield "recursion", programas.programa_recursion(10)
+    yield "grafico", programas.programa_grafico(10)
+    yield "polinomios", programas.programa_polinomios(8)
+    rnd = random.Random(semilla)
+    for i in range(aleatorios):
+        yield f"aleatorio[{i}]", _programa_aleatorio(rnd)
+
+
+# ------------------------------------------------------------
+# Validación
+# ------------------------------------------------------------
+def validar(aleatorios=500, semilla=0):
+    discrepancias = 0
+    total = 0
+    tiempo_antlr = 0.0
+    tiempo_rapido = 0.0
+
+    for nombre, codigo in corpus(aleatorios, semilla):
+        total += 1
+        inicio = time.perf_counter()
+        arbol_antlr, errores = parsear_antlr(codigo)
+        tiempo_antlr += time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        try:
+            arbol_rapido = ParserRapido(tokenizar(codigo)).programa()
+            fallo = None
+        except ErrorSintaxis as e:
+            arbol_rapido, fallo = None, e
+        tiempo_rapido += time.perf_counter() - inicio
+
+        if errores:
+            if fallo is None:
+                discrepancias += 1
+                print(f"✗ {nombre}: ANTLR informa {errores} error(es) pero el parser rápido lo acepta")
+            continue
+        if fallo is not None:
+            discrepancias += 1
+            print(f"✗ {nombre}: el parser rápido rechaza un programa válido ({fallo})")
+            continue
+        if firma(arbol_rapido) != firma(arbol_antlr) or not padres_coherentes(arbol_rapido):
+            discrepancias += 1
+            print(f"✗ {nombre}: los árboles no coinciden")
+            print(f"   antlr : {arbol_antlr.toStringTree(recog=MinicodeParser)[:300]}")
+            print(f"   rapido: {arbol_rapido.toStringTree(recog=MinicodeParser)[:300]}")
+
+    print(f"\n{total} programas, {discrepancias} discrepancia(s)")
+    if tiempo_rapido > 0:
+        print(f"ANTLR {tiempo_antlr * 1000:.1f} ms, rápido {tiempo_rapido * 1000:.1f} ms "
+              f"(x{tiempo_antlr / tiempo_rapido:.1f})")
+    return discrepancias
+
+
+def main(argv=None):
+    argp = argparse.ArgumentParser(description="Compara el parser rápido con el de ANTLR")
+    argp.add_argument("--aleatorios", type=int, default=500, help="programas aleatorios a generar")
+    argp.add_argument("--semilla", type=int, default=0)
+    args = argp.parse_args(argv)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000))
+    return 1 if validar(args.aleatorios, args.semilla) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+"""
+Ejecución aislada: cada programa corre en un proceso trabajador con límites de memoria y CPU.
+
+Un programa desbocado (un bucle que llena una lista, un producto enorme de polinomios
+en visitOperar_polinomio...) puede agotar la memoria del IDE o del proceso que corrige
+entregas. GrupoTrabajadores mantiene unos procesos ya arrancados, con Minicode, ANTLR,
+SymPy y NumPy importados y el parser precalentado, y les pasa los programas por un Pipe:
+
+    with GrupoTrabajadores(trabajadores=4, memoria_mb=256, cpu=5) as grupo:
+        resultado = grupo.ejecutar(codigo)
+        resultado.estado, resultado.salida, resultado.eventos
+
+Antes de cada programa el trabajador baja con `resource` el límite blando de espacio
+de direcciones (RLIMIT_AS: lo que ya ocupa + memoria_mb) y de tiempo de CPU
+(RLIMIT_CPU: lo ya consumido + cpu), y los restaura al terminar. Al pasarse de memoria
+Python lanza MemoryError; al pasarse de CPU llega SIGXCPU y se corta la ejecución.
+Si aun así el trabajador no contesta a tiempo o muere, el supervisor lo mata, lo
+sustituye por otro y devuelve el resultado con el estado correspondiente: el IDE y el
+resto de trabajadores no se enteran. Sin `resource` (Windows) solo queda el límite
+de tiempo del supervisor.
+
+Arranque de los trabajadores: donde existe (Linux, macOS) se usa el método
+"forkserver" de multiprocessing. Un proceso servidor importa core/precarga.py una sola
+vez (intérprete, ANTLR, SymPy y NumPy importados y ya usados) y cada trabajador nuevo
+es un fork suyo que comparte esas páginas copy-on-write: crear o sustituir un
+trabajador cuesta milisegundos en lugar del segundo largo de importarlo todo. Así cada trabajador se puede retirar tras
+`trabajos_por_trabajador` programas (lo que dejen atrás no se acumula) sin que se note.
+En el resto de sistemas se usa "spawn" y cada trabajador importa core/precarga.py al arrancar.
+
+El resultado lleva la salida de consola y el registro de eventos (core/eventos.py):
+el IDE lo reproduce en sus paneles como si el programa hubiera corrido en él.
+
+Uso como corrector en lote (una línea JSON por programa):
+
+    python -m core.aislamiento entregas/*.minicode --trabajadores 4 --memoria 256 --cpu 5
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: sin rlimits
+    resource = None
+
+LIMITE_MEMORIA_MB = 512
+LIMITE_CPU = 10            # segundos de CPU por programa
+MARGEN_SUPERVISOR = 2.0    # segundos de reloj de más antes de matar a un trabajador
+ESPERA_ARRANQUE = 60.0     # lo que puede tardar un trabajador nuevo en importar todo
+TRABAJOS_POR_TRABAJADOR = 200  # programas que ejecuta un trabajador antes de cambiarlo por otro
+
+# Módulos que el servidor de forks importa una vez para todos los trabajadores
+PRECARGA = ["core.aislamiento", "core.precarga"]
+
+# Estados de un Resultado
+OK = "ok"
+SINTAXIS = "sintaxis"      # el programa no se ejecutó: tiene errores de sintaxis
+ERROR = "error"            # error del programa (variable no definida, división por cero...)
+LIMITE = "limite"          # presupuesto de pasos o de tiempo del executor (LimiteEjecucion)
+MEMORIA = "memoria"        # superó memoria_mb
+CPU = "cpu"                # superó los segundos de CPU
+TIEMPO = "tiempo"          # no contestó a tiempo: el supervisor lo mató
+CAIDO = "caido"            # el trabajador murió por otra causa
+
+
+class Resultado:
+    __slots__ = ("estado", "salida", "error", "eventos", "segundos", "pasos")
+
+    def __init__(self, estado, salida=(), error=None, eventos=b"", segundos=0.0, pasos=0):
+        self.estado = estado
+        self.salida = list(salida)      # líneas de consola
+        self.error = error              # mensaje si estado != OK
+        self.eventos = eventos          # registro de core/eventos.py
+        self.segundos = segundos
+        self.pasos = pasos
+
+    def a_dict(self):
+        """Para JSON: sin el registro de eventos, que es binario."""
+        return {"estado": self.estado, "salida": self.salida, "error": self.error,
+                "segundos": round(self.segundos, 6), "pasos": self.pasos}
+
+    def __repr__(self):
+        return f"Resultado({self.estado}, {len(self.salida)} línea(s), {self.segundos:.3f} s)"
+
+
+# ============================================================
+# 👷 PROCESO TRABAJADOR
+# ============================================================
+class _SinCPU(BaseException):
+    """BaseException: que no la atrapen los `except Exception` del executor."""
+
+
+def _sin_cpu(signum, frame):
+    raise _SinCPU("Error: el programa superó su tiempo de CPU.")
+
+
+def _precargar():
+    """Deja el trabajador listo (con "forkserver" ya lo está: viene del servidor)."""
+    import core.precarga  # noqa: F401
+    if hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _sin_cpu)
+
+
+def _memoria_virtual():
+    """Bytes de espacio de direcciones que ocupa el proceso (0 si no se puede saber)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _limitar(memoria_mb, cpu):
+    """Baja los límites blandos para el siguiente programa; devuelve los anteriores."""
+    if resource is None:
+        return None
+    anteriores = (resource.getrlimit(resource.RLIMIT_AS), resource.getrlimit(resource.RLIMIT_CPU))
+    ocupada = _memoria_virtual()
+    if memoria_mb and ocupada:
+        blando, duro = anteriores[0]
+        limite = ocupada + memoria_mb * 1024 * 1024
+        if duro != resource.RLIM_INFINITY:
+            limite = min(limite, duro)
+        resource.setrlimit(resource.RLIMIT_AS, (limite, duro))
+    if cpu:
+        uso = resource.getrusage(resource.RUSAGE_SELF)
+        blando, duro = anteriores[1]
+        limite = int(uso.ru_utime + uso.ru_stime + cpu) + 1
+        if duro != resource.RLIM_INFINITY:
+            limite = min(limite, duro)
+        resource.setrlimit(resource.RLIMIT_CPU, (limite, duro))
+    return anteriores
+
+
+def _restaurar(anteriores):
+    if anteriores is not None:
+        resource.setrlimit(resource.RLIMIT_AS, anteriores[0])
+        resource.setrlimit(resource.RLIMIT_CPU, anteriores[1])
+
+
+class _Consola:
+    def __init__(self):
+        self.lineas = []
+
+    def append(self, texto):
+        self.lineas.append(str(texto))
+
+
+class _ErrorSintaxis(Exception):
+    pass
+
+
+def _parsear(codigo):
+    """Árbol del programa; con errores de sintaxis lanza _ErrorSintaxis con sus mensajes."""
+    from core.parser_rapido import ErrorSintaxis, parsear as parsear_rapido
+    try:
+        return parsear_rapido(codigo)
+    except ErrorSintaxis:
+        from core.diagnosticos import errores_sintaxis
+        tree, diagnosticos = errores_sintaxis(codigo)
+        if not diagnosticos:
+            return tree
+        raise _ErrorSintaxis("\n".join(f"Línea {d.linea}:{d.columna}: {d.mensaje}" for d in diagnosticos))
+
+
+def _ejecutar_trabajo(codigo, opciones):
+    """Ejecuta un programa dentro del trabajador y devuelve los campos de un Resultado."""
+    from core.eventos import GrabadorEventos
+    from core.executor import LimiteEjecucion, MinicodeExecutor
+    from core.optimizador import OptimizadorAST
+
+    consola = _Consola()
+    grabador = GrabadorEventos()
+    executor = None
+    estado, error = OK, None
+    inicio = time.perf_counter()
+    anteriores = _limitar(opciones.get("memoria_mb"), opciones.get("cpu"))
+    try:
+        tree = _parsear(codigo)
+        modo = opciones.get("modo")
+        if modo is not None:
+            from core.modos import rebanar
+            conservadas, total = rebanar(tree, modo)
+            grabador.envolver_consola(consola).append(
+                f"(Modo {modo}: se ejecutan {conservadas} de {total} instrucciones)")
+        tree = OptimizadorAST(numeros=opciones.get("numeros")).optimizar(tree)
+        executor = MinicodeExecutor(consola, numeros=opciones.get("numeros"), grabador=grabador,
+                                    limite_pasos=opciones.get("limite_pasos"),
+                                    limite_segundos=opciones.get("limite_segundos"))
+        executor.visit(tree)
+    except _ErrorSintaxis as e:
+        estado, error = SINTAXIS, str(e)
+    except LimiteEjecucion as e:
+        estado, error = LIMITE, str(e)
+    except MemoryError:
+        estado, error = MEMORIA, "Error: el programa superó el límite de memoria."
+    except _SinCPU as e:
+        estado, error = CPU, str(e)
+    except RecursionError:
+        estado, error = ERROR, "Error: demasiadas llamadas anidadas (recursión sin fin)."
+    except Exception as e:
+        estado, error = ERROR, str(e) or type(e).__name__
+    finally:
+        tree = None
+        _restaurar(anteriores)
+    pasos = executor.pasos if executor is not None else 0
+    return estado, consola.lineas, error, bytes(grabador), time.perf_counter() - inicio, pasos
+
+
+def _trabajador(conexion):
+    """Bucle del proceso trabajador: (codigo, opciones) -> campos de Resultado; None termina."""
+    _precargar()
+    conexion.send("listo")
+    while True:
+        try:
+            trabajo = conexion.recv()
+        except (EOFError, OSError):
+            return
+        if trabajo is None:
+            return
+        conexion.send(_ejecutar_trabajo(*trabajo))
+
+
+# ============================================================
+# 🧑‍✈️ SUPERVISOR
+# ============================================================
+class _Trabajador:
+    __slots__ = ("proceso", "conexion", "listo", "trabajos")
+
+    def __init__(self, proceso, conexion):
+        self.proceso = proceso
+        self.conexion = conexion
+        self.listo = False
+        self.trabajos = 0
+
+    def esperar_arranque(self, espera):
+        if not self.listo and self.conexion.poll(espera):
+            self.listo = self.conexion.recv() == "listo"
+        return self.listo
+
+    def matar(self):
+        if self.proceso.is_alive():
+            self.proceso.kill()
+        self.proceso.join(1)
+        self.conexion.close()
+
+    def retirar(self):
+        """Le pide que termine sin esperarle (multiprocessing recoge el proceso más tarde)."""
+        try:
+            self.conexion.send(None)
+        except OSError:
+            pass
+        self.conexion.close()
+
+
+class GrupoTrabajadores:
+    """
+    Procesos trabajadores arrancados de antemano que ejecutan programas Minicode de uno
+    en uno con límites de memoria y CPU (ver el docstring del módulo). ejecutar() se puede
+    llamar desde varios hilos a la vez: cada llamada toma un trabajador libre.
+    """
+
+    def __init__(self, trabajadores=None, memoria_mb=LIMITE_MEMORIA_MB, cpu=LIMITE_CPU,
+                 trabajos_por_trabajador=TRABAJOS_POR_TRABAJADOR):
+        self.memoria_mb = memoria_mb
+        self.cpu = cpu
+        self.trabajos_por_trabajador = trabajos_por_trabajador
+        self.trabajadores = trabajadores or max(1, min(4, os.cpu_count() or 1))
+        # Ni "forkserver" ni "spawn" hacen fork del proceso que llama, que puede tener hilos (Qt)
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._contexto = multiprocessing.get_context("forkserver")
+            # Con `python -m core.aislamiento` este módulo es __main__ y el servidor ya lo
+            # ejecuta como tal: importarlo otra vez daría un RuntimeWarning en cada trabajador
+            principal = getattr(sys.modules["__main__"].__spec__, "name", None)
+            self._contexto.set_forkserver_preload([m for m in PRECARGA if m != principal])
+        else:
+            self._contexto = multiprocessing.get_context("spawn")
+        self._libres = queue.Queue()
+        self._cerrado = False
+        for _ in range(self.trabajadores):
+            self._libres.put(self._arrancar())
+
+    def _arrancar(self):
+        conexion, extremo = self._contexto.Pipe()
+        proceso = self._contexto.Process(target=_trabajador, args=(extremo,),
+                                         name="minicode-trabajador", daemon=True)
+        proceso.start()
+        extremo.close()
+        return _Trabajador(proceso, conexion)
+
+    def ejecutar(self, codigo, modo=None, numeros=None, limite_pasos=None, limite_segundos=None,
+                 memoria_mb=None, cpu=None):
+        """Ejecuta `codigo` en un trabajador y devuelve su Resultado."""
+        if self._cerrado:
+            raise RuntimeError("El grupo de trabajadores está cerrado.")
+        memoria_mb = self.memoria_mb if memoria_mb is None else memoria_mb
+        cpu = self.cpu if cpu is None else cpu
+        opciones = {"modo": modo, "numeros": numeros, "limite_pasos": limite_pasos,
+                    "limite_segundos": limite_segundos, "memoria_mb": memoria_mb, "cpu": cpu}
+        espera = max(cpu or 0, limite_segundos or 0) or None
+        if espera is not None:
+            espera += MARGEN_SUPERVISOR
+
+        trabajador = self._libres.get()
+        sano = False
+        inicio = time.perf_counter()
+        try:
+            if not trabajador.esperar_arranque(ESPERA_ARRANQUE):
+                return Resultado(CAIDO, error="Error: el proceso trabajador no llegó a arrancar.")
+            inicio = time.perf_counter()
+            trabajador.conexion.send((codigo, opciones))
+            if not trabajador.conexion.poll(espera):
+                return Resultado(TIEMPO, error=f"Error: el programa no terminó en {espera:.0f} s.",
+                                 segundos=time.perf_counter() - inicio)
+            resultado = Resultado(*trabajador.conexion.recv())
+            trabajador.trabajos += 1
+            # Tras un MemoryError el trabajador puede haber quedado en mal estado: se cambia
+            sano = resultado.estado != MEMORIA
+            return resultado
+        except (EOFError, OSError):
+            return self._caido(trabajador, time.perf_counter() - inicio)
+        finally:
+            if sano and trabajador.trabajos < self.trabajos_por_trabajador:
+                self._libres.put(trabajador)
+            else:
+                if sano:
+                    trabajador.retirar()
+                else:
+                    trabajador.matar()
+                if not self._cerrado:
+                    self._libres.put(self._arrancar())
+
+    @staticmethod
+    def _caido(trabajador, segundos):
+        trabajador.proceso.join(1)
+        codigo = trabajador.proceso.exitcode
+        if codigo == -getattr(signal, "SIGXCPU", 0):
+            return Resultado(CPU, error="Error: el programa superó su tiempo de CPU.", segundos=segundos)
+        if codigo == -getattr(signal, "SIGKILL", 0):
+            # En Linux, lo más habitual: el sistema se quedó sin memoria y eligió este proceso
+            return Resultado(MEMORIA, error="Error: el sistema detuvo el programa (memoria).", segundos=segundos)
+        return Resultado(CAIDO, error=f"Error: el proceso trabajador terminó (código {codigo}).",
+                         segundos=segundos)
+
+    def ejecutar_varios(self, codigos, **opciones):
+        """Resultados de varios programas, en el mismo orden, repartidos entre los trabajadores."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(self.trabajadores) as hilos:
+            yield from hilos.map(lambda codigo: self.ejecutar(codigo, **opciones), codigos)
+
+    def cerrar(self):
+        self._cerrado = True
+        while True:
+            try:
+                trabajador = self._libres.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                trabajador.conexion.send(None)
+                trabajador.proceso.join(1)
+            except OSError:
+                pass
+            trabajador.matar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# ============================================================
+# 📋 CORRECTOR EN LOTE
+# ============================================================
+def main(argv=None):
+    argp = argparse.ArgumentParser(description="Ejecuta programas Minicode en procesos aislados")
+    argp.add_argument("archivos", nargs="+", help="programas .minicode")
+    argp.add_argument("--trabajadores", type=int, default=None)
+    argp.add_argument("--memoria", type=int, default=LIMITE_MEMORIA_MB, help="MB por programa")
+    argp.add_argument("--cpu", type=float, default=LIMITE_CPU, help="segundos de CPU por programa")
+    argp.add_argument("--pasos", type=int, default=None, help="límite de pasos del executor")
+    argp.add_argument("--trabajos-por-trabajador", type=int, default=TRABAJOS_POR_TRABAJADOR,
+                      help="programas que ejecuta cada proceso antes de cambiarlo por otro")
+    argp.add_argument("--registros", default=None,
+                      help="carpeta donde guardar el registro de eventos (.mcev) de cada programa")
+    args = argp.parse_args(argv)
+
+    codigos = []
+    for ruta in args.archivos:
+        with open(ruta, encoding="utf-8") as f:
+            codigos.append(f.read())
+    if args.registros:
+        os.makedirs(args.registros, exist_ok=True)
+
+    fallos = 0
+    with GrupoTrabajadores(args.trabajadores, memoria_mb=args.memoria, cpu=args.cpu,
+                           trabajos_por_trabajador=args.trabajos_por_trabajador) as grupo:
+        resultados = grupo.ejecutar_varios(codigos, limite_pasos=args.pasos)
+        for ruta, resultado in zip(args.archivos, resultados):
+            fallos += resultado.estado != OK
+            if args.registros:
+                nombre = os.path.splitext(os.path.basename(ruta))[0] + ".mcev"
+                with open(os.path.join(args.registros, nombre), "wb") as f:
+                    f.write(resultado.eventos)
+            print(json.dumps({"archivo": ruta, **resultado.a_dict()}, ensure_ascii=False), flush=True)
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
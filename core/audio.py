@@ -0,0 +1,258 @@
+"""
+Motor de audio de Minicode: sintetiza notas con NumPy y las mezcla en un buffer.
+
+No necesita tarjeta de sonido: un programa musical se convierte en una lista de
+eventos (inicio, nota, duración) que se renderiza de una vez, mucho más rápido que
+en tiempo real, y se puede guardar como WAV. Cada nota es una senoide con
+envolvente ADSR; las formas de onda se guardan por (nota, duración), así que una
+melodía con muchas notas repetidas solo sintetiza cada una la primera vez. La caché
+está limitada por número de muestras y las notas largas no entran en ella: se
+sintetizan por tramos, según se van necesitando. Ninguna nota dura más de
+DURACION_MAXIMA_NOTA segundos.
+
+Nombres de nota: do, re, mi, fa, sol, la, si (o c..b), con sostenido/bemol
+opcional (`dosostenido`, `sibemol`, `cs`, `bb`) y octava opcional (`la4` = 440 Hz,
+la octava por defecto es la 4). `silencio` no suena pero ocupa su duración.
+Como `si` es la palabra clave del condicional, esa nota se escribe con octava (`si4`).
+
+La reproducción no frena al intérprete: el executor solo apunta los eventos en una
+LineaDeTiempo y, al terminar, un ProgramadorMusical (hilo aparte) los sintetiza por
+bloques y se los pasa a la salida de audio (gui/audio_player.py) o a un fichero.
+"""
+import re
+import threading
+import wave
+from collections import OrderedDict
+
+FRECUENCIA_MUESTREO = 44100
+OCTAVA_POR_DEFECTO = 4
+SILENCIO = "silencio"
+DURACION_MAXIMA_NOTA = 60.0  # segundos
+MUESTRAS_NOTA_CACHE = 5 * FRECUENCIA_MUESTREO  # las notas más largas se sintetizan por tramos
+LIMITE_CACHE_MUESTRAS = 4_000_000  # ~16 MB de float32 entre todas las formas de onda guardadas
+
+_SEMITONOS = {"do": 0, "re": 2, "mi": 4, "fa": 5, "sol": 7, "la": 9, "si": 11,
+              "c": 0, "d": 2, "e": 4, "f": 5, "g": 7, "a": 9, "b": 11}
+_ALTERACIONES = {"sostenido": 1, "s": 1, "bemol": -1, "b": -1, None: 0}
+_PATRON_NOTA = re.compile(r"(do|re|mi|fa|sol|la|si|[a-g])(sostenido|bemol|s|b)?(\d)?")
+
+
+def frecuencia(nota):
+    """Frecuencia en Hz de `nota` (None para `silencio`). Lanza ValueError si no se reconoce."""
+    nota = str(nota).lower()
+    if nota == SILENCIO:
+        return None
+    m = _PATRON_NOTA.fullmatch(nota)
+    if m is None:
+        raise ValueError(f"Nota desconocida: '{nota}'.")
+    nombre, alteracion, octava = m.groups()
+    octava = int(octava) if octava is not None else OCTAVA_POR_DEFECTO
+    midi = 12 * (octava + 1) + _SEMITONOS[nombre] + _ALTERACIONES[alteracion]
+    return 440.0 * 2.0 ** ((midi - 69) / 12)
+
+
+class Sintetizador:
+    """Renderiza notas (senoide + ADSR) y guarda cada forma de onda ya calculada."""
+
+    def __init__(self, frecuencia_muestreo=FRECUENCIA_MUESTREO, ataque=0.01, decaimiento=0.05,
+                 sostenido=0.7, liberacion=0.05, volumen=0.5):
+        self.frecuencia_muestreo = frecuencia_muestreo
+        self.ataque = ataque
+        self.decaimiento = decaimiento
+        self.sostenido = sostenido
+        self.liberacion = liberacion
+        self.volumen = volumen
+        self._cache = OrderedDict()  # (nota, duración) -> array float32 de solo lectura (LRU)
+        self._muestras_cache = 0
+
+    def muestras(self, duracion):
+        return max(0, int(round(float(duracion) * self.frecuencia_muestreo)))
+
+    def _envolvente(self, n, desde, hasta):
+        """Muestras [desde, hasta) de la envolvente ADSR de una nota de `n` muestras."""
+        import numpy as np
+
+        sr = self.frecuencia_muestreo
+        a = min(n, int(self.ataque * sr))
+        d = min(n - a, int(self.decaimiento * sr))
+        r = min(n - a - d, int(self.liberacion * sr))
+        s = self.sostenido
+        i = np.arange(desde, hasta, dtype=np.float32)
+        envolvente = np.full(len(i), s, dtype=np.float32)
+        tramo = i < a
+        envolvente[tramo] = i[tramo] / a
+        tramo = (i >= a) & (i < a + d)
+        envolvente[tramo] = 1.0 + (s - 1.0) * (i[tramo] - a) / d
+        tramo = i >= n - r
+        envolvente[tramo] = s - s * (i[tramo] - (n - r)) / max(1, r - 1)
+        return envolvente
+
+    def _sintetizar(self, nota, n, desde, hasta):
+        """Muestras [desde, hasta) de `nota` con `n` muestras en total."""
+        import numpy as np
+
+        hz = frecuencia(nota)
+        if hz is None:
+            return np.zeros(hasta - desde, dtype=np.float32)
+        t = np.arange(desde, hasta, dtype=np.float32) / np.float32(self.frecuencia_muestreo)
+        onda = np.sin(np.float32(2 * np.pi * hz) * t)
+        onda *= self._envolvente(n, desde, hasta)
+        onda *= np.float32(self.volumen)
+        return onda
+
+    def renderizar_nota(self, nota, duracion):
+        """Forma de onda de `nota` durante `duracion` segundos (compartida: no modificarla)."""
+        clave = (str(nota).lower(), float(duracion))
+        onda = self._cache.get(clave)
+        if onda is not None:
+            self._cache.move_to_end(clave)
+            return onda
+        n = self.muestras(duracion)
+        onda = self._sintetizar(nota, n, 0, n)
+        onda.flags.writeable = False
+        if n <= MUESTRAS_NOTA_CACHE:
+            self._cache[clave] = onda
+            self._muestras_cache += n
+            while self._muestras_cache > LIMITE_CACHE_MUESTRAS:
+                _, vieja = self._cache.popitem(last=False)
+                self._muestras_cache -= len(vieja)
+        return onda
+
+    def tramo(self, nota, duracion, desde, hasta):
+        """Muestras [desde, hasta) de la nota: de la caché si es corta, sintetizadas aparte si es larga."""
+        n = self.muestras(duracion)
+        if n <= MUESTRAS_NOTA_CACHE:
+            return self.renderizar_nota(nota, duracion)[desde:hasta]
+        return self._sintetizar(nota, n, desde, min(hasta, n))
+
+    def mezclar(self, eventos):
+        """
+        Mezcla los eventos [(inicio_s, nota, duración_s)] en un único buffer float32
+        (todo de una vez, para exportar; para reproducir, ProgramadorMusical).
+        Si la suma satura, se normaliza para que el pico quede en 1.
+        """
+        import numpy as np
+
+        if not eventos:
+            return np.zeros(0, dtype=np.float32)
+        fin = max(self.muestras(inicio) + self.muestras(duracion) for inicio, _, duracion in eventos)
+        buffer = np.zeros(fin, dtype=np.float32)
+        for inicio, nota, duracion in eventos:
+            onda = self.renderizar_nota(nota, duracion)
+            desde = self.muestras(inicio)
+            buffer[desde:desde + len(onda)] += onda
+        pico = float(np.abs(buffer).max()) if len(buffer) else 0.0
+        if pico > 1.0:
+            buffer /= pico
+        return buffer
+
+
+# ============================================================
+# 🕒 LÍNEA DE TIEMPO Y PROGRAMADOR
+# ============================================================
+class LineaDeTiempo:
+    """
+    Eventos (inicio_s, nota, duración_s) de un programa. Las notas se encadenan una
+    tras otra; un acorde empieza todas sus notas a la vez. Las duraciones se
+    escriben en pulsos a TEMPO_REFERENCIA (60 ppm: un pulso = un segundo) y se
+    convierten a segundos con el tempo vigente, que puede cambiar a mitad de programa.
+    """
+    TEMPO_REFERENCIA = 60.0
+
+    def __init__(self, tempo=TEMPO_REFERENCIA):
+        self.eventos = []
+        self.cursor = 0.0  # instante (s) en el que empieza la próxima nota
+        self.tempo = float(tempo)
+
+    def cambiar_tempo(self, tempo):
+        tempo = float(tempo)
+        if not 0 < tempo < float("inf"):  # también descarta NaN
+            raise ValueError(f"El tempo debe ser un número positivo: {tempo:g}.")
+        self.tempo = tempo
+
+    def segundos(self, duracion):
+        """Duración en segundos de `duracion` pulsos con el tempo vigente."""
+        return float(duracion) * self.TEMPO_REFERENCIA / self.tempo
+
+    def agregar(self, notas, duracion):
+        """Añade una nota (o un acorde si `notas` es una lista) y avanza el cursor."""
+        segundos = self.segundos(duracion)
+        for nota in ([notas] if isinstance(notas, str) else notas):
+            self.eventos.append((self.cursor, nota, segundos))
+        self.cursor += segundos
+
+    def duracion_total(self):
+        return max((inicio + duracion for inicio, _, duracion in self.eventos), default=0.0)
+
+
+class ProgramadorMusical(threading.Thread):
+    """
+    Hilo que recorre una LineaDeTiempo en orden y entrega el audio en bloques de
+    BLOQUE_S segundos a `salida(bloque_float32)`. La salida marca el ritmo: un
+    reproductor la bloquea mientras su buffer esté lleno, así que el hilo solo va
+    por delante lo que quepa en él. De cada nota se sintetiza solo el tramo que cae
+    en el bloque (Sintetizador.tramo), no la nota entera. Las notas que se solapan (acordes) se suman y
+    los picos se suavizan con tanh en lugar de recortarse.
+    """
+    BLOQUE_S = 0.05
+
+    def __init__(self, linea, salida, sintetizador=None, al_terminar=None):
+        super().__init__(name="programador-musical", daemon=True)
+        self.eventos = sorted(linea.eventos)
+        self.salida = salida
+        self.sintetizador = sintetizador or Sintetizador()
+        self.al_terminar = al_terminar
+        self._detener = threading.Event()
+
+    def detener(self):
+        self._detener.set()
+
+    @property
+    def detenido(self):
+        return self._detener.is_set()
+
+    def run(self):
+        import numpy as np
+
+        sint = self.sintetizador
+        n = sint.muestras(self.BLOQUE_S)
+        total = max((sint.muestras(i) + sint.muestras(d) for i, _, d in self.eventos), default=0)
+        siguiente = 0
+        activos = []  # [(muestra_inicial, muestras, nota, duración)] que suenan en el bloque actual
+        try:
+            for desde in range(0, total, n):
+                if self._detener.is_set():
+                    return
+                hasta = desde + n
+                while siguiente < len(self.eventos) and sint.muestras(self.eventos[siguiente][0]) < hasta:
+                    inicio, nota, duracion = self.eventos[siguiente]
+                    activos.append((sint.muestras(inicio), sint.muestras(duracion), nota, duracion))
+                    siguiente += 1
+                bloque = np.zeros(min(n, total - desde), dtype=np.float32)
+                for inicio, muestras, nota, duracion in activos:
+                    a, b = max(desde, inicio), min(hasta, inicio + muestras)
+                    if a < b:
+                        bloque[a - desde:b - desde] += sint.tramo(nota, duracion, a - inicio, b - inicio)
+                activos = [activo for activo in activos if activo[0] + activo[1] > hasta]
+                if len(bloque) and float(np.abs(bloque).max()) > 1.0:
+                    np.tanh(bloque, out=bloque)
+                self.salida(bloque)
+        finally:
+            if self.al_terminar is not None:
+                self.al_terminar()
+
+
+def a_pcm16(buffer):
+    """Muestras float en [-1, 1] a bytes PCM de 16 bits (little-endian)."""
+    import numpy as np
+
+    return (np.clip(buffer, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+def escribir_wav(ruta, buffer, frecuencia_muestreo=FRECUENCIA_MUESTREO):
+    """Guarda `buffer` (float en [-1, 1]) como WAV mono de 16 bits."""
+    with wave.open(ruta, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(frecuencia_muestreo)
+        f.writeframes(a_pcm16(buffer))
@@ -0,0 +1,86 @@
+import time
+
+
+# ============================================================
+# 🐞 DEPURADOR PASO A PASO
+# ============================================================
+# Órdenes que puede devolver al_detenerse:
+#   "continuar" hasta el siguiente punto de ruptura
+#   "entrar"    hasta la siguiente instrucción, aunque esté dentro de una función
+#   "saltar"    hasta la siguiente instrucción de esta función (o de las que la llamaron)
+#   "salir"     hasta volver a la función que llamó a esta
+#   "detener"   termina la ejecución con DepuracionDetenida
+ORDENES = ("continuar", "entrar", "saltar", "salir", "detener")
+
+
+class DepuracionDetenida(Exception):
+    """El usuario detuvo el programa desde el depurador."""
+
+
+class Depurador:
+    """
+    Puntos de ruptura y ejecución paso a paso. Lo alimenta MinicodeExecutor cuando se
+    crea con `depurador=...`: solo entonces el executor cambia visit() por una versión
+    que avisa antes de cada instrucción y no fusiona los comandos gráficos en lotes, así
+    que la ejecución normal no paga nada.
+
+    Cada vez que el programa se detiene se llama a `al_detenerse(depurador)`, que puede
+    consultar `linea`, `pila` y marcos() y debe devolver una de ORDENES. La interfaz
+    espera ahí a que el usuario pulse un botón; sin interfaz basta una función normal.
+    """
+
+    def __init__(self, al_detenerse, puntos_ruptura=(), detenerse_al_empezar=False):
+        self.al_detenerse = al_detenerse
+        self.puntos_ruptura = set(puntos_ruptura)
+        self.pila = []  # [(función, línea de la llamada)] de las llamadas en curso
+        self.executor = None
+        self.linea = None  # línea de la instrucción en la que está detenido
+        self._orden = "entrar" if detenerse_al_empezar else "continuar"
+        self._profundidad = 0
+
+    # -----------------------------------------------------------
+    # Llamado por el executor
+    # -----------------------------------------------------------
+    def antes_de(self, executor, ctx):
+        """Antes de ejecutar la instrucción `ctx`. Devuelve los segundos que estuvo detenido."""
+        linea = ctx.start.line
+        profundidad = len(self.pila)
+        orden = self._orden
+        if not (linea in self.puntos_ruptura or orden == "entrar"
+                or (orden == "saltar" and profundidad <= self._profundidad)
+                or (orden == "salir" and profundidad < self._profundidad)):
+            return 0.0
+
+        self.executor = executor
+        self.linea = linea
+        inicio = time.perf_counter()
+        orden = self.al_detenerse(self)
+        if orden not in ORDENES:
+            raise ValueError(f"Orden de depuración desconocida: '{orden}'.")
+        if orden == "detener":
+            raise DepuracionDetenida(f"Ejecución detenida en la línea {linea}.")
+        self._orden = orden
+        self._profundidad = profundidad
+        return time.perf_counter() - inicio
+
+    def entrar_funcion(self, nombre, linea):
+        self.pila.append((nombre, linea))
+
+    def salir_funcion(self):
+        self.pila.pop()
+
+    # -----------------------------------------------------------
+    # Inspección (mientras está detenido)
+    # -----------------------------------------------------------
+    def marcos(self):
+        """
+        [(nombre, variables)] de la función en curso hacia el programa principal,
+        sacados de executor.call_stack: cada llamada guarda ahí las variables de
+        quien la hizo y `executor.variables` son las de la función en curso.
+        """
+        executor = self.executor
+        if executor is None:
+            return []
+        ambitos = executor.call_stack[1:] + [executor.variables]
+        nombres = ["programa"] + [f"{nombre} (llamada en la línea {linea})" for nombre, linea in self.pila]
+        return list(zip(nombres, ambitos))[::-1]
@@ -0,0 +1,212 @@
+"""
+Diagnósticos de código Minicode sin ejecutarlo: errores de sintaxis (recogidos
+del parser de ANTLR) y comprobaciones semánticas sobre el árbol:
+
+  - variables que no se definen en ningún punto del programa (error) o que se
+    usan antes de su primera definición en el código principal (aviso);
+  - funciones no definidas y llamadas con un número de argumentos distinto al
+    de parámetros, como comprueba MinicodeExecutor.visitFuncion_llamada (error),
+    también para las funciones nativas de listas (core/listas.py);
+  - polinomios que se muestran, grafican u operan sin haberse definido (aviso).
+
+Lo usa el servicio de diagnósticos del editor (gui/diagnostics_service.py)
+desde un hilo en segundo plano: aquí no se toca nada de Qt.
+"""
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.tree.Tree import TerminalNode
+from antlr.MinicodeParser import MinicodeParser as P
+from core.listas import FUNCIONES_NATIVAS
+
+ERROR = "error"
+AVISO = "aviso"
+
+
+class Diagnostico:
+    __slots__ = ("linea", "columna", "longitud", "nivel", "mensaje")
+
+    def __init__(self, linea, columna, longitud, nivel, mensaje):
+        self.linea = linea          # 1-based, como en ANTLR
+        self.columna = columna      # 0-based
+        self.longitud = max(1, longitud)
+        self.nivel = nivel
+        self.mensaje = mensaje
+
+    def __repr__(self):
+        return f"Diagnostico({self.linea}:{self.columna} {self.nivel}: {self.mensaje})"
+
+
+class RecolectorErrores(ErrorListener):
+    """ErrorListener que guarda los errores de sintaxis en lugar de imprimirlos."""
+
+    def __init__(self):
+        self.diagnosticos = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        longitud = 1
+        if offendingSymbol is not None and offendingSymbol.text and offendingSymbol.type != -1:
+            longitud = len(offendingSymbol.text)
+        self.diagnosticos.append(Diagnostico(line, column, longitud, ERROR, f"Error de sintaxis: {msg}"))
+
+
+def errores_sintaxis(codigo):
+    """Parsea con ANTLR (LL completo) y devuelve (tree, [Diagnostico])."""
+    from antlr4 import InputStream, CommonTokenStream
+    from antlr.MinicodeLexer import MinicodeLexer
+
+    recolector = RecolectorErrores()
+    lexer = MinicodeLexer(InputStream(codigo))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(recolector)
+    parser = P(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(recolector)
+    tree = parser.programa()
+    return tree, recolector.diagnosticos
+
+
+def analizar(codigo):
+    """Devuelve la lista de Diagnostico de `codigo`, ordenada por posición."""
+    from core.parser_rapido import ErrorSintaxis, parsear as parsear_rapido
+
+    try:
+        tree = parsear_rapido(codigo)
+        diagnosticos = []
+    except ErrorSintaxis:
+        tree, diagnosticos = errores_sintaxis(codigo)
+
+    # Un árbol con errores de sintaxis tiene huecos: solo se analiza si está completo
+    if not diagnosticos:
+        diagnosticos = AnalizadorSemantico().analizar(tree)
+    diagnosticos.sort(key=lambda d: (d.linea, d.columna))
+    return diagnosticos
+
+
+# ============================================================
+# 🔍 ANÁLISIS SEMÁNTICO
+# ============================================================
+class AnalizadorSemantico:
+    """
+    Recorre el árbol en orden textual. Minicode tiene ámbito dinámico (una función
+    ve las variables de quien la llama), así que dentro de las funciones solo se
+    comprueba que cada nombre se defina en algún punto del programa.
+    """
+
+    def __init__(self):
+        self.funciones = {}        # nombre -> (número de parámetros, línea)
+        self.nombres = set()       # variables definidas en cualquier punto
+        self.polinomios = set()
+        self.definidos = set()     # definidos hasta ahora en el código principal
+        self.diagnosticos = []
+
+    def analizar(self, tree):
+        self._recoger(tree)
+        self._comprobar(tree, en_funcion=False)
+        return self.diagnosticos
+
+    def _nuevo(self, token, nivel, mensaje):
+        self.diagnosticos.append(Diagnostico(token.line, token.column, len(token.text), nivel, mensaje))
+
+    # -----------------------------------------------------------
+    # Primera pasada: qué se define en todo el programa
+    # -----------------------------------------------------------
+    def _recoger(self, tree):
+        pendientes = [tree]
+        while pendientes:
+            nodo = pendientes.pop()
+            if isinstance(nodo, TerminalNode):
+                continue
+            if isinstance(nodo, P.Funcion_defContext):
+                parametros = nodo.parametros().ID() if nodo.parametros() else []
+                self.funciones[nodo.ID().getText()] = (len(parametros), nodo.start.line)
+                self.nombres.update(p.getText() for p in parametros)
+            elif isinstance(nodo, (P.Declarar_varContext, P.AsignacionContext, P.Para_cadaContext)):
+                self.nombres.add(nodo.ID().getText())
+            elif isinstance(nodo, P.Definir_polinomioContext):
+                self.polinomios.add(nodo.ID().getText())
+            elif isinstance(nodo, P.Operar_polinomioContext):
+                op = nodo.children[0].getText()
+                self.polinomios.add(f"{nodo.ID(0).getText()}_{op}_{nodo.ID(1).getText()}")
+            pendientes.extend(nodo.children or ())
+
+    # -----------------------------------------------------------
+    # Segunda pasada: usos
+    # -----------------------------------------------------------
+    def _hijos(self, nodo, en_funcion):
+        for hijo in nodo.children or ():
+            if not isinstance(hijo, TerminalNode):
+                self._comprobar(hijo, en_funcion)
+
+    def _comprobar(self, nodo, en_funcion):
+        if isinstance(nodo, (P.Declarar_varContext, P.AsignacionContext)):
+            self._hijos(nodo, en_funcion)
+            if not en_funcion:
+                self.definidos.add(nodo.ID().getText())
+
+        elif isinstance(nodo, P.Para_cadaContext):
+            self._comprobar(nodo.expresion(), en_funcion)
+            if not en_funcion:
+                self.definidos.add(nodo.ID().getText())
+            self._comprobar(nodo.bloque(), en_funcion)
+
+        elif isinstance(nodo, P.Asignar_elementoContext):
+            self._comprobar_variable(nodo.ID().symbol, en_funcion)
+            self._hijos(nodo, en_funcion)
+
+        elif isinstance(nodo, P.Funcion_defContext):
+            self._comprobar(nodo.bloque(), en_funcion=True)
+
+        elif isinstance(nodo, P.Funcion_llamadaContext):
+            self._comprobar_llamada(nodo, en_funcion)
+            self._hijos(nodo, en_funcion)
+
+        elif isinstance(nodo, P.ExpIDContext):
+            self._comprobar_variable(nodo.ID().symbol, en_funcion)
+
+        elif isinstance(nodo, P.Definir_polinomioContext):
+            # La expresión es texto para SymPy (x es su variable), no se evalúa
+            if not en_funcion:
+                self.definidos.add(nodo.ID().getText())
+
+        elif isinstance(nodo, (P.Mostrar_polinomioContext, P.Graficar_polinomioContext)):
+            self._comprobar_polinomio(nodo.ID().symbol)
+
+        elif isinstance(nodo, P.Operar_polinomioContext):
+            self._comprobar_polinomio(nodo.ID(0).symbol)
+            self._comprobar_polinomio(nodo.ID(1).symbol)
+
+        else:
+            self._hijos(nodo, en_funcion)
+
+    def _comprobar_variable(self, token, en_funcion):
+        nombre = token.text
+        if nombre in self.polinomios:
+            return
+        if nombre not in self.nombres:
+            self._nuevo(token, ERROR, f"Variable '{nombre}' no definida.")
+        elif not en_funcion and nombre not in self.definidos:
+            self._nuevo(token, AVISO, f"Variable '{nombre}' usada antes de definirse.")
+
+    def _comprobar_llamada(self, ctx, en_funcion):
+        token = ctx.ID().symbol
+        nombre = token.text
+        recibidos = len(ctx.argumentos().expresion()) if ctx.argumentos() else 0
+        if nombre not in self.funciones and nombre in FUNCIONES_NATIVAS:
+            _, minimo, maximo = FUNCIONES_NATIVAS[nombre]
+            if not minimo <= recibidos <= maximo:
+                esperados = minimo if minimo == maximo else f"{minimo} o {maximo}"
+                self._nuevo(token, ERROR, f"La función '{nombre}' esperaba {esperados} argumento(s) "
+                                          f"pero recibe {recibidos}.")
+            return
+        if nombre not in self.funciones:
+            self._nuevo(token, ERROR, f"Función '{nombre}' no definida.")
+            return
+        esperados, linea = self.funciones[nombre]
+        if esperados != recibidos:
+            self._nuevo(token, ERROR, f"La función '{nombre}' esperaba {esperados} argumento(s) "
+                                      f"pero recibe {recibidos}.")
+        elif not en_funcion and linea > token.line:
+            self._nuevo(token, AVISO, f"Función '{nombre}' llamada antes de definirse (línea {linea}).")
+
+    def _comprobar_polinomio(self, token):
+        if token.text not in self.polinomios:
+            self._nuevo(token, AVISO, f"Polinomio '{token.text}' no definido.")
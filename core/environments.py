@@ -1,5 +1,11 @@
 import traceback
 
+from core import traza
+
+_traza_graficos = traza.categoria(traza.GRAFICOS)
+_traza_musica = traza.categoria(traza.MUSICA)
+_traza_polinomios = traza.categoria(traza.POLINOMIOS)
+
 # ============================================================
 # 🟩 ENTORNO GRÁFICO (versión mapa 2D / SimulationPanel moderno)
 # ============================================================
@@ -15,7 +21,7 @@ class EntornoGrafico:
         self.lapiz_abajo = True
         self.color_actual = "negro"
 
-        print("🟢 Entorno gráfico inicializado (modo mapa 2D).")
+        _traza_graficos.info("Entorno gráfico inicializado (modo mapa 2D).")
 
     # ------------------------------------------------------------
     # Utilidades internas
@@ -23,7 +29,7 @@ class EntornoGrafico:
     def _asegurar_widget(self):
         """Verifica que exista un widget de simulación antes de usarlo."""
         if not self.simulation_widget:
-            print("⚠️ No hay widget de simulación disponible. Se omite la acción gráfica.")
+            _traza_graficos.aviso("No hay widget de simulación disponible. Se omite la acción gráfica.")
             return False
         return True
 
@@ -33,8 +39,7 @@ class EntornoGrafico:
             if self._asegurar_widget():
                 accion(*args, **kwargs)
         except Exception as e:
-            print(f"❌ Error ejecutando acción gráfica: {e}")
-            traceback.print_exc()
+            _traza_graficos.error("Error ejecutando acción gráfica: %s\n%s", e, traceback.format_exc())
 
     # ------------------------------------------------------------
     # Comandos gráficos
@@ -45,7 +50,7 @@ class EntornoGrafico:
         - 'adelante' y 'atras' usan el ángulo actual.
         - dirección puede ser texto sin comillas (adelante, atras).
         """
-        print(f"MOVER {direccion} {distancia} paso(s).")
+        _traza_graficos.detalle("MOVER %s %s paso(s).", direccion, distancia)
 
         def accion():
             self.simulation_widget.move_turtle(
@@ -53,7 +58,7 @@ class EntornoGrafico:
                 self.lapiz_abajo, self.color_actual
             )
             self.x, self.y = self.simulation_widget.get_turtle_pos()
-            print(f"📍 Posición actual del jugador: ({self.x}, {self.y})")
+            _traza_graficos.detalle("Posición actual del jugador: (%s, %s)", self.x, self.y)
 
         self._seguro(accion)
 
@@ -62,7 +67,7 @@ class EntornoGrafico:
         Gira el jugador visualmente (90° por defecto).
         - 'izquierda' o 'derecha'
         """
-        print(f"GIRAR {direccion} {grados} grados.")
+        _traza_graficos.detalle("GIRAR %s %s grados.", direccion, grados)
 
         def accion():
             self.simulation_widget.rotate_player(str(direccion).lower())
@@ -78,19 +83,58 @@ class EntornoGrafico:
     def cambiar_color(self, color):
         """Cambia el color actual del jugador o del lápiz (si aplica)."""
         self.color_actual = str(color)
-        print(f"🎨 CAMBIAR COLOR a {self.color_actual}.")
+        _traza_graficos.detalle("CAMBIAR COLOR a %s.", self.color_actual)
         # En este modo, el color no dibuja líneas, pero lo conservamos.
         self._seguro(self.simulation_widget.update)
 
     def bajar_lapiz(self):
         """Activa el trazo (solo relevante en modo tortuga clásico)."""
         self.lapiz_abajo = True
-        print("🖊️ BAJAR LÁPIZ.")
+        _traza_graficos.detalle("BAJAR LÁPIZ.")
 
     def subir_lapiz(self):
         """Desactiva el trazo (solo relevante en modo tortuga clásico)."""
         self.lapiz_abajo = False
-        print("✋ SUBIR LÁPIZ.")
+        _traza_graficos.detalle("SUBIR LÁPIZ.")
+
+    def ejecutar_lote(self, comandos):
+        """
+        Ejecuta de una vez una secuencia de comandos gráficos ya evaluados:
+        ('mover', direccion, distancia), ('girar', direccion, grados),
+        ('color', valor), ('bajar_lapiz',) y ('subir_lapiz',).
+        Los movimientos y giros se envían al SimulationPanel en una sola llamada.
+        """
+        trayecto = []
+        color_cambiado = False
+        for comando in comandos:
+            tipo = comando[0]
+            if tipo == 'mover':
+                trayecto.append(('move', str(comando[1]).lower(), comando[2]))
+            elif tipo == 'girar':
+                direccion, grados = comando[1], comando[2]
+                if direccion == "izquierda":
+                    self.angulo = (self.angulo + grados) % 360
+                elif direccion == "derecha":
+                    self.angulo = (self.angulo - grados + 360) % 360
+                trayecto.append(('rotate', str(direccion).lower()))
+            elif tipo == 'color':
+                self.color_actual = str(comando[1])
+                color_cambiado = True
+            elif tipo == 'bajar_lapiz':
+                self.lapiz_abajo = True
+            elif tipo == 'subir_lapiz':
+                self.lapiz_abajo = False
+
+        _traza_graficos.detalle("LOTE de %s comando(s) gráfico(s).", len(comandos))
+
+        def accion():
+            if trayecto:
+                self.simulation_widget.move_path(trayecto)
+                self.x, self.y = self.simulation_widget.get_turtle_pos()
+            if color_cambiado:
+                self.simulation_widget.update()
+
+        self._seguro(accion)
 
 
 
@@ -98,16 +142,52 @@ class EntornoGrafico:
 # 🟦 ENTORNO MUSICAL
 # ============================================================
 class EntornoMusical:
-    def __init__(self):
-        print("🎵 Entorno musical inicializado.")
+    """
+    Apunta las notas del programa en una LineaDeTiempo sin esperar a que suenen;
+    el audio se sintetiza después (renderizar / exportar_wav / reproductor, core/audio.py).
+    Un acorde se escribe uniendo las notas con '_': `tocar nota do_mi_sol`.
+    """
+
+    def __init__(self, sintetizador=None):
+        from core.audio import LineaDeTiempo, Sintetizador
+        self.sintetizador = sintetizador or Sintetizador()
+        self.linea = LineaDeTiempo()
+        _traza_musica.info("Entorno musical inicializado.")
+
+    @property
+    def eventos(self):
+        return self.linea.eventos
 
     def tocar_nota(self, nota, duracion=0.5):
-        """
-        Simula la reproducción de una nota musical.
-        En versiones futuras se integrará una librería de audio real.
-        """
-        print(f"TOCAR NOTA: {nota} durante {duracion} segundos.")
-        # Aquí se podría usar `pygame.mixer` o `pyaudio` en el futuro.
+        """Añade `nota` (o acorde) a continuación de la anterior. Lanza ValueError si no existe."""
+        from core.audio import DURACION_MAXIMA_NOTA, frecuencia
+        duracion = float(duracion)
+        if duracion < 0:
+            raise ValueError(f"Duración negativa para la nota '{nota}': {duracion}.")
+        if self.linea.segundos(duracion) > DURACION_MAXIMA_NOTA:
+            raise ValueError(f"La nota '{nota}' no puede durar más de {DURACION_MAXIMA_NOTA:g} segundos "
+                             f"({duracion:g} pulsos a {self.linea.tempo:g} ppm).")
+        notas = str(nota).split("_")
+        for n in notas:
+            frecuencia(n)  # valida el nombre ahora, no al renderizar
+        _traza_musica.detalle("TOCAR NOTA: %s durante %s segundos.", nota, duracion)
+        self.linea.agregar(notas, duracion)
+
+    def cambiar_tempo(self, tempo):
+        """Pulsos por minuto para las notas siguientes (60: las duraciones son segundos)."""
+        self.linea.cambiar_tempo(tempo)
+        _traza_musica.detalle("CAMBIAR TEMPO: %s ppm.", tempo)
+
+    def duracion_total(self):
+        return self.linea.duracion_total()
+
+    def renderizar(self):
+        """Buffer float32 con todas las notas mezcladas."""
+        return self.sintetizador.mezclar(self.eventos)
+
+    def exportar_wav(self, ruta):
+        from core.audio import escribir_wav
+        escribir_wav(ruta, self.renderizar(), self.sintetizador.frecuencia_muestreo)
 
 
 # ============================================================
@@ -117,18 +197,18 @@ class EntornoPolinomios:
     def __init__(self, panel=None):
         self.panel = panel
         self.polinomios = {}
-        print("📈 Entorno de polinomios inicializado.")
+        _traza_polinomios.info("Entorno de polinomios inicializado.")
 
     def definir_polinomio(self, nombre, expresion_simbolica):
         self.polinomios[nombre] = expresion_simbolica
-        print(f"DEFINIR POLINOMIO '{nombre}' como '{expresion_simbolica}'.")
+        _traza_polinomios.detalle("DEFINIR POLINOMIO '%s' como '%s'.", nombre, expresion_simbolica)
         if self.panel:
             self.panel.definir_polinomio(nombre, expresion_simbolica)
 
     def graficar_polinomio(self, nombre_polinomio):
         if nombre_polinomio in self.polinomios:
             expr = self.polinomios[nombre_polinomio]
-            print(f"GRAFICAR POLINOMIO '{nombre_polinomio}' ({expr}).")
+            _traza_polinomios.detalle("GRAFICAR POLINOMIO '%s' (%s).", nombre_polinomio, expr)
             if self.panel:
                 self.panel.graficar_polinomio(nombre_polinomio)
         else:
@@ -0,0 +1,294 @@
+"""
+Registro binario de los efectos de una ejecución, para reproducirla sin interpretar.
+
+MinicodeExecutor(grabador=GrabadorEventos()) apunta, en el orden en que ocurren,
+todo lo que el programa hace fuera de sí mismo: líneas de consola, comandos
+gráficos, polinomios definidos / mostrados / graficados, notas y cambios de tempo. reproducir() vuelve
+a mandar esos eventos a la consola y a los paneles, así que una ejecución anterior
+(o la de otro equipo, p. ej. un corrector sin interfaz) se vuelve a mostrar al
+instante, sin parsear ni ejecutar nada.
+
+Formato: la cabecera CABECERA y después un evento tras otro, cada uno un byte de
+código seguido de sus campos. Los textos van como longitud (varint) + UTF-8, los
+enteros como varint zigzag y el resto de números como float64.
+Los polinomios se guardan como texto de SymPy y reproducir() los vuelve a leer con
+sympify: solo se deben reproducir registros de confianza.
+"""
+import struct
+
+CABECERA = b"MCEV\x01"
+
+# Códigos de evento
+CONSOLA = 1
+MOVER = 2
+GIRAR = 3
+COLOR = 4
+BAJAR_LAPIZ = 5
+SUBIR_LAPIZ = 6
+DEFINIR_POLINOMIO = 7
+MOSTRAR_POLINOMIO = 8
+GRAFICAR_POLINOMIO = 9
+NOTA = 10
+TEMPO = 11
+
+# Comandos gráficos (tuplas de MinicodeExecutor / EntornoGrafico.ejecutar_lote) -> código
+_GRAFICOS = {"mover": MOVER, "girar": GIRAR, "color": COLOR,
+             "bajar_lapiz": BAJAR_LAPIZ, "subir_lapiz": SUBIR_LAPIZ}
+_NOMBRES_GRAFICOS = {codigo: nombre for nombre, codigo in _GRAFICOS.items()}
+
+_ENTERO = 0
+_REAL = 1
+_DOBLE = struct.Struct("<d")
+
+
+class RegistroInvalido(Exception):
+    pass
+
+
+# ============================================================
+# ✏️ ESCRITURA
+# ============================================================
+class GrabadorEventos:
+    """Acumula los eventos de una ejecución en un bytearray."""
+
+    def __init__(self):
+        self.datos = bytearray(CABECERA)
+        self.cantidad = 0
+
+    def _varint(self, n):
+        datos = self.datos
+        while n > 0x7F:
+            datos.append((n & 0x7F) | 0x80)
+            n >>= 7
+        datos.append(n)
+
+    def _texto(self, texto):
+        codificado = str(texto).encode("utf-8")
+        self._varint(len(codificado))
+        self.datos += codificado
+
+    def _numero(self, valor):
+        if type(valor) is int:
+            self.datos.append(_ENTERO)
+            self._varint(valor << 1 if valor >= 0 else (-valor << 1) - 1)
+        else:
+            self.datos.append(_REAL)
+            self.datos += _DOBLE.pack(float(valor))
+
+    def _evento(self, codigo):
+        self.datos.append(codigo)
+        self.cantidad += 1
+
+    def consola(self, texto):
+        self._evento(CONSOLA)
+        self._texto(texto)
+
+    def graficos(self, comandos):
+        """Comandos de un lote de EntornoGrafico.ejecutar_lote."""
+        for comando in comandos:
+            codigo = _GRAFICOS[comando[0]]
+            self._evento(codigo)
+            if codigo in (MOVER, GIRAR):
+                self._texto(comando[1])
+                self._numero(comando[2])
+            elif codigo == COLOR:
+                self._texto(comando[1])
+
+    def polinomio(self, codigo, nombre, expresion):
+        self._evento(codigo)
+        self._texto(nombre)
+        self._texto(expresion)
+
+    def nota(self, nota, duracion):
+        self._evento(NOTA)
+        self._texto(nota)
+        self._numero(duracion)
+
+    def tempo(self, tempo):
+        self._evento(TEMPO)
+        self._numero(tempo)
+
+    # -----------------------------------------------------------
+    # Conexión con el executor
+    # -----------------------------------------------------------
+    def envolver_consola(self, consola):
+        """Consola que apunta cada línea y la pasa a `consola` (si hay)."""
+        return _ConsolaGrabada(consola, self)
+
+    def envolver_graficos(self, entorno):
+        """Hace que los lotes de `entorno` (EntornoGrafico) queden apuntados."""
+        ejecutar_lote = entorno.ejecutar_lote
+
+        def lote_grabado(comandos):
+            self.graficos(comandos)
+            ejecutar_lote(comandos)
+        entorno.ejecutar_lote = lote_grabado
+        return entorno
+
+    def envolver_musica(self, entorno):
+        """Hace que las notas y los cambios de tempo válidos de `entorno` (EntornoMusical) queden apuntados."""
+        tocar_nota = entorno.tocar_nota
+        cambiar_tempo = entorno.cambiar_tempo
+
+        def nota_grabada(nota, duracion=0.5):
+            tocar_nota(nota, duracion)
+            self.nota(nota, duracion)
+
+        def tempo_grabado(tempo):
+            cambiar_tempo(tempo)
+            self.tempo(tempo)
+        entorno.tocar_nota = nota_grabada
+        entorno.cambiar_tempo = tempo_grabado
+        return entorno
+
+    def __bytes__(self):
+        return bytes(self.datos)
+
+    def guardar(self, ruta):
+        with open(ruta, "wb") as f:
+            f.write(self.datos)
+
+
+class _ConsolaGrabada:
+    def __init__(self, consola, grabador):
+        self.consola = consola
+        self.grabador = grabador
+
+    def append(self, texto):
+        self.grabador.consola(texto)
+        if self.consola is not None:
+            self.consola.append(texto)
+
+
+# ============================================================
+# 📖 LECTURA
+# ============================================================
+def leer_eventos(datos):
+    """
+    Genera los eventos de un registro como tuplas. Los gráficos tienen la forma de
+    los comandos del executor (('mover', dirección, distancia), ('girar', ...),
+    ('color', valor), ('bajar_lapiz',), ('subir_lapiz',)); el resto son
+    ('consola', texto), ('definir_polinomio' | 'mostrar_polinomio' |
+    'graficar_polinomio', nombre, texto_sympy), ('nota', nota, duración) y
+    ('tempo', pulsos_por_minuto).
+    """
+    datos = memoryview(datos)
+    if bytes(datos[:len(CABECERA)]) != CABECERA:
+        raise RegistroInvalido("No es un registro de ejecución de Minicode (cabecera desconocida).")
+    pos = len(CABECERA)
+    n = len(datos)
+
+    def varint():
+        nonlocal pos
+        valor = desplazamiento = 0
+        while True:
+            if pos >= n:
+                raise RegistroInvalido("Registro de ejecución truncado.")
+            byte = datos[pos]
+            pos += 1
+            valor |= (byte & 0x7F) << desplazamiento
+            if byte < 0x80:
+                return valor
+            desplazamiento += 7
+
+    def texto():
+        nonlocal pos
+        longitud = varint()
+        if pos + longitud > n:
+            raise RegistroInvalido("Registro de ejecución truncado.")
+        valor = str(datos[pos:pos + longitud], "utf-8")
+        pos += longitud
+        return valor
+
+    def numero():
+        nonlocal pos
+        if pos >= n:
+            raise RegistroInvalido("Registro de ejecución truncado.")
+        tipo = datos[pos]
+        pos += 1
+        if tipo == _ENTERO:
+            z = varint()
+            return (z >> 1) if not z & 1 else -((z + 1) >> 1)
+        if pos + _DOBLE.size > n:
+            raise RegistroInvalido("Registro de ejecución truncado.")
+        valor = _DOBLE.unpack_from(datos, pos)[0]
+        pos += _DOBLE.size
+        return valor
+
+    while pos < n:
+        codigo = datos[pos]
+        pos += 1
+        if codigo == CONSOLA:
+            yield ("consola", texto())
+        elif codigo in (MOVER, GIRAR):
+            yield (_NOMBRES_GRAFICOS[codigo], texto(), numero())
+        elif codigo == COLOR:
+            yield ("color", texto())
+        elif codigo in (BAJAR_LAPIZ, SUBIR_LAPIZ):
+            yield (_NOMBRES_GRAFICOS[codigo],)
+        elif codigo == DEFINIR_POLINOMIO:
+            yield ("definir_polinomio", texto(), texto())
+        elif codigo == MOSTRAR_POLINOMIO:
+            yield ("mostrar_polinomio", texto(), texto())
+        elif codigo == GRAFICAR_POLINOMIO:
+            yield ("graficar_polinomio", texto(), texto())
+        elif codigo == NOTA:
+            yield ("nota", texto(), numero())
+        elif codigo == TEMPO:
+            yield ("tempo", numero())
+        else:
+            raise RegistroInvalido(f"Evento desconocido ({codigo}) en la posición {pos - 1}.")
+
+
+def cargar(ruta):
+    with open(ruta, "rb") as f:
+        return f.read()
+
+
+# ============================================================
+# ▶️ REPRODUCCIÓN
+# ============================================================
+def reproducir(datos, consola=None, simulacion=None, polinomios_panel=None, graficos=None):
+    """
+    Manda los eventos de `datos` a la consola, al SimulationPanel y al panel de
+    polinomios (los que no sean None). Los comandos gráficos seguidos se envían
+    como un solo lote, igual que al ejecutar, a `graficos` si se da (un
+    EntornoGrafico, que queda con la posición final) o a uno nuevo sobre `simulacion`.
+    Devuelve el EntornoMusical con las notas (o None si no hay), para reproducirlo o exportarlo.
+    """
+    from core.environments import EntornoGrafico, EntornoMusical
+
+    if graficos is None and simulacion is not None:
+        graficos = EntornoGrafico(simulacion)
+    musica = None
+    lote = []
+    for evento in leer_eventos(datos):
+        tipo = evento[0]
+        if tipo in _GRAFICOS:
+            lote.append(evento)
+            continue
+        if lote:
+            if graficos is not None:
+                graficos.ejecutar_lote(lote)
+            lote = []
+        if tipo == "consola":
+            if consola is not None:
+                consola.append(evento[1])
+        elif tipo == "nota":
+            if musica is None:
+                musica = EntornoMusical()
+            musica.tocar_nota(evento[1], evento[2])
+        elif tipo == "tempo":
+            if musica is None:
+                musica = EntornoMusical()
+            musica.cambiar_tempo(evento[1])
+        elif tipo in ("mostrar_polinomio", "graficar_polinomio") and polinomios_panel is not None:
+            from sympy import sympify
+            expr = sympify(evento[2])
+            if tipo == "mostrar_polinomio":
+                polinomios_panel.display_expression(expr, evento[1])
+            else:
+                polinomios_panel.plot_expression(expr, evento[1])
+    if lote and graficos is not None:
+        graficos.ejecutar_lote(lote)
+    return musica
@@ -2,11 +2,93 @@ from antlr4 import *
 from antlr.MinicodeLexer import MinicodeLexer
 from antlr.MinicodeParser import MinicodeParser
 from antlr.MinicodeVisitor import MinicodeVisitor
-from antlr4.tree.Tree import TerminalNodeImpl
+from antlr4.tree.Tree import TerminalNodeImpl, TerminalNode
 from core.environments import EntornoGrafico, EntornoMusical, EntornoPolinomios
-from sympy import symbols, sympify, simplify, pretty
+from core.listas import FUNCIONES_NATIVAS, Lista, combinar, indice
+from core import eventos, traza
+from decimal import Decimal
+from fractions import Fraction
+import math
+import operator
+import os
+import sys
+import time
 import traceback
-x = symbols('x')
+
+_traza = traza.categoria(traza.EJECUTOR)
+
+# Aritmética: "nativo" (int de precisión arbitraria y float), o exacta con "decimal"
+# o "fraccion" (los literales con decimales y las divisiones no pasan por float)
+MODOS_NUMERICOS = ("nativo", "decimal", "fraccion")
+MODO_NUMERICO_POR_DEFECTO = os.environ.get("MINICODE_NUMEROS", "nativo")
+
+_OPERADORES = {
+    MinicodeParser.POR: operator.mul,
+    MinicodeParser.MOD: operator.mod,
+    MinicodeParser.MAS: operator.add,
+    MinicodeParser.MENOS: operator.sub,
+    MinicodeParser.MENOR: operator.lt,
+    MinicodeParser.MAYOR: operator.gt,
+    MinicodeParser.MENORIGUAL: operator.le,
+    MinicodeParser.MAYORIGUAL: operator.ge,
+    MinicodeParser.IGUAL: operator.eq,
+    MinicodeParser.DIFERENTE: operator.ne,
+    MinicodeParser.DIV: None,  # depende del modo numérico: MinicodeExecutor._dividir
+    MinicodeParser.POTENCIA: None,  # MinicodeExecutor._potencia
+}
+
+# Potencias enteras: por encima de este tamaño del resultado (en bits) se da error
+# en lugar de dejar al intérprete calculando durante minutos
+LIMITE_BITS_POTENCIA = 1_000_000
+
+# Cifras de la mayor potencia permitida: `mostrar` debe poder enseñarla aunque CPython
+# no pase a texto enteros de más de 4300 cifras (ver _a_texto)
+LIMITE_CIFRAS = int(LIMITE_BITS_POTENCIA * math.log10(2)) + 1
+
+# Límite de ejecución: cada vuelta de un bucle y cada llamada a función cuenta como
+# un paso. Sin límite de pasos ni de tiempo (por defecto) un programa corre lo que haga falta
+LIMITE_PASOS_POR_DEFECTO = int(os.environ.get("MINICODE_LIMITE_PASOS") or 0) or None
+LIMITE_SEGUNDOS_POR_DEFECTO = float(os.environ.get("MINICODE_LIMITE_SEGUNDOS") or 0) or None
+PASOS_ENTRE_REVISIONES = 1000  # cada cuántos pasos se mira el reloj
+_SIN_LIMITE = 1 << 62
+
+
+def _a_texto(valor):
+    """str(valor), admitiendo enteros de hasta LIMITE_CIFRAS cifras solo durante la conversión."""
+    try:
+        return str(valor)
+    except ValueError:
+        pass  # entero por encima de sys.get_int_max_str_digits()
+    anterior = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(LIMITE_CIFRAS)
+    try:
+        return str(valor)
+    except ValueError:
+        # Más cifras que cualquier potencia permitida (p. ej. producto de potencias enormes)
+        raise Exception(f"Error: el número tiene más de {LIMITE_CIFRAS} cifras y no se puede mostrar.")
+    finally:
+        sys.set_int_max_str_digits(anterior)
+
+
+class LimiteEjecucion(Exception):
+    """El programa agotó su presupuesto de pasos o de tiempo en la línea `linea`."""
+
+    def __init__(self, mensaje, linea=None, columna=None):
+        super().__init__(mensaje)
+        self.linea = linea
+        self.columna = columna
+
+
+_LITERALES = {
+    "nativo": float,
+    "decimal": Decimal,
+    "fraccion": Fraction,
+}
+_DIVISIONES = {
+    "nativo": operator.truediv,
+    "decimal": lambda izq, der: Decimal(izq) / Decimal(der),
+    "fraccion": lambda izq, der: Fraction(izq) / Fraction(der),
+}
 
 
 class MinicodeExecutor(MinicodeVisitor):
@@ -16,7 +98,17 @@ class MinicodeExecutor(MinicodeVisitor):
     y coordina los entornos de salida (consola, gráfico, musical, polinomios).
     """
 
-    def __init__(self, console_output, simulation_panel=None, polinomios_panel=None):
+    def __init__(self, console_output, simulation_panel=None, polinomios_panel=None, perfilador=None,
+                 numeros=None, limite_pasos=None, limite_segundos=None, grabador=None,
+                 puntos_control=None, depurador=None):
+        # Con un GrabadorEventos (core/eventos.py) los efectos de la ejecución quedan apuntados.
+        # Los puntos de control (core/puntos_control.py) lo necesitan para recuperar la salida
+        self.puntos_control = puntos_control
+        if puntos_control is not None and grabador is None:
+            grabador = eventos.GrabadorEventos()
+        self.grabador = grabador
+        if grabador is not None:
+            console_output = grabador.envolver_consola(console_output)
         self.console_output = console_output
         self.simulation = simulation_panel
         self.polinomios_panel = polinomios_panel
@@ -25,25 +117,145 @@ class MinicodeExecutor(MinicodeVisitor):
         self.polinomios = {}  # 🔹 Único diccionario central para polinomios
         self.funciones = {}
         self.graficos = None
+        self.musica = None
         self.simulation_widget = simulation_panel
 
+        self.numeros = numeros or MODO_NUMERICO_POR_DEFECTO
+        if self.numeros not in MODOS_NUMERICOS:
+            raise ValueError(f"Modo numérico desconocido: '{self.numeros}'.")
+        self._literal_decimal = _LITERALES[self.numeros]
+        self._division = _DIVISIONES[self.numeros]
+
+        self.limite_pasos = limite_pasos or LIMITE_PASOS_POR_DEFECTO
+        self.limite_segundos = limite_segundos or LIMITE_SEGUNDOS_POR_DEFECTO
+        self._reiniciar_presupuesto()
+
+        # Modo perfilador: solo entonces se sustituye visit(), la ejecución normal no paga nada
+        self.perfilador = perfilador
+        if perfilador is not None:
+            self.visit = self._visit_perfilado
+            self._ejecutar_lote = self._ejecutar_lote_perfilado
+
+        # Modo depuración (core/depurador.py): igual, solo con depurador se revisa cada instrucción
+        self.depurador = depurador
+        if depurador is not None:
+            if perfilador is not None:
+                raise ValueError("No se puede perfilar y depurar la misma ejecución.")
+            self.visit = self._visit_depurado
+            self._ejecutar_lote = self._ejecutar_lote_depurado
+            self.visitFuncion_llamada = self._visitFuncion_llamada_depurada
+
 
     # -----------------------------------------------------------
-    # Inicialización diferida de entornos gráficos
+    # Inicialización diferida de entornos gráficos y musical
     # -----------------------------------------------------------
     def get_graficos(self):
         if self.graficos is None:
             try:
                 self.graficos = EntornoGrafico(self.simulation_widget)
+                if self.grabador is not None:
+                    self.grabador.envolver_graficos(self.graficos)
             except Exception:
                 tb = traceback.format_exc()
                 if self.console_output:
                     self.console_output.append("--- Error iniciando entorno gráfico ---\n" + tb)
                 else:
-                    print("--- Error iniciando entorno gráfico ---\n" + tb)
+                    _traza.error("Error iniciando entorno gráfico:\n%s", tb)
                 self.graficos = None
         return self.graficos
 
+    def get_musica(self):
+        """El entorno musical (y con él NumPy) solo se crea si el programa toca notas."""
+        if self.musica is None:
+            self.musica = EntornoMusical()
+            if self.grabador is not None:
+                self.grabador.envolver_musica(self.musica)
+        return self.musica
+
+    # -----------------------------------------------------------
+    # Presupuesto de ejecución (pasos y tiempo)
+    # -----------------------------------------------------------
+    def _reiniciar_presupuesto(self):
+        self._inicio = time.perf_counter()
+        self._pasos_revisados = 0
+        if self.limite_pasos is None and self.limite_segundos is None:
+            self._tramo = _SIN_LIMITE  # el contador nunca llega a cero: no se revisa nada
+        elif self.limite_pasos is None:
+            self._tramo = PASOS_ENTRE_REVISIONES
+        else:
+            self._tramo = min(PASOS_ENTRE_REVISIONES, self.limite_pasos + 1)
+        self._restantes = self._tramo
+
+    @property
+    def pasos(self):
+        """Pasos (vueltas de bucle y llamadas) ejecutados desde que empezó el programa."""
+        return self._pasos_revisados + self._tramo - self._restantes
+
+    def _paso(self, ctx):
+        self._restantes -= 1
+        if self._restantes <= 0:
+            self._revisar_presupuesto(ctx)
+
+    def _revisar_presupuesto(self, ctx):
+        """Se llama cada `_tramo` pasos: lanza LimiteEjecucion si el programa se pasó."""
+        self._pasos_revisados += self._tramo
+        self._tramo = self._restantes = 0
+        linea, columna = (ctx.start.line, ctx.start.column) if ctx.start is not None else (None, None)
+        if self.limite_pasos is not None and self._pasos_revisados > self.limite_pasos:
+            raise LimiteEjecucion(f"Error: el programa superó el límite de {self.limite_pasos} pasos "
+                                  f"(línea {linea}). ¿Hay un bucle que no termina?", linea, columna)
+        if self.limite_segundos is not None and time.perf_counter() - self._inicio > self.limite_segundos:
+            raise LimiteEjecucion(f"Error: el programa superó el límite de {self.limite_segundos:g} segundos "
+                                  f"(línea {linea}). ¿Hay un bucle que no termina?", linea, columna)
+        self._tramo = PASOS_ENTRE_REVISIONES
+        if self.limite_pasos is not None:
+            self._tramo = min(self._tramo, self.limite_pasos + 1 - self._pasos_revisados)
+        self._restantes = self._tramo
+
+    # -----------------------------------------------------------
+    # Perfilador (core/perfilador.py)
+    # -----------------------------------------------------------
+    def _visit_perfilado(self, tree):
+        if not isinstance(tree, MinicodeParser.InstruccionContext) or tree.start is None:
+            return tree.accept(self)
+
+        self.perfilador.entrar(('linea', tree.start.line))
+        try:
+            return tree.accept(self)
+        finally:
+            self.perfilador.salir()
+
+    def _ejecutar_lote_perfilado(self, instrucciones):
+        # Un lote de comandos gráficos se atribuye a la línea donde empieza
+        self.perfilador.entrar(('linea', instrucciones[0].start.line))
+        try:
+            MinicodeExecutor._ejecutar_lote(self, instrucciones)
+        finally:
+            self.perfilador.salir()
+
+    def _visit_depurado(self, tree):
+        if isinstance(tree, MinicodeParser.InstruccionContext):
+            if tree.start is not None and not self._es_vacia(tree):
+                # El tiempo detenido no cuenta para limite_segundos
+                self._inicio += self.depurador.antes_de(self, tree)
+        return tree.accept(self)
+
+    def _visitFuncion_llamada_depurada(self, ctx):
+        # Las llamadas llegan por accept() (visitChildren), no por visit()
+        nombre = ctx.ID().getText()
+        if nombre not in self.funciones:
+            return MinicodeExecutor.visitFuncion_llamada(self, ctx)
+        self.depurador.entrar_funcion(nombre, ctx.start.line)
+        try:
+            return MinicodeExecutor.visitFuncion_llamada(self, ctx)
+        finally:
+            self.depurador.salir_funcion()
+
+    def _ejecutar_lote_depurado(self, instrucciones):
+        # Paso a paso cada comando gráfico es una instrucción: no se fusionan en lotes
+        for instr in instrucciones:
+            self.visit(instr)
+
     # -----------------------------------------------------------
     # Manejo de scopes (funciones)
     # -----------------------------------------------------------
@@ -76,8 +288,11 @@ class MinicodeExecutor(MinicodeVisitor):
     # Visitadores principales
     # -----------------------------------------------------------
     def visitPrograma(self, ctx: MinicodeParser.ProgramaContext):
-        for instr in ctx.instruccion():
-            self.visit(instr)
+        self._reiniciar_presupuesto()
+        if self.puntos_control is not None:
+            self._ejecutar_con_puntos_control(ctx)
+        else:
+            self._ejecutar_instrucciones(ctx)
 
     def visitInstruccion(self, ctx: MinicodeParser.InstruccionContext):
         return self.visitChildren(ctx)
@@ -97,6 +312,15 @@ class MinicodeExecutor(MinicodeVisitor):
         valor = self.visit(ctx.expresion())
         self.set_variable_value(nombre, valor)
 
+    def visitAsignar_elemento(self, ctx: MinicodeParser.Asignar_elementoContext):
+        *indices, expresion = ctx.expresion()
+        lista = self.get_variable_value(ctx.ID().getText())
+        for sub in indices[:-1]:
+            lista = indice(lista, self.visit(sub))
+        if not isinstance(lista, Lista):
+            raise Exception("Error: solo se pueden cambiar elementos de una lista.")
+        lista.asignar(self.visit(indices[-1]), self.visit(expresion))
+
     # -----------------------------------------------------------
     # Funciones
     # -----------------------------------------------------------
@@ -110,6 +334,8 @@ class MinicodeExecutor(MinicodeVisitor):
     def visitFuncion_llamada(self, ctx: MinicodeParser.Funcion_llamadaContext):
         nombre = ctx.ID().getText()
         if nombre not in self.funciones:
+            if nombre in FUNCIONES_NATIVAS:
+                return self._llamar_nativa(ctx, nombre)
             raise Exception(f"Error: función '{nombre}' no definida.")
 
         func_info = self.funciones[nombre]
@@ -123,16 +349,30 @@ class MinicodeExecutor(MinicodeVisitor):
         if len(params) != len(args):
             raise Exception(f"Error: la función '{nombre}' esperaba {len(params)} argumento(s) pero recibió {len(args)}.")
 
+        self._paso(ctx)
         self.push_scope()
         for i, p in enumerate(params):
             self.variables[p] = args[i]
 
+        if self.perfilador is not None:
+            self.perfilador.lineas_funcion[nombre] = cuerpo.parentCtx.start.line
+            self.perfilador.entrar(('funcion', nombre))
         try:
             self.visit(cuerpo)
         finally:
             self.pop_scope()
+            if self.perfilador is not None:
+                self.perfilador.salir()
         return None
 
+    def _llamar_nativa(self, ctx, nombre):
+        funcion, minimo, maximo = FUNCIONES_NATIVAS[nombre]
+        args = [self.visit(e) for e in ctx.argumentos().expresion()] if ctx.argumentos() else []
+        if not minimo <= len(args) <= maximo:
+            esperados = minimo if minimo == maximo else f"{minimo} o {maximo}"
+            raise Exception(f"Error: la función '{nombre}' esperaba {esperados} argumento(s) pero recibió {len(args)}.")
+        return funcion(*args)
+
     # -----------------------------------------------------------
     # Condicionales y bucles
     # -----------------------------------------------------------
@@ -145,22 +385,45 @@ class MinicodeExecutor(MinicodeVisitor):
 
     def visitRepetir(self, ctx: MinicodeParser.RepetirContext):
         veces = int(self.visit(ctx.expresion()))
+        # Expresiones invariantes marcadas por el optimizador: se recalculan en cada entrada al bucle
+        for invariante in getattr(ctx, "invariantes", ()):
+            invariante.reiniciar()
         for _ in range(veces):
+            self._paso(ctx)
             self.visit(ctx.bloque())
 
+    def visitMientras(self, ctx: MinicodeParser.MientrasContext):
+        for invariante in getattr(ctx, "invariantes", ()):
+            invariante.reiniciar()
+        condicion, cuerpo = ctx.expresion(), ctx.bloque()
+        while self.visit(condicion):
+            self._paso(ctx)
+            self.visit(cuerpo)
+
+    def visitPara_cada(self, ctx: MinicodeParser.Para_cadaContext):
+        coleccion = self.visit(ctx.expresion())
+        if not isinstance(coleccion, (Lista, str)):
+            raise Exception("Error: 'para cada' necesita una lista o un texto.")
+        for invariante in getattr(ctx, "invariantes", ()):
+            invariante.reiniciar()
+        nombre, cuerpo = ctx.ID().getText(), ctx.bloque()
+        for elemento in coleccion:
+            self._paso(ctx)
+            self.set_variable_value(nombre, elemento)
+            self.visit(cuerpo)
+
     def visitBloque(self, ctx: MinicodeParser.BloqueContext):
-        for instr in ctx.instruccion():
-            self.visit(instr)
+        self._ejecutar_instrucciones(ctx)
 
     # -----------------------------------------------------------
     # Mostrar / Imprimir
     # -----------------------------------------------------------
     def visitImprimir(self, ctx: MinicodeParser.ImprimirContext):
-        valor = self.visit(ctx.expresion())
+        texto = _a_texto(self.visit(ctx.expresion()))
         if self.console_output:
-            self.console_output.append(str(valor))
+            self.console_output.append(texto)
         else:
-            print(str(valor))
+            print(texto)
 
     # -----------------------------------------------------------
     # Comandos gráficos
@@ -171,57 +434,200 @@ class MinicodeExecutor(MinicodeVisitor):
             if self.console_output:
                 self.console_output.append("Error: no se pudo inicializar el entorno gráfico.\n")
             else:
-                print("Error: no se pudo inicializar el entorno gráfico.")
+                _traza.error("No se pudo inicializar el entorno gráfico.")
             return
 
         try:
-            if ctx.MOVER():
-                direccion = ctx.getChild(1).getText()
-                distancia = 1
-                if ctx.expresion():
-                    distancia = self.visit(ctx.expresion())
-                graficos.mover(direccion, distancia)
-                return
+            comando = self._leer_comando_grafico(ctx)
+            if comando is not None:
+                graficos.ejecutar_lote([comando])
+        except Exception:
+            self._error_comando_grafico()
+
+    def _leer_comando_grafico(self, ctx):
+        """Evalúa los argumentos de un comando gráfico y lo devuelve como tupla."""
+        if ctx.MOVER():
+            distancia = 1
+            if ctx.expresion():
+                distancia = self.visit(ctx.expresion())
+            return ('mover', ctx.getChild(1).getText(), distancia)
+
+        if ctx.GIRAR():
+            grados = 90
+            if ctx.expresion():
+                grados = self.visit(ctx.expresion())
+            return ('girar', ctx.getChild(1).getText(), grados)
+
+        if ctx.CAMBIAR() and ctx.COLOR():
+            color_valor = "negro"
+            if ctx.expresion():
+                color_valor = self.visit(ctx.expresion())
+            return ('color', str(color_valor))
+
+        if ctx.BAJAR() and ctx.LAPIZ():
+            return ('bajar_lapiz',)
+
+        if ctx.SUBIR() and ctx.LAPIZ():
+            return ('subir_lapiz',)
+        return None
 
-            if ctx.GIRAR():
-                direccion = ctx.getChild(1).getText()
-                grados = 90
-                if ctx.expresion():
-                    grados = self.visit(ctx.expresion())
-                graficos.girar(direccion, grados)
-                return
+    def _error_comando_grafico(self):
+        tb = traceback.format_exc()
+        if self.console_output:
+            self.console_output.append("--- Error ejecutando comando gráfico ---\n" + tb)
+        else:
+            _traza.error("Error ejecutando comando gráfico:\n%s", tb)
 
-            if ctx.CAMBIAR() and ctx.COLOR():
-                color_valor = "negro"
-                if ctx.expresion():
-                    color_valor = self.visit(ctx.expresion())
-                graficos.cambiar_color(str(color_valor))
-                return
+    # -----------------------------------------------------------
+    # Fusión de comandos gráficos consecutivos
+    # -----------------------------------------------------------
+    def _ejecutar_instrucciones(self, ctx):
+        """
+        Ejecuta las instrucciones de un programa o bloque. Las secuencias de
+        comandos gráficos consecutivos (incluidos los `repetir` que solo contienen
+        comandos gráficos) se envían al entorno gráfico como un único lote.
+        """
+        for es_lote, contenido in self._plan(ctx):
+            if es_lote:
+                self._ejecutar_lote(contenido)
+            else:
+                self.visit(contenido)
 
-            if ctx.BAJAR() and ctx.LAPIZ():
-                graficos.bajar_lapiz()
-                return
+    def _plan(self, ctx):
+        plan = getattr(ctx, "plan_grafico", None)
+        if plan is None:
+            plan = ctx.plan_grafico = self._planificar(ctx.instruccion())
+        return plan
 
-            if ctx.SUBIR() and ctx.LAPIZ():
-                graficos.subir_lapiz()
-                return
+    def _planificar(self, instrucciones):
+        plan = []
+        tramo = []
+
+        def cerrar_tramo():
+            if any(not self._es_vacia(i) for i in tramo):
+                plan.append((True, list(tramo)))
+            else:
+                plan.extend((False, i) for i in tramo)
+            tramo.clear()
+
+        for instr in instrucciones:
+            if self._es_fusionable(instr):
+                tramo.append(instr)
+            else:
+                cerrar_tramo()
+                plan.append((False, instr))
+        cerrar_tramo()
+        return plan
+
+    @staticmethod
+    def _es_vacia(instr):
+        return all(isinstance(h, TerminalNode) for h in (instr.children or []))
+
+    def _es_fusionable(self, instr):
+        if self._es_vacia(instr):
+            return True
+        hijo = instr.getChild(0)
+        if isinstance(hijo, MinicodeParser.Comando_graficoContext):
+            return hijo.expresion() is None or self._sin_llamadas(hijo.expresion())
+        if isinstance(hijo, MinicodeParser.RepetirContext):
+            return hijo.bloque() is not None and self._sin_llamadas(hijo.expresion()) and \
+                all(self._es_fusionable(i) for i in hijo.bloque().instruccion())
+        return False
+
+    @staticmethod
+    def _sin_llamadas(expr):
+        """Una expresión sin llamadas a funciones no puede mover al jugador al evaluarse."""
+        pendientes = [expr]
+        while pendientes:
+            nodo = pendientes.pop()
+            if isinstance(nodo, (MinicodeParser.Funcion_llamadaContext, MinicodeParser.ExpFuncionContext)):
+                return False
+            pendientes.extend(h for h in (nodo.children or []) if not isinstance(h, TerminalNode))
+        return True
+
+    def _ejecutar_lote(self, instrucciones):
+        graficos = self.get_graficos()
+        if graficos is None:
+            for instr in instrucciones:
+                self.visit(instr)
+            return
+
+        comandos = []
+        try:
+            for instr in instrucciones:
+                self._expandir(instr, comandos)
+        finally:
+            if comandos:
+                graficos.ejecutar_lote(comandos)
 
+    def _expandir(self, instr, comandos):
+        """Desenrolla una instrucción fusionable en la lista plana de comandos gráficos."""
+        if self._es_vacia(instr):
+            return
+        hijo = instr.getChild(0)
+        if isinstance(hijo, MinicodeParser.RepetirContext):
+            veces = int(self.visit(hijo.expresion()))
+            for invariante in getattr(hijo, "invariantes", ()):
+                invariante.reiniciar()
+            cuerpo = hijo.bloque().instruccion()
+            for _ in range(veces):
+                self._paso(hijo)
+                for sub in cuerpo:
+                    self._expandir(sub, comandos)
+            return
+        try:
+            comando = self._leer_comando_grafico(hijo)
+            if comando is not None:
+                comandos.append(comando)
         except Exception:
-            tb = traceback.format_exc()
-            if self.console_output:
-                self.console_output.append("--- Error ejecutando comando gráfico ---\n" + tb)
+            self._error_comando_grafico()
+
+    # -----------------------------------------------------------
+    # Puntos de control (core/puntos_control.py)
+    # -----------------------------------------------------------
+    def _ejecutar_con_puntos_control(self, ctx):
+        """
+        Como _ejecutar_instrucciones para el programa, pero empezando por el punto de
+        control más avanzado que siga valiendo y guardando otros por el camino.
+        """
+        puntos = self.puntos_control
+        plan = self._plan(ctx)
+        for es_lote, contenido in plan[puntos.reanudar(self, plan):]:
+            puntos.revisar(self, contenido)
+            if es_lote:
+                self._ejecutar_lote(contenido)
             else:
-                print("--- Error ejecutando comando gráfico ---\n" + tb)
+                self.visit(contenido)
+        puntos.revisar(self)
+
+    def reproducir_registro(self, registro, cantidad):
+        """
+        Deja las salidas como las dejó la ejecución que grabó `registro`: reproduce sus
+        eventos en la consola y los paneles, se queda con la posición del jugador y las
+        notas, y sigue grabando a continuación de ellos.
+        """
+        grabador = self.grabador
+        graficos = EntornoGrafico(self.simulation_widget)
+        self.musica = eventos.reproducir(registro, self.console_output.consola, self.simulation_widget,
+                                         self.polinomios_panel, graficos=graficos)
+        self.graficos = grabador.envolver_graficos(graficos)
+        if self.musica is not None:
+            grabador.envolver_musica(self.musica)
+        grabador.datos = bytearray(registro)
+        grabador.cantidad = cantidad
 
     # -----------------------------------------------------------
     # Comandos musicales
     # -----------------------------------------------------------
     def visitComando_musical(self, ctx: MinicodeParser.Comando_musicalContext):
+        if ctx.TOCAR() is None:  # cambiar tempo N
+            self.get_musica().cambiar_tempo(self.visit(ctx.expresion()))
+            return
         nota = ctx.ID().getText()
         duracion = 0.5
         if ctx.DURANTE():
             duracion = self.visit(ctx.expresion())
-        self.musica.tocar_nota(nota, duracion)
+        self.get_musica().tocar_nota(nota, duracion)
 
     # -----------------------------------------------------------
     # Polinomios centralizados
@@ -230,9 +636,12 @@ class MinicodeExecutor(MinicodeVisitor):
         nombre = ctx.ID().getText()
         expr_texto = ctx.expresion().getText()
         try:
+            from sympy import sympify  # SymPy solo se carga si el programa usa polinomios
             expr = sympify(expr_texto)
             self.polinomios[nombre] = expr
             self.variables[nombre] = expr
+            if self.grabador is not None:
+                self.grabador.polinomio(eventos.DEFINIR_POLINOMIO, nombre, expr)
             if self.console_output:
                 self.console_output.append(f"📈 Polinomio '{nombre}' definido como: {expr}")
         except Exception as e:
@@ -245,8 +654,11 @@ class MinicodeExecutor(MinicodeVisitor):
             self.console_output.append(f"⚠️ Polinomio '{nombre}' no existe.")
             return
         expr = self.polinomios[nombre]
+        from sympy import pretty
         self.console_output.append("🧮 Polinomio:")
         self.console_output.append(pretty(expr))
+        if self.grabador is not None:
+            self.grabador.polinomio(eventos.MOSTRAR_POLINOMIO, nombre, expr)
         if self.polinomios_panel:
             self.polinomios_panel.display_expression(expr, nombre)
 
@@ -260,6 +672,7 @@ class MinicodeExecutor(MinicodeVisitor):
 
         expr1 = self.polinomios[p1]
         expr2 = self.polinomios[p2]
+        from sympy import simplify, pretty
 
         if op == "sumar":
             resultado = simplify(expr1 + expr2)
@@ -277,6 +690,9 @@ class MinicodeExecutor(MinicodeVisitor):
         self.polinomios[nombre_res] = resultado
         self.variables[nombre_res] = resultado
         self.console_output.append(f"✅ Nuevo polinomio '{nombre_res}' = {pretty(resultado)}")
+        if self.grabador is not None:
+            self.grabador.polinomio(eventos.DEFINIR_POLINOMIO, nombre_res, resultado)
+            self.grabador.polinomio(eventos.MOSTRAR_POLINOMIO, nombre_res, resultado)
         if self.polinomios_panel:
             self.polinomios_panel.display_expression(resultado, nombre_res)
 
@@ -287,50 +703,72 @@ class MinicodeExecutor(MinicodeVisitor):
             return
         expr = self.polinomios[nombre]
         self.console_output.append(f"📊 Graficando polinomio '{nombre}'...")
+        if self.grabador is not None:
+            self.grabador.polinomio(eventos.GRAFICAR_POLINOMIO, nombre, expr)
         if self.polinomios_panel:
             self.polinomios_panel.plot_expression(expr, nombre)
 
     # -----------------------------------------------------------
     # Expresiones
     # -----------------------------------------------------------
+    # Cada nodo binario guarda en `ic` (caché en línea) sus dos operandos y la función
+    # del operador la primera vez que se ejecuta: las siguientes evaluaciones no
+    # vuelven a buscar los hijos ni a comparar el tipo de operador.
+    def _binaria(self, ctx):
+        ctx.ic = (ctx.expresion(0), ctx.expresion(1), _OPERADORES[ctx.op.type])
+        return ctx.ic
+
+    def _dividir(self, izq, der):
+        if type(izq) is Lista or type(der) is Lista:
+            return combinar(self._dividir, izq, der)
+        if der == 0:
+            raise Exception("Error: división por cero.")
+        return self._division(izq, der)
+
     def visitExpMulDiv(self, ctx: MinicodeParser.ExpMulDivContext):
-        izq = self.visit(ctx.expresion(0))
-        der = self.visit(ctx.expresion(1))
-        op = ctx.op.type
-        if op == MinicodeParser.POR:
-            return izq * der
-        elif op == MinicodeParser.DIV:
-            if der == 0:
-                raise Exception("Error: división por cero.")
-            return izq / der
-        elif op == MinicodeParser.MOD:
-            return izq % der
+        izq, der, funcion = getattr(ctx, "ic", None) or self._binaria(ctx)
+        if funcion is None:
+            return self._dividir(self.visit(izq), self.visit(der))
+        return funcion(self.visit(izq), self.visit(der))
 
     def visitExpSumaResta(self, ctx: MinicodeParser.ExpSumaRestaContext):
-        izq = self.visit(ctx.expresion(0))
-        der = self.visit(ctx.expresion(1))
-        op = ctx.op.type
-        if op == MinicodeParser.MAS:
-            return izq + der
-        elif op == MinicodeParser.MENOS:
-            return izq - der
+        izq, der, funcion = getattr(ctx, "ic", None) or self._binaria(ctx)
+        return funcion(self.visit(izq), self.visit(der))
+
+    def _potencia(self, base, exponente):
+        if type(exponente) is int and type(base) is int:
+            # log2 da el tamaño exacto del resultado (salvo un bit), también con exponente negativo:
+            # en los modos exactos 3 ** -n calcula 3 ** n
+            if abs(base) > 1 and abs(exponente) * math.log2(abs(base)) > LIMITE_BITS_POTENCIA:
+                if abs(base).bit_length() > 1000:
+                    base = f"(número de {int(math.log10(abs(base))) + 1} cifras)"
+                raise Exception(f"Error: la potencia {base} ** {exponente} es demasiado grande.")
+            if exponente < 0:
+                if base == 0:
+                    raise Exception("Error: división por cero.")
+                if self.numeros != "nativo":
+                    # 2 ** -1: en los modos exactos el resultado también es exacto
+                    return self._division(1, base ** -exponente)
+            return base ** exponente  # int ** int: exponenciación binaria de CPython, exacta
+        if type(base) is Lista or type(exponente) is Lista:
+            return combinar(self._potencia, base, exponente)
+        try:
+            resultado = base ** exponente
+        except ZeroDivisionError:
+            raise Exception("Error: división por cero.")
+        except OverflowError:
+            raise Exception(f"Error: la potencia {base} ** {exponente} es demasiado grande.")
+        if isinstance(resultado, complex):
+            raise Exception(f"Error: {base} ** {exponente} no es un número real.")
+        return resultado
+
+    def visitExpPotencia(self, ctx: MinicodeParser.ExpPotenciaContext):
+        base, exponente, _ = getattr(ctx, "ic", None) or self._binaria(ctx)
+        return self._potencia(self.visit(base), self.visit(exponente))
 
     def visitExpComparacion(self, ctx: MinicodeParser.ExpComparacionContext):
-        izq = self.visit(ctx.expresion(0))
-        der = self.visit(ctx.expresion(1))
-        op = ctx.op.type
-        if op == MinicodeParser.MENOR:
-            return izq < der
-        elif op == MinicodeParser.MAYOR:
-            return izq > der
-        elif op == MinicodeParser.MENORIGUAL:
-            return izq <= der
-        elif op == MinicodeParser.MAYORIGUAL:
-            return izq >= der
-        elif op == MinicodeParser.IGUAL:
-            return izq == der
-        elif op == MinicodeParser.DIFERENTE:
-            return izq != der
+        izq, der, funcion = getattr(ctx, "ic", None) or self._binaria(ctx)
+        return funcion(self.visit(izq), self.visit(der))
 
     def visitExpLogica(self, ctx: MinicodeParser.ExpLogicaContext):
         izq = self.visit(ctx.expresion(0))
@@ -355,7 +793,13 @@ class MinicodeExecutor(MinicodeVisitor):
         return -valor if op == '-' else valor
 
     def visitExpNumero(self, ctx: MinicodeParser.ExpNumeroContext):
-        return float(ctx.NUMERO().getText())
+        # Caché por modo numérico: el mismo árbol puede ejecutarse con otro modo
+        ic = getattr(ctx, "ic", None)
+        if ic is None or ic[0] != self.numeros:
+            texto = ctx.NUMERO().getText()
+            valor = self._literal_decimal(texto) if "." in texto else int(texto)
+            ic = ctx.ic = (self.numeros, valor)
+        return ic[1]
 
     def visitExpTexto(self, ctx: MinicodeParser.ExpTextoContext):
         return ctx.TEXTO().getText().strip('"')
@@ -374,3 +818,22 @@ class MinicodeExecutor(MinicodeVisitor):
 
     def visitExpFuncion(self, ctx: MinicodeParser.ExpFuncionContext):
         return self.visit(ctx.funcion_llamada())
+
+    def visitExpLista(self, ctx: MinicodeParser.ExpListaContext):
+        return Lista([self.visit(e) for e in ctx.expresion()])
+
+    def visitExpIndice(self, ctx: MinicodeParser.ExpIndiceContext):
+        return indice(self.visit(ctx.expresion(0)), self.visit(ctx.expresion(1)))
+
+    # -----------------------------------------------------------
+    # Nodos generados por el optimizador (core/optimizador.py)
+    # -----------------------------------------------------------
+    def visitExpConstante(self, ctx):
+        return ctx.valor
+
+    def visitExpInvariante(self, ctx):
+        if not ctx.calculado:
+            ctx.valor = self.visit(ctx.expresion())
+            # Una lista se crea de nuevo en cada vuelta: si se reutilizara, todas serían la misma
+            ctx.calculado = type(ctx.valor) is not Lista
+        return ctx.valor
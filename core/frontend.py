@@ -0,0 +1,124 @@
+"""
+Punto único de entrada para convertir código Minicode en árbol de sintaxis.
+
+Hay dos motores con el mismo resultado:
+  - "rapido": lexer y parser escritos a mano (core/parser_rapido.py).
+  - "antlr":  el lexer/parser generados por ANTLR a partir de Minicode.g4.
+
+El motor por defecto se elige con la variable de entorno MINICODE_PARSER
+(por defecto "rapido"). Si el parser rápido encuentra un error de sintaxis se
+repite el parseo con ANTLR, que es quien informa y se recupera de los errores.
+"""
+import os
+
+MOTORES = ("rapido", "antlr")
+MOTOR_POR_DEFECTO = os.environ.get("MINICODE_PARSER", "rapido")
+
+
+# Programa que recorre todas las reglas de la gramática; se parsea una vez al
+# arrancar para que la caché DFA de ANTLR no se construya durante el primer parseo real.
+_PROGRAMA_CALENTAMIENTO = """\
+definir a como 1 + 2 * (3 - 4) % 5
+definir b
+b = -a ** 2 / 3
+si a < b y b >= 2 o a != 1 y b no es falso:
+    mostrar "texto"
+sino:
+    imprimir verdadero
+fin
+funcion f(n, paso):
+    repetir n veces:
+        mover adelante paso
+        mover atras
+        girar izquierda 90
+        girar derecha
+        cambiar color "rojo"
+        bajar lapiz
+        subir lapiz
+    fin
+    mientras paso < n hacer:
+        paso = paso + 1
+    fin
+fin
+f(a, b)
+llamar f(1, 2)
+mostrar f(a, llamar f)
+l = [a, [b], []]
+l[1][0] = l[0]
+para cada e en l:
+    mostrar e
+fin
+tocar nota do durante 0.5 segundos
+definir polinomio p = x**2 + 1
+mostrar polinomio p
+graficar p
+sumar polinomio p con polinomio p
+multiplicar polinomio p * polinomio p
+"""
+
+_precalentado = False
+
+
+def parsear_antlr(codigo):
+    """
+    Devuelve (tree, parser) usando el parser generado por ANTLR en dos etapas:
+
+    1. Predicción SLL con BailErrorStrategy: no hay análisis de contexto completo
+       y el primer error aborta el parseo. Es suficiente para casi todo programa válido.
+    2. Solo si la etapa 1 falla: se vuelve a parsear el mismo flujo de tokens con
+       LL completo y la estrategia de errores por defecto (mensajes y recuperación).
+
+    Las cachés DFA (decisionsToDFA, sharedContextCache) son atributos de clase
+    de MinicodeLexer/MinicodeParser, así que se conservan entre parseos.
+    """
+    from antlr4 import InputStream, CommonTokenStream
+    from antlr4.atn.PredictionMode import PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException
+    from antlr.MinicodeLexer import MinicodeLexer
+    from antlr.MinicodeParser import MinicodeParser
+
+    lexer = MinicodeLexer(InputStream(codigo))
+    stream = CommonTokenStream(lexer)
+
+    parser = MinicodeParser(stream)
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    try:
+        return parser.programa(), parser
+    except ParseCancellationException:
+        pass
+
+    stream.seek(0)
+    parser = MinicodeParser(stream)
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.programa(), parser
+
+
+def precalentar():
+    """Llena las cachés DFA del lexer y del parser de ANTLR (solo la primera vez)."""
+    global _precalentado
+    if not _precalentado:
+        parsear_antlr(_PROGRAMA_CALENTAMIENTO)
+        _precalentado = True
+
+
+def parsear(codigo, motor=None):
+    """
+    Devuelve (tree, parser). Con el motor rápido `parser` es la clase
+    MinicodeParser (solo se usa para consultar ruleNames, p. ej. en el visor del AST).
+    """
+    motor = motor or MOTOR_POR_DEFECTO
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de parseo desconocido: {motor!r} (opciones: {', '.join(MOTORES)})")
+
+    if motor == "rapido":
+        from core.parser_rapido import ErrorSintaxis, parsear as parsear_rapido
+        from antlr.MinicodeParser import MinicodeParser
+        try:
+            return parsear_rapido(codigo), MinicodeParser
+        except ErrorSintaxis:
+            pass  # ANTLR genera los mensajes de error y el árbol con recuperación
+
+    return parsear_antlr(codigo)
@@ -0,0 +1,242 @@
+"""
+Listas de Minicode: literales `[1, 2, 3]`, índices `l[0]` (desde 0; los negativos
+cuentan desde el final), `l[i] = v`, `para cada x en l:` y las funciones nativas
+longitud, agregar, suma, minimo, maximo y rango.
+
+Almacenamiento compacto: una lista solo de enteros se guarda en un array.array("q")
+y una solo de decimales en un array.array("d") (8 bytes por elemento en lugar de un
+objeto Python cada uno); cualquier otra mezcla es una list normal. Si se mete un
+valor que no cabe en el array (un texto, un entero de más de 64 bits...), la lista
+pasa a list sin que el programa note nada.
+
+Operaciones en bloque: `lista <op> número` (y `número <op> lista`) aplica la
+operación a cada elemento con map(), un bucle en C, y devuelve una lista nueva.
+`lista + lista` une las dos listas; el resto de operaciones entre dos listas es un error.
+Las listas no se ordenan: `<`, `>`, `<=` y `>=` con una lista también son un error.
+
+Ninguna operación crea una lista de más de MAXIMO_ELEMENTOS elementos: rango(), la
+unión y las operaciones en bloque llenan la lista en una sola llamada nativa, que ni
+el límite de pasos ni el de tiempo del executor pueden interrumpir.
+"""
+import operator
+from array import array
+from itertools import repeat
+
+_BITS_ENTERO = 63  # rango de array("q")
+MAXIMO_ELEMENTOS = 10_000_000  # 80 MB en un array("q")
+
+
+def _comprobar_tamano(n):
+    if n > MAXIMO_ELEMENTOS:
+        raise Exception(f"Error: una lista no puede tener más de {MAXIMO_ELEMENTOS} elementos ({n} pedidos).")
+
+
+def _almacen(valores):
+    """El contenedor más compacto para `valores` (array.array o list)."""
+    if isinstance(valores, array):
+        return valores
+    if not isinstance(valores, list):
+        valores = list(valores)
+    tipos = set(map(type, valores))
+    if tipos == {int}:
+        try:
+            return array("q", valores)
+        except OverflowError:
+            return valores
+    if tipos == {float}:
+        return array("d", valores)
+    return valores
+
+
+def _cabe(datos, valor):
+    """¿Se puede guardar `valor` en `datos` sin cambiar de representación?"""
+    if type(datos) is list:
+        return True
+    if datos.typecode == "q":
+        return type(valor) is int and -(1 << _BITS_ENTERO) <= valor < (1 << _BITS_ENTERO)
+    return type(valor) is float
+
+
+def combinar(funcion, izq, der):
+    """Aplica `funcion` elemento a elemento cuando uno de los operandos es una Lista."""
+    if isinstance(izq, Lista) and isinstance(der, Lista):
+        raise Exception("Error: entre dos listas solo se puede usar + (para unirlas).")
+    _comprobar_tamano(len(izq if isinstance(izq, Lista) else der))
+    if isinstance(izq, Lista):
+        return Lista(list(map(funcion, izq.datos, repeat(der))))
+    return Lista(list(map(funcion, repeat(izq, len(der)), der.datos)))
+
+
+class Lista:
+    """Valor lista de Minicode. `datos` es un array.array o una list (ver _almacen)."""
+    __slots__ = ("datos",)
+    __hash__ = None
+
+    def __init__(self, valores=()):
+        self.datos = _almacen(valores)
+
+    # -----------------------------------------------------------
+    # Acceso
+    # -----------------------------------------------------------
+    def __len__(self):
+        return len(self.datos)
+
+    def __iter__(self):
+        return iter(self.datos)
+
+    def _posicion(self, indice):
+        if type(indice) is not int:
+            raise Exception(f"Error: el índice de una lista debe ser un número entero, no '{indice}'.")
+        n = len(self.datos)
+        if not -n <= indice < n:
+            raise Exception(f"Error: índice {indice} fuera de rango (la lista tiene {n} elemento(s)).")
+        return indice
+
+    def obtener(self, indice):
+        return self.datos[self._posicion(indice)]
+
+    def asignar(self, indice, valor):
+        posicion = self._posicion(indice)
+        if not _cabe(self.datos, valor):
+            self.datos = list(self.datos)
+        self.datos[posicion] = valor
+
+    def agregar(self, valor):
+        if not self.datos:
+            self.datos = _almacen([valor])
+            return
+        if not _cabe(self.datos, valor):
+            self.datos = list(self.datos)
+        self.datos.append(valor)
+
+    # -----------------------------------------------------------
+    # Operadores
+    # -----------------------------------------------------------
+    def __add__(self, otro):
+        if isinstance(otro, Lista):
+            _comprobar_tamano(len(self.datos) + len(otro.datos))
+            if type(self.datos) is type(otro.datos) and \
+                    (type(self.datos) is list or self.datos.typecode == otro.datos.typecode):
+                return Lista(self.datos + otro.datos)
+            return Lista(list(self.datos) + list(otro.datos))
+        return combinar(operator.add, self, otro)
+
+    def __radd__(self, otro):
+        return combinar(operator.add, otro, self)
+
+    def __sub__(self, otro):
+        return combinar(operator.sub, self, otro)
+
+    def __rsub__(self, otro):
+        return combinar(operator.sub, otro, self)
+
+    def __mul__(self, otro):
+        return combinar(operator.mul, self, otro)
+
+    def __rmul__(self, otro):
+        return combinar(operator.mul, otro, self)
+
+    def __mod__(self, otro):
+        return combinar(operator.mod, self, otro)
+
+    def __rmod__(self, otro):
+        return combinar(operator.mod, otro, self)
+
+    def __neg__(self):
+        _comprobar_tamano(len(self.datos))
+        return Lista(list(map(operator.neg, self.datos)))
+
+    def __pos__(self):
+        return self
+
+    def __eq__(self, otro):
+        if not isinstance(otro, Lista):
+            return False
+        if type(self.datos) is type(otro.datos):
+            return self.datos == otro.datos
+        return list(self.datos) == list(otro.datos)
+
+    def _sin_orden(self, otro):
+        raise Exception("Error: las listas no se pueden comparar con <, >, <= ni >=.")
+
+    __lt__ = __le__ = __gt__ = __ge__ = _sin_orden
+
+    def __str__(self):
+        return "[" + ", ".join(map(str, self.datos)) + "]"
+
+    def __repr__(self):
+        return f"Lista({list(self.datos)!r})"
+
+
+# ============================================================
+# 🧰 FUNCIONES NATIVAS
+# ============================================================
+def _lista(valor, funcion):
+    if not isinstance(valor, Lista):
+        raise Exception(f"Error: '{funcion}' necesita una lista.")
+    return valor
+
+
+def longitud(valor):
+    if not isinstance(valor, (Lista, str)):
+        raise Exception("Error: 'longitud' necesita una lista o un texto.")
+    return len(valor)
+
+
+def agregar(lista, valor):
+    _lista(lista, "agregar").agregar(valor)
+
+
+def suma(lista):
+    return sum(_lista(lista, "suma").datos)
+
+
+def minimo(lista):
+    if not _lista(lista, "minimo").datos:
+        raise Exception("Error: 'minimo' de una lista vacía.")
+    return min(lista.datos)
+
+
+def maximo(lista):
+    if not _lista(lista, "maximo").datos:
+        raise Exception("Error: 'maximo' de una lista vacía.")
+    return max(lista.datos)
+
+
+def rango(desde, hasta=None):
+    """rango(n) = [0, 1, ..., n - 1]; rango(a, b) = [a, ..., b - 1]."""
+    if hasta is None:
+        desde, hasta = 0, desde
+    if type(desde) is not int or type(hasta) is not int:
+        raise Exception("Error: 'rango' necesita números enteros.")
+    _comprobar_tamano(max(0, hasta - desde))
+    return Lista(array("q", range(desde, hasta)))
+
+
+# nombre -> (función, mínimo de argumentos, máximo de argumentos).
+# Una función definida en el programa con el mismo nombre tiene prioridad.
+FUNCIONES_NATIVAS = {
+    "longitud": (longitud, 1, 1),
+    "agregar": (agregar, 2, 2),
+    "suma": (suma, 1, 1),
+    "minimo": (minimo, 1, 1),
+    "maximo": (maximo, 1, 1),
+    "rango": (rango, 1, 2),
+}
+
+
+def indice(valor, posicion):
+    """valor[posicion] para listas y textos."""
+    if isinstance(valor, Lista):
+        return valor.obtener(posicion)
+    if isinstance(valor, str):
+        return _caracter(valor, posicion)
+    raise Exception("Error: solo se puede usar [ ] con listas y textos.")
+
+
+def _caracter(texto, posicion):
+    if type(posicion) is not int:
+        raise Exception(f"Error: el índice de un texto debe ser un número entero, no '{posicion}'.")
+    if not -len(texto) <= posicion < len(texto):
+        raise Exception(f"Error: índice {posicion} fuera de rango (el texto tiene {len(texto)} carácter(es)).")
+    return texto[posicion]
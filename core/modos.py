@@ -0,0 +1,177 @@
+"""
+Modos de ejecución aislados: musica, polinomios y juegos.
+
+Antes de ejecutar se recorta el programa (program slicing) a las instrucciones de
+un solo entorno y a todo aquello de lo que dependen: las asignaciones de las
+variables que leen, los `si`/`repetir`/`mientras` que las contienen y las funciones (con sus
+llamadas) desde las que se ejecutan. El resto se quita del árbol, así que la
+ejecución ni lo visita ni inicializa los entornos que no usa.
+
+Minicode tiene ámbito dinámico, de modo que el análisis trabaja con nombres y sin
+orden (una asignación cuenta si escribe un nombre que alguien necesita, esté donde
+esté): conserva de más en algún caso raro, pero nunca quita algo necesario.
+
+Una misma lista puede estar en varias variables (`b = a`), así que lo que cambia
+una lista (`l[i] = v`, `agregar(l, v)`) no se asocia a un nombre: se conserva en
+cuanto alguna instrucción conservada lee una variable cualquiera.
+"""
+from antlr4 import ParserRuleContext
+from antlr.MinicodeParser import MinicodeParser as P
+
+# Nombre ficticio que "escriben" las instrucciones que modifican una lista
+_MUTACION = "[lista]"
+_NATIVAS_QUE_MODIFICAN = {"agregar"}
+
+# Instrucciones que forman cada modo
+MODOS = {
+    "musica": (P.Comando_musicalContext,),
+    "polinomios": (P.Definir_polinomioContext, P.Mostrar_polinomioContext,
+                   P.Graficar_polinomioContext, P.Operar_polinomioContext),
+    "juegos": (P.Comando_graficoContext,),
+}
+
+
+class _Info:
+    """Lo que lee, escribe y llama una instrucción (sin contar su bloque interior)."""
+    __slots__ = ("instr", "nodo", "lee", "escribe", "llama", "contenedores", "funcion")
+
+    def __init__(self, instr, nodo, contenedores, funcion):
+        self.instr = instr
+        self.nodo = nodo
+        self.lee = set()
+        self.escribe = set()
+        self.llama = set()
+        self.contenedores = contenedores  # instrucciones si/repetir/mientras/para cada que la rodean
+        self.funcion = funcion            # nombre de la función en la que está, o None
+
+
+class Rebanador:
+    """Calcula y aplica el recorte de un árbol de `programa` para un modo."""
+
+    def __init__(self, modo):
+        if modo not in MODOS:
+            raise ValueError(f"Modo desconocido: '{modo}'.")
+        self.criterio = MODOS[modo]
+        self.infos = []
+        self.definiciones = {}  # nombre de función -> _Info de su funcion_def
+        self.parametros = {}    # nombre de función -> [parámetros]
+
+    def rebanar(self, tree):
+        """Quita del árbol las instrucciones que no afectan al modo. Devuelve (conservadas, total)."""
+        self._recoger(tree, (), None)
+        conservadas = self._relevantes()
+        for info in self.infos:
+            if info.instr not in conservadas:
+                info.instr.parentCtx.children.remove(info.instr)
+        return len(conservadas), len(self.infos)
+
+    # -----------------------------------------------------------
+    # Recogida de lecturas / escrituras
+    # -----------------------------------------------------------
+    def _recoger(self, nodo, contenedores, funcion):
+        for instr in nodo.getTypedRuleContexts(P.InstruccionContext):
+            hijo = instr.getChild(0)
+            if not isinstance(hijo, ParserRuleContext):
+                continue  # NUEVALINEA
+            info = _Info(instr, hijo, contenedores, funcion)
+            self.infos.append(info)
+
+            if isinstance(hijo, (P.Declarar_varContext, P.AsignacionContext)):
+                info.escribe.add(hijo.ID().getText())
+                self._expresiones(hijo.expresion(), info)
+            elif isinstance(hijo, P.Asignar_elementoContext):
+                info.escribe.add(_MUTACION)
+                info.lee.add(hijo.ID().getText())
+                self._expresiones(hijo, info)
+            elif isinstance(hijo, P.Funcion_defContext):
+                nombre = hijo.ID().getText()
+                self.definiciones[nombre] = info
+                self.parametros[nombre] = [p.getText() for p in hijo.parametros().ID()] if hijo.parametros() else []
+                self._recoger(hijo.bloque(), (), nombre)
+            elif isinstance(hijo, (P.CondicionalContext, P.RepetirContext, P.MientrasContext)):
+                self._expresiones(hijo.expresion(), info)
+                for bloque in hijo.getTypedRuleContexts(P.BloqueContext):
+                    self._recoger(bloque, contenedores + (info,), funcion)
+            elif isinstance(hijo, P.Para_cadaContext):
+                info.escribe.add(hijo.ID().getText())
+                self._expresiones(hijo.expresion(), info)
+                self._recoger(hijo.bloque(), contenedores + (info,), funcion)
+            elif isinstance(hijo, P.Definir_polinomioContext):
+                pass  # su expresión es texto para SymPy, no se evalúa
+            else:
+                self._expresiones(hijo, info)
+
+    def _expresiones(self, nodo, info):
+        pendientes = [nodo] if nodo is not None else []
+        while pendientes:
+            actual = pendientes.pop()
+            if isinstance(actual, P.ExpIDContext):
+                info.lee.add(actual.ID().getText())
+            elif isinstance(actual, P.Funcion_llamadaContext):
+                info.llama.add(actual.ID().getText())
+                if actual.ID().getText() in _NATIVAS_QUE_MODIFICAN:
+                    info.escribe.add(_MUTACION)
+            for hijo in actual.getChildren():
+                if isinstance(hijo, ParserRuleContext):
+                    pendientes.append(hijo)
+
+    def _escrituras_de_funciones(self):
+        """Nombres que puede escribir cada función, incluidas las que llama (y sus parámetros)."""
+        directas = {nombre: set(params) for nombre, params in self.parametros.items()}
+        llamadas = {nombre: set() for nombre in self.parametros}
+        for info in self.infos:
+            if info.funcion in directas:
+                directas[info.funcion] |= info.escribe
+                llamadas[info.funcion] |= info.llama
+        cambiado = True
+        while cambiado:
+            cambiado = False
+            for nombre, llamadas_f in llamadas.items():
+                for otra in llamadas_f:
+                    nuevas = directas.get(otra, set()) - directas[nombre]
+                    if nuevas:
+                        directas[nombre] |= nuevas
+                        cambiado = True
+        return directas
+
+    # -----------------------------------------------------------
+    # Punto fijo
+    # -----------------------------------------------------------
+    def _relevantes(self):
+        escrituras = self._escrituras_de_funciones()
+        necesarios = set()   # variables que alguna instrucción conservada lee
+        funciones = set()    # funciones que deben ejecutarse
+        conservadas = set()
+        pendientes = [info for info in self.infos if isinstance(info.nodo, self.criterio)]
+
+        while True:
+            while pendientes:
+                info = pendientes.pop()
+                if info.instr in conservadas:
+                    continue
+                conservadas.add(info.instr)
+                necesarios |= info.lee
+                if info.lee:
+                    necesarios.add(_MUTACION)
+                funciones |= info.llama
+                pendientes.extend(info.contenedores)
+                if info.funcion is not None:
+                    funciones.add(info.funcion)
+            for nombre in funciones:
+                definicion = self.definiciones.get(nombre)
+                if definicion is not None and definicion.instr not in conservadas:
+                    pendientes.append(definicion)
+
+            for info in self.infos:
+                if info.instr in conservadas:
+                    continue
+                if (info.escribe & necesarios or info.llama & funciones
+                        or any(escrituras.get(f, set()) & necesarios for f in info.llama)):
+                    pendientes.append(info)
+            if not pendientes:
+                return conservadas
+
+
+def rebanar(tree, modo):
+    """Recorta `tree` en sitio para `modo`; devuelve (instrucciones conservadas, total)."""
+    return Rebanador(modo).rebanar(tree)
@@ -0,0 +1,254 @@
+from antlr4 import ParserRuleContext
+from antlr4.tree.Tree import ParseTreeVisitor
+from antlr.MinicodeParser import MinicodeParser
+from core.executor import MinicodeExecutor
+
+
+# ============================================================
+# 🟨 NODOS SINTÉTICOS GENERADOS POR EL OPTIMIZADOR
+# ============================================================
+class ExpConstanteContext(MinicodeParser.ExpresionContext):
+    """
+    Expresión cuyo valor se calculó una sola vez durante la optimización.
+    Conserva la expresión original como único hijo para que getText()
+    (usado por ejemplo al definir polinomios) siga devolviendo el código fuente.
+    """
+
+    def __init__(self, original, valor):
+        super().__init__(original.parser, original.parentCtx, original.invokingState)
+        self.valor = valor
+        self.start = original.start
+        self.stop = original.stop
+        self.addChild(original)
+
+    def expresion(self):
+        return self.getTypedRuleContext(MinicodeParser.ExpresionContext, 0)
+
+    def accept(self, visitor: ParseTreeVisitor):
+        if hasattr(visitor, "visitExpConstante"):
+            return visitor.visitExpConstante(self)
+        else:
+            return visitor.visitChildren(self)
+
+
+class ExpInvarianteContext(MinicodeParser.ExpresionContext):
+    """
+    Expresión invariante dentro de un `repetir`: se evalúa la primera vez que
+    se necesita en cada entrada al bucle y después se reutiliza el resultado.
+    """
+
+    def __init__(self, original):
+        super().__init__(original.parser, original.parentCtx, original.invokingState)
+        self.calculado = False
+        self.valor = None
+        self.start = original.start
+        self.stop = original.stop
+        self.addChild(original)
+
+    def reiniciar(self):
+        self.calculado = False
+        self.valor = None
+
+    def expresion(self):
+        return self.getTypedRuleContext(MinicodeParser.ExpresionContext, 0)
+
+    def accept(self, visitor: ParseTreeVisitor):
+        if hasattr(visitor, "visitExpInvariante"):
+            return visitor.visitExpInvariante(self)
+        else:
+            return visitor.visitChildren(self)
+
+
+# ============================================================
+# 🟧 OPTIMIZADOR DEL ÁRBOL
+# ============================================================
+class OptimizadorAST:
+    """
+    Pasada de optimización sobre el árbol que produce el parser:
+    - pliega subexpresiones constantes (y convierte los literales numéricos una sola vez),
+    - elimina las ramas de `si`/`sino` que nunca se ejecutarán,
+    - saca de los `repetir`, `mientras` y `para cada` las expresiones que no cambian entre iteraciones.
+
+    Las constantes se evalúan con el propio MinicodeExecutor, así que el resultado
+    coincide siempre con el de una ejecución normal. Si evaluar falla (p. ej. una
+    división por cero) la expresión se deja intacta y el error aparece al ejecutar.
+    """
+
+    _LITERALES = (
+        MinicodeParser.ExpNumeroContext,
+        MinicodeParser.ExpTextoContext,
+        MinicodeParser.ExpVerdaderoContext,
+        MinicodeParser.ExpFalsoContext,
+    )
+
+    _COMPUESTAS = (
+        MinicodeParser.ExpParenContext,
+        MinicodeParser.ExpSignoContext,
+        MinicodeParser.ExpMulDivContext,
+        MinicodeParser.ExpSumaRestaContext,
+        MinicodeParser.ExpComparacionContext,
+        MinicodeParser.ExpPotenciaContext,
+    )
+
+    def __init__(self, numeros=None):
+        # Mismo modo numérico que la ejecución, para que las constantes plegadas coincidan
+        self.evaluador = MinicodeExecutor(None, numeros=numeros)
+
+    def optimizar(self, tree):
+        """Optimiza el árbol en sitio y lo devuelve."""
+        self._plegar(tree)
+        self._eliminar_ramas(tree)
+        self._sacar_invariantes(tree)
+        return tree
+
+    # -----------------------------------------------------------
+    # Utilidades internas
+    # -----------------------------------------------------------
+    @staticmethod
+    def _reemplazar(padre, nodo, nuevo):
+        """Sustituye `nodo` por `nuevo` (o lo elimina si es None) dentro de `padre`."""
+        indice = padre.children.index(nodo)
+        if hasattr(padre, "ic"):
+            del padre.ic  # la caché en línea del executor apuntaba al hijo antiguo
+        if nuevo is None:
+            del padre.children[indice]
+            return
+        padre.children[indice] = nuevo
+        nuevo.parentCtx = padre
+        if nodo in (nuevo.children or []):
+            nodo.parentCtx = nuevo
+
+    def _evaluar(self, ctx):
+        try:
+            return True, self.evaluador.visit(ctx)
+        except Exception:
+            return False, None
+
+    @staticmethod
+    def _hijos(nodo):
+        return [h for h in (nodo.children or []) if isinstance(h, ParserRuleContext)]
+
+    # -----------------------------------------------------------
+    # Plegado de constantes
+    # -----------------------------------------------------------
+    def _plegar(self, nodo):
+        """Recorre el árbol en postorden y devuelve si `nodo` quedó como constante."""
+        for hijo in self._hijos(nodo):
+            self._plegar(hijo)
+
+        if isinstance(nodo, ExpConstanteContext):
+            return True
+        if not isinstance(nodo, MinicodeParser.ExpresionContext):
+            return False
+
+        constante = False
+        if isinstance(nodo, self._LITERALES):
+            constante = True
+        elif isinstance(nodo, self._COMPUESTAS):
+            constante = all(isinstance(h, ExpConstanteContext) for h in self._hijos(nodo))
+        elif isinstance(nodo, MinicodeParser.ExpLogicaContext):
+            # `falso y ...` y `verdadero o ...` no evalúan el lado derecho
+            izq, der = nodo.expresion(0), nodo.expresion(1)
+            if isinstance(izq, ExpConstanteContext):
+                corta = (nodo.op.type == MinicodeParser.Y and not izq.valor) or \
+                        (nodo.op.type == MinicodeParser.O and izq.valor)
+                constante = corta or isinstance(der, ExpConstanteContext)
+
+        if not constante:
+            return False
+        ok, valor = self._evaluar(nodo)
+        if not ok:
+            return False
+        self._reemplazar(nodo.parentCtx, nodo, ExpConstanteContext(nodo, valor))
+        return True
+
+    # -----------------------------------------------------------
+    # Eliminación de ramas muertas
+    # -----------------------------------------------------------
+    def _eliminar_ramas(self, nodo):
+        for hijo in self._hijos(nodo):
+            self._eliminar_ramas(hijo)
+
+        if not isinstance(nodo, MinicodeParser.CondicionalContext):
+            return
+        condicion = nodo.expresion()
+        if not isinstance(condicion, ExpConstanteContext):
+            return
+
+        padre = nodo.parentCtx
+        if condicion.valor:
+            self._reemplazar(padre, nodo, nodo.bloque(0))
+        elif nodo.SINO():
+            self._reemplazar(padre, nodo, nodo.bloque(1))
+        else:
+            self._reemplazar(padre, nodo, None)
+
+    # -----------------------------------------------------------
+    # Expresiones invariantes en bucles
+    # -----------------------------------------------------------
+    def _sacar_invariantes(self, nodo):
+        if isinstance(nodo, (MinicodeParser.RepetirContext, MinicodeParser.MientrasContext,
+                             MinicodeParser.Para_cadaContext)):
+            cuerpo = nodo.bloque()
+            asignados = self._nombres_asignados(cuerpo)
+            if asignados is not None and isinstance(nodo, MinicodeParser.Para_cadaContext):
+                asignados.add(nodo.ID().getText())  # la variable del bucle cambia en cada vuelta
+            if asignados is not None:
+                invariantes = []
+                self._marcar_invariantes(cuerpo, asignados, invariantes)
+                if invariantes:
+                    nodo.invariantes = invariantes
+
+        for hijo in self._hijos(nodo):
+            self._sacar_invariantes(hijo)
+
+    def _nombres_asignados(self, cuerpo):
+        """
+        Devuelve los nombres que el cuerpo puede modificar, o None si contiene
+        llamadas a funciones (que pueden tocar cualquier variable del llamador) o
+        cambia elementos de una lista (que puede estar en varias variables a la vez).
+        """
+        asignados = set()
+        pendientes = [cuerpo]
+        while pendientes:
+            nodo = pendientes.pop()
+            if isinstance(nodo, (MinicodeParser.Funcion_llamadaContext, MinicodeParser.Asignar_elementoContext)):
+                return None
+            if isinstance(nodo, (MinicodeParser.Declarar_varContext,
+                                 MinicodeParser.AsignacionContext,
+                                 MinicodeParser.Para_cadaContext,
+                                 MinicodeParser.Definir_polinomioContext)):
+                asignados.add(nodo.ID().getText())
+            elif isinstance(nodo, MinicodeParser.Operar_polinomioContext):
+                op = nodo.children[0].getText()
+                asignados.add(f"{nodo.ID(0).getText()}_{op}_{nodo.ID(1).getText()}")
+            pendientes.extend(self._hijos(nodo))
+        return asignados
+
+    def _es_invariante(self, expr, asignados):
+        pendientes = [expr]
+        while pendientes:
+            nodo = pendientes.pop()
+            if isinstance(nodo, ExpConstanteContext):
+                continue
+            if isinstance(nodo, MinicodeParser.ExpIDContext) and nodo.getText() in asignados:
+                return False
+            if isinstance(nodo, (MinicodeParser.ExpFuncionContext, ExpInvarianteContext)):
+                return False
+            pendientes.extend(self._hijos(nodo))
+        return True
+
+    def _marcar_invariantes(self, nodo, asignados, invariantes):
+        for hijo in self._hijos(nodo):
+            # El cuerpo de una función se ejecuta fuera del bucle: su caché no se reiniciaría
+            if isinstance(hijo, (ExpConstanteContext, ExpInvarianteContext, MinicodeParser.Funcion_defContext)):
+                continue
+            # Solo merece la pena cachear expresiones compuestas
+            if isinstance(hijo, self._COMPUESTAS + (MinicodeParser.ExpLogicaContext,)) and \
+                    not isinstance(hijo, MinicodeParser.ExpParenContext) and \
+                    self._es_invariante(hijo, asignados):
+                envoltura = ExpInvarianteContext(hijo)
+                self._reemplazar(nodo, hijo, envoltura)
+                invariantes.append(envoltura)
+            else:
+                self._marcar_invariantes(hijo, asignados, invariantes)
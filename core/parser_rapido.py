@@ -0,0 +1,607 @@
+"""
+Lexer y parser escritos a mano para Minicode.
+
+Producen exactamente el mismo árbol que el parser generado por ANTLR (mismas
+clases de contexto de antlr/MinicodeParser.py, mismos tokens), de modo que el
+executor, el optimizador y el visor del AST funcionan sin cambios, pero sin la
+predicción adaptativa (ATN) del runtime de Python, que es lo más lento con
+programas grandes.
+
+Ante cualquier error léxico o sintáctico se lanza ErrorSintaxis: no se intenta
+recuperar. core/frontend.py vuelve entonces a parsear con ANTLR, que es quien
+genera los mensajes y el árbol de recuperación habituales.
+"""
+import re
+
+from antlr4.Token import CommonToken, Token
+from antlr.MinicodeParser import MinicodeParser as P
+
+
+class ErrorSintaxis(Exception):
+    def __init__(self, mensaje, linea=0, columna=0):
+        super().__init__(f"línea {linea}:{columna} {mensaje}")
+        self.mensaje = mensaje
+        self.linea = linea
+        self.columna = columna
+
+
+# ============================================================
+# 🔤 LEXER
+# ============================================================
+_PALABRAS_CLAVE = {
+    'definir': P.DEFINIR, 'como': P.COMO, 'funcion': P.FUNCION, 'llamar': P.LLAMAR,
+    'fin': P.FIN, 'si': P.SI, 'sino': P.SINO, 'repetir': P.REPETIR, 'veces': P.VECES,
+    'mientras': P.MIENTRAS, 'para': P.PARA, 'cada': P.CADA,
+    'imprimir': P.IMPRIMIR, 'mostrar': P.MOSTRAR,
+    'mover': P.MOVER, 'adelante': P.ADELANTE, 'atras': P.ATRAS, 'girar': P.GIRAR,
+    'izquierda': P.IZQUIERDA, 'derecha': P.DERECHA, 'cambiar': P.CAMBIAR, 'color': P.COLOR,
+    'bajar': P.BAJAR, 'subir': P.SUBIR, 'lapiz': P.LAPIZ,
+    'tocar': P.TOCAR, 'nota': P.NOTA, 'durante': P.DURANTE, 'segundos': P.SEGUNDOS,
+    'polinomio': P.POLINOMIO, 'graficar': P.GRAFICAR, 'sumar': P.SUMAR, 'restar': P.RESTAR,
+    'multiplicar': P.MULTIPLICAR, 'dividir': P.DIVIDIR, 'con': P.CON,
+    'verdadero': P.VERDADERO, 'cierto': P.VERDADERO, 'falso': P.FALSO,
+    'es': P.IGUAL, 'y': P.Y, 'o': P.O,
+}
+
+_SIMBOLOS = {
+    '=': P.T__0, '(': P.T__1, ')': P.T__2, ':': P.T__3, ',': P.T__4,
+    '+': P.MAS, '-': P.MENOS, '*': P.POR, '/': P.DIV, '%': P.MOD, '**': P.POTENCIA,
+    '<': P.MENOR, '>': P.MAYOR, '<=': P.MENORIGUAL, '>=': P.MAYORIGUAL,
+    '==': P.IGUAL, '!=': P.DIFERENTE, 'no es': P.DIFERENTE,
+    '[': P.ABRECORCHETE, ']': P.CIERRACORCHETE,
+}
+
+# El orden de los grupos reproduce la regla de ANTLR: gana la coincidencia más larga.
+# 'no es' va antes que las palabras porque siempre es más largo que el ID "no".
+_LETRA = "a-zA-ZáéíóúÁÉÍÓÚñÑ_"
+_PATRON = re.compile(
+    r"(?P<espacio>[ \t]+)"
+    r"|(?P<comentario>#[^\r\n]*)"
+    r"|(?P<nl>(?:\r?\n)+)"
+    r"|(?P<simbolo>no es|\*\*|<=|>=|==|!=|[=(),:+\-*/%<>\[\]])"
+    rf"|(?P<palabra>[{_LETRA}][{_LETRA}0-9]*)"
+    r"|(?P<numero>[0-9]+(?:\.[0-9]+)?)"
+    r'|(?P<texto>"(?:[^"\\]|\\[\s\S])*")'
+)
+
+
+def tokenizar(codigo):
+    """Devuelve la lista de CommonToken (con EOF al final) que generaría MinicodeLexer."""
+    tokens = []
+    pos = 0
+    linea = 1
+    inicio_linea = 0
+    n = len(codigo)
+    buscar = _PATRON.match
+
+    while pos < n:
+        m = buscar(codigo, pos)
+        if m is None:
+            raise ErrorSintaxis(f"token recognition error at: '{codigo[pos]}'", linea, pos - inicio_linea)
+        grupo = m.lastgroup
+        texto = m.group()
+        fin = m.end()
+
+        if grupo != 'espacio' and grupo != 'comentario':
+            if grupo == 'palabra':
+                tipo = _PALABRAS_CLAVE.get(texto, P.ID)
+            elif grupo == 'simbolo':
+                tipo = _SIMBOLOS[texto]
+            elif grupo == 'nl':
+                tipo = P.NUEVALINEA
+            elif grupo == 'numero':
+                tipo = P.NUMERO
+            else:
+                tipo = P.TEXTO
+            token = CommonToken(type=tipo, start=pos, stop=fin - 1)
+            token.text = texto
+            token.line = linea
+            token.column = pos - inicio_linea
+            token.tokenIndex = len(tokens)
+            tokens.append(token)
+
+        if grupo == 'nl' or (grupo == 'texto' and '\n' in texto):
+            linea += texto.count('\n')
+            inicio_linea = pos + texto.rindex('\n') + 1
+        pos = fin
+
+    eof = CommonToken(type=Token.EOF, start=n, stop=n - 1)
+    eof.text = "<EOF>"
+    eof.line = linea
+    eof.column = n - inicio_linea
+    eof.tokenIndex = len(tokens)
+    tokens.append(eof)
+    return tokens
+
+
+# ============================================================
+# 🌳 PARSER (descenso recursivo + Pratt para expresiones)
+# ============================================================
+
+# Precedencias tal y como quedan en la gramática (cuanto mayor, más fuerte liga).
+# ANTLR numera las alternativas de `expresion` de abajo arriba: el índice `a[i]` es la
+# 16, la potencia la 15, el signo prefijo (#expSigno) la 14 y `o` la 9, de modo que
+# `-2 ** 2` es `-(2 ** 2)` y `-a * b` es `(-a) * b`, como en Python.
+PRECEDENCIA_BINARIA = {
+    P.POTENCIA: (15, P.ExpPotenciaContext),
+    P.POR: (13, P.ExpMulDivContext), P.DIV: (13, P.ExpMulDivContext), P.MOD: (13, P.ExpMulDivContext),
+    P.MAS: (12, P.ExpSumaRestaContext), P.MENOS: (12, P.ExpSumaRestaContext),
+    P.MENOR: (11, P.ExpComparacionContext), P.MAYOR: (11, P.ExpComparacionContext),
+    P.MENORIGUAL: (11, P.ExpComparacionContext), P.MAYORIGUAL: (11, P.ExpComparacionContext),
+    P.IGUAL: (11, P.ExpComparacionContext), P.DIFERENTE: (11, P.ExpComparacionContext),
+    P.Y: (10, P.ExpLogicaContext),
+    P.O: (9, P.ExpLogicaContext),
+}
+PRECEDENCIA_INDICE = 16
+PRECEDENCIA_SIGNO = 14
+ASOCIATIVOS_DERECHA = {P.POTENCIA}
+
+_LITERALES = {
+    P.NUMERO: P.ExpNumeroContext,
+    P.TEXTO: P.ExpTextoContext,
+    P.VERDADERO: P.ExpVerdaderoContext,
+    P.FALSO: P.ExpFalsoContext,
+}
+
+_INICIO_EXPRESION = frozenset([P.T__1, P.MAS, P.MENOS, P.NUMERO, P.TEXTO, P.VERDADERO,
+                               P.FALSO, P.ID, P.LLAMAR, P.ABRECORCHETE])
+
+_INICIO_INSTRUCCION = frozenset([
+    P.DEFINIR, P.ID, P.IMPRIMIR, P.MOSTRAR, P.REPETIR, P.MIENTRAS, P.PARA, P.SI, P.FUNCION, P.LLAMAR,
+    P.MOVER, P.GIRAR, P.CAMBIAR, P.BAJAR, P.SUBIR, P.TOCAR, P.GRAFICAR,
+    P.SUMAR, P.RESTAR, P.MULTIPLICAR, P.DIVIDIR, P.NUEVALINEA,
+])
+
+# Contexto vacío del que copian los contextos etiquetados (#expNumero, ...)
+_BASE = P.ExpresionContext(None)
+
+
+class ParserRapido:
+    """
+    Parser de Minicode sin retroceso ni predicción adaptativa. Construye los
+    mismos contextos que MinicodeParser; `programa()` devuelve la raíz.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    # -----------------------------------------------------------
+    # Utilidades
+    # -----------------------------------------------------------
+    def _la(self, k=1):
+        i = self.pos + k - 1
+        if i >= len(self.tokens):
+            return Token.EOF
+        return self.tokens[i].type
+
+    def _error(self, esperado=None):
+        token = self.tokens[self.pos]
+        if esperado is not None:
+            nombre = P.literalNames[esperado] if esperado < len(P.literalNames) else "<INVALID>"
+            if nombre == "<INVALID>":
+                nombre = P.symbolicNames[esperado]
+            mensaje = f"se esperaba {nombre} en '{token.text}'"
+        else:
+            mensaje = f"entrada no válida en '{token.text}'"
+        raise ErrorSintaxis(mensaje, token.line, token.column)
+
+    def _consumir(self, ctx, tipo):
+        token = self.tokens[self.pos]
+        if token.type != tipo:
+            self._error(tipo)
+        ctx.addTokenNode(token)
+        self.pos += 1
+        return token
+
+    def _opcional(self, ctx, tipo):
+        if self.tokens[self.pos].type == tipo:
+            ctx.addTokenNode(self.tokens[self.pos])
+            self.pos += 1
+            return True
+        return False
+
+    def _palabra(self, padre, clase, texto):
+        """Palabra clave contextual (p. ej. `tempo`): un ID con ese texto en su propia regla."""
+        token = self.tokens[self.pos]
+        if token.type != P.ID or token.text != texto:
+            raise ErrorSintaxis(f"se esperaba '{texto}' en '{token.text}'", token.line, token.column)
+        ctx = self._abrir(clase, padre)
+        self._consumir(ctx, P.ID)
+        return self._cerrar(ctx, padre)
+
+    def _abrir(self, clase, padre):
+        ctx = clase(None, padre)
+        ctx.start = self.tokens[self.pos]
+        return ctx
+
+    def _cerrar(self, ctx, padre):
+        ctx.stop = self.tokens[self.pos - 1] if self.pos > 0 else None
+        if padre is not None:
+            padre.addChild(ctx)
+        return ctx
+
+    # -----------------------------------------------------------
+    # Reglas
+    # -----------------------------------------------------------
+    def programa(self):
+        ctx = self._abrir(P.ProgramaContext, None)
+        while self._la() != Token.EOF:
+            self.instruccion(ctx)
+        # Como en ANTLR, EOF se añade al árbol pero no se consume: `stop` es el último token real
+        ctx.addTokenNode(self.tokens[self.pos])
+        ctx.stop = self.tokens[self.pos - 1] if self.pos > 0 else None
+        return ctx
+
+    def instruccion(self, padre):
+        ctx = self._abrir(P.InstruccionContext, padre)
+        la = self._la()
+        if la == P.NUEVALINEA:
+            self._consumir(ctx, P.NUEVALINEA)
+        elif la == P.DEFINIR:
+            if self._la(2) == P.POLINOMIO:
+                self.definir_polinomio(ctx)
+            else:
+                self.declarar_var(ctx)
+        elif la == P.ID:
+            if self._la(2) == P.T__0:
+                self.asignacion(ctx)
+            elif self._la(2) == P.ABRECORCHETE:
+                self.asignar_elemento(ctx)
+            elif self._la(2) == P.T__1:
+                self.funcion_llamada(ctx)
+            else:
+                self._error()
+        elif la == P.LLAMAR:
+            self.funcion_llamada(ctx)
+        elif la == P.IMPRIMIR:
+            self.imprimir(ctx)
+        elif la == P.MOSTRAR:
+            if self._la(2) == P.POLINOMIO:
+                self.mostrar_polinomio(ctx)
+            else:
+                self.imprimir(ctx)
+        elif la == P.REPETIR:
+            self.repetir(ctx)
+        elif la == P.MIENTRAS:
+            self.mientras(ctx)
+        elif la == P.PARA:
+            self.para_cada(ctx)
+        elif la == P.SI:
+            self.condicional(ctx)
+        elif la == P.FUNCION:
+            self.funcion_def(ctx)
+        elif la == P.CAMBIAR and self._la(2) == P.ID:
+            self.comando_musical(ctx)
+        elif la in (P.MOVER, P.GIRAR, P.CAMBIAR, P.BAJAR, P.SUBIR):
+            self.comando_grafico(ctx)
+        elif la == P.TOCAR:
+            self.comando_musical(ctx)
+        elif la == P.GRAFICAR:
+            self.graficar_polinomio(ctx)
+        elif la in (P.SUMAR, P.RESTAR, P.MULTIPLICAR, P.DIVIDIR):
+            self.operar_polinomio(ctx)
+        else:
+            self._error()
+        return self._cerrar(ctx, padre)
+
+    def declarar_var(self, padre):
+        ctx = self._abrir(P.Declarar_varContext, padre)
+        self._consumir(ctx, P.DEFINIR)
+        self._consumir(ctx, P.ID)
+        if self._opcional(ctx, P.COMO):
+            self.expresion(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def asignacion(self, padre):
+        ctx = self._abrir(P.AsignacionContext, padre)
+        self._consumir(ctx, P.ID)
+        self._consumir(ctx, P.T__0)
+        self.expresion(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def asignar_elemento(self, padre):
+        ctx = self._abrir(P.Asignar_elementoContext, padre)
+        self._consumir(ctx, P.ID)
+        self._consumir(ctx, P.ABRECORCHETE)
+        self.expresion(ctx)
+        self._consumir(ctx, P.CIERRACORCHETE)
+        while self._opcional(ctx, P.ABRECORCHETE):
+            self.expresion(ctx)
+            self._consumir(ctx, P.CIERRACORCHETE)
+        self._consumir(ctx, P.T__0)
+        self.expresion(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def funcion_def(self, padre):
+        ctx = self._abrir(P.Funcion_defContext, padre)
+        self._consumir(ctx, P.FUNCION)
+        self._consumir(ctx, P.ID)
+        self._consumir(ctx, P.T__1)
+        if self._la() == P.ID:
+            self.parametros(ctx)
+        self._consumir(ctx, P.T__2)
+        self._consumir(ctx, P.T__3)
+        self._consumir(ctx, P.NUEVALINEA)
+        self.bloque(ctx)
+        self._consumir(ctx, P.FIN)
+        return self._cerrar(ctx, padre)
+
+    def parametros(self, padre):
+        ctx = self._abrir(P.ParametrosContext, padre)
+        self._consumir(ctx, P.ID)
+        while self._opcional(ctx, P.T__4):
+            self._consumir(ctx, P.ID)
+        return self._cerrar(ctx, padre)
+
+    def funcion_llamada(self, padre):
+        ctx = self._abrir(P.Funcion_llamadaContext, padre)
+        if self._opcional(ctx, P.LLAMAR):
+            self._consumir(ctx, P.ID)
+            if self._la() == P.T__1:
+                self._argumentos_entre_parentesis(ctx)
+        else:
+            self._consumir(ctx, P.ID)
+            self._argumentos_entre_parentesis(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def _argumentos_entre_parentesis(self, ctx):
+        self._consumir(ctx, P.T__1)
+        if self._la() in _INICIO_EXPRESION:
+            self.argumentos(ctx)
+        self._consumir(ctx, P.T__2)
+
+    def argumentos(self, padre):
+        ctx = self._abrir(P.ArgumentosContext, padre)
+        self.expresion(ctx)
+        while self._opcional(ctx, P.T__4):
+            self.expresion(ctx)
+        return self._cerrar(ctx, padre)
+
+    def condicional(self, padre):
+        ctx = self._abrir(P.CondicionalContext, padre)
+        self._consumir(ctx, P.SI)
+        self.expresion(ctx)
+        self._consumir(ctx, P.T__3)
+        self._consumir(ctx, P.NUEVALINEA)
+        self.bloque(ctx)
+        if self._opcional(ctx, P.SINO):
+            self._consumir(ctx, P.T__3)
+            self._consumir(ctx, P.NUEVALINEA)
+            self.bloque(ctx)
+        self._consumir(ctx, P.FIN)
+        return self._cerrar(ctx, padre)
+
+    def repetir(self, padre):
+        ctx = self._abrir(P.RepetirContext, padre)
+        self._consumir(ctx, P.REPETIR)
+        self.expresion(ctx)
+        self._consumir(ctx, P.VECES)
+        self._consumir(ctx, P.T__3)
+        self._consumir(ctx, P.NUEVALINEA)
+        self.bloque(ctx)
+        self._consumir(ctx, P.FIN)
+        return self._cerrar(ctx, padre)
+
+    def mientras(self, padre):
+        ctx = self._abrir(P.MientrasContext, padre)
+        self._consumir(ctx, P.MIENTRAS)
+        self.expresion(ctx)
+        if self._la() == P.ID:
+            self._palabra(ctx, P.Palabra_hacerContext, "hacer")
+        self._consumir(ctx, P.T__3)
+        self._consumir(ctx, P.NUEVALINEA)
+        self.bloque(ctx)
+        self._consumir(ctx, P.FIN)
+        return self._cerrar(ctx, padre)
+
+    def para_cada(self, padre):
+        ctx = self._abrir(P.Para_cadaContext, padre)
+        self._consumir(ctx, P.PARA)
+        self._consumir(ctx, P.CADA)
+        self._consumir(ctx, P.ID)
+        self._palabra(ctx, P.Palabra_enContext, "en")
+        self.expresion(ctx)
+        self._consumir(ctx, P.T__3)
+        self._consumir(ctx, P.NUEVALINEA)
+        self.bloque(ctx)
+        self._consumir(ctx, P.FIN)
+        return self._cerrar(ctx, padre)
+
+    def bloque(self, padre):
+        ctx = self._abrir(P.BloqueContext, padre)
+        self.instruccion(ctx)
+        while self._la() in _INICIO_INSTRUCCION:
+            self.instruccion(ctx)
+        return self._cerrar(ctx, padre)
+
+    def imprimir(self, padre):
+        ctx = self._abrir(P.ImprimirContext, padre)
+        if not self._opcional(ctx, P.IMPRIMIR):
+            self._consumir(ctx, P.MOSTRAR)
+        self.expresion(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def comando_grafico(self, padre):
+        ctx = self._abrir(P.Comando_graficoContext, padre)
+        la = self._la()
+        if la == P.MOVER:
+            self._consumir(ctx, P.MOVER)
+            if not self._opcional(ctx, P.ADELANTE):
+                self._consumir(ctx, P.ATRAS)
+            con_argumento = True
+        elif la == P.GIRAR:
+            self._consumir(ctx, P.GIRAR)
+            if not self._opcional(ctx, P.IZQUIERDA):
+                self._consumir(ctx, P.DERECHA)
+            con_argumento = True
+        elif la == P.CAMBIAR:
+            self._consumir(ctx, P.CAMBIAR)
+            self._consumir(ctx, P.COLOR)
+            con_argumento = True
+        elif la == P.BAJAR:
+            self._consumir(ctx, P.BAJAR)
+            self._consumir(ctx, P.LAPIZ)
+            con_argumento = False
+        else:
+            self._consumir(ctx, P.SUBIR)
+            self._consumir(ctx, P.LAPIZ)
+            con_argumento = False
+        if con_argumento and self._la() in _INICIO_EXPRESION:
+            self.expresion(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def comando_musical(self, padre):
+        ctx = self._abrir(P.Comando_musicalContext, padre)
+        if self._opcional(ctx, P.CAMBIAR):
+            self._palabra(ctx, P.Palabra_tempoContext, "tempo")
+            self.expresion(ctx)
+            self._opcional(ctx, P.NUEVALINEA)
+            return self._cerrar(ctx, padre)
+        self._consumir(ctx, P.TOCAR)
+        self._consumir(ctx, P.NOTA)
+        self._consumir(ctx, P.ID)
+        if self._opcional(ctx, P.DURANTE):
+            self.expresion(ctx)
+            self._consumir(ctx, P.SEGUNDOS)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def definir_polinomio(self, padre):
+        ctx = self._abrir(P.Definir_polinomioContext, padre)
+        self._consumir(ctx, P.DEFINIR)
+        self._consumir(ctx, P.POLINOMIO)
+        self._consumir(ctx, P.ID)
+        self._consumir(ctx, P.T__0)
+        self.expresion(ctx)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def mostrar_polinomio(self, padre):
+        ctx = self._abrir(P.Mostrar_polinomioContext, padre)
+        self._consumir(ctx, P.MOSTRAR)
+        self._consumir(ctx, P.POLINOMIO)
+        self._consumir(ctx, P.ID)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def graficar_polinomio(self, padre):
+        ctx = self._abrir(P.Graficar_polinomioContext, padre)
+        self._consumir(ctx, P.GRAFICAR)
+        self._consumir(ctx, P.ID)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    def operar_polinomio(self, padre):
+        ctx = self._abrir(P.Operar_polinomioContext, padre)
+        token = self.tokens[self.pos]
+        if token.type not in (P.SUMAR, P.RESTAR, P.MULTIPLICAR, P.DIVIDIR):
+            self._error()
+        self._consumir(ctx, token.type)
+        self._consumir(ctx, P.POLINOMIO)
+        self._consumir(ctx, P.ID)
+        if not self._opcional(ctx, P.CON):
+            self._consumir(ctx, P.POR)
+        self._consumir(ctx, P.POLINOMIO)
+        self._consumir(ctx, P.ID)
+        self._opcional(ctx, P.NUEVALINEA)
+        return self._cerrar(ctx, padre)
+
+    # -----------------------------------------------------------
+    # Expresiones (Pratt)
+    # -----------------------------------------------------------
+    def _etiquetada(self, clase, padre):
+        ctx = clase(None, _BASE)
+        ctx.parentCtx = padre
+        ctx.start = self.tokens[self.pos]
+        return ctx
+
+    def expresion(self, padre, precedencia=0):
+        izq = self._primaria(padre)
+
+        while True:
+            token = self.tokens[self.pos]
+            if token.type == P.ABRECORCHETE and PRECEDENCIA_INDICE >= precedencia:
+                izq = self._indice(izq, padre)
+                continue
+            entrada = PRECEDENCIA_BINARIA.get(token.type)
+            if entrada is None or entrada[0] < precedencia:
+                break
+            nivel, clase = entrada
+            ctx = clase(None, _BASE)
+            ctx.parentCtx = padre
+            ctx.start = izq.start
+            ctx.addChild(izq)
+            izq.parentCtx = ctx
+            ctx.op = token
+            ctx.addTokenNode(token)
+            self.pos += 1
+            # `a ** b ** c` es `a ** (b ** c)`; el resto asocia por la izquierda
+            self.expresion(ctx, nivel if token.type in ASOCIATIVOS_DERECHA else nivel + 1)
+            ctx.stop = self.tokens[self.pos - 1]
+            izq = ctx
+
+        padre.addChild(izq)
+        return izq
+
+    def _indice(self, izq, padre):
+        ctx = P.ExpIndiceContext(None, _BASE)
+        ctx.parentCtx = padre
+        ctx.start = izq.start
+        ctx.addChild(izq)
+        izq.parentCtx = ctx
+        self._consumir(ctx, P.ABRECORCHETE)
+        self.expresion(ctx, 0)
+        self._consumir(ctx, P.CIERRACORCHETE)
+        ctx.stop = self.tokens[self.pos - 1]
+        return ctx
+
+    def _primaria(self, padre):
+        token = self.tokens[self.pos]
+        tipo = token.type
+
+        clase = _LITERALES.get(tipo)
+        if clase is not None:
+            ctx = self._etiquetada(clase, padre)
+            ctx.addTokenNode(token)
+            self.pos += 1
+        elif tipo == P.ID and self._la(2) != P.T__1:
+            ctx = self._etiquetada(P.ExpIDContext, padre)
+            ctx.addTokenNode(token)
+            self.pos += 1
+        elif tipo == P.ID or tipo == P.LLAMAR:
+            ctx = self._etiquetada(P.ExpFuncionContext, padre)
+            self.funcion_llamada(ctx)
+        elif tipo == P.T__1:
+            ctx = self._etiquetada(P.ExpParenContext, padre)
+            self._consumir(ctx, P.T__1)
+            self.expresion(ctx, 0)
+            self._consumir(ctx, P.T__2)
+        elif tipo == P.ABRECORCHETE:
+            ctx = self._etiquetada(P.ExpListaContext, padre)
+            self._consumir(ctx, P.ABRECORCHETE)
+            if self._la() in _INICIO_EXPRESION:
+                self.expresion(ctx, 0)
+                while self._opcional(ctx, P.T__4):
+                    self.expresion(ctx, 0)
+            self._consumir(ctx, P.CIERRACORCHETE)
+        elif tipo == P.MAS or tipo == P.MENOS:
+            ctx = self._etiquetada(P.ExpSignoContext, padre)
+            ctx.addTokenNode(token)
+            self.pos += 1
+            self.expresion(ctx, PRECEDENCIA_SIGNO)
+        else:
+            self._error()
+        ctx.stop = self.tokens[self.pos - 1]
+        return ctx
+
+
+def parsear(codigo):
+    """Tokeniza y parsea `codigo`; devuelve el ProgramaContext o lanza ErrorSintaxis."""
+    return ParserRapido(tokenizar(codigo)).programa()
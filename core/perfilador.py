@@ -0,0 +1,142 @@
+import json
+import marshal
+import time
+
+
+# ============================================================
+# ⏱️ PERFILADOR DE PROGRAMAS MINICODE
+# ============================================================
+class PerfiladorMinicode:
+    """
+    Acumula, por línea de código fuente y por función Minicode, el número de
+    llamadas, el tiempo total (incluyendo lo que se ejecuta dentro) y el tiempo
+    propio. Lo alimenta MinicodeExecutor cuando se crea con `perfilador=...`.
+
+    Los marcos son tuplas ('linea', n) o ('funcion', nombre).
+    """
+
+    def __init__(self, archivo="<minicode>"):
+        self.archivo = archivo
+        # marco -> [llamadas, tiempo_total, tiempo_propio]
+        self.estadisticas = {}
+        # marco -> {marco_llamador: [llamadas, tiempo_propio, tiempo_total]}
+        self.llamadores = {}
+        # pila completa de marcos -> tiempo propio (para exportar a speedscope)
+        self.pilas = {}
+        # línea donde se define cada función (para los informes)
+        self.lineas_funcion = {}
+        self._pila = []      # [marco, inicio, tiempo_hijos]
+        self._activos = {}   # marco -> veces que está en la pila (recursión)
+
+    # -----------------------------------------------------------
+    # Registro (llamado por el executor)
+    # -----------------------------------------------------------
+    def entrar(self, marco):
+        self._activos[marco] = self._activos.get(marco, 0) + 1
+        self._pila.append([marco, time.perf_counter(), 0.0])
+
+    def salir(self):
+        marco, inicio, hijos = self._pila.pop()
+        total = time.perf_counter() - inicio
+        propio = total - hijos
+        self._activos[marco] -= 1
+
+        stats = self.estadisticas.setdefault(marco, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[2] += propio
+        # En llamadas recursivas solo cuenta el tiempo total del marco más externo
+        if self._activos[marco] == 0:
+            stats[1] += total
+
+        llamador = self._pila[-1][0] if self._pila else None
+        arista = self.llamadores.setdefault(marco, {}).setdefault(llamador, [0, 0.0, 0.0])
+        arista[0] += 1
+        arista[1] += propio
+        arista[2] += total
+
+        pila = tuple(m for m, _, _ in self._pila) + (marco,)
+        self.pilas[pila] = self.pilas.get(pila, 0.0) + propio
+
+        if self._pila:
+            self._pila[-1][2] += total
+
+    # -----------------------------------------------------------
+    # Consultas
+    # -----------------------------------------------------------
+    def tiempos_por_linea(self):
+        """Devuelve {linea: tiempo_propio} para pintar el mapa de calor del editor."""
+        return {m[1]: s[2] for m, s in self.estadisticas.items() if m[0] == 'linea'}
+
+    def nombre_marco(self, marco):
+        if marco[0] == 'linea':
+            return f"línea {marco[1]}"
+        return f"funcion {marco[1]}"
+
+    def linea_marco(self, marco):
+        if marco[0] == 'linea':
+            return marco[1]
+        return self.lineas_funcion.get(marco[1], 0)
+
+    def resumen(self, limite=10):
+        """Texto con los puntos calientes ordenados por tiempo propio."""
+        filas = sorted(self.estadisticas.items(), key=lambda item: item[1][2], reverse=True)
+        lineas = [f"{'marco':<24}{'llamadas':>10}{'total (s)':>12}{'propio (s)':>12}"]
+        for marco, (llamadas, total, propio) in filas[:limite]:
+            lineas.append(f"{self.nombre_marco(marco):<24}{llamadas:>10}{total:>12.6f}{propio:>12.6f}")
+        return "\n".join(lineas)
+
+    # -----------------------------------------------------------
+    # Exportación
+    # -----------------------------------------------------------
+    def _clave_pstats(self, marco):
+        return (self.archivo, self.linea_marco(marco), self.nombre_marco(marco))
+
+    def exportar_pstats(self, ruta):
+        """Escribe un volcado compatible con `pstats.Stats(ruta)` / snakeviz."""
+        datos = {}
+        for marco, (llamadas, total, propio) in self.estadisticas.items():
+            callers = {}
+            for llamador, (n, propio_l, total_l) in self.llamadores.get(marco, {}).items():
+                if llamador is not None:
+                    callers[self._clave_pstats(llamador)] = (n, n, propio_l, total_l)
+            datos[self._clave_pstats(marco)] = (llamadas, llamadas, propio, total, callers)
+        with open(ruta, "wb") as f:
+            marshal.dump(datos, f)
+
+    def exportar_speedscope(self, ruta):
+        """Escribe un perfil 'sampled' en el formato JSON de https://www.speedscope.app."""
+        indices = {}
+        frames = []
+        samples = []
+        weights = []
+        for pila, propio in self.pilas.items():
+            muestra = []
+            for marco in pila:
+                if marco not in indices:
+                    indices[marco] = len(frames)
+                    frames.append({
+                        "name": self.nombre_marco(marco),
+                        "file": self.archivo,
+                        "line": self.linea_marco(marco),
+                    })
+                muestra.append(indices[marco])
+            samples.append(muestra)
+            weights.append(propio)
+
+        perfil = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": self.archivo,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": self.archivo,
+            "exporter": "Minicode IDE",
+        }
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(perfil, f)
@@ -0,0 +1,23 @@
+"""
+Importar este módulo deja el proceso listo para ejecutar programas sin pagar costes
+de primera vez: importa el intérprete, ANTLR, SymPy y NumPy, llena las cachés DFA del
+parser de ANTLR y hace una primera pasada por sympify, simplify y pretty (que cargan
+y compilan bastante la primera vez que se usan).
+
+Solo lo importan los procesos trabajadores de core/aislamiento.py; con "forkserver"
+lo importa una vez el servidor y todos los trabajadores nacen ya calientes.
+"""
+from core import traza
+from core.frontend import precalentar
+import core.audio  # noqa: F401  (NumPy)
+import core.diagnosticos  # noqa: F401
+import core.eventos  # noqa: F401
+import core.executor  # noqa: F401
+import core.modos  # noqa: F401
+import core.optimizador  # noqa: F401
+import core.parser_rapido  # noqa: F401
+from sympy import pretty, simplify, sympify
+
+traza.configurar("graficos=error")  # sin panel, cada comando gráfico avisaría
+precalentar()
+pretty(simplify(sympify("x**2 + 2*x + 1") * sympify("x - 1")))
@@ -0,0 +1,191 @@
+"""
+Puntos de control: volver a ejecutar un programa editado sin repetir lo que no cambió.
+
+Con MinicodeExecutor(puntos_control=PuntosControl()) el executor guarda, entre las
+instrucciones del nivel superior y como mucho una vez cada `intervalo` segundos de
+ejecución, una foto de su estado: variables, funciones, polinomios y el registro de
+eventos (core/eventos.py) producido hasta ese momento, que es lo que hace falta para
+recuperar la consola, el dibujo y la posición del jugador, los polinomios y las notas.
+
+Cada punto se identifica por la posición en el código de la instrucción que iba a
+ejecutarse y una huella del código anterior a ella (más el modo numérico). En la
+siguiente ejecución se busca el punto más avanzado cuyo prefijo no ha cambiado: el
+executor restaura la foto, reproduce el registro y sigue desde esa instrucción. Si
+el código no cambió en absoluto, el último punto está al final y no se ejecuta nada.
+
+Es correcto porque una ejecución de Minicode solo depende del código y del modo
+numérico: el programa no puede leer el mapa, la posición del jugador ni el reloj, así
+que el mismo prefijo llega siempre al mismo estado. El presupuesto de pasos cuenta
+desde la instrucción en la que se reanuda. No se debe usar con los modos aislados
+(core/modos.py): lo que se conserva del prefijo depende del resto del programa.
+"""
+import hashlib
+import time
+
+from core.listas import Lista
+
+INTERVALO_POR_DEFECTO = 0.05  # segundos de ejecución entre dos puntos de control
+MAXIMO_PUNTOS = 32
+
+
+def huella(codigo, posicion, contexto=""):
+    """Huella de codigo[:posicion] (y de `contexto`, p. ej. el modo numérico)."""
+    h = hashlib.blake2b(contexto.encode("utf-8"), digest_size=16)
+    h.update(b"\0")
+    h.update(codigo[:posicion].encode("utf-8"))
+    return h.digest()
+
+
+def _copiar(valor, memo):
+    """Copia las listas (el único valor mutable) respetando los alias; el resto se comparte."""
+    if type(valor) is not Lista:
+        return valor
+    copia = memo.get(id(valor))
+    if copia is None:
+        copia = memo[id(valor)] = Lista()
+        datos = valor.datos
+        copia.datos = [_copiar(v, memo) for v in datos] if type(datos) is list else datos[:]
+    return copia
+
+
+def _copiar_variables(variables):
+    memo = {}
+    return {nombre: _copiar(valor, memo) for nombre, valor in variables.items()}
+
+
+def _primera(contenido):
+    """Primera instrucción de una entrada del plan del executor (instrucción o lote)."""
+    return contenido[0] if isinstance(contenido, list) else contenido
+
+
+def _posicion(contenido):
+    return _primera(contenido).start.start
+
+
+def _linea(contenido):
+    return _primera(contenido).start.line
+
+
+def _definiciones(instrucciones, definiciones):
+    """Añade a `definiciones` los Funcion_defContext bajo `instrucciones`, por posición."""
+    from antlr4 import ParserRuleContext
+    from antlr.MinicodeParser import MinicodeParser
+
+    pendientes = list(instrucciones)
+    while pendientes:
+        nodo = pendientes.pop()
+        if isinstance(nodo, MinicodeParser.Funcion_defContext):
+            definiciones[nodo.start.start] = nodo
+        pendientes.extend(h for h in (nodo.children or []) if isinstance(h, ParserRuleContext))
+    return definiciones
+
+
+class PuntoControl:
+    """Foto del executor justo antes de la instrucción que empieza en `posicion`."""
+    __slots__ = ("posicion", "huella", "variables", "funciones", "polinomios", "registro", "eventos")
+
+    def __init__(self, posicion, huella, executor):
+        self.posicion = posicion
+        self.huella = huella
+        self.variables = _copiar_variables(executor.variables)
+        # Las funciones apuntan a nodos del árbol: se guarda dónde está su definición
+        self.funciones = {nombre: (tuple(f['parametros']), f['cuerpo'].parentCtx.start.start)
+                          for nombre, f in executor.funciones.items()}
+        self.polinomios = dict(executor.polinomios)
+        self.registro = bytes(executor.grabador.datos)
+        self.eventos = executor.grabador.cantidad
+
+
+class PuntosControl:
+    """
+    Puntos de control de las ejecuciones de un programa. Se reutiliza el mismo objeto
+    de una ejecución a otra, llamando a preparar(codigo) antes de cada una.
+    """
+
+    def __init__(self, intervalo=INTERVALO_POR_DEFECTO, maximo=MAXIMO_PUNTOS):
+        self.intervalo = intervalo
+        self.maximo = maximo
+        self.puntos = {}  # posición -> PuntoControl
+        self.codigo = ""
+        self.reanudado = None  # PuntoControl desde el que siguió la última ejecución
+        self.linea = None  # primera línea que se volvió a ejecutar (None: ninguna)
+        self._contexto = ""
+        self._espera = intervalo
+        self._ultimo = 0.0
+
+    def preparar(self, codigo):
+        """Indica el código que se va a ejecutar a continuación."""
+        self.codigo = codigo
+        self.reanudado = self.linea = None
+
+    def limpiar(self):
+        self.puntos.clear()
+        self.reanudado = self.linea = None
+
+    # -----------------------------------------------------------
+    # Llamadas desde MinicodeExecutor
+    # -----------------------------------------------------------
+    def reanudar(self, executor, plan):
+        """
+        Descarta los puntos que ya no valen para el código actual y restaura en
+        `executor` el más avanzado que caiga en una entrada de `plan`. Devuelve el
+        índice de la entrada por la que seguir (0 si no hay punto aprovechable).
+        """
+        self._contexto = executor.numeros
+        self.puntos = {posicion: punto for posicion, punto in self.puntos.items()
+                       if punto.huella == huella(self.codigo, posicion, self._contexto)}
+        self._espera = self.intervalo
+        self._ultimo = time.perf_counter()
+
+        posiciones = [_posicion(contenido) for _, contenido in plan] + [len(self.codigo)]
+        for k in range(len(plan), 0, -1):
+            punto = self.puntos.get(posiciones[k])
+            if punto is None:
+                continue
+            funciones = self._funciones(punto, plan[:k])
+            if funciones is None:
+                continue
+            executor.variables = _copiar_variables(punto.variables)
+            executor.funciones = funciones
+            executor.polinomios = dict(punto.polinomios)
+            executor.reproducir_registro(punto.registro, punto.eventos)
+            self.reanudado = punto
+            self.linea = _linea(plan[k][1]) if k < len(plan) else None
+            self._ultimo = time.perf_counter()
+            return k
+        return 0
+
+    def revisar(self, executor, contenido=None):
+        """Guarda un punto antes de `contenido` (None: al final) si ya toca."""
+        ahora = time.perf_counter()
+        if ahora - self._ultimo < self._espera:
+            return
+        posicion = len(self.codigo) if contenido is None else _posicion(contenido)
+        self.puntos[posicion] = PuntoControl(posicion, huella(self.codigo, posicion, self._contexto), executor)
+        if len(self.puntos) > self.maximo:
+            self._aclarar()
+        self._ultimo = time.perf_counter()
+
+    # -----------------------------------------------------------
+    # Utilidades internas
+    # -----------------------------------------------------------
+    @staticmethod
+    def _funciones(punto, entradas):
+        """Las funciones del punto, con sus cuerpos tomados del árbol actual (o None)."""
+        definiciones = {}
+        for _, contenido in entradas:
+            _definiciones(contenido if isinstance(contenido, list) else [contenido], definiciones)
+        funciones = {}
+        for nombre, (parametros, posicion) in punto.funciones.items():
+            definicion = definiciones.get(posicion)
+            if definicion is None:
+                return None
+            funciones[nombre] = {'parametros': list(parametros), 'cuerpo': definicion.bloque()}
+        return funciones
+
+    def _aclarar(self):
+        """Demasiados puntos: se queda uno de cada dos y se espacian los siguientes."""
+        posiciones = sorted(self.puntos)
+        for posicion in posiciones[-2::-2]:
+            del self.puntos[posicion]
+        self._espera *= 2
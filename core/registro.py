@@ -0,0 +1,182 @@
+"""
+Registro estructurado de errores del IDE.
+
+Cada error se guarda como una línea JSON en logs/minicode.jsonl con la fecha,
+la fase en la que ocurrió (parseo, ejecución, AST...), un hash del código que se
+estaba procesando y, si se conoce, la línea/columna del programa Minicode.
+
+La escritura no bloquea la interfaz: registrar_error() solo encola el registro
+(QueueHandler) y un hilo (QueueListener) lo formatea y lo escribe en un fichero
+que rota al llegar a TAMANO_MAXIMO. Los errores repetidos (misma fase, mismo
+tipo, mismo mensaje y misma posición) se escriben una sola vez por VENTANA_DEDUP
+segundos; la siguiente aparición lleva el número de repeticiones omitidas.
+"""
+import atexit
+import datetime
+import hashlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import traceback
+
+from core import traza
+
+DIRECTORIO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+ARCHIVO = "minicode.jsonl"
+TAMANO_MAXIMO = 1024 * 1024
+COPIAS = 3
+VENTANA_DEDUP = 60.0
+TRAZAS_ADJUNTAS = 50  # últimos mensajes del anillo de trazas (core/traza.py) por error
+
+_logger = None
+_listener = None
+
+
+class FormatoJSON(logging.Formatter):
+    """Convierte cada registro en una línea JSON con los campos de registrar_error()."""
+
+    def format(self, record):
+        datos = {
+            "fecha": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "fase": getattr(record, "fase", None),
+            "mensaje": record.getMessage(),
+            "tipo": getattr(record, "tipo", None),
+            "hash_codigo": getattr(record, "hash_codigo", None),
+            "linea": getattr(record, "linea", None),
+            "columna": getattr(record, "columna", None),
+            "traceback": getattr(record, "detalle", None),
+        }
+        ultimas_trazas = getattr(record, "trazas", None)
+        if ultimas_trazas:
+            datos["trazas"] = ultimas_trazas
+        repeticiones = getattr(record, "repeticiones", 0)
+        if repeticiones:
+            datos["repeticiones_omitidas"] = repeticiones
+        return json.dumps(datos, ensure_ascii=False)
+
+
+class FiltroRepetidos(logging.Filter):
+    """
+    Deja pasar la primera aparición de cada huella y descarta las repeticiones
+    durante `ventana` segundos. Se ejecuta en el hilo del QueueListener.
+    """
+
+    def __init__(self, ventana=VENTANA_DEDUP):
+        super().__init__()
+        self.ventana = ventana
+        self.vistos = {}  # huella -> [instante_ultima_escritura, repeticiones_omitidas]
+
+    def filter(self, record):
+        huella = getattr(record, "huella", None)
+        if huella is None:
+            return True
+        ahora = record.created
+        visto = self.vistos.get(huella)
+        if visto is not None and ahora - visto[0] < self.ventana:
+            visto[1] += 1
+            return False
+        record.repeticiones = visto[1] if visto is not None else 0
+        self.vistos[huella] = [ahora, 0]
+        return True
+
+
+def configurar(directorio=DIRECTORIO):
+    """Crea (una sola vez) el logger 'minicode' con su cola y su hilo escritor."""
+    global _logger, _listener
+    if _logger is not None:
+        return _logger
+
+    os.makedirs(directorio, exist_ok=True)
+    manejador = logging.handlers.RotatingFileHandler(
+        os.path.join(directorio, ARCHIVO), maxBytes=TAMANO_MAXIMO, backupCount=COPIAS,
+        encoding="utf-8", delay=True)
+    manejador.setFormatter(FormatoJSON())
+    manejador.addFilter(FiltroRepetidos())
+
+    cola = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(cola, manejador, respect_handler_level=True)
+    _listener.start()
+    atexit.register(detener)
+
+    _logger = logging.getLogger("minicode")
+    _logger.setLevel(logging.INFO)
+    _logger.propagate = False
+    _logger.addHandler(logging.handlers.QueueHandler(cola))
+    return _logger
+
+
+def detener():
+    """Vacía la cola y para el hilo escritor (se llama también al salir)."""
+    global _logger, _listener
+    if _listener is not None:
+        _listener.stop()
+        for manejador in _listener.handlers:
+            manejador.close()
+        _listener = None
+    if _logger is not None:
+        for manejador in list(_logger.handlers):
+            _logger.removeHandler(manejador)
+        _logger = None  # un error posterior vuelve a configurar el registro
+
+
+def hash_codigo(codigo):
+    if codigo is None:
+        return None
+    return hashlib.sha1(codigo.encode("utf-8")).hexdigest()[:12]
+
+
+def posicion_en_programa(exc):
+    """
+    (línea, columna) del programa Minicode donde se produjo `exc`, o (None, None).
+    Los errores de sintaxis la llevan consigo; para los de ejecución se busca el
+    último marco del traceback que estuviera visitando un nodo (`ctx`).
+    """
+    if exc is None:
+        return None, None
+    if hasattr(exc, "linea") and hasattr(exc, "columna"):
+        return exc.linea, exc.columna
+    posicion = (None, None)
+    tb = exc.__traceback__
+    while tb is not None:
+        ctx = tb.tb_frame.f_locals.get("ctx")
+        inicio = getattr(ctx, "start", None)
+        if inicio is not None and hasattr(inicio, "line"):
+            posicion = (inicio.line, inicio.column)
+        tb = tb.tb_next
+    return posicion
+
+
+def registrar_error(fase, exc=None, codigo=None, mensaje=None, detalle=None):
+    """
+    Registra un error. `exc` es la excepción (si la hay), `codigo` el programa que se
+    procesaba y `detalle` el traceback ya formateado (por defecto, el de `exc`).
+    """
+    logger = configurar()
+    if mensaje is None:
+        mensaje = f"{type(exc).__name__}: {exc}" if exc is not None else fase
+    if detalle is None and exc is not None:
+        detalle = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    linea, columna = posicion_en_programa(exc)
+    tipo = type(exc).__name__ if exc is not None else None
+    logger.error(mensaje, extra={
+        "fase": fase,
+        "tipo": tipo,
+        "hash_codigo": hash_codigo(codigo),
+        "linea": linea,
+        "columna": columna,
+        "detalle": detalle,
+        "huella": (fase, tipo, mensaje, linea, columna),
+        "trazas": traza.ultimas(TRAZAS_ADJUNTAS),
+    })
+
+
+def leer_registros(directorio=DIRECTORIO):
+    """Devuelve los registros del fichero actual (el más reciente) como diccionarios."""
+    ruta = os.path.join(directorio, ARCHIVO)
+    if not os.path.exists(ruta):
+        return []
+    with open(ruta, "r", encoding="utf-8") as f:
+        return [json.loads(linea) for linea in f if linea.strip()]
@@ -0,0 +1,147 @@
+"""
+Trazas de depuración por categorías y niveles.
+
+Sustituye a los print() de estado que el IDE emitía en cada paso (mover, girar,
+animar...). Cada módulo pide su categoría y escribe con el nivel adecuado:
+
+    from core import traza
+    _traza = traza.categoria(traza.ANIMACION)
+    _traza.detalle("Nueva posición lógica: (%s, %s)", x, y)
+
+Los mensajes usan formato perezoso (%s con argumentos aparte): si el nivel está
+desactivado, el método es una función vacía y el texto nunca se construye. Para
+argumentos caros de calcular, `if _traza.activa(traza.DETALLE):` evita hasta eso.
+
+Configuración (variables de entorno, o configurar()/activar_anillo() en código):
+
+    MINICODE_TRAZA="graficos=detalle,animacion=info"   # "*" = todas las categorías
+    MINICODE_TRAZA_ANILLO=5000                         # guarda los últimos N mensajes
+
+Por defecto solo se muestran avisos y errores. El anillo guarda en memoria los
+últimos mensajes (de cualquier nivel activado para él) para volcarlos cuando
+ocurre un error; el registro de errores (core/registro.py) los adjunta.
+"""
+import collections
+import functools
+import os
+import sys
+import time
+
+# Categorías
+EJECUTOR = "executor"
+GRAFICOS = "graficos"
+POLINOMIOS = "polinomios"
+ANIMACION = "animacion"
+MUSICA = "musica"
+IDE = "ide"
+
+# Niveles (los mismos valores que el módulo logging)
+DETALLE = 10
+INFO = 20
+AVISO = 30
+ERROR = 40
+NADA = 100
+
+NIVELES = {"detalle": DETALLE, "info": INFO, "aviso": AVISO, "error": ERROR, "nada": NADA}
+_NOMBRES_NIVEL = {valor: nombre for nombre, valor in NIVELES.items()}
+
+_categorias = {}
+_anillo = None          # deque con (instante, categoría, nivel, texto) o None
+_nivel_anillo = DETALLE
+
+
+def _nada(*args):
+    pass
+
+
+class Categoria:
+    """
+    Emisor de una categoría. `detalle`, `info`, `aviso` y `error` se reasignan al
+    cambiar la configuración: o emiten, o son la función vacía _nada.
+    """
+
+    def __init__(self, nombre, nivel=AVISO):
+        self.nombre = nombre
+        self.nivel = nivel      # a partir de qué nivel se escribe en la salida de errores
+        self._minimo = NADA
+        self._actualizar()
+
+    def _actualizar(self):
+        self._minimo = min(self.nivel, _nivel_anillo if _anillo is not None else NADA)
+        for nivel, metodo in ((DETALLE, "detalle"), (INFO, "info"), (AVISO, "aviso"), (ERROR, "error")):
+            setattr(self, metodo, functools.partial(self._emitir, nivel) if nivel >= self._minimo else _nada)
+
+    def activa(self, nivel):
+        return nivel >= self._minimo
+
+    def _emitir(self, nivel, mensaje, *args):
+        texto = mensaje % args if args else mensaje
+        if _anillo is not None and nivel >= _nivel_anillo:
+            _anillo.append((time.time(), self.nombre, nivel, texto))
+        if nivel >= self.nivel:
+            print(f"[{self.nombre}] {texto}", file=sys.stderr)
+
+
+def categoria(nombre):
+    """Devuelve (creándola si hace falta) la categoría `nombre`."""
+    cat = _categorias.get(nombre)
+    if cat is None:
+        cat = _categorias[nombre] = Categoria(nombre, _nivel_por_defecto)
+    return cat
+
+
+def configurar(especificacion):
+    """
+    Aplica una especificación "categoria=nivel,..." (como MINICODE_TRAZA). Una
+    categoría sin nivel se activa en `detalle`; "*" cambia el nivel de todas.
+    """
+    global _nivel_por_defecto
+    partes = [p.strip() for p in especificacion.split(",") if p.strip()]
+    # "*" primero, para que las categorías nombradas lo sobrescriban sea cual sea el orden
+    partes.sort(key=lambda p: not p.startswith("*"))
+    for parte in partes:
+        nombre, _, nivel = parte.partition("=")
+        valor = NIVELES.get(nivel.strip().lower() or "detalle")
+        if valor is None:
+            raise ValueError(f"Nivel de traza desconocido: {nivel!r}")
+        nombre = nombre.strip()
+        if nombre == "*":
+            _nivel_por_defecto = valor
+            for cat in _categorias.values():
+                cat.nivel = valor
+                cat._actualizar()
+        else:
+            cat = categoria(nombre)
+            cat.nivel = valor
+            cat._actualizar()
+
+
+def activar_anillo(capacidad=5000, nivel=DETALLE):
+    """Guarda en memoria los últimos `capacidad` mensajes de nivel >= `nivel` (0 lo desactiva)."""
+    global _anillo, _nivel_anillo
+    _anillo = collections.deque(maxlen=capacidad) if capacidad else None
+    _nivel_anillo = nivel
+    for cat in _categorias.values():
+        cat._actualizar()
+
+
+def ultimas(n=None):
+    """Últimos `n` mensajes del anillo (todos si n es None), ya formateados como texto."""
+    if _anillo is None:
+        return []
+    entradas = list(_anillo)[-n:] if n else list(_anillo)
+    return [f"{time.strftime('%H:%M:%S', time.localtime(t))}.{int(t * 1000) % 1000:03d} "
+            f"{_NOMBRES_NIVEL[nivel]:<7} [{cat}] {texto}"
+            for t, cat, nivel, texto in entradas]
+
+
+def volcar(ruta):
+    """Escribe el contenido del anillo en `ruta` (un mensaje por línea)."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.writelines(linea + "\n" for linea in ultimas())
+
+
+_nivel_por_defecto = AVISO
+configurar(os.environ.get("MINICODE_TRAZA", ""))
+if os.environ.get("MINICODE_TRAZA_ANILLO"):
+    activar_anillo(int(os.environ["MINICODE_TRAZA_ANILLO"]))
@@ -1,27 +1,290 @@
 # minicode_ide/gui/ast_viewer.py
-from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem
-from antlr4.tree.Tree import TerminalNode
+import difflib
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QTreeView
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, pyqtSignal
+
+
+class _ASTItem:
+    """Envoltorio de un nodo del árbol de ANTLR; sus hijos se crean al pedirlos la vista."""
+    __slots__ = ("node", "parent", "row", "children", "signature")
+
+    def __init__(self, node, parent, row):
+        self.node = node
+        self.parent = parent
+        self.row = row
+        self.children = None
+        self.signature = None
+
+
+def _is_terminal(node):
+    return not hasattr(node, "getRuleIndex")
+
+
+class ASTModel(QAbstractItemModel):
+    """
+    Modelo perezoso sobre el árbol sintáctico: la vista solo pide los hijos de los
+    nodos que el usuario despliega, así que mostrar un programa enorme cuesta lo
+    mismo que uno pequeño. Al cambiar el árbol (set_tree) se conservan los
+    elementos, y con ellos lo desplegado, de las instrucciones que no cambiaron.
+    """
+
+    # Tamaño máximo (instrucciones antiguas × nuevas) del tramo que se compara con difflib
+    MAX_DIFF = 250000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rule_names = []
+        self._source = None
+        self._root = _ASTItem(None, None, 0)  # raíz invisible; su único hijo es `programa`
+        self._root.children = []
+
+    # ------------------------------------------------------------
+    # Interfaz de QAbstractItemModel
+    # ------------------------------------------------------------
+    def _item(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _children(self, item):
+        if item.children is None:
+            node = item.node
+            item.children = [_ASTItem(node.getChild(i), item, i) for i in range(node.getChildCount())]
+        return item.children
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        item = self._item(parent)
+        if item.children is not None:
+            return len(item.children)
+        return item.node.getChildCount()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._children(self._item(parent))[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer().node
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.label(node)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            line, column = self.position(node)
+            return f"línea {line}, columna {column + 1}" if line else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return "Árbol Sintáctico (AST)"
+        return None
+
+    # ------------------------------------------------------------
+    # Nodos
+    # ------------------------------------------------------------
+    def label(self, node):
+        if _is_terminal(node):
+            return node.getText()
+        return self.rule_names[node.getRuleIndex()]
+
+    @staticmethod
+    def position(node):
+        """(línea 1-based, columna 0-based) del primer token del nodo, o (0, 0)."""
+        token = node.getSymbol() if _is_terminal(node) else node.start
+        if token is None:
+            return 0, 0
+        return token.line, token.column
+
+    def node_from_index(self, index):
+        return index.internalPointer().node if index.isValid() else None
+
+    def _signature(self, item):
+        if item.signature is None:
+            node = item.node
+            if self._source is not None and not _is_terminal(node) and node.stop is not None:
+                # Trozo del código fuente que cubre el nodo: mucho más barato que getText()
+                text = self._source[node.start.start:node.stop.stop + 1]
+            else:
+                text = node.getText()
+            item.signature = (type(node).__name__, text)
+        return item.signature
+
+    # ------------------------------------------------------------
+    # Cambio de árbol reutilizando lo que no cambió
+    # ------------------------------------------------------------
+    def set_tree(self, tree, rule_names, source=None):
+        """`source` es el código parseado; si se da, acelera la comparación con el árbol anterior."""
+        self.rule_names = rule_names
+        if tree is None:
+            self.clear()
+            return
+
+        if not self._root.children:
+            self._source = source
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self._root.children = [_ASTItem(tree, self._root, 0)]
+            self.endInsertRows()
+            return
+
+        programa = self._root.children[0]
+        programa_index = self.createIndex(0, 0, programa)
+        old_items = self._children(programa)
+        old_signatures = [self._signature(item) for item in old_items]  # con el código anterior
+        self._source = source
+        new_items = [_ASTItem(tree.getChild(i), programa, i) for i in range(tree.getChildCount())]
+
+        # Una edición suele tocar pocas instrucciones: el principio y el final comunes se
+        # emparejan directamente y solo el tramo central pasa por difflib
+        prefix = 0
+        limit = min(len(old_items), len(new_items))
+        while prefix < limit and old_signatures[prefix] == self._signature(new_items[prefix]):
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix and old_signatures[-1 - suffix]
+               == self._signature(new_items[-1 - suffix])):
+            suffix += 1
+        old_end, new_end = len(old_items) - suffix, len(new_items) - suffix
+
+        if (old_end - prefix) * (new_end - prefix) > self.MAX_DIFF:
+            # Árbol casi completamente distinto (p. ej. otro archivo): no merece la pena comparar
+            self.beginResetModel()
+            self._root.children = [_ASTItem(tree, self._root, 0)]
+            self.endResetModel()
+            return
+
+        matcher = difflib.SequenceMatcher(None, old_signatures[prefix:old_end],
+                                          [self._signature(i) for i in new_items[prefix:new_end]],
+                                          autojunk=False)
+        opcodes = [("equal", 0, prefix, 0, prefix)]
+        opcodes += [(tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+                    for tag, i1, i2, j1, j2 in matcher.get_opcodes()]
+        opcodes.append(("equal", old_end, len(old_items), new_end, len(new_items)))
+
+        # De atrás hacia delante: los índices de las operaciones anteriores siguen siendo válidos
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                for old, new in zip(old_items[i1:i2], new_items[j1:j2]):
+                    self._rebind(old, new.node)
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(programa_index, i1, i2 - 1)
+                del old_items[i1:i2]
+                self._renumber(old_items, i1)
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(programa_index, i1, i1 + (j2 - j1) - 1)
+                old_items[i1:i1] = new_items[j1:j2]
+                self._renumber(old_items, i1)
+                self.endInsertRows()
+        programa.node = tree
+
+    @staticmethod
+    def _renumber(items, start):
+        for row in range(start, len(items)):
+            items[row].row = row
+
+    def _rebind(self, item, node):
+        """Apunta un subárbol ya creado (idéntico en texto y forma) a los nodos del árbol nuevo."""
+        pending = [(item, node)]
+        while pending:
+            item, node = pending.pop()
+            item.node = node
+            if item.children is not None:
+                pending.extend((child, node.getChild(i)) for i, child in enumerate(item.children))
+
+    def clear(self):
+        self.beginResetModel()
+        self._root.children = []
+        self.endResetModel()
+
+    # ------------------------------------------------------------
+    # Búsqueda
+    # ------------------------------------------------------------
+    def find(self, text, after=None):
+        """
+        Devuelve el QModelIndex del siguiente nodo (en preorden, después de `after`)
+        cuya etiqueta contiene `text`, volviendo al principio si hace falta.
+        Los nodos intermedios se crean solo para el camino hasta el resultado.
+        """
+        if not self._root.children:
+            return QModelIndex()
+        text = text.lower()
+        start_node = self.node_from_index(after) if after is not None else None
+
+        first_match = None
+        passed = start_node is None
+        pending = [(self._root.children[0].node, (0,))]
+        while pending:
+            node, path = pending.pop()
+            if node is start_node:
+                passed = True
+            elif text in self.label(node).lower():
+                if passed:
+                    return self._index_for_path(path)
+                if first_match is None:
+                    first_match = path
+            count = node.getChildCount()
+            pending.extend((node.getChild(i), path + (i,)) for i in range(count - 1, -1, -1))
+        return self._index_for_path(first_match) if first_match else QModelIndex()
+
+    def _index_for_path(self, path):
+        index = QModelIndex()
+        for row in path:
+            index = self.index(row, 0, index)
+        return index
+
+
+class ASTViewer(QWidget):
+    # Doble clic en un nodo: (línea 1-based, columna 0-based) de su primer token
+    node_activated = pyqtSignal(int, int)
 
-class ASTViewer(QTreeWidget):
     def __init__(self):
         super().__init__()
-        self.setHeaderLabel("Árbol Sintáctico (AST)")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
 
-    def show_ast(self, tree, parser):
-        self.clear()
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Buscar nodo (Enter: siguiente)")
+        self.search_box.returnPressed.connect(self.find_next)
+        layout.addWidget(self.search_box)
+
+        self.model = ASTModel(self)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.model)
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.doubleClicked.connect(self._on_double_clicked)
+        layout.addWidget(self.tree_view)
+
+    def show_ast(self, tree, parser, source=None):
         if not tree:
+            self.model.clear()
             return
+        self.model.set_tree(tree, parser.ruleNames, source)
+        self.tree_view.expand(self.model.index(0, 0))
 
-        def add_node(parent_item, node):
-            if isinstance(node, TerminalNode):
-                item = QTreeWidgetItem(parent_item, [node.getText()])
-                # item.setForeground(0, QColor("blue")) # Opcional: Colorear terminales
-            else:
-                rule_name = parser.ruleNames[node.getRuleIndex()]
-                item = QTreeWidgetItem(parent_item, [rule_name])
-                for i in range(node.getChildCount()):
-                    add_node(item, node.getChild(i))
-
-        root_item = QTreeWidgetItem(self, ["programa"]) # O la regla inicial de tu gramática
-        add_node(root_item, tree)
-        self.expandAll()
\ No newline at end of file
+    def find_next(self):
+        text = self.search_box.text().strip()
+        if not text:
+            return
+        current = self.tree_view.currentIndex()
+        index = self.model.find(text, current if current.isValid() else None)
+        if index.isValid():
+            self.tree_view.setCurrentIndex(index)
+            self.tree_view.scrollTo(index)
+
+    def _on_double_clicked(self, index):
+        line, column = self.model.position(self.model.node_from_index(index))
+        if line:
+            self.node_activated.emit(line, column)
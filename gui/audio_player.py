@@ -0,0 +1,119 @@
+# minicode_ide/gui/audio_player.py
+import queue
+import threading
+
+from PyQt6.QtCore import QIODevice, QObject, pyqtSignal
+from PyQt6.QtMultimedia import QAudio, QAudioFormat, QAudioSink, QMediaDevices
+
+from core.audio import FRECUENCIA_MUESTREO, ProgramadorMusical, a_pcm16
+
+
+class _AudioSource(QIODevice):
+    """
+    Dispositivo de solo lectura del que QAudioSink saca el audio. Los bloques los
+    mete el hilo del ProgramadorMusical; si aún no hay datos se entrega silencio.
+    """
+
+    def __init__(self, blocks, parent=None):
+        super().__init__(parent)
+        self._blocks = blocks
+        self._pending = b""
+        self._lock = threading.Lock()
+        self.finished = False
+
+    def readData(self, maxlen):
+        with self._lock:
+            data = self._pending
+            while len(data) < maxlen:
+                try:
+                    block = self._blocks.get_nowait()
+                except queue.Empty:
+                    break
+                if block is None:
+                    self.finished = True
+                    break
+                data += block
+            self._pending = data[maxlen:]
+            data = data[:maxlen]
+        if not data and not self.finished:
+            return bytes(min(maxlen, 2048))  # silencio mientras el programador se pone al día
+        return data
+
+    def writeData(self, data):
+        return -1
+
+    def bytesAvailable(self):
+        return len(self._pending) + super().bytesAvailable()
+
+    def isSequential(self):
+        return True
+
+
+class AudioPlayer(QObject):
+    """
+    Reproduce la LineaDeTiempo de un EntornoMusical. Se sintetiza en un hilo aparte
+    (ProgramadorMusical) que solo va MAX_BLOCKS bloques por delante de la tarjeta
+    de sonido, así que reproducir miles de notas no cuesta memoria ni bloquea la UI.
+    """
+    finished = pyqtSignal()
+    MAX_BLOCKS = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._scheduler = None
+        self._sink = None
+        self._source = None
+
+    @staticmethod
+    def available():
+        return not QMediaDevices.defaultAudioOutput().isNull()
+
+    def play(self, musica):
+        self.stop()
+        fmt = QAudioFormat()
+        fmt.setSampleRate(musica.sintetizador.frecuencia_muestreo or FRECUENCIA_MUESTREO)
+        fmt.setChannelCount(1)
+        fmt.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+
+        blocks = queue.Queue(maxsize=self.MAX_BLOCKS)
+        scheduler = ProgramadorMusical(musica.linea, None, musica.sintetizador)
+        scheduler.salida = lambda block: self._put(scheduler, blocks, a_pcm16(block))
+        scheduler.al_terminar = lambda: self._put(scheduler, blocks, None)
+        self._scheduler = scheduler
+        self._source = _AudioSource(blocks, self)
+        self._source.open(QIODevice.OpenModeFlag.ReadOnly)
+        self._sink = QAudioSink(QMediaDevices.defaultAudioOutput(), fmt, self)
+        self._sink.stateChanged.connect(self._on_state_changed)
+        self._scheduler.start()
+        self._sink.start(self._source)
+
+    @staticmethod
+    def _put(scheduler, blocks, item):
+        # Espera con tiempo límite para poder salir si se detiene la reproducción
+        while not scheduler.detenido:
+            try:
+                blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _on_state_changed(self, state):
+        if state == QAudio.State.IdleState and self._source is not None and self._source.finished:
+            self.stop()
+            self.finished.emit()
+
+    def is_playing(self):
+        return self._sink is not None
+
+    def stop(self):
+        if self._scheduler is not None:
+            self._scheduler.detener()
+            self._scheduler = None
+        if self._sink is not None:
+            self._sink.stop()
+            self._sink.deleteLater()
+            self._sink = None
+        if self._source is not None:
+            self._source.close()
+            self._source.deleteLater()
+            self._source = None
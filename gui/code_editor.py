@@ -1,69 +1,410 @@
 # minicode_ide/gui/code_editor.py
-from PyQt6.QtWidgets import QTextEdit
-from PyQt6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QTextDocument
-from PyQt6.QtCore import QRegularExpression
+from PyQt6.QtWidgets import QPlainTextEdit, QTextEdit, QWidget, QToolTip
+from PyQt6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor, QPainter, QTextCursor
+from PyQt6.QtCore import Qt, QTimer, QRect, QSize, QPoint, QEvent
+import re
+import time
+
+# Estados de bloque del resaltador
+NORMAL = 0
+DENTRO_DE_TEXTO = 1  # la línea anterior dejó una cadena "..." sin cerrar
+
+# Un único patrón con todas las categorías: cada línea se recorre una sola vez y
+# la primera alternativa que coincide decide el color (un comentario o una cadena
+# ya no se colorean por dentro como palabras clave u operadores).
+_PATRON_TOKENS = re.compile(
+    r'(?P<comentario>#.*)'
+    r'|(?P<texto>"(?:[^"\\]|\\.)*")'
+    r'|(?P<texto_abierto>"(?:[^"\\]|\\.)*\\?$)'
+    r'|(?P<numero>\b\d+(?:\.\d+)?\b)'
+    r'|(?P<operador>\bno es\b|\*\*|==|!=|<=|>=|[-+*/%=<>])'
+    r'|(?P<palabra>[^\W\d]\w*)'
+)
+_FIN_DE_TEXTO = re.compile(r'(?:[^"\\]|\\.)*"')
+
 
 class MinicodeHighlighter(QSyntaxHighlighter):
+    # Tiempo máximo por paso al resaltar en segundo plano un documento grande
+    MS_POR_PASO = 15
+    # Entradas máximas de la caché (estado_anterior, texto) -> resultado
+    LIMITE_CACHE = 20000
+
     def __init__(self, document):
         super().__init__(document)
 
-        self.highlightingRules = []
-
         # Palabras clave de Minicode
-        keywords = [
+        self.keywords = {
             "decir", "definir", "como", "si", "entonces", "sino", "fin",
             "repetir", "veces", "funcion", "mostrar", "mover", "adelante",
             "atras", "girar", "izquierda", "derecha", "cambiar", "color",
             "bajar", "lapiz", "subir", "tocar", "nota", "durante", "segundos",
-            "graficar", "polinomio", "verdadero", "falso", "mientras", "hacer"
-        ]
+            "graficar", "polinomio", "verdadero", "falso", "mientras", "hacer",
+            "llamar", "imprimir", "cierto", "sumar", "restar", "multiplicar",
+            "dividir", "con", "para", "cada", "en",
+        }
+        # Operadores con forma de palabra
+        self.word_operators = {"es", "y", "o"}
+
         keywordFormat = QTextCharFormat()
         keywordFormat.setForeground(QColor("#5B9E4B")) # Verde oscuro
         keywordFormat.setFontWeight(QFont.Weight.Bold)
-        for word in keywords:
-            pattern = QRegularExpression(r"\b" + word + r"\b")
-            self.highlightingRules.append((pattern, keywordFormat))
 
         # Números
         numberFormat = QTextCharFormat()
         numberFormat.setForeground(QColor("#D98F4F")) # Naranja
-        self.highlightingRules.append((QRegularExpression(r"\b\d+(\.\d+)?\b"), numberFormat))
 
         # Cadenas (texto)
         stringFormat = QTextCharFormat()
         stringFormat.setForeground(QColor("#4E9A06")) # Verde
-        self.highlightingRules.append((QRegularExpression(r'"[^"]*"'), stringFormat))
 
         # Comentarios
         commentFormat = QTextCharFormat()
         commentFormat.setForeground(QColor("#A0A0A0")) # Gris
         commentFormat.setFontItalic(True)
-        self.highlightingRules.append((QRegularExpression(r'#.*'), commentFormat))
 
         # Operadores
         operatorFormat = QTextCharFormat()
         operatorFormat.setForeground(QColor("#CC0000")) # Rojo
-        operators = ['+', '-', '*', '/', '%', '=', '==', '!=', '<', '>', '<=', '>=', 'es', 'no es', 'y', 'o']
-        for op in operators:
-            pattern = QRegularExpression(r"\b" + QRegularExpression.escape(op) + r"\b")
-            self.highlightingRules.append((pattern, operatorFormat))
 
         # IDs de funciones (ej. `miFuncion(`)
         functionFormat = QTextCharFormat()
         functionFormat.setForeground(QColor("#729FCF")) # Azul claro
-        self.highlightingRules.append((QRegularExpression(r"\b[A-Za-z0-9_]+\("), functionFormat))
 
+        self.formats = {
+            "palabra_clave": keywordFormat,
+            "numero": numberFormat,
+            "texto": stringFormat,
+            "comentario": commentFormat,
+            "operador": operatorFormat,
+            "funcion": functionFormat,
+        }
+
+        self._cache = {}
+        self._diferido = False
+        self._pendientes = []
+        self._temporizador = QTimer(self)
+        self._temporizador.setInterval(0)
+        self._temporizador.timeout.connect(self._resaltar_pendientes)
+
+    # ------------------------------------------------------------
+    # Análisis de una línea (una sola pasada)
+    # ------------------------------------------------------------
+    def _analizar(self, text, estado_anterior):
+        """Devuelve ([(inicio, longitud, nombre_formato)], estado_final) para una línea."""
+        tramos = []
+        pos = 0
+        if estado_anterior == DENTRO_DE_TEXTO:
+            cierre = _FIN_DE_TEXTO.match(text)
+            if cierre is None:
+                return [(0, len(text), "texto")], DENTRO_DE_TEXTO
+            tramos.append((0, cierre.end(), "texto"))
+            pos = cierre.end()
+
+        estado = NORMAL
+        for match in _PATRON_TOKENS.finditer(text, pos):
+            tipo = match.lastgroup
+            inicio, fin = match.span()
+            if tipo == "palabra":
+                palabra = match.group()
+                if palabra in self.word_operators:
+                    tipo = "operador"
+                elif palabra in self.keywords:
+                    tipo = "palabra_clave"
+                elif text.startswith("(", fin):
+                    tipo = "funcion"
+                    fin += 1
+                else:
+                    continue
+            elif tipo == "texto_abierto":
+                tipo = "texto"
+                estado = DENTRO_DE_TEXTO
+            tramos.append((inicio, fin - inicio, tipo))
+        return tramos, estado
 
     def highlightBlock(self, text):
-        for pattern, format in self.highlightingRules:
-            match_iterator = pattern.globalMatch(text)
-            while match_iterator.hasNext():
-                match = match_iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+        if self._diferido:
+            # Carga de un documento grande: se colorea después, por partes (ver diferir())
+            self.setCurrentBlockState(NORMAL)
+            return
+
+        anterior = self.previousBlockState()
+        clave = (anterior, text)
+        resultado = self._cache.get(clave)
+        if resultado is None:
+            resultado = self._analizar(text, anterior)
+            if len(self._cache) >= self.LIMITE_CACHE:
+                self._cache.clear()
+            self._cache[clave] = resultado
+
+        tramos, estado = resultado
+        for inicio, longitud, nombre in tramos:
+            self.setFormat(inicio, longitud, self.formats[nombre])
+        self.setCurrentBlockState(estado)
+
+    # ------------------------------------------------------------
+    # Resaltado en segundo plano de documentos grandes
+    # ------------------------------------------------------------
+    def diferir(self):
+        """A partir de ahora los bloques nuevos no se colorean hasta llamar a reanudar()."""
+        self._temporizador.stop()
+        self._pendientes = []
+        self._diferido = True
+
+    def reanudar(self, primer_bloque_visible=0, bloques_visibles=100):
+        """
+        Colorea ya los bloques visibles y programa el resto del documento en pasos
+        de MS_POR_PASO dentro del bucle de eventos, sin bloquear la interfaz.
+        """
+        self._diferido = False
+        documento = self.document()
+        total = documento.blockCount()
+        fin_visible = min(total, primer_bloque_visible + bloques_visibles)
+        for numero in range(primer_bloque_visible, fin_visible):
+            self.rehighlightBlock(documento.findBlockByNumber(numero))
+        # Se procesa en orden desde el principio para propagar bien los estados de bloque
+        self._pendientes = [range(0, primer_bloque_visible), range(fin_visible, total)]
+        self._temporizador.start()
+
+    def _resaltar_pendientes(self):
+        limite = time.perf_counter() + self.MS_POR_PASO / 1000
+        documento = self.document()
+        while self._pendientes:
+            tramo = self._pendientes[0]
+            bloque = documento.findBlockByNumber(tramo.start)
+            numero = tramo.start
+            while numero < tramo.stop and bloque.isValid() and time.perf_counter() < limite:
+                self.rehighlightBlock(bloque)
+                bloque = bloque.next()
+                numero += 1
+            if numero < tramo.stop and bloque.isValid():
+                self._pendientes[0] = range(numero, tramo.stop)
+                return
+            self._pendientes.pop(0)
+        self._temporizador.stop()
+
+class LineNumberArea(QWidget):
+    """
+    Margen izquierdo del editor: puntos de ruptura (clic para ponerlos o quitarlos),
+    números de línea, mapa de calor y marcas de diagnóstico.
+    """
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.setMouseTracking(True)
+
+    def sizeHint(self):
+        return QSize(self.editor.line_number_area_width(), 0)
+
+    def paintEvent(self, event):
+        self.editor.line_number_area_paint_event(event)
+
+    def mousePressEvent(self, event):
+        linea = self.editor.line_at_y(event.position().toPoint().y())
+        if event.button() == Qt.MouseButton.LeftButton and linea is not None:
+            self.editor.alternar_punto_ruptura(linea)
+        else:
+            super().mousePressEvent(event)
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            texto = self.editor.tooltip_for_line(self.editor.line_at_y(event.pos().y()))
+            if texto:
+                QToolTip.showText(event.globalPos(), texto, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+
+class CodeEditor(QPlainTextEdit):
+    # A partir de este número de líneas el coloreado se hace en segundo plano
+    LINEAS_RESALTADO_DIFERIDO = 2000
+    # Ancho de la franja del mapa de calor y de las marcas de diagnóstico en el margen
+    ANCHO_MARCAS = 10
 
-class CodeEditor(QTextEdit):
     def __init__(self):
         super().__init__()
         self.setFont(QFont("Monospace", 12))
         self.setTabStopDistance(20) # 4 espacios
-        self.highlighter = MinicodeHighlighter(self.document())
\ No newline at end of file
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.highlighter = MinicodeHighlighter(self.document())
+
+        # {linea (1-based): (intensidad 0..1, segundos)}
+        self.mapa_calor = {}
+        # {linea (1-based): [(nivel, mensaje)]} con nivel "error" o "aviso" (ver mostrar_diagnosticos)
+        self.diagnosticos = {}
+        # Depurador: líneas (1-based) con punto de ruptura y línea donde está detenido
+        self.puntos_ruptura = set()
+        self.linea_detenida = None
+
+        self.line_number_area = LineNumberArea(self)
+        self.blockCountChanged.connect(self.update_line_number_area_width)
+        self.updateRequest.connect(self.update_line_number_area)
+        self.update_line_number_area_width()
+
+    def setPlainText(self, text):
+        """Carga texto plano; en archivos grandes colorea primero lo visible y el resto después."""
+        if text.count("\n") < self.LINEAS_RESALTADO_DIFERIDO:
+            super().setPlainText(text)
+            return
+        self.highlighter.diferir()
+        super().setPlainText(text)
+        self.highlighter.reanudar(self.firstVisibleBlock().blockNumber(),
+                                  self.viewport().height() // max(1, self.fontMetrics().height()) + 1)
+
+    # ------------------------------------------------------------
+    # Margen con números de línea
+    # ------------------------------------------------------------
+    def line_number_area_width(self):
+        digitos = len(str(max(1, self.blockCount())))
+        return 8 + self.fontMetrics().horizontalAdvance("9") * digitos + 2 * self.ANCHO_MARCAS
+
+    def update_line_number_area_width(self, _=0):
+        self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
+
+    def update_line_number_area(self, rect, dy):
+        if dy:
+            self.line_number_area.scroll(0, dy)
+        else:
+            self.line_number_area.update(0, rect.y(), self.line_number_area.width(), rect.height())
+        if rect.contains(self.viewport().rect()):
+            self.update_line_number_area_width()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        cr = self.contentsRect()
+        self.line_number_area.setGeometry(QRect(cr.left(), cr.top(), self.line_number_area_width(), cr.height()))
+
+    def line_number_area_paint_event(self, event):
+        """Pinta solo los bloques visibles: el coste no depende del tamaño del documento."""
+        painter = QPainter(self.line_number_area)
+        painter.fillRect(event.rect(), QColor("#F0F0F0"))
+        ancho = self.line_number_area.width()
+        alto_linea = self.fontMetrics().height()
+        painter.setFont(self.font())
+
+        bloque = self.firstVisibleBlock()
+        numero = bloque.blockNumber()
+        top = round(self.blockBoundingGeometry(bloque).translated(self.contentOffset()).top())
+        bottom = top + round(self.blockBoundingRect(bloque).height())
+        while bloque.isValid() and top <= event.rect().bottom():
+            if bloque.isVisible() and bottom >= event.rect().top():
+                linea = numero + 1
+                calor = self.mapa_calor.get(linea)
+                if linea == self.linea_detenida:
+                    painter.fillRect(0, top, ancho, bottom - top, QColor("#FFF176"))
+                elif calor is not None:
+                    painter.fillRect(0, top, ancho, bottom - top, self._color_calor(calor[0]))
+                if linea in self.puntos_ruptura:
+                    lado = min(self.ANCHO_MARCAS - 1, alto_linea - 4)
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(QColor("#C62828"))
+                    painter.drawEllipse(1, top + (alto_linea - lado) // 2, lado, lado)
+                marcas = self.diagnosticos.get(linea)
+                if marcas:
+                    es_error = any(nivel == "error" for nivel, _ in marcas)
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(QColor("#D32F2F") if es_error else QColor("#F9A825"))
+                    lado = min(self.ANCHO_MARCAS - 2, alto_linea - 4)
+                    painter.drawEllipse(ancho - self.ANCHO_MARCAS, top + (alto_linea - lado) // 2, lado, lado)
+                painter.setPen(QColor("#909090"))
+                painter.drawText(0, top, ancho - self.ANCHO_MARCAS - 4, alto_linea,
+                                 Qt.AlignmentFlag.AlignRight, str(linea))
+            bloque = bloque.next()
+            top = bottom
+            bottom = top + round(self.blockBoundingRect(bloque).height())
+            numero += 1
+        painter.end()
+
+    def line_at_y(self, y):
+        """Número de línea (1-based) bajo la coordenada y del margen, o None."""
+        bloque = self.cursorForPosition(QPoint(0, y)).block()
+        return bloque.blockNumber() + 1 if bloque.isValid() else None
+
+    def tooltip_for_line(self, linea):
+        partes = [mensaje for _, mensaje in self.diagnosticos.get(linea, ())]
+        calor = self.mapa_calor.get(linea)
+        if calor is not None:
+            partes.append(f"{calor[1] * 1000:.3f} ms")
+        return "\n".join(partes)
+
+    # ------------------------------------------------------------
+    # Mapa de calor del perfilador
+    # ------------------------------------------------------------
+    @staticmethod
+    def _color_calor(intensidad):
+        return QColor(255, int(245 - 180 * intensidad), int(200 - 200 * intensidad), 160)
+
+    def mostrar_mapa_calor(self, tiempos_por_linea):
+        """
+        Colorea en el margen cada línea según el tiempo propio medido por el perfilador
+        (de amarillo pálido a rojo). `tiempos_por_linea` es {linea (1-based): segundos}.
+        """
+        maximo = max(tiempos_por_linea.values(), default=0)
+        self.mapa_calor = {}
+        if maximo > 0:
+            self.mapa_calor = {linea: (tiempo / maximo, tiempo) for linea, tiempo in tiempos_por_linea.items()}
+        self.line_number_area.update()
+
+    def limpiar_mapa_calor(self):
+        self.mapa_calor = {}
+        self.line_number_area.update()
+
+    # ------------------------------------------------------------
+    # Depurador
+    # ------------------------------------------------------------
+    def alternar_punto_ruptura(self, linea):
+        self.puntos_ruptura ^= {linea}
+        self.line_number_area.update()
+
+    def limpiar_puntos_ruptura(self):
+        self.puntos_ruptura.clear()
+        self.line_number_area.update()
+
+    def mostrar_linea_detenida(self, linea):
+        """Resalta en el margen la línea donde está detenido el depurador (None: ninguna)."""
+        self.linea_detenida = linea
+        if linea is not None:
+            bloque = self.document().findBlockByNumber(linea - 1)
+            if bloque.isValid():
+                self.setTextCursor(QTextCursor(bloque))
+                self.ensureCursorVisible()
+        self.line_number_area.update()
+
+    # ------------------------------------------------------------
+    # Marcas de diagnóstico en el margen
+    # ------------------------------------------------------------
+    def mostrar_diagnosticos(self, diagnosticos):
+        """
+        Subraya con una línea ondulada cada diagnóstico y lo marca en el margen.
+        `diagnosticos` es una lista de core.diagnosticos.Diagnostico (nivel "error" o "aviso").
+        """
+        self.diagnosticos = {}
+        selecciones = []
+        documento = self.document()
+        for d in diagnosticos:
+            self.diagnosticos.setdefault(d.linea, []).append((d.nivel, d.mensaje))
+            bloque = documento.findBlockByNumber(d.linea - 1)
+            if not bloque.isValid():
+                continue
+            inicio = bloque.position() + min(d.columna, max(0, bloque.length() - 1))
+            cursor = QTextCursor(documento)
+            cursor.setPosition(inicio)
+            cursor.setPosition(min(inicio + d.longitud, bloque.position() + bloque.length() - 1),
+                               QTextCursor.MoveMode.KeepAnchor)
+            if not cursor.hasSelection():
+                # Error al final de la línea (p. ej. falta un ')'): se subraya el último carácter
+                cursor.movePosition(QTextCursor.MoveOperation.Left, QTextCursor.MoveMode.KeepAnchor)
+            seleccion = QTextEdit.ExtraSelection()
+            seleccion.format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
+            seleccion.format.setUnderlineColor(QColor("#D32F2F") if d.nivel == "error" else QColor("#F9A825"))
+            seleccion.format.setToolTip(d.mensaje)
+            seleccion.cursor = cursor
+            selecciones.append(seleccion)
+        self.setExtraSelections(selecciones)
+        self.line_number_area.update()
+
+    def limpiar_diagnosticos(self):
+        self.mostrar_diagnosticos([])
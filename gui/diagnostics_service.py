@@ -0,0 +1,94 @@
+# minicode_ide/gui/diagnostics_service.py
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, QTimer, pyqtSignal
+
+from core import traza
+
+_traza = traza.categoria(traza.IDE)
+
+
+class _DiagnosticsWorker(QObject):
+    """Vive en un QThread propio: parsea y analiza sin bloquear la interfaz."""
+    finished = pyqtSignal(int, object)
+
+    def analyze(self, version, code):
+        try:
+            from core.diagnosticos import analizar
+            diagnosticos = analizar(code)
+        except Exception as e:
+            _traza.aviso("No se pudo analizar el código: %s", e)
+            diagnosticos = []
+        self.finished.emit(version, diagnosticos)
+
+    def warm_up(self):
+        try:
+            from core.frontend import precalentar
+            precalentar()
+        except Exception as e:
+            _traza.aviso("No se pudo precalentar el parser: %s", e)
+
+
+class DiagnosticsService(QObject):
+    """
+    Analiza el contenido del editor cuando el usuario deja de escribir durante
+    DEBOUNCE_MS y le pasa los diagnósticos (core/diagnosticos.py) para que los
+    subraye. Solo hay un análisis en curso a la vez; si el texto cambia mientras
+    tanto, el resultado antiguo se descarta y se analiza la versión nueva.
+    """
+    DEBOUNCE_MS = 400
+    _request = pyqtSignal(int, str)
+    _warm_up = pyqtSignal()
+
+    def __init__(self, editor, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self._version = 0
+        self._busy = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._start_analysis)
+
+        self._thread = QThread(self)
+        self._thread.setObjectName("diagnosticos")
+        self._worker = _DiagnosticsWorker()
+        self._worker.moveToThread(self._thread)
+        self._request.connect(self._worker.analyze)
+        self._warm_up.connect(self._worker.warm_up)
+        self._worker.finished.connect(self._on_finished)
+        self._thread.start()
+        # Si la aplicación termina sin cerrar la ventana, el hilo debe pararse antes de destruirse
+        QCoreApplication.instance().aboutToQuit.connect(self.stop)
+
+        editor.document().contentsChanged.connect(self.schedule)
+
+    def warm_up(self):
+        """
+        Llena las cachés DFA de ANTLR en el hilo de los diagnósticos, el único que parsea
+        en segundo plano: así nunca se llenan a la vez que se analiza un programa.
+        """
+        self._warm_up.emit()
+
+    def schedule(self):
+        """Reinicia la espera: el análisis arranca DEBOUNCE_MS después del último cambio."""
+        self._version += 1
+        self._timer.start(self.DEBOUNCE_MS)
+
+    def _start_analysis(self):
+        if self._busy:
+            return  # al terminar el análisis en curso se lanzará el de esta versión
+        self._busy = True
+        self._request.emit(self._version, self.editor.toPlainText())
+
+    def _on_finished(self, version, diagnosticos):
+        self._busy = False
+        if version != self._version:
+            if not self._timer.isActive():
+                self._start_analysis()
+            return
+        self.editor.mostrar_diagnosticos(diagnosticos)
+
+    def stop(self):
+        self._timer.stop()
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
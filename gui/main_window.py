@@ -1,27 +1,37 @@
 # minicode_ide/gui/main_window.py
 import sys
 import os
+import math
+import threading
 import traceback
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QFileDialog, QSplitter, QSizePolicy, QTabWidget,
-    QMessageBox, QComboBox
+    QMessageBox, QComboBox, QTreeWidget, QTreeWidgetItem
 )
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QAction, QIcon, QDesktopServices
+from PyQt6.QtCore import Qt, QUrl, QTimer, QEventLoop, pyqtSignal
+from PyQt6.QtGui import QAction, QActionGroup, QIcon, QDesktopServices
 
 from gui.code_editor import CodeEditor
 from gui.console_output import ConsoleOutput
 from gui.ast_viewer import ASTViewer
 from gui.simulation_panel import SimulationPanel
 from gui.tutorial_manager import TutorialManager
-from gui.polinomios_panel import PolinomiosPanel
+from gui.diagnostics_service import DiagnosticsService
+from core.registro import registrar_error, detener as detener_registro
+from core import traza
 
 
 # Nota: las importaciones de antlr4 y del executor se realizan en tiempo de ejecución
 # dentro de run_code() para poder capturar errores de importación y mostrarlos en la UI.
+# El panel de polinomios (matplotlib + SymPy) tampoco se importa al arrancar: se
+# construye la primera vez que se necesita (ver la propiedad polinomios_panel).
+
+_traza = traza.categoria(traza.IDE)
 
 class MainWindow(QMainWindow):
+    # Lo emite el hilo de precalentamiento al terminar; el slot corre en el hilo de la interfaz
+    _prewarmed = pyqtSignal()
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Minicode IDE")
@@ -38,12 +48,29 @@ class MainWindow(QMainWindow):
 
         # Estado actual del archivo
         self.current_file = None
+        self.ultimo_perfil = None
+        self.ultima_musica = None
+        self.last_run_log = None  # eventos de la última ejecución (core/eventos.py)
+        self._audio_player = None
+        self.numeric_mode = None  # None: el modo por defecto del executor
+        # El programa corre en el hilo de la interfaz: un bucle sin fin la congelaría
+        self.time_limit = 10.0
+        # Puntos de control (core/puntos_control.py): tras editar, se sigue desde lo que no cambió
+        self.use_checkpoints = True
+        self.checkpoints = None
+        # Ejecución en procesos trabajadores con límites de memoria y CPU (core/aislamiento.py)
+        self.sandbox = None
+        # Depurador (core/depurador.py): bucle de eventos anidado mientras el programa está detenido
+        self._debug_loop = None
+        self._debug_order = None
         self.code_editor.document().contentsChanged.connect(self._document_modified)
 
         # Instalar handler global de excepciones para capturar errores no atrapados
-        # y escribirlos en un log y en la consola de la aplicación.
+        # y escribirlos en el registro de errores y en la consola de la aplicación.
         sys.excepthook = self._global_excepthook
 
+        self._precalentamiento = None
+
     # ---------------------------
     # Creación de widgets / layouts
     # ---------------------------
@@ -52,7 +79,23 @@ class MainWindow(QMainWindow):
         self.console_output = ConsoleOutput()
         self.ast_viewer = ASTViewer()
         self.simulation_panel = SimulationPanel()
-        self.polinomios_panel = PolinomiosPanel()
+        # Variables del programa detenido en el depurador, una rama por función en curso
+        self.variables_view = QTreeWidget()
+        self.variables_view.setHeaderLabels(["Variable", "Valor"])
+        # Contenedor vacío de la pestaña "Polinomios"; el panel real se crea al usarlo
+        self._polinomios_panel = None
+        self.polinomios_container = QWidget()
+        polinomios_layout = QVBoxLayout(self.polinomios_container)
+        polinomios_layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def polinomios_panel(self):
+        """Panel de polinomios; se importa y construye la primera vez que se pide."""
+        if self._polinomios_panel is None:
+            from gui.polinomios_panel import PolinomiosPanel
+            self._polinomios_panel = PolinomiosPanel()
+            self.polinomios_container.layout().addWidget(self._polinomios_panel)
+        return self._polinomios_panel
 
 
     def _create_layouts(self):
@@ -69,7 +112,8 @@ class MainWindow(QMainWindow):
         self.right_tabs.addTab(self.console_output, "Consola")
         self.right_tabs.addTab(self.ast_viewer, "Árbol AST")
         self.right_tabs.addTab(self.simulation_panel, "Juegos")
-        self.right_tabs.addTab(self.polinomios_panel, "Polinomios")
+        self.right_tabs.addTab(self.polinomios_container, "Polinomios")
+        self.right_tabs.addTab(self.variables_view, "Variables")
 
 
 
@@ -119,6 +163,83 @@ class MainWindow(QMainWindow):
         run_action.triggered.connect(self.run_code)
         run_menu.addAction(run_action)
 
+        restart_action = QAction("Ejecutar desde el principio", self)
+        restart_action.triggered.connect(self.run_from_start)
+        run_menu.addAction(restart_action)
+
+        # Menú Depurar (core/depurador.py)
+        debug_menu = menu_bar.addMenu("&Depurar")
+        for label, shortcut, slot in (
+                ("Depurar / Continuar", "F5", self.debug_code),
+                ("Paso a paso (entrar)", "F11", lambda: self._debug_command("entrar")),
+                ("Paso (saltar funciones)", "F10", lambda: self._debug_command("saltar")),
+                ("Salir de la función", "Shift+F11", lambda: self._debug_command("salir")),
+                ("Detener depuración", "Shift+F5", lambda: self._debug_command("detener")),
+                ("Poner / quitar punto de ruptura", "F9", self.toggle_breakpoint),
+                ("Quitar todos los puntos de ruptura", None, self.code_editor.limpiar_puntos_ruptura)):
+            debug_action = QAction(label, self)
+            if shortcut:
+                debug_action.setShortcut(shortcut)
+            debug_action.triggered.connect(slot)
+            debug_menu.addAction(debug_action)
+
+        checkpoints_action = QAction("Reanudar tras editar (puntos de control)", self, checkable=True)
+        checkpoints_action.setChecked(True)
+        checkpoints_action.triggered.connect(lambda activo: setattr(self, "use_checkpoints", activo))
+        run_menu.addAction(checkpoints_action)
+
+        self.sandbox_action = QAction("Ejecutar en proceso aislado (límites de memoria y CPU)", self, checkable=True)
+        self.sandbox_action.triggered.connect(self.set_sandbox)
+        run_menu.addAction(self.sandbox_action)
+
+        profile_action = QAction("Ejecutar con perfilador", self)
+        profile_action.triggered.connect(lambda: self.run_code(perfilar=True))
+        run_menu.addAction(profile_action)
+
+        mode_menu = run_menu.addMenu("Ejecutar solo...")
+        for mode, label in (("musica", "Música"), ("polinomios", "Polinomios"), ("juegos", "Juegos (mapa)")):
+            mode_action = QAction(label, self)
+            mode_action.triggered.connect(lambda _, m=mode: self.run_code(mode=m))
+            mode_menu.addAction(mode_action)
+
+        # Aritmética del executor (core/executor.py, MODOS_NUMERICOS)
+        numbers_menu = run_menu.addMenu("Números")
+        numbers_group = QActionGroup(self)
+        current = os.environ.get("MINICODE_NUMEROS", "nativo")
+        for numeros, label in (("nativo", "Enteros y decimales (rápido)"),
+                               ("decimal", "Decimales exactos"), ("fraccion", "Fracciones exactas")):
+            numbers_action = QAction(label, self, checkable=True)
+            numbers_action.setChecked(numeros == current)
+            numbers_action.triggered.connect(lambda _, n=numeros: setattr(self, "numeric_mode", n))
+            numbers_group.addAction(numbers_action)
+            numbers_menu.addAction(numbers_action)
+
+        export_profile_action = QAction("Exportar perfil...", self)
+        export_profile_action.triggered.connect(self.export_profile)
+        run_menu.addAction(export_profile_action)
+
+        export_audio_action = QAction("Exportar música (WAV)...", self)
+        export_audio_action.triggered.connect(self.export_audio)
+        run_menu.addAction(export_audio_action)
+
+        stop_audio_action = QAction("Detener música", self)
+        stop_audio_action.triggered.connect(self.stop_audio)
+        run_menu.addAction(stop_audio_action)
+        run_menu.addSeparator()
+
+        # Registro de eventos: volver a mostrar una ejecución sin interpretar (core/eventos.py)
+        replay_action = QAction("Repetir última ejecución (sin ejecutar)", self)
+        replay_action.triggered.connect(lambda: self.replay_run(self.last_run_log))
+        run_menu.addAction(replay_action)
+
+        save_log_action = QAction("Guardar registro de ejecución...", self)
+        save_log_action.triggered.connect(self.save_run_log)
+        run_menu.addAction(save_log_action)
+
+        open_log_action = QAction("Abrir registro de ejecución...", self)
+        open_log_action.triggered.connect(self.open_run_log)
+        run_menu.addAction(open_log_action)
+
         # Menú Ayuda
         help_menu = menu_bar.addMenu("Ay&uda")
         about_action = QAction("Acerca de...", self)
@@ -168,8 +289,10 @@ class MainWindow(QMainWindow):
     def _connect_signals(self):
         # Conexiones adicionales si son necesarias
         self.right_tabs.currentChanged.connect(self._on_tab_changed)
+        self.ast_viewer.node_activated.connect(self._go_to_position)
 
-        pass
+        # Errores de sintaxis y semánticos subrayados mientras se escribe
+        self.diagnostics_service = DiagnosticsService(self.code_editor, self)
 
     # ---------------------------
     # Gestión de archivos
@@ -199,7 +322,7 @@ class MainWindow(QMainWindow):
             else:
                 # Es un tutorial normal
                 code = self.tutorial_manager.load_tutorial_code(tutorial_name)
-                self.code_editor.setText(code)
+                self.code_editor.setPlainText(code)
                 self.current_file = f"Tutorial: {tutorial_name}"
                 self._document_modified()
 
@@ -238,7 +361,7 @@ class MainWindow(QMainWindow):
         file_name, _ = QFileDialog.getOpenFileName(self, "Abrir Archivo Minicode", "", "Minicode Files (*.minicode);;All Files (*)")
         if file_name:
             with open(file_name, 'r', encoding='utf-8') as f:
-                self.code_editor.setText(f.read())
+                self.code_editor.setPlainText(f.read())
             self.current_file = file_name
             self._document_modified()
             self.console_output.clear()
@@ -273,123 +396,475 @@ class MainWindow(QMainWindow):
     # ---------------------------
     # Ejecución del código (robusta)
     # ---------------------------
-    def run_code(self, mode=None):
+    def run_code(self, mode=None, perfilar=False, depurar=False, paso_a_paso=False):
         """
         Ejecuta el código Minicode con manejo de errores, 
         soporte de modos (musical, polinomios, juegos o completo),
         y limpieza de la cola de animaciones previas.
+        Con `perfilar=True` mide el tiempo por línea y función y lo muestra como mapa de calor.
+        Con `depurar=True` se detiene en los puntos de ruptura (y en la primera
+        instrucción si `paso_a_paso`).
         """
         import traceback
+        if self._debugger_busy():
+            return
         self.console_output.clear()
         self.console_output.append("--- Ejecutando Código Minicode ---")
+        self.stop_audio()
+        self.code_editor.limpiar_mapa_calor()
 
-        #  Limpiar cola de movimientos previos antes de ejecutar nuevo código
-        try:
-            if hasattr(self.simulation_panel, "action_queue"):
-                self.simulation_panel.action_queue.clear()
-                self.simulation_panel._is_processing_queue = False
-                print("🧹 Cola de acciones anterior limpiada.")
-            if hasattr(self.simulation_panel, "flush_action_queue"):
-                self.simulation_panel.flush_action_queue()
-        except Exception:
-            import traceback
-            print(" No se pudo limpiar la cola gráfica:", traceback.format_exc())
-
-        # Preparar el panel gráfico antes de ejecutar
-        try:
-            if self.simulation_panel.map_data is None:
-                self.simulation_panel.clear_canvas()
-            else:
-                self.console_output.append("(ℹ Mapa cargado: se conserva durante la ejecución)")
-        except Exception:
-            self.console_output.append("Warning: fallo al preparar el panel de simulación (ignored).")
+        # Los modos musica/polinomios no tocan el panel de simulación
+        usa_simulacion = mode in (None, "juegos")
+        self._prepare_simulation(usa_simulacion, mode)
 
         codigo = self.code_editor.toPlainText()
 
+        if self.sandbox is not None and not perfilar and not depurar:
+            self._run_sandboxed(codigo, mode, usa_simulacion)
+            return
+
         #  Importaciones seguras en tiempo de ejecución
         try:
             project_root = os.path.dirname(os.path.dirname(__file__))
             if project_root not in sys.path:
                 sys.path.insert(0, project_root)
 
-            from antlr4 import InputStream, CommonTokenStream
-            from antlr.MinicodeLexer import MinicodeLexer
-            from antlr.MinicodeParser import MinicodeParser
+            from core.frontend import parsear
 
-        except Exception:
+        except Exception as e:
             tb = traceback.format_exc()
             self.console_output.append("--- Error de importación (ANTLR/Parser) ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error de importación ---\n")
-                f.write(tb + "\n")
+            registrar_error("importacion", e)
             return
 
         # 2 Cargar el executor
         try:
-            from core.executor import MinicodeExecutor
-        except Exception:
+            from core.executor import MinicodeExecutor, LimiteEjecucion
+            from core.eventos import GrabadorEventos
+            from core.depurador import DepuracionDetenida
+        except Exception as e:
             tb = traceback.format_exc()
             self.console_output.append("--- Error al cargar el Executor ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error al cargar el Executor ---\n")
-                f.write(tb + "\n")
+            registrar_error("executor", e)
             return
 
         # 3 Parsear el código
         try:
-            input_stream = InputStream(codigo)
-            lexer = MinicodeLexer(input_stream)
-            stream = CommonTokenStream(lexer)
-            parser = MinicodeParser(stream)
-            tree = parser.programa()
-        except Exception:
+            tree, parser = parsear(codigo)
+
+            # Modo aislado: quitar lo que no afecta a ese entorno (core/modos.py)
+            if mode is not None:
+                from core.modos import rebanar
+                conservadas, total = rebanar(tree, mode)
+                self.console_output.append(f"(Modo {mode}: se ejecutan {conservadas} de {total} instrucciones)")
+
+            # Plegado de constantes, ramas muertas e invariantes de bucles
+            # (al depurar no: el paso a paso debe recorrer el código tal como está escrito)
+            if not depurar:
+                from core.optimizador import OptimizadorAST
+                tree = OptimizadorAST(numeros=self.numeric_mode).optimizar(tree)
+        except Exception as e:
             tb = traceback.format_exc()
             self.console_output.append("--- Error durante el parseo ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error durante el parseo ---\n")
-                f.write(tb + "\n")
+            registrar_error("parseo", e, codigo)
             return
 
         # 4 Ejecutar según el modo
+        # Los efectos quedan apuntados (core/eventos.py) para poder repetirlos sin ejecutar
+        grabador = GrabadorEventos()
         try:
-            if hasattr(self, 'polinomios_panel') and self.polinomios_panel is not None:
-                self.polinomios_panel.clear_panel()
-            executor = MinicodeExecutor(self.console_output, self.simulation_panel, polinomios_panel=self.polinomios_panel)
-
-            if mode == "musica":
-                self.console_output.append(" Ejecutando solo el entorno musical...")
-                executor.entorno_musical()
-            elif mode == "polinomios":
-                self.console_output.append(" Ejecutando solo el entorno de polinomios...")
-                executor.entorno_polinomios()
-            elif mode == "juegos":
-                self.console_output.append(" Ejecutando solo el entorno gráfico (mapas)...")
-                executor.entorno_grafico()
-            else:
-                # Modo completo (normal)
-                executor.visit(tree)
+            if self._polinomios_panel is not None:
+                self._polinomios_panel.clear_panel()
+            # Solo los programas con polinomios necesitan el panel (y con él matplotlib)
+            usa_polinomios = mode in (None, "polinomios") and ("polinomio" in codigo or "graficar" in codigo)
+            perfilador = None
+            if perfilar:
+                from core.perfilador import PerfiladorMinicode
+                perfilador = PerfiladorMinicode(self.current_file or "<sin título>")
+            # Solo en ejecuciones completas: los modos aislados y el perfil necesitan todo el programa
+            puntos = None
+            if self.use_checkpoints and mode is None and not perfilar and not depurar:
+                if self.checkpoints is None:
+                    from core.puntos_control import PuntosControl
+                    self.checkpoints = PuntosControl()
+                puntos = self.checkpoints
+                puntos.preparar(codigo)
+            depurador = None
+            if depurar:
+                from core.depurador import Depurador
+                depurador = Depurador(self._debugger_paused, self.code_editor.puntos_ruptura,
+                                      detenerse_al_empezar=paso_a_paso)
+            executor = MinicodeExecutor(self.console_output,
+                                        self.simulation_panel if usa_simulacion else None,
+                                        polinomios_panel=self.polinomios_panel if usa_polinomios else None,
+                                        perfilador=perfilador, numeros=self.numeric_mode,
+                                        limite_segundos=self.time_limit, grabador=grabador,
+                                        puntos_control=puntos, depurador=depurador)
+
+            executor.visit(tree)
+            if puntos is not None and puntos.reanudado is not None:
+                if puntos.linea is None:
+                    self.console_output.append("(↻ Sin cambios: se ha reproducido la ejecución anterior)")
+                else:
+                    self.console_output.append(
+                        f"(↻ Reanudado en la línea {puntos.linea}: lo anterior no cambió y no se volvió a ejecutar)")
 
             # 5 Ejecutar la cola de acciones gráficas (si aplica)
             try:
-                if hasattr(self.simulation_panel, "flush_action_queue"):
+                if usa_simulacion and hasattr(self.simulation_panel, "flush_action_queue"):
                     self.simulation_panel.flush_action_queue()
             except Exception:
                 import traceback
-                print(" No se pudo ejecutar la cola gráfica:", traceback.format_exc())
+                _traza.error("No se pudo ejecutar la cola gráfica: %s", traceback.format_exc())
 
             self.console_output.append("--- Ejecución Finalizada ---")
 
-        except Exception:
+            self.ultima_musica = executor.musica
+            if executor.musica is not None and executor.musica.eventos:
+                self.console_output.append(
+                    f"🎵 {len(executor.musica.eventos)} nota(s), {executor.musica.duracion_total():.2f} s "
+                    "(Ejecutar → Exportar música para guardarlas como WAV)")
+                self._play_audio(executor.musica)
+
+            if perfilador is not None:
+                self.ultimo_perfil = perfilador
+                self.console_output.append("--- Perfil de ejecución ---")
+                self.console_output.append(perfilador.resumen())
+                self.code_editor.mostrar_mapa_calor(perfilador.tiempos_por_linea())
+
+        except LimiteEjecucion as e:
+            self.console_output.append(f"⛔ {e}")
+            registrar_error("ejecucion", e, codigo)
+
+        except DepuracionDetenida as e:
+            self.console_output.append(f"⏹ {e}")
+
+        except Exception as e:
             tb = traceback.format_exc()
             self.console_output.append("--- Error durante la ejecución ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error durante la ejecución ---\n")
-                f.write(tb + "\n")
+            registrar_error("ejecucion", e, codigo)
+
+        finally:
+            self.last_run_log = bytes(grabador)
+
+    # ---------------------------
+    # Depurador
+    # ---------------------------
+    def debug_code(self):
+        """F5: empieza a depurar o, si el programa está detenido, continúa."""
+        if self._debug_loop is not None:
+            self._debug_command("continuar")
+        else:
+            self.run_code(depurar=True)
+
+    def _debugger_busy(self):
+        """
+        True (y un aviso en la consola) si hay un programa detenido en el depurador. Lo que
+        reinicia la consola o los paneles debe esperar: el programa seguiría escribiendo encima.
+        """
+        if self._debug_loop is None:
+            return False
+        self.console_output.append("⚠️ Hay un programa detenido en el depurador: continúalo o detenlo primero.")
+        return True
+
+    def toggle_breakpoint(self):
+        self.code_editor.alternar_punto_ruptura(self.code_editor.textCursor().blockNumber() + 1)
+
+    def _debug_command(self, orden):
+        if self._debug_loop is None:
+            # Sin programa detenido, dar un paso es empezar a depurar por la primera instrucción
+            if orden in ("entrar", "saltar"):
+                self.run_code(depurar=True, paso_a_paso=True)
+            return
+        self._debug_order = orden
+        self._debug_loop.quit()
+
+    def _debugger_paused(self, depurador):
+        """al_detenerse del Depurador: muestra dónde está y espera a la orden del usuario."""
+        self.code_editor.mostrar_linea_detenida(depurador.linea)
+        self._show_variables(depurador.marcos())
+        self.statusBar().showMessage(f"⏸ Detenido en la línea {depurador.linea} "
+                                     "(F5 continuar, F10/F11 paso, Shift+F11 salir, Shift+F5 detener)")
+        # Mientras tanto la interfaz sigue viva: animaciones, editor, puntos de ruptura...
+        self._debug_order = "detener"
+        self._debug_loop = QEventLoop()
+        try:
+            self._debug_loop.exec()
+        finally:
+            self._debug_loop = None
+            self.statusBar().clearMessage()
+            self.code_editor.mostrar_linea_detenida(None)
+        depurador.puntos_ruptura = set(self.code_editor.puntos_ruptura)
+        return self._debug_order
+
+    def _show_variables(self, marcos):
+        self.variables_view.clear()
+        for nombre, variables in marcos:
+            marco = QTreeWidgetItem(self.variables_view, [nombre, ""])
+            for variable, valor in sorted(variables.items()):
+                QTreeWidgetItem(marco, [variable, self._debug_text(valor)])
+            marco.setExpanded(True)
+
+    @staticmethod
+    def _debug_text(valor, limite=200):
+        if isinstance(valor, bool):
+            return "verdadero" if valor else "falso"
+        if isinstance(valor, int) and valor.bit_length() > 4 * limite:
+            # Pasar a texto un entero enorme solo para recortarlo tarda (o falla)
+            return f"(entero de unas {int(valor.bit_length() * math.log10(2)) + 1} cifras)"
+        texto = f'"{valor}"' if isinstance(valor, str) else str(valor)
+        return texto if len(texto) <= limite else texto[:limite] + "…"
+
+    # ---------------------------
+    # Ejecución aislada (core/aislamiento.py)
+    # ---------------------------
+    def set_sandbox(self, activo):
+        """Activa la ejecución en un proceso trabajador, que se arranca ya para que la primera sea rápida."""
+        if self._debugger_busy():
+            self.sandbox_action.setChecked(self.sandbox is not None)
+            return
+        if activo and self.sandbox is None:
+            from core.aislamiento import GrupoTrabajadores
+            self.sandbox = GrupoTrabajadores(trabajadores=1)
+        elif not activo and self.sandbox is not None:
+            self.sandbox.cerrar()
+            self.sandbox = None
+
+    def _run_sandboxed(self, codigo, mode, usa_simulacion):
+        """Ejecuta en el proceso trabajador y reproduce en los paneles lo que hizo el programa."""
+        try:
+            resultado = self.sandbox.ejecutar(codigo, modo=mode, numeros=self.numeric_mode,
+                                              limite_segundos=self.time_limit)
+            musica = self._replay_into_panels(resultado.eventos, usa_simulacion)
+        except Exception as e:
+            self.console_output.append("--- Error en la ejecución aislada ---")
+            self.console_output.append(traceback.format_exc())
+            registrar_error("aislamiento", e, codigo)
+            return
+
+        self.last_run_log = resultado.eventos
+        if resultado.estado == "ok":
+            self.console_output.append("--- Ejecución Finalizada ---")
+        elif resultado.estado == "error":
+            self.console_output.append("--- Error durante la ejecución ---")
+            self.console_output.append(resultado.error)
+        else:
+            self.console_output.append(f"⛔ {resultado.error}")
+        if resultado.estado != "ok":
+            registrar_error("ejecucion", RuntimeError(resultado.error), codigo)
+
+        self.ultima_musica = musica
+        if musica is not None and musica.eventos:
+            self.console_output.append(
+                f"🎵 {len(musica.eventos)} nota(s), {musica.duracion_total():.2f} s "
+                "(Ejecutar → Exportar música para guardarlas como WAV)")
+            self._play_audio(musica)
+
+    def run_from_start(self):
+        """Ejecuta sin aprovechar los puntos de control de ejecuciones anteriores."""
+        if self._debugger_busy():
+            return
+        if self.checkpoints is not None:
+            self.checkpoints.limpiar()
+        self.run_code()
+
+    def _prepare_simulation(self, usa_simulacion, mode=None):
+        """Vacía la cola de animaciones pendiente y deja el panel listo para dibujar."""
+        #  Limpiar cola de movimientos previos antes de ejecutar nuevo código
+        try:
+            if usa_simulacion and hasattr(self.simulation_panel, "action_queue"):
+                self.simulation_panel.action_queue.clear()
+                self.simulation_panel._is_processing_queue = False
+                _traza.detalle("Cola de acciones anterior limpiada.")
+            if usa_simulacion and hasattr(self.simulation_panel, "flush_action_queue"):
+                self.simulation_panel.flush_action_queue()
+        except Exception:
+            import traceback
+            _traza.error("No se pudo limpiar la cola gráfica: %s", traceback.format_exc())
+
+        # Preparar el panel gráfico antes de ejecutar
+        try:
+            if not usa_simulacion:
+                self.console_output.append(f"(ℹ Modo {mode}: el panel de simulación no se usa)")
+            elif self.simulation_panel.map_data is None:
+                self.simulation_panel.clear_canvas()
+            else:
+                self.console_output.append("(ℹ Mapa cargado: se conserva durante la ejecución)")
+        except Exception:
+            self.console_output.append("Warning: fallo al preparar el panel de simulación (ignored).")
+
+
+    def closeEvent(self, event):
+        if self._debug_loop is not None:
+            self._debug_command("detener")
+        if self.sandbox is not None:
+            self.sandbox.cerrar()
+        self.diagnostics_service.stop()
+        self.stop_audio()
+        detener_registro()
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._precalentamiento is None:
+            # Tras el primer pintado, cargar en segundo plano lo que se dejó para después
+            self._precalentamiento = threading.Thread(
+                target=self._precalentar, name="precalentamiento", daemon=True)
+            self._prewarmed.connect(self._precalentar_interfaz)
+            QTimer.singleShot(0, self._precalentamiento.start)
+            QTimer.singleShot(0, self.diagnostics_service.warm_up)
+
+    def _precalentar(self):
+        """
+        Importa los módulos pesados que no tocan Qt (executor, NumPy, SymPy, la parte de
+        matplotlib sin backend) para que la primera ejecución no pague esos costes. Las
+        cachés DFA de ANTLR se llenan en el hilo de los diagnósticos y el backend Qt de
+        matplotlib se importa después en el hilo de la interfaz.
+        """
+        try:
+            import core.executor
+            import core.optimizador
+            import numpy
+            import sympy
+            import matplotlib.figure
+        except Exception:
+            _traza.aviso("No se pudo precalentar: %s", traceback.format_exc())
+            return
+        try:
+            self._prewarmed.emit()
+        except RuntimeError:
+            pass  # la ventana ya se ha destruido
+
+    def _precalentar_interfaz(self):
+        """Importa el panel de polinomios (backend Qt de matplotlib) en el hilo de la interfaz."""
+        try:
+            import gui.polinomios_panel
+        except Exception:
+            _traza.aviso("No se pudo precalentar el panel de polinomios: %s", traceback.format_exc())
+
+    def export_profile(self):
+        """Guarda el último perfil como JSON de speedscope o como volcado de pstats (.prof)."""
+        if self.ultimo_perfil is None:
+            self.console_output.append("⚠️ Primero ejecuta el código con el perfilador.")
+            return
+        file_name, _ = QFileDialog.getSaveFileName(self, "Exportar perfil", "",
+                                                   "Speedscope (*.json);;pstats (*.prof)")
+        if not file_name:
+            return
+        if file_name.endswith(".prof"):
+            self.ultimo_perfil.exportar_pstats(file_name)
+        else:
+            if not file_name.endswith(".json"):
+                file_name += ".json"
+            self.ultimo_perfil.exportar_speedscope(file_name)
+        self.console_output.append(f"💾 Perfil exportado a {file_name}")
+
+    def _play_audio(self, musica):
+        """Reproduce las notas en segundo plano; la ejecución ya ha terminado."""
+        try:
+            if self._audio_player is None:
+                from gui.audio_player import AudioPlayer  # QtMultimedia solo si hay música
+                self._audio_player = AudioPlayer(self)
+            if not self._audio_player.available():
+                self.console_output.append("(ℹ No hay salida de audio: usa Exportar música)")
+                return
+            self._audio_player.play(musica)
+        except Exception as e:
+            self.console_output.append(f"(ℹ No se puede reproducir audio: {e})")
+            registrar_error("audio", e)
 
+    def stop_audio(self):
+        if self._audio_player is not None:
+            self._audio_player.stop()
+
+    def export_audio(self):
+        """Sintetiza las notas de la última ejecución y las guarda como WAV."""
+        if self.ultima_musica is None or not self.ultima_musica.eventos:
+            self.console_output.append("⚠️ La última ejecución no tocó ninguna nota.")
+            return
+        file_name, _ = QFileDialog.getSaveFileName(self, "Exportar música", "", "Audio WAV (*.wav)")
+        if not file_name:
+            return
+        if not file_name.endswith(".wav"):
+            file_name += ".wav"
+        try:
+            self.ultima_musica.exportar_wav(file_name)
+        except Exception as e:
+            self.console_output.append(f"--- Error al exportar la música ---\n{e}")
+            registrar_error("audio", e)
+            return
+        self.console_output.append(f"💾 Música exportada a {file_name}")
+
+    # ---------------------------
+    # Registro de ejecución (record / replay)
+    # ---------------------------
+    def replay_run(self, datos):
+        """Vuelve a mostrar una ejecución a partir de su registro de eventos, sin interpretar."""
+        if self._debugger_busy():
+            return
+        if not datos:
+            self.console_output.append("⚠️ No hay ninguna ejecución que repetir.")
+            return
+        self.console_output.clear()
+        self.stop_audio()
+        self._prepare_simulation(True)
+        self.console_output.append("--- Reproduciendo ejecución registrada ---")
+        try:
+            musica = self._replay_into_panels(datos)
+        except Exception as e:
+            self.console_output.append(f"--- Error al reproducir el registro ---\n{e}")
+            registrar_error("reproduccion", e)
+            return
+        self.console_output.append("--- Reproducción Finalizada ---")
+        self.ultima_musica = musica
+        if musica is not None and musica.eventos:
+            self._play_audio(musica)
+
+    def _replay_into_panels(self, datos, usa_simulacion=True):
+        """Manda un registro de eventos a la consola y los paneles; devuelve su EntornoMusical."""
+        from core.eventos import leer_eventos, reproducir
+
+        usa_polinomios = any(e[0] in ("mostrar_polinomio", "graficar_polinomio") for e in leer_eventos(datos))
+        if self._polinomios_panel is not None:
+            self._polinomios_panel.clear_panel()
+        musica = reproducir(datos, self.console_output, self.simulation_panel if usa_simulacion else None,
+                            self.polinomios_panel if usa_polinomios else None)
+        if usa_simulacion and hasattr(self.simulation_panel, "flush_action_queue"):
+            self.simulation_panel.flush_action_queue()
+        return musica
+
+    def save_run_log(self):
+        if not self.last_run_log:
+            self.console_output.append("⚠️ No hay ninguna ejecución que guardar.")
+            return
+        file_name, _ = QFileDialog.getSaveFileName(self, "Guardar registro de ejecución", "",
+                                                   "Registro de Minicode (*.mcev)")
+        if not file_name:
+            return
+        if not file_name.endswith(".mcev"):
+            file_name += ".mcev"
+        with open(file_name, "wb") as f:
+            f.write(self.last_run_log)
+        self.console_output.append(f"💾 Registro guardado en {file_name}")
+
+    def open_run_log(self):
+        if self._debugger_busy():
+            return
+        file_name, _ = QFileDialog.getOpenFileName(self, "Abrir registro de ejecución", "",
+                                                   "Registro de Minicode (*.mcev)")
+        if not file_name:
+            return
+        from core.eventos import cargar
+        try:
+            datos = cargar(file_name)
+        except OSError as e:
+            self.console_output.append(f"--- Error al abrir el registro ---\n{e}")
+            return
+        self.replay_run(datos)
 
     # ---------------------------
     # AST viewer
@@ -398,23 +873,26 @@ class MainWindow(QMainWindow):
         codigo = self.code_editor.toPlainText()
         try:
             # importar en tiempo de ejecución para manejar faltas
-            from antlr4 import InputStream, CommonTokenStream
-            from antlr.MinicodeLexer import MinicodeLexer
-            from antlr.MinicodeParser import MinicodeParser
-
-            input_stream = InputStream(codigo)
-            lexer = MinicodeLexer(input_stream)
-            stream = CommonTokenStream(lexer)
-            parser = MinicodeParser(stream)
-            tree = parser.programa()
-            self.ast_viewer.show_ast(tree, parser)
-        except Exception:
+            from core.frontend import parsear
+
+            tree, parser = parsear(codigo)
+            self.ast_viewer.show_ast(tree, parser, codigo)
+        except Exception as e:
             tb = traceback.format_exc()
             self.console_output.append("--- Error al generar AST ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error al generar AST ---\n")
-                f.write(tb + "\n")
+            registrar_error("ast", e, codigo)
+
+    def _go_to_position(self, line, column):
+        """Lleva el cursor del editor a (línea 1-based, columna 0-based)."""
+        block = self.code_editor.document().findBlockByNumber(line - 1)
+        if not block.isValid():
+            return
+        cursor = self.code_editor.textCursor()
+        cursor.setPosition(block.position() + min(column, block.length() - 1))
+        self.code_editor.setTextCursor(cursor)
+        self.code_editor.centerCursor()
+        self.code_editor.setFocus()
 
     def _on_tab_changed(self, index):
         """
@@ -430,27 +908,20 @@ class MainWindow(QMainWindow):
                     self.console_output.append("⚠️ No hay código para generar el AST.")
                     return
 
-                from antlr4 import InputStream, CommonTokenStream
-                from antlr.MinicodeLexer import MinicodeLexer
-                from antlr.MinicodeParser import MinicodeParser
+                from core.frontend import parsear
 
-                input_stream = InputStream(codigo)
-                lexer = MinicodeLexer(input_stream)
-                stream = CommonTokenStream(lexer)
-                parser = MinicodeParser(stream)
-                tree = parser.programa()
+                tree, parser = parsear(codigo)
 
-                self.ast_viewer.show_ast(tree, parser)
+                self.ast_viewer.show_ast(tree, parser, codigo)
+            elif tab_name == "Polinomios":
+                self.polinomios_panel  # construye el panel al abrir la pestaña
 
 
         except Exception as e:
-            import traceback
             tb = traceback.format_exc()
             self.console_output.append("--- Error al generar AST automáticamente ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error al generar AST automáticamente ---\n")
-                f.write(tb + "\n")
+            registrar_error("ast", e, self.code_editor.toPlainText())
 
     # ---------------------------
     # Dialogo Acerca de...
@@ -466,7 +937,7 @@ class MainWindow(QMainWindow):
     # ---------------------------
     def _global_excepthook(self, exctype, value, tb_obj):
         """
-        Captura excepciones no manejadas y las escribe en la consola y en fatal_error.log.
+        Captura excepciones no manejadas y las escribe en la consola y en el registro de errores.
         Esto ayuda a diagnosticar cerrados inesperados del proceso.
         """
         err = ''.join(traceback.format_exception(exctype, value, tb_obj))
@@ -479,10 +950,9 @@ class MainWindow(QMainWindow):
             # Si incluso escribir en la UI falla, caerá al archivo log
             pass
 
-        # Siempre escribir en el archivo log
+        # Siempre dejarlo en el registro de errores (logs/minicode.jsonl)
         try:
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write(err + "\n")
+            registrar_error("no_capturado", value, self.code_editor.toPlainText(), detalle=err)
         except Exception:
             # si escribir al log falla, no podemos hacer más aquí
             pass
@@ -495,12 +965,10 @@ class MainWindow(QMainWindow):
                 self.console_output.append("🔁 Mapa restaurado a su estado inicial.")
             else:
                 self.console_output.append("⚠️ El panel de simulación no soporta reinicio.")
-        except Exception:
+        except Exception as e:
             tb = traceback.format_exc()
             self.console_output.append("--- Error al reiniciar el mapa ---")
             self.console_output.append(tb)
-            with open("fatal_error.log", "a", encoding="utf-8") as f:
-                f.write("--- Error al reiniciar el mapa ---\n")
-                f.write(tb + "\n")
+            registrar_error("simulacion", e)
 
 
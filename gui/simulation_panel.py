@@ -7,10 +7,15 @@ from PyQt6.QtCore import Qt, QTimer
 from math import cos, sin, radians
 import sys
 
+from core import traza
+
+_traza_graficos = traza.categoria(traza.GRAFICOS)
+_traza_animacion = traza.categoria(traza.ANIMACION)
+
 class SimulationPanel(QGraphicsView):
     def __init__(self):
         super().__init__()
-        print(" Inicializando SimulationPanel (modo juego 2D)...")
+        _traza_graficos.info("Inicializando SimulationPanel (modo juego 2D)...")
 
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
@@ -35,7 +40,7 @@ class SimulationPanel(QGraphicsView):
 
     def clear_canvas(self):
         """Limpia la escena y crea cuadrícula vacía. Restablece el jugador al centro."""
-        print("🧹 Limpiando canvas...")
+        _traza_graficos.detalle("Limpiando canvas...")
         self.scene.clear()
         self.map_data = None # Se limpia el mapa activo, pero _initial_map_data se mantiene
         self.player_item = None
@@ -66,13 +71,13 @@ class SimulationPanel(QGraphicsView):
                 if self.player_item.scene() is not None:
                     self.scene.removeItem(self.player_item)
             except RuntimeError:
-                print(" player_item eliminado por Qt (ignorado).")
+                _traza_graficos.detalle("player_item eliminado por Qt (ignorado).")
             self.player_item = None
 
         try:
             pixmap = QPixmap("assets/player.png")
             if pixmap.isNull():
-                print(" No se encontró 'assets/player.png'. Usando un cuadrado azul temporal.")
+                _traza_graficos.aviso("No se encontró 'assets/player.png'. Usando un cuadrado azul temporal.")
                 rect = QGraphicsRectItem(0, 0, 30, 30)
                 rect.setBrush(QBrush(QColor("blue")))
                 self.player_item = rect
@@ -91,7 +96,7 @@ class SimulationPanel(QGraphicsView):
             self.player_item.setRotation(-self.angle)
         except Exception:
             import traceback
-            print(" Error en _draw_player:", traceback.format_exc())
+            _traza_graficos.error("Error en _draw_player: %s", traceback.format_exc())
 
     def _update_player_position(self):
         """Posiciona el sprite según coordenadas de celda."""
@@ -107,63 +112,144 @@ class SimulationPanel(QGraphicsView):
         """
         Añade pasos de movimiento a la cola general.
         """
-        print(f"➡️ move_turtle llamado: ({direction}, {distance})")
+        _traza_graficos.detalle("move_turtle llamado: (%s, %s)", direction, distance)
 
         try:
             steps = int(round(float(distance))) if distance is not None else 1
         except Exception:
             steps = 1
 
-        temp_x, temp_y = self.player_x, self.player_y
-        temp_angle = self.angle
+        temp_x, temp_y, temp_angle = self._queued_state()
 
-        # Simular las acciones ya en la cola para obtener el punto de partida
-        for action, *args in self.action_queue:
-            if action == 'move':
-                temp_x, temp_y = args[0], args[1]
-            elif action == 'rotate':
-                dir_or_deg = args[0]
-                if dir_or_deg == "izquierda":
-                    temp_angle = (temp_angle + 90) % 360
-                elif dir_or_deg == "derecha":
-                    temp_angle = (temp_angle - 90) % 360
-                    if temp_angle < 0: temp_angle += 360
-                else:
-                    try:
-                        deg = int(dir_or_deg)
-                        temp_angle = deg % 360
-                    except Exception:
-                        pass
-        
         current_temp_x, current_temp_y = temp_x, temp_y
         current_temp_angle = temp_angle
 
-        for _ in range(max(1, steps)):
+        for _ in range(min(max(1, steps), self.grid_size)):
             dx, dy = self._dir_to_delta_for_temp_angle(direction, current_temp_angle)
             next_temp_x = current_temp_x + dx
             next_temp_y = current_temp_y + dy
 
             if not self._is_inside_map(next_temp_x, next_temp_y):
-                print(" Límite del mapa alcanzado, deteniendo secuencia.")
+                _traza_graficos.info("Límite del mapa alcanzado, deteniendo secuencia.")
                 break
             if self.map_data and self.map_data[next_temp_y][next_temp_x] == 1:
-                print(" Choque con muro, deteniendo secuencia.")
+                _traza_graficos.info("Choque con muro, deteniendo secuencia.")
                 break
 
             self.action_queue.append(('move', next_temp_x, next_temp_y))
             current_temp_x, current_temp_y = next_temp_x, next_temp_y # Actualizar para el siguiente paso en esta ráfaga
 
-        print(f" Movimiento encolado (cola total: {len(self.action_queue)} acciones).")
+        _traza_graficos.detalle("Movimiento encolado (cola total: %s acciones).", len(self.action_queue))
+
+
+    def _queued_state(self):
+        """Simula las acciones ya en la cola para obtener el punto de partida (x, y, ángulo)."""
+        temp_x, temp_y = self.player_x, self.player_y
+        temp_angle = self.angle
 
+        for action, *args in self.action_queue:
+            if action == 'move':
+                temp_x, temp_y = args[0], args[1]
+            elif action == 'rotate':
+                temp_angle = self._rotated_angle(temp_angle, args[0])
+        return temp_x, temp_y, temp_angle
+
+    @staticmethod
+    def _rotated_angle(angle, dir_or_deg):
+        if dir_or_deg == "izquierda":
+            return (angle + 90) % 360
+        if dir_or_deg == "derecha":
+            return (angle - 90) % 360
+        try:
+            return int(dir_or_deg) % 360
+        except Exception:
+            return angle
+
+    def move_path(self, actions):
+        """
+        Encola de una vez un trayecto completo: una lista de ('move', direction, distance)
+        y ('rotate', direction_or_degrees). Cada movimiento se detiene al chocar con un muro
+        o con el borde, igual que move_turtle, pero las colisiones de todos los pasos
+        consecutivos se comprueban con operaciones vectorizadas de NumPy.
+        """
+        import numpy as np  # diferido: no hace falta para arrancar el IDE
+
+        x, y, angle = self._queued_state()
+        walls = np.asarray(self.map_data) == 1 if self.map_data else None
+        queued_before = len(self.action_queue)
+
+        i = 0
+        while i < len(actions):
+            action = actions[i]
+            if action[0] == 'rotate':
+                self.action_queue.append(('rotate', action[1]))
+                angle = self._rotated_angle(angle, action[1])
+                i += 1
+                continue
+
+            # Agrupar los movimientos consecutivos (sin giros entre ellos)
+            deltas_x, deltas_y, owners = [], [], []
+            while i < len(actions) and actions[i][0] == 'move':
+                _, direction, distance = actions[i]
+                try:
+                    steps = int(round(float(distance))) if distance is not None else 1
+                except Exception:
+                    steps = 1
+                # En línea recta no hay más de grid_size casillas hasta el borde: los arrays
+                # no deben crecer con la distancia pedida (mover adelante 300000000)
+                steps = min(max(1, steps), self.grid_size)
+                dx, dy = self._dir_to_delta_for_temp_angle(direction, angle)
+                deltas_x.append(np.full(steps, dx))
+                deltas_y.append(np.full(steps, dy))
+                owners.append(np.full(steps, len(owners)))
+                i += 1
+            x, y = self._enqueue_steps(x, y, np.concatenate(deltas_x), np.concatenate(deltas_y),
+                                       np.concatenate(owners), walls)
+
+        _traza_graficos.detalle("Trayecto encolado: %s acciones (cola total: %s acciones).",
+                              len(self.action_queue) - queued_before, len(self.action_queue))
+
+    def _enqueue_steps(self, x, y, dxs, dys, owners, walls):
+        """
+        Encola los pasos (dxs[k], dys[k]) partiendo de (x, y). owners[k] indica a qué
+        movimiento pertenece cada paso: al chocar se descartan los pasos restantes de ese
+        movimiento y se continúa con el siguiente desde la última posición válida.
+        """
+        import numpy as np
+
+        start = 0
+        total = len(dxs)
+        while start < total:
+            xs = x + np.cumsum(dxs[start:])
+            ys = y + np.cumsum(dys[start:])
+            blocked = ~((xs >= 0) & (xs < self.grid_size) & (ys >= 0) & (ys < self.grid_size))
+            if walls is not None:
+                inside = ~blocked
+                blocked[inside] = walls[ys[inside], xs[inside]]
+
+            hit = int(np.argmax(blocked)) if blocked.any() else len(xs)
+            self.action_queue.extend(('move', px, py) for px, py in zip(xs[:hit].tolist(), ys[:hit].tolist()))
+            if hit == len(xs):
+                return int(xs[-1]), int(ys[-1])
+
+            if hit > 0:
+                x, y = int(xs[hit - 1]), int(ys[hit - 1])
+            _traza_graficos.info("Choque con muro o límite del mapa, deteniendo secuencia.")
+            # Saltar el resto de pasos del movimiento que chocó
+            owner = owners[start + hit]
+            start += hit
+            while start < total and owners[start] == owner:
+                start += 1
+        return x, y
 
     def rotate_player(self, direction_or_degrees):
         """
         Encola una acción de rotación en la misma cola global.
         """
-        print(f" rotate_player llamado: {direction_or_degrees}")
+        _traza_graficos.detalle("rotate_player llamado: %s", direction_or_degrees)
 
         self.action_queue.append(('rotate', direction_or_degrees))
-        print(f" Rotación encolada (cola total: {len(self.action_queue)} acciones).")
+        _traza_graficos.detalle("Rotación encolada (cola total: %s acciones).", len(self.action_queue))
 
     def flush_action_queue(self):
         """
@@ -171,14 +257,14 @@ class SimulationPanel(QGraphicsView):
         Llamar a esto una vez que el programa Minicode haya terminado de interpretar.
         """
         if not self.action_queue:
-            print(" No hay acciones pendientes para ejecutar.")
+            _traza_animacion.detalle("No hay acciones pendientes para ejecutar.")
             return
 
         if self._is_processing_queue:
-            print(" Ya hay una animación en curso.")
+            _traza_animacion.info("Ya hay una animación en curso.")
             return
 
-        print(f" Iniciando ejecución de {len(self.action_queue)} acciones acumuladas...")
+        _traza_animacion.info("Iniciando ejecución de %s acciones acumuladas...", len(self.action_queue))
         self._is_processing_queue = True
         self._process_next_action_in_queue()
 
@@ -186,7 +272,7 @@ class SimulationPanel(QGraphicsView):
     def _process_next_action_in_queue(self):
         """Procesa secuencialmente los movimientos/rotaciones en la cola."""
         if not self.action_queue:
-            print(" Cola de acciones vacía.")
+            _traza_animacion.detalle("Cola de acciones vacía.")
             self._is_processing_queue = False
             return
 
@@ -199,13 +285,13 @@ class SimulationPanel(QGraphicsView):
             self._perform_rotation(direction)
             QTimer.singleShot(80, self._process_next_action_in_queue)
         else:
-            print(f" Acción desconocida: {action}")
+            _traza_animacion.aviso("Acción desconocida: %s", action)
             QTimer.singleShot(80, self._process_next_action_in_queue)
 
     def _animate_single_step(self, new_x, new_y):
         """Anima un solo paso en la cuadrícula."""
         if not self.player_item:
-            print(" No hay sprite del jugador para animar.")
+            _traza_animacion.aviso("No hay sprite del jugador para animar.")
             QTimer.singleShot(80, self._process_next_action_in_queue)
             return
 
@@ -226,10 +312,10 @@ class SimulationPanel(QGraphicsView):
                 QTimer.singleShot(duration, lambda: animate(step + 1))
             else:
                 self.player_x, self.player_y = new_x, new_y
-                print(f" Nueva posición lógica: ({self.player_x}, {self.player_y})")
+                _traza_animacion.detalle("Nueva posición lógica: (%s, %s)", self.player_x, self.player_y)
 
                 if self.map_data and self.map_data[new_y][new_x] == 2:
-                    print(" ¡Meta alcanzada!")
+                    _traza_animacion.info("¡Meta alcanzada!")
                     self.action_queue.clear()
                     self._is_processing_queue = False
                     QTimer.singleShot(100, self._on_goal_reached)
@@ -263,7 +349,7 @@ class SimulationPanel(QGraphicsView):
             except Exception:
                 pass
 
-        print(f" Jugador rotado a {self.angle}°")
+        _traza_animacion.detalle("Jugador rotado a %s°", self.angle)
 
         if self.player_item:
             br = self.player_item.boundingRect()
@@ -273,7 +359,7 @@ class SimulationPanel(QGraphicsView):
 
     def load_map(self, grid):
         """Dibuja un mapa desde una matriz de 0/1/2/3 y lo almacena como el mapa inicial."""
-        print(" Cargando mapa...")
+        _traza_graficos.info("Cargando mapa...")
         self._initial_map_data = [row[:] for row in grid] # Almacenar una copia profunda
         self._load_map_internal(grid)
 
@@ -288,7 +374,7 @@ class SimulationPanel(QGraphicsView):
         rows = len(grid)
         cols = len(grid[0]) if rows else 0
         if rows == 0 or cols == 0:
-            print(" Mapa vacío.")
+            _traza_graficos.aviso("Mapa vacío.")
             return
 
         self.grid_size = rows
@@ -320,13 +406,13 @@ class SimulationPanel(QGraphicsView):
         self.player_x, self.player_y = start_x, start_y
         self.angle = 0
         self._draw_player()
-        print(f" Mapa cargado. Inicio en ({start_x}, {start_y})")
+        _traza_graficos.info("Mapa cargado. Inicio en (%s, %s)", start_x, start_y)
 
     def reset_simulation(self):
         """Restablece la simulación al estado inicial del mapa o al lienzo en blanco."""
-        print(" Reiniciando simulación...")
+        _traza_graficos.info("Reiniciando simulación...")
         if self._is_processing_queue:
-            print(" Deteniendo animación actual para reiniciar.")
+            _traza_animacion.info("Deteniendo animación actual para reiniciar.")
             # Si hay una animación en curso, la detenemos y limpiamos la cola
             self.action_queue.clear()
             self._is_processing_queue = False
@@ -343,7 +429,7 @@ class SimulationPanel(QGraphicsView):
 
     def _on_goal_reached(self):
         """Evento al llegar a la meta."""
-        print(" ¡Has llegado a la meta!")
+        _traza_graficos.info("¡Has llegado a la meta!")
         msg = QMessageBox()
         msg.setWindowTitle("¡Victoria!")
         msg.setText(" ¡Has llegado a la meta del laberinto!")
@@ -352,7 +438,7 @@ class SimulationPanel(QGraphicsView):
 
     def get_turtle_pos(self):
         """Compatibilidad: devuelve la posición lógica en celdas."""
-        print(f" Posición actual del jugador: ({self.player_x}, {self.player_y})")
+        _traza_graficos.detalle("Posición actual del jugador: (%s, %s)", self.player_x, self.player_y)
         return self.player_x, self.player_y
     
     def reset_map(self):
@@ -364,11 +450,11 @@ class SimulationPanel(QGraphicsView):
         - Reinicia el ángulo y la cola de animaciones
         """
         if not self.map_data:
-            print(" No hay mapa cargado. Se limpia el canvas.")
+            _traza_graficos.info("No hay mapa cargado. Se limpia el canvas.")
             self.clear_canvas()
             return
 
-        print("🔁 Reiniciando mapa al estado original...")
+        _traza_graficos.info("Reiniciando mapa al estado original...")
 
         # Guardar una copia del mapa actual (por si fue modificado)
         mapa_original = [row[:] for row in self.map_data]
@@ -414,5 +500,5 @@ class SimulationPanel(QGraphicsView):
         self.map_data = mapa_original
         self._draw_player()
 
-        print(f" Mapa reiniciado. Jugador en ({self.player_x}, {self.player_y}) con ángulo {self.angle}°.")
+        _traza_graficos.info("Mapa reiniciado. Jugador en (%s, %s) con ángulo %s°.", self.player_x, self.player_y, self.angle)
 
@@ -13,13 +13,16 @@ sys.path.append(os.path.dirname(__file__))
 
 
 from gui.tutorial_manager import TutorialManager
+from core import traza
 
+_traza = traza.categoria(traza.IDE)
 
 
 if __name__ == "__main__":
-    tm = TutorialManager()
-    print("Ruta base:", tm.tutorials_path)
-    print("Archivos encontrados:", tm.get_tutorial_names())
+    if _traza.activa(traza.INFO):  # listar los tutoriales solo si se va a mostrar
+        tm = TutorialManager()
+        _traza.info("Ruta base: %s", tm.tutorials_path)
+        _traza.info("Archivos encontrados: %s", tm.get_tutorial_names())
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()